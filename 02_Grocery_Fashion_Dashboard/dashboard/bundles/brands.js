@@ -0,0 +1,97 @@
+// Dashboard bundle: brands (auto-generated)
+dashboardBundle("brands", {
+    
+    // Top 10 Brands
+    topBrands: [
+        {
+            category: "Fashion",
+            brand: "BrandF3",
+            transactions: 8989,
+            revenue: 119811028.82,
+            profit: 36868196.72,
+            margin: 44.93,
+            skus: 7977
+        },
+        {
+            category: "Fashion",
+            brand: "BrandF5",
+            transactions: 8993,
+            revenue: 117362323.31,
+            profit: 36174438.34,
+            margin: 45.02,
+            skus: 7951
+        },
+        {
+            category: "Fashion",
+            brand: "BrandF1",
+            transactions: 8920,
+            revenue: 117207155.71,
+            profit: 36088577.67,
+            margin: 45.05,
+            skus: 7848
+        },
+        {
+            category: "Fashion",
+            brand: "BrandF2",
+            transactions: 8867,
+            revenue: 116444677.76,
+            profit: 35963422.57,
+            margin: 45.25,
+            skus: 7854
+        },
+        {
+            category: "Fashion",
+            brand: "BrandF4",
+            transactions: 8846,
+            revenue: 114831546.89,
+            profit: 35276775.67,
+            margin: 44.85,
+            skus: 7854
+        },
+        {
+            category: "Grocery",
+            brand: "BrandG3",
+            transactions: 13523,
+            revenue: 35191493.13,
+            profit: 4514685.91,
+            margin: 14.99,
+            skus: 11292
+        },
+        {
+            category: "Grocery",
+            brand: "BrandG5",
+            transactions: 13373,
+            revenue: 34710198.45,
+            profit: 4463579.00,
+            margin: 15.01,
+            skus: 11146
+        },
+        {
+            category: "Grocery",
+            brand: "BrandG1",
+            transactions: 13284,
+            revenue: 34605031.39,
+            profit: 4440517.33,
+            margin: 15.02,
+            skus: 11120
+        },
+        {
+            category: "Grocery",
+            brand: "BrandG4",
+            transactions: 13354,
+            revenue: 34584185.92,
+            profit: 4392374.18,
+            margin: 14.89,
+            skus: 11183
+        },
+        {
+            category: "Grocery",
+            brand: "BrandG2",
+            transactions: 13195,
+            revenue: 34565148.29,
+            profit: 4387286.30,
+            margin: 14.87,
+            skus: 11003
+        },
+    ]
+});
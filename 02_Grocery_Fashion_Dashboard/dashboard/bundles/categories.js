@@ -0,0 +1,220 @@
+// Dashboard bundle: categories (auto-generated)
+dashboardBundle("categories", {
+    
+    // Category Performance
+    categories: [
+        {
+            name: "Fashion",
+            transactions: 44615,
+            revenue: 585656732.49,
+            avgRevenue: 13126.90,
+            profit: 180371410.97,
+            margin: 45.02,
+            quantity: 89289,
+            skus: 39484
+        },
+        {
+            name: "Grocery",
+            transactions: 66729,
+            revenue: 173656057.18,
+            avgRevenue: 2602.41,
+            profit: 22198442.72,
+            margin: 14.96,
+            quantity: 200106,
+            skus: 55744
+        },
+    ],
+    
+    // Stock Ageing
+    stockAgeing: [
+        {
+            category: "Ageing",
+            transactions: 55530,
+            revenue: 378359116.63,
+            quantity: 144070,
+            avgAge: 135.27
+        },
+        {
+            category: "Fresh",
+            transactions: 18656,
+            revenue: 125235468.53,
+            quantity: 48409,
+            avgAge: 15.45
+        },
+        {
+            category: "Normal",
+            transactions: 37158,
+            revenue: 255718204.51,
+            quantity: 96916,
+            avgAge: 60.36
+        },
+    ],
+    
+    // SubCategory Performance
+    subCategories: [
+        {
+            category: "Fashion",
+            subCategory: "Accessories",
+            transactions: 11179,
+            revenue: 146474199.79,
+            avgRevenue: 13102.62,
+            profit: 45157926.36,
+            margin: 45.04,
+            quantity: 22335
+        },
+        {
+            category: "Fashion",
+            subCategory: "Kids",
+            transactions: 11181,
+            revenue: 147103944.25,
+            avgRevenue: 13156.60,
+            profit: 45352331.67,
+            margin: 45.07,
+            quantity: 22422
+        },
+        {
+            category: "Fashion",
+            subCategory: "Men",
+            transactions: 11062,
+            revenue: 145374122.58,
+            avgRevenue: 13141.76,
+            profit: 44759102.09,
+            margin: 45.06,
+            quantity: 22259
+        },
+        {
+            category: "Fashion",
+            subCategory: "Women",
+            transactions: 11193,
+            revenue: 146704465.87,
+            avgRevenue: 13106.80,
+            profit: 45102050.85,
+            margin: 44.90,
+            quantity: 22273
+        },
+        {
+            category: "Grocery",
+            subCategory: "Dairy",
+            transactions: 16892,
+            revenue: 43925260.43,
+            avgRevenue: 2600.36,
+            profit: 5608253.29,
+            margin: 14.97,
+            quantity: 50552
+        },
+        {
+            category: "Grocery",
+            subCategory: "FMCG",
+            transactions: 16586,
+            revenue: 43184968.11,
+            avgRevenue: 2603.70,
+            profit: 5507898.92,
+            margin: 14.89,
+            quantity: 49611
+        },
+        {
+            category: "Grocery",
+            subCategory: "Snacks",
+            transactions: 16746,
+            revenue: 43913904.31,
+            avgRevenue: 2622.35,
+            profit: 5609805.84,
+            margin: 14.96,
+            quantity: 50486
+        },
+        {
+            category: "Grocery",
+            subCategory: "Staples",
+            transactions: 16505,
+            revenue: 42631924.33,
+            avgRevenue: 2582.97,
+            profit: 5472484.67,
+            margin: 15.00,
+            quantity: 49457
+        },
+    ],
+    
+    // Margin Analysis
+    marginAnalysis: [
+        {
+            category: "Fashion",
+            subCategory: "Accessories",
+            avgMargin: 45.04,
+            minMargin: 30.01,
+            maxMargin: 60.00,
+            profit: 45157926.36,
+            revenue: 146474199.79,
+            profitMargin: 30.83
+        },
+        {
+            category: "Fashion",
+            subCategory: "Kids",
+            avgMargin: 45.07,
+            minMargin: 30.00,
+            maxMargin: 60.00,
+            profit: 45352331.67,
+            revenue: 147103944.25,
+            profitMargin: 30.83
+        },
+        {
+            category: "Fashion",
+            subCategory: "Men",
+            avgMargin: 45.06,
+            minMargin: 30.00,
+            maxMargin: 60.00,
+            profit: 44759102.09,
+            revenue: 145374122.58,
+            profitMargin: 30.79
+        },
+        {
+            category: "Fashion",
+            subCategory: "Women",
+            avgMargin: 44.90,
+            minMargin: 30.01,
+            maxMargin: 60.00,
+            profit: 45102050.85,
+            revenue: 146704465.87,
+            profitMargin: 30.74
+        },
+        {
+            category: "Grocery",
+            subCategory: "Dairy",
+            avgMargin: 14.97,
+            minMargin: 5.00,
+            maxMargin: 25.00,
+            profit: 5608253.29,
+            revenue: 43925260.43,
+            profitMargin: 12.77
+        },
+        {
+            category: "Grocery",
+            subCategory: "FMCG",
+            avgMargin: 14.89,
+            minMargin: 5.00,
+            maxMargin: 25.00,
+            profit: 5507898.92,
+            revenue: 43184968.11,
+            profitMargin: 12.75
+        },
+        {
+            category: "Grocery",
+            subCategory: "Snacks",
+            avgMargin: 14.96,
+            minMargin: 5.00,
+            maxMargin: 25.00,
+            profit: 5609805.84,
+            revenue: 43913904.31,
+            profitMargin: 12.77
+        },
+        {
+            category: "Grocery",
+            subCategory: "Staples",
+            avgMargin: 15.00,
+            minMargin: 5.00,
+            maxMargin: 25.00,
+            profit: 5472484.67,
+            revenue: 42631924.33,
+            profitMargin: 12.84
+        },
+    ]
+});
@@ -0,0 +1,59 @@
+// Dashboard bundle manifest (auto-generated)
+const dashboardManifest = {
+    "kpis": {
+        "Total Transactions": "111,344",
+        "Total Revenue (INR)": "759,312,789.67",
+        "Total Profit (INR)": "202,569,853.69",
+        "Average Margin (%)": "27.00",
+        "Total Quantity Sold": "289,395",
+        "Unique SKUs": "95,228",
+        "Unique Stores": "5",
+        "Fresh Stock (%)": "16.76",
+        "Ageing Stock (%)": "49.87",
+        "Average Transaction Value (INR)": "6,819.52",
+        "Grocery Revenue (INR)": "173,656,057.18",
+        "Fashion Revenue (INR)": "585,656,732.49",
+        "POS1 Revenue (INR)": "454,015,765.27",
+        "POS2 Revenue (INR)": "305,297,024.40"
+    },
+    "bundles": {
+        "categories": {
+            "file": "bundles/categories.js",
+            "sections": [
+                "categories",
+                "stockAgeing",
+                "subCategories",
+                "marginAnalysis"
+            ],
+            "bytes": 5808
+        },
+        "monthly": {
+            "file": "bundles/monthly.js",
+            "sections": [
+                "monthlyTrends"
+            ],
+            "bytes": 5173
+        },
+        "pos": {
+            "file": "bundles/pos.js",
+            "sections": [
+                "posData"
+            ],
+            "bytes": 1404
+        },
+        "brands": {
+            "file": "bundles/brands.js",
+            "sections": [
+                "topBrands"
+            ],
+            "bytes": 2466
+        },
+        "skus": {
+            "file": "bundles/skus.js",
+            "sections": [
+                "topSkus"
+            ],
+            "bytes": 26621
+        }
+    }
+};
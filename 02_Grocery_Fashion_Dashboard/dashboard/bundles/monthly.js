@@ -0,0 +1,199 @@
+// Dashboard bundle: monthly (auto-generated)
+dashboardBundle("monthly", {
+    
+    // Monthly Trends
+    monthlyTrends: [
+        {
+            month: "2024-01",
+            category: "Fashion",
+            transactions: 4038,
+            revenue: 51780604.80,
+            profit: 15978552.87,
+            quantity: 8040
+        },
+        {
+            month: "2024-01",
+            category: "Grocery",
+            transactions: 6046,
+            revenue: 15851680.89,
+            profit: 2020438.85,
+            quantity: 18158
+        },
+        {
+            month: "2024-02",
+            category: "Fashion",
+            transactions: 3109,
+            revenue: 41016425.51,
+            profit: 12625475.12,
+            quantity: 6223
+        },
+        {
+            month: "2024-02",
+            category: "Grocery",
+            transactions: 4616,
+            revenue: 11957977.70,
+            profit: 1522039.19,
+            quantity: 13659
+        },
+        {
+            month: "2024-03",
+            category: "Fashion",
+            transactions: 4090,
+            revenue: 53979373.41,
+            profit: 16630488.19,
+            quantity: 8270
+        },
+        {
+            month: "2024-03",
+            category: "Grocery",
+            transactions: 6145,
+            revenue: 16151443.14,
+            profit: 2065760.21,
+            quantity: 18456
+        },
+        {
+            month: "2024-04",
+            category: "Fashion",
+            transactions: 3231,
+            revenue: 42914125.65,
+            profit: 13218147.62,
+            quantity: 6557
+        },
+        {
+            month: "2024-04",
+            category: "Grocery",
+            transactions: 4610,
+            revenue: 12211986.82,
+            profit: 1549797.66,
+            quantity: 13869
+        },
+        {
+            month: "2024-05",
+            category: "Fashion",
+            transactions: 3235,
+            revenue: 42580896.71,
+            profit: 13045344.78,
+            quantity: 6540
+        },
+        {
+            month: "2024-05",
+            category: "Grocery",
+            transactions: 4869,
+            revenue: 12781650.78,
+            profit: 1623429.51,
+            quantity: 14806
+        },
+        {
+            month: "2024-06",
+            category: "Fashion",
+            transactions: 3281,
+            revenue: 42508239.36,
+            profit: 13065948.58,
+            quantity: 6481
+        },
+        {
+            month: "2024-06",
+            category: "Grocery",
+            transactions: 4900,
+            revenue: 12865005.24,
+            profit: 1650468.44,
+            quantity: 14706
+        },
+        {
+            month: "2024-07",
+            category: "Fashion",
+            transactions: 3386,
+            revenue: 44338035.97,
+            profit: 13626835.23,
+            quantity: 6755
+        },
+        {
+            month: "2024-07",
+            category: "Grocery",
+            transactions: 5016,
+            revenue: 13007998.46,
+            profit: 1675789.19,
+            quantity: 15092
+        },
+        {
+            month: "2024-08",
+            category: "Fashion",
+            transactions: 4013,
+            revenue: 52801150.37,
+            profit: 16277386.47,
+            quantity: 8086
+        },
+        {
+            month: "2024-08",
+            category: "Grocery",
+            transactions: 6020,
+            revenue: 15241138.79,
+            profit: 1946560.33,
+            quantity: 17915
+        },
+        {
+            month: "2024-09",
+            category: "Fashion",
+            transactions: 3297,
+            revenue: 43288065.65,
+            profit: 13336668.13,
+            quantity: 6499
+        },
+        {
+            month: "2024-09",
+            category: "Grocery",
+            transactions: 4921,
+            revenue: 12561792.31,
+            profit: 1607224.40,
+            quantity: 14785
+        },
+        {
+            month: "2024-10",
+            category: "Fashion",
+            transactions: 4314,
+            revenue: 56569391.89,
+            profit: 17360058.77,
+            quantity: 8552
+        },
+        {
+            month: "2024-10",
+            category: "Grocery",
+            transactions: 6504,
+            revenue: 16848464.75,
+            profit: 2167266.25,
+            quantity: 19495
+        },
+        {
+            month: "2024-11",
+            category: "Fashion",
+            transactions: 4304,
+            revenue: 56686131.25,
+            profit: 17528559.66,
+            quantity: 8595
+        },
+        {
+            month: "2024-11",
+            category: "Grocery",
+            transactions: 6525,
+            revenue: 16910925.19,
+            profit: 2154930.79,
+            quantity: 19423
+        },
+        {
+            month: "2024-12",
+            category: "Fashion",
+            transactions: 4317,
+            revenue: 57194291.92,
+            profit: 17677945.55,
+            quantity: 8691
+        },
+        {
+            month: "2024-12",
+            category: "Grocery",
+            transactions: 6557,
+            revenue: 17265993.11,
+            profit: 2214737.90,
+            quantity: 19742
+        },
+    ]
+});
@@ -0,0 +1,57 @@
+// Dashboard bundle: pos (auto-generated)
+dashboardBundle("pos", {
+    
+    // POS Comparison
+    posData: [
+        {
+            pos: "POS1",
+            store: "Store_A",
+            transactions: 22301,
+            revenue: 152738567.53,
+            profit: 40869813.38,
+            margin: 27.05,
+            quantity: 57762,
+            skus: 21576
+        },
+        {
+            pos: "POS1",
+            store: "Store_B",
+            transactions: 22435,
+            revenue: 151747695.49,
+            profit: 40373335.01,
+            margin: 26.95,
+            quantity: 58279,
+            skus: 21730
+        },
+        {
+            pos: "POS1",
+            store: "Store_C",
+            transactions: 21984,
+            revenue: 149529502.25,
+            profit: 39858071.93,
+            margin: 26.99,
+            quantity: 57413,
+            skus: 21327
+        },
+        {
+            pos: "POS2",
+            store: "Store_D",
+            transactions: 22193,
+            revenue: 153378002.65,
+            profit: 40905169.02,
+            margin: 26.95,
+            quantity: 57769,
+            skus: 21505
+        },
+        {
+            pos: "POS2",
+            store: "Store_E",
+            transactions: 22431,
+            revenue: 151919021.75,
+            profit: 40563464.35,
+            margin: 27.07,
+            quantity: 58172,
+            skus: 21767
+        },
+    ]
+});
@@ -581,6 +581,1010 @@ const dashboardData = {
             revenue: 42631924.33,
             profitMargin: 12.84
         },
+    ],
+    
+    // Top 100 SKUs
+    topSkus: [
+        {
+            sku: "FASMEN29037",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF2",
+            transactions: 5,
+            revenue: 99020.57,
+            profit: 34247.35,
+            quantity: 11
+        },
+        {
+            sku: "FASKID11905",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF1",
+            transactions: 4,
+            revenue: 96655.32,
+            profit: 32197.92,
+            quantity: 9
+        },
+        {
+            sku: "FASACC36537",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF3",
+            transactions: 3,
+            revenue: 94056.63,
+            profit: 29192.46,
+            quantity: 9
+        },
+        {
+            sku: "FASACC44638",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF4",
+            transactions: 3,
+            revenue: 91136.21,
+            profit: 25543.96,
+            quantity: 8
+        },
+        {
+            sku: "FASWOM48481",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF4",
+            transactions: 3,
+            revenue: 89331.36,
+            profit: 29039.67,
+            quantity: 9
+        },
+        {
+            sku: "FASWOM33544",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF3",
+            transactions: 4,
+            revenue: 89069.23,
+            profit: 29467.54,
+            quantity: 11
+        },
+        {
+            sku: "FASACC48851",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF4",
+            transactions: 3,
+            revenue: 87130.53,
+            profit: 27595.38,
+            quantity: 9
+        },
+        {
+            sku: "FASWOM33396",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF3",
+            transactions: 3,
+            revenue: 84735.99,
+            profit: 22347.39,
+            quantity: 9
+        },
+        {
+            sku: "FASACC21999",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF2",
+            transactions: 3,
+            revenue: 84592.44,
+            profit: 27972.30,
+            quantity: 9
+        },
+        {
+            sku: "FASKID25829",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF2",
+            transactions: 3,
+            revenue: 81828.76,
+            profit: 20968.56,
+            quantity: 8
+        },
+        {
+            sku: "FASMEN56573",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF5",
+            transactions: 2,
+            revenue: 80183.07,
+            profit: 28087.44,
+            quantity: 6
+        },
+        {
+            sku: "FASWOM34352",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF3",
+            transactions: 2,
+            revenue: 79219.98,
+            profit: 21577.92,
+            quantity: 6
+        },
+        {
+            sku: "FASMEN36660",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF3",
+            transactions: 3,
+            revenue: 78885.38,
+            profit: 22585.29,
+            quantity: 8
+        },
+        {
+            sku: "FASMEN19913",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF1",
+            transactions: 3,
+            revenue: 76533.45,
+            profit: 27450.57,
+            quantity: 9
+        },
+        {
+            sku: "FASMEN31979",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF3",
+            transactions: 2,
+            revenue: 75923.91,
+            profit: 22182.21,
+            quantity: 6
+        },
+        {
+            sku: "FASACC54285",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF5",
+            transactions: 3,
+            revenue: 75803.64,
+            profit: 26965.97,
+            quantity: 7
+        },
+        {
+            sku: "FASKID15774",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF1",
+            transactions: 2,
+            revenue: 74743.95,
+            profit: 22280.64,
+            quantity: 6
+        },
+        {
+            sku: "FASWOM53452",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF5",
+            transactions: 2,
+            revenue: 73963.02,
+            profit: 21154.59,
+            quantity: 6
+        },
+        {
+            sku: "FASWOM47579",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF4",
+            transactions: 3,
+            revenue: 73919.81,
+            profit: 23583.80,
+            quantity: 8
+        },
+        {
+            sku: "FASKID35604",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF3",
+            transactions: 2,
+            revenue: 73671.69,
+            profit: 23617.86,
+            quantity: 6
+        },
+        {
+            sku: "FASACC44777",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF4",
+            transactions: 4,
+            revenue: 73447.17,
+            profit: 23122.62,
+            quantity: 12
+        },
+        {
+            sku: "FASACC38289",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF3",
+            transactions: 3,
+            revenue: 71804.45,
+            profit: 24580.79,
+            quantity: 7
+        },
+        {
+            sku: "FASKID56843",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF5",
+            transactions: 2,
+            revenue: 71756.13,
+            profit: 25353.09,
+            quantity: 6
+        },
+        {
+            sku: "FASWOM23809",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF2",
+            transactions: 3,
+            revenue: 71130.10,
+            profit: 22984.22,
+            quantity: 7
+        },
+        {
+            sku: "FASKID38055",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF3",
+            transactions: 2,
+            revenue: 70965.21,
+            profit: 21081.72,
+            quantity: 6
+        },
+        {
+            sku: "FASKID38555",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF3",
+            transactions: 3,
+            revenue: 70749.44,
+            profit: 20209.30,
+            quantity: 6
+        },
+        {
+            sku: "FASWOM25674",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF2",
+            transactions: 3,
+            revenue: 70710.73,
+            profit: 23628.12,
+            quantity: 7
+        },
+        {
+            sku: "FASACC22182",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF2",
+            transactions: 2,
+            revenue: 70603.41,
+            profit: 18463.53,
+            quantity: 6
+        },
+        {
+            sku: "FASKID48990",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF4",
+            transactions: 3,
+            revenue: 70485.89,
+            profit: 21935.84,
+            quantity: 7
+        },
+        {
+            sku: "FASWOM41468",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF4",
+            transactions: 2,
+            revenue: 69884.70,
+            profit: 21043.17,
+            quantity: 6
+        },
+        {
+            sku: "FASKID11869",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF1",
+            transactions: 2,
+            revenue: 69667.77,
+            profit: 17227.26,
+            quantity: 6
+        },
+        {
+            sku: "FASACC49471",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF4",
+            transactions: 4,
+            revenue: 69488.61,
+            profit: 23615.14,
+            quantity: 11
+        },
+        {
+            sku: "FASMEN42076",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF4",
+            transactions: 3,
+            revenue: 69404.98,
+            profit: 21839.87,
+            quantity: 6
+        },
+        {
+            sku: "FASMEN31871",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF3",
+            transactions: 3,
+            revenue: 69304.92,
+            profit: 20211.43,
+            quantity: 7
+        },
+        {
+            sku: "FASKID17984",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF1",
+            transactions: 2,
+            revenue: 68713.41,
+            profit: 21503.37,
+            quantity: 6
+        },
+        {
+            sku: "FASKID54649",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF5",
+            transactions: 3,
+            revenue: 68681.66,
+            profit: 20498.47,
+            quantity: 7
+        },
+        {
+            sku: "FASWOM45887",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF4",
+            transactions: 2,
+            revenue: 68540.31,
+            profit: 21322.05,
+            quantity: 6
+        },
+        {
+            sku: "FASKID25695",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF2",
+            transactions: 2,
+            revenue: 68484.75,
+            profit: 22544.07,
+            quantity: 6
+        },
+        {
+            sku: "FASWOM53128",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF5",
+            transactions: 3,
+            revenue: 68407.14,
+            profit: 18774.89,
+            quantity: 8
+        },
+        {
+            sku: "FASACC29840",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF2",
+            transactions: 2,
+            revenue: 68405.01,
+            profit: 22366.38,
+            quantity: 6
+        },
+        {
+            sku: "FASMEN27450",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF2",
+            transactions: 2,
+            revenue: 68379.15,
+            profit: 22786.17,
+            quantity: 6
+        },
+        {
+            sku: "FASMEN23843",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF2",
+            transactions: 2,
+            revenue: 68264.37,
+            profit: 23293.32,
+            quantity: 6
+        },
+        {
+            sku: "FASACC13480",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF1",
+            transactions: 2,
+            revenue: 68214.09,
+            profit: 21658.50,
+            quantity: 6
+        },
+        {
+            sku: "FASKID47951",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF4",
+            transactions: 2,
+            revenue: 67975.29,
+            profit: 22566.69,
+            quantity: 6
+        },
+        {
+            sku: "FASMEN32403",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF3",
+            transactions: 3,
+            revenue: 67938.69,
+            profit: 22594.67,
+            quantity: 7
+        },
+        {
+            sku: "FASACC22092",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF2",
+            transactions: 2,
+            revenue: 67403.88,
+            profit: 17738.01,
+            quantity: 6
+        },
+        {
+            sku: "FASMEN19494",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF1",
+            transactions: 2,
+            revenue: 67374.96,
+            profit: 20188.41,
+            quantity: 6
+        },
+        {
+            sku: "FASKID14886",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF1",
+            transactions: 3,
+            revenue: 67145.52,
+            profit: 17671.89,
+            quantity: 9
+        },
+        {
+            sku: "FASWOM13277",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF1",
+            transactions: 2,
+            revenue: 66327.09,
+            profit: 18164.54,
+            quantity: 5
+        },
+        {
+            sku: "FASMEN31894",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF3",
+            transactions: 3,
+            revenue: 66285.65,
+            profit: 22426.85,
+            quantity: 7
+        },
+        {
+            sku: "FASWOM28952",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF2",
+            transactions: 3,
+            revenue: 66262.35,
+            profit: 20843.28,
+            quantity: 6
+        },
+        {
+            sku: "FASWOM15699",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF1",
+            transactions: 3,
+            revenue: 66061.94,
+            profit: 19536.70,
+            quantity: 7
+        },
+        {
+            sku: "FASWOM34516",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF3",
+            transactions: 2,
+            revenue: 65976.12,
+            profit: 20361.09,
+            quantity: 6
+        },
+        {
+            sku: "FASACC22086",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF2",
+            transactions: 2,
+            revenue: 65954.48,
+            profit: 20493.88,
+            quantity: 5
+        },
+        {
+            sku: "FASKID19727",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF1",
+            transactions: 3,
+            revenue: 65943.37,
+            profit: 19734.87,
+            quantity: 7
+        },
+        {
+            sku: "FASACC44411",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF4",
+            transactions: 2,
+            revenue: 65841.60,
+            profit: 21652.32,
+            quantity: 6
+        },
+        {
+            sku: "FASKID44376",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF4",
+            transactions: 2,
+            revenue: 65750.86,
+            profit: 22460.23,
+            quantity: 5
+        },
+        {
+            sku: "FASMEN47291",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF4",
+            transactions: 2,
+            revenue: 65702.01,
+            profit: 19078.65,
+            quantity: 6
+        },
+        {
+            sku: "FASACC26083",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF2",
+            transactions: 2,
+            revenue: 65506.71,
+            profit: 22528.11,
+            quantity: 6
+        },
+        {
+            sku: "FASWOM36463",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF3",
+            transactions: 2,
+            revenue: 65498.43,
+            profit: 19644.00,
+            quantity: 5
+        },
+        {
+            sku: "FASWOM13453",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF1",
+            transactions: 2,
+            revenue: 65361.13,
+            profit: 17277.44,
+            quantity: 5
+        },
+        {
+            sku: "FASKID34281",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF3",
+            transactions: 3,
+            revenue: 64866.32,
+            profit: 20295.44,
+            quantity: 7
+        },
+        {
+            sku: "FASKID38206",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF3",
+            transactions: 3,
+            revenue: 64862.18,
+            profit: 23155.00,
+            quantity: 8
+        },
+        {
+            sku: "FASACC33362",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF3",
+            transactions: 3,
+            revenue: 64795.49,
+            profit: 22250.90,
+            quantity: 7
+        },
+        {
+            sku: "FASACC37765",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF3",
+            transactions: 2,
+            revenue: 64774.89,
+            profit: 16002.03,
+            quantity: 6
+        },
+        {
+            sku: "FASMEN42518",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF4",
+            transactions: 2,
+            revenue: 64761.69,
+            profit: 19045.05,
+            quantity: 6
+        },
+        {
+            sku: "FASKID32474",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF3",
+            transactions: 2,
+            revenue: 64739.88,
+            profit: 18579.84,
+            quantity: 6
+        },
+        {
+            sku: "FASKID59030",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF5",
+            transactions: 2,
+            revenue: 64562.67,
+            profit: 21133.59,
+            quantity: 6
+        },
+        {
+            sku: "FASACC14462",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF1",
+            transactions: 2,
+            revenue: 64508.94,
+            profit: 20231.67,
+            quantity: 6
+        },
+        {
+            sku: "FASMEN54516",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF5",
+            transactions: 3,
+            revenue: 64486.47,
+            profit: 20130.94,
+            quantity: 7
+        },
+        {
+            sku: "FASKID27928",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF2",
+            transactions: 3,
+            revenue: 64214.73,
+            profit: 20233.65,
+            quantity: 8
+        },
+        {
+            sku: "FASKID22988",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF2",
+            transactions: 2,
+            revenue: 64200.48,
+            profit: 19661.31,
+            quantity: 6
+        },
+        {
+            sku: "FASACC26781",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF2",
+            transactions: 2,
+            revenue: 64142.31,
+            profit: 20127.96,
+            quantity: 6
+        },
+        {
+            sku: "FASMEN21169",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF2",
+            transactions: 2,
+            revenue: 63767.97,
+            profit: 20927.01,
+            quantity: 5
+        },
+        {
+            sku: "FASMEN22849",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF2",
+            transactions: 2,
+            revenue: 63725.91,
+            profit: 18392.25,
+            quantity: 6
+        },
+        {
+            sku: "FASKID51105",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF5",
+            transactions: 2,
+            revenue: 63664.56,
+            profit: 21773.53,
+            quantity: 5
+        },
+        {
+            sku: "FASMEN35738",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF3",
+            transactions: 2,
+            revenue: 63500.22,
+            profit: 19245.36,
+            quantity: 6
+        },
+        {
+            sku: "FASWOM55550",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF5",
+            transactions: 4,
+            revenue: 63414.82,
+            profit: 17714.33,
+            quantity: 10
+        },
+        {
+            sku: "FASACC37137",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF3",
+            transactions: 2,
+            revenue: 63350.07,
+            profit: 21122.49,
+            quantity: 6
+        },
+        {
+            sku: "FASACC12095",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF1",
+            transactions: 3,
+            revenue: 63279.33,
+            profit: 18811.89,
+            quantity: 9
+        },
+        {
+            sku: "FASACC25609",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF2",
+            transactions: 2,
+            revenue: 62966.44,
+            profit: 21022.36,
+            quantity: 5
+        },
+        {
+            sku: "FASMEN53512",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF5",
+            transactions: 2,
+            revenue: 62928.51,
+            profit: 18572.28,
+            quantity: 6
+        },
+        {
+            sku: "FASWOM35488",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF3",
+            transactions: 2,
+            revenue: 62706.66,
+            profit: 21125.88,
+            quantity: 6
+        },
+        {
+            sku: "FASWOM16287",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF1",
+            transactions: 4,
+            revenue: 62562.66,
+            profit: 21881.42,
+            quantity: 8
+        },
+        {
+            sku: "FASACC13330",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF1",
+            transactions: 2,
+            revenue: 62247.18,
+            profit: 18609.99,
+            quantity: 6
+        },
+        {
+            sku: "FASACC22080",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF2",
+            transactions: 2,
+            revenue: 62188.95,
+            profit: 20727.30,
+            quantity: 6
+        },
+        {
+            sku: "FASKID24352",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF2",
+            transactions: 2,
+            revenue: 62188.91,
+            profit: 16967.80,
+            quantity: 5
+        },
+        {
+            sku: "FASMEN46251",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF4",
+            transactions: 2,
+            revenue: 62076.60,
+            profit: 18547.80,
+            quantity: 6
+        },
+        {
+            sku: "FASACC49536",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF4",
+            transactions: 2,
+            revenue: 62036.73,
+            profit: 16896.78,
+            quantity: 6
+        },
+        {
+            sku: "FASACC22348",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF2",
+            transactions: 2,
+            revenue: 62029.06,
+            profit: 15920.33,
+            quantity: 5
+        },
+        {
+            sku: "FASACC11931",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF1",
+            transactions: 2,
+            revenue: 61735.26,
+            profit: 21576.90,
+            quantity: 6
+        },
+        {
+            sku: "FASACC48336",
+            category: "Fashion",
+            subCategory: "Accessories",
+            brand: "BrandF4",
+            transactions: 2,
+            revenue: 61626.15,
+            profit: 19644.00,
+            quantity: 6
+        },
+        {
+            sku: "FASKID32979",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF3",
+            transactions: 2,
+            revenue: 61609.47,
+            profit: 18081.54,
+            quantity: 6
+        },
+        {
+            sku: "FASWOM38792",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF3",
+            transactions: 3,
+            revenue: 61580.48,
+            profit: 16290.05,
+            quantity: 8
+        },
+        {
+            sku: "FASKID57718",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF5",
+            transactions: 3,
+            revenue: 61396.78,
+            profit: 20538.00,
+            quantity: 8
+        },
+        {
+            sku: "FASKID25680",
+            category: "Fashion",
+            subCategory: "Kids",
+            brand: "BrandF2",
+            transactions: 3,
+            revenue: 61387.42,
+            profit: 20482.92,
+            quantity: 7
+        },
+        {
+            sku: "FASMEN12645",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF1",
+            transactions: 2,
+            revenue: 61227.00,
+            profit: 21036.30,
+            quantity: 6
+        },
+        {
+            sku: "FASMEN26478",
+            category: "Fashion",
+            subCategory: "Men",
+            brand: "BrandF2",
+            transactions: 2,
+            revenue: 61027.55,
+            profit: 19564.60,
+            quantity: 5
+        },
+        {
+            sku: "FASWOM33815",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF3",
+            transactions: 3,
+            revenue: 61003.62,
+            profit: 19476.20,
+            quantity: 6
+        },
+        {
+            sku: "FASWOM12289",
+            category: "Fashion",
+            subCategory: "Women",
+            brand: "BrandF1",
+            transactions: 2,
+            revenue: 60926.43,
+            profit: 18951.30,
+            quantity: 6
+        },
     ]
 };
 
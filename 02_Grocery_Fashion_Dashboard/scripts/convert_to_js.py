@@ -1,203 +1,144 @@
 """
 Convert Dashboard CSVs to JavaScript Data for Interactive Dashboard
+Each section is streamed from its CSV straight to the output file
 """
 
+import os
+
 import pandas as pd
-import json
+
+from js_emitter import write_dashboard_js, write_bundle, write_manifest
+
+# Output layout: 'pretty' (readable, the default), 'minified' (no whitespace),
+# or 'columnar' (one array per field, smallest for very large tables)
+JS_LAYOUT = 'pretty'
+OUTPUT_FILE = 'dashboard/dashboard_data.js'
+
+# Per-panel bundles loaded on demand by interactive_dashboard.html; the
+# manifest holds the KPIs and bundle list so the page can paint immediately
+WRITE_BUNDLES = True
+BUNDLE_DIR = 'dashboard/bundles'
+BUNDLES = {
+    'categories': ['categories', 'stockAgeing', 'subCategories', 'marginAnalysis'],
+    'monthly': ['monthlyTrends'],
+    'pos': ['posData'],
+    'brands': ['topBrands'],
+    'skus': ['topSkus']
+}
+
+# (js key, comment, source CSV, [(field, CSV column, kind)], row limit)
+SECTIONS = [
+    ('categories', 'Category Performance', 'dashboard/category_performance.csv', [
+        ('name', 'Category', 'str'),
+        ('transactions', 'Transactions', 'int'),
+        ('revenue', 'TotalRevenue', 'float'),
+        ('avgRevenue', 'AvgRevenue', 'float'),
+        ('profit', 'TotalProfit', 'float'),
+        ('margin', 'AvgMargin', 'float'),
+        ('quantity', 'TotalQuantity', 'int'),
+        ('skus', 'UniqueSKUs', 'int')
+    ], None),
+    ('monthlyTrends', 'Monthly Trends', 'dashboard/monthly_trends.csv', [
+        ('month', 'YearMonth', 'str'),
+        ('category', 'Category', 'str'),
+        ('transactions', 'Transactions', 'int'),
+        ('revenue', 'Revenue', 'float'),
+        ('profit', 'Profit', 'float'),
+        ('quantity', 'Quantity', 'int')
+    ], None),
+    ('stockAgeing', 'Stock Ageing', 'dashboard/stock_ageing_overall.csv', [
+        ('category', 'StockAgeCategory', 'str'),
+        ('transactions', 'Transactions', 'int'),
+        ('revenue', 'TotalRevenue', 'float'),
+        ('quantity', 'TotalQuantity', 'int'),
+        ('avgAge', 'AvgStockAge', 'float')
+    ], None),
+    ('posData', 'POS Comparison', 'dashboard/pos_comparison.csv', [
+        ('pos', 'POS_System', 'str'),
+        ('store', 'Store', 'str'),
+        ('transactions', 'Transactions', 'int'),
+        ('revenue', 'TotalRevenue', 'float'),
+        ('profit', 'TotalProfit', 'float'),
+        ('margin', 'AvgMargin', 'float'),
+        ('quantity', 'TotalQuantity', 'int'),
+        ('skus', 'UniqueSKUs', 'int')
+    ], None),
+    ('subCategories', 'SubCategory Performance', 'dashboard/subcategory_performance.csv', [
+        ('category', 'Category', 'str'),
+        ('subCategory', 'SubCategory', 'str'),
+        ('transactions', 'Transactions', 'int'),
+        ('revenue', 'TotalRevenue', 'float'),
+        ('avgRevenue', 'AvgRevenue', 'float'),
+        ('profit', 'TotalProfit', 'float'),
+        ('margin', 'AvgMargin', 'float'),
+        ('quantity', 'TotalQuantity', 'int')
+    ], None),
+    ('topBrands', 'Top 10 Brands', 'dashboard/brand_performance.csv', [
+        ('category', 'Category', 'str'),
+        ('brand', 'Brand', 'str'),
+        ('transactions', 'Transactions', 'int'),
+        ('revenue', 'TotalRevenue', 'float'),
+        ('profit', 'TotalProfit', 'float'),
+        ('margin', 'AvgMargin', 'float'),
+        ('skus', 'UniqueSKUs', 'int')
+    ], 10),
+    ('marginAnalysis', 'Margin Analysis', 'dashboard/margin_analysis.csv', [
+        ('category', 'Category', 'str'),
+        ('subCategory', 'SubCategory', 'str'),
+        ('avgMargin', 'AvgMargin', 'float'),
+        ('minMargin', 'MinMargin', 'float'),
+        ('maxMargin', 'MaxMargin', 'float'),
+        ('profit', 'TotalProfit', 'float'),
+        ('revenue', 'TotalRevenue', 'float'),
+        ('profitMargin', 'ProfitMargin%', 'float')
+    ], None),
+    ('topSkus', 'Top 100 SKUs', 'dashboard/top_100_skus.csv', [
+        ('sku', 'SKU_ID', 'str'),
+        ('category', 'Category', 'str'),
+        ('subCategory', 'SubCategory', 'str'),
+        ('brand', 'Brand', 'str'),
+        ('transactions', 'Transactions', 'int'),
+        ('revenue', 'TotalRevenue', 'float'),
+        ('profit', 'TotalProfit', 'float'),
+        ('quantity', 'TotalQuantity', 'int')
+    ], None)
+]
 
 print("=" * 60)
 print("CONVERTING CSV TO JAVASCRIPT DATA")
 print("=" * 60)
 print()
 
-# Load all dashboard CSVs
-print("Loading dashboard data...")
-
-# 1. Summary KPIs
+# The KPI table is tiny; every other section is read in chunks while writing
 kpis_df = pd.read_csv('dashboard/summary_kpis.csv')
-kpis_data = dict(zip(kpis_df['Metric'], kpis_df['Value']))
-
-# 2. Category Performance
-category_df = pd.read_csv('dashboard/category_performance.csv')
-
-# 3. Monthly Trends
-monthly_df = pd.read_csv('dashboard/monthly_trends.csv')
+kpis_data = list(zip(kpis_df['Metric'], kpis_df['Value']))
 
-# 4. Stock Ageing
-stock_ageing_df = pd.read_csv('dashboard/stock_ageing_overall.csv')
+print(f"Writing {len(SECTIONS) + 1} sections ({JS_LAYOUT} layout)...")
+write_dashboard_js(OUTPUT_FILE, kpis_data, SECTIONS, layout=JS_LAYOUT)
 
-# 5. POS Comparison
-pos_df = pd.read_csv('dashboard/pos_comparison.csv')
-
-# 6. SubCategory Performance
-subcat_df = pd.read_csv('dashboard/subcategory_performance.csv')
-
-# 7. Brand Performance
-brand_df = pd.read_csv('dashboard/brand_performance.csv')
-
-# 8. Margin Analysis
-margin_df = pd.read_csv('dashboard/margin_analysis.csv')
-
-print("✓ All data loaded")
+print(f"✓ Created: {OUTPUT_FILE}")
 print()
 
-# Create JavaScript data file
-js_content = """
-// Grocery + Fashion Dashboard - Interactive Data
-// Auto-generated from CSV files
-
-const dashboardData = {
-    
-    // Key Performance Indicators
-    kpis: {
-"""
-
-# Add KPIs
-for metric, value in kpis_data.items():
-    js_content += f'        "{metric}": "{value}",\n'
-
-js_content += """    },
-    
-    // Category Performance
-    categories: [
-"""
-
-for _, row in category_df.iterrows():
-    js_content += f"""        {{
-            name: "{row['Category']}",
-            transactions: {row['Transactions']},
-            revenue: {row['TotalRevenue']:.2f},
-            avgRevenue: {row['AvgRevenue']:.2f},
-            profit: {row['TotalProfit']:.2f},
-            margin: {row['AvgMargin']:.2f},
-            quantity: {row['TotalQuantity']},
-            skus: {row['UniqueSKUs']}
-        }},
-"""
-
-js_content += """    ],
-    
-    // Monthly Trends
-    monthlyTrends: [
-"""
-
-for _, row in monthly_df.iterrows():
-    js_content += f"""        {{
-            month: "{row['YearMonth']}",
-            category: "{row['Category']}",
-            transactions: {row['Transactions']},
-            revenue: {row['Revenue']:.2f},
-            profit: {row['Profit']:.2f},
-            quantity: {row['Quantity']}
-        }},
-"""
-
-js_content += """    ],
-    
-    // Stock Ageing
-    stockAgeing: [
-"""
-
-for _, row in stock_ageing_df.iterrows():
-    js_content += f"""        {{
-            category: "{row['StockAgeCategory']}",
-            transactions: {row['Transactions']},
-            revenue: {row['TotalRevenue']:.2f},
-            quantity: {row['TotalQuantity']},
-            avgAge: {row['AvgStockAge']:.2f}
-        }},
-"""
-
-js_content += """    ],
-    
-    // POS Comparison
-    posData: [
-"""
-
-for _, row in pos_df.iterrows():
-    js_content += f"""        {{
-            pos: "{row['POS_System']}",
-            store: "{row['Store']}",
-            transactions: {row['Transactions']},
-            revenue: {row['TotalRevenue']:.2f},
-            profit: {row['TotalProfit']:.2f},
-            margin: {row['AvgMargin']:.2f},
-            quantity: {row['TotalQuantity']},
-            skus: {row['UniqueSKUs']}
-        }},
-"""
-
-js_content += """    ],
-    
-    // SubCategory Performance
-    subCategories: [
-"""
-
-for _, row in subcat_df.iterrows():
-    js_content += f"""        {{
-            category: "{row['Category']}",
-            subCategory: "{row['SubCategory']}",
-            transactions: {row['Transactions']},
-            revenue: {row['TotalRevenue']:.2f},
-            avgRevenue: {row['AvgRevenue']:.2f},
-            profit: {row['TotalProfit']:.2f},
-            margin: {row['AvgMargin']:.2f},
-            quantity: {row['TotalQuantity']}
-        }},
-"""
-
-js_content += """    ],
-    
-    // Top 10 Brands
-    topBrands: [
-"""
-
-for _, row in brand_df.head(10).iterrows():
-    js_content += f"""        {{
-            category: "{row['Category']}",
-            brand: "{row['Brand']}",
-            transactions: {row['Transactions']},
-            revenue: {row['TotalRevenue']:.2f},
-            profit: {row['TotalProfit']:.2f},
-            margin: {row['AvgMargin']:.2f},
-            skus: {row['UniqueSKUs']}
-        }},
-"""
-
-js_content += """    ],
-    
-    // Margin Analysis
-    marginAnalysis: [
-"""
-
-for _, row in margin_df.iterrows():
-    js_content += f"""        {{
-            category: "{row['Category']}",
-            subCategory: "{row['SubCategory']}",
-            avgMargin: {row['AvgMargin']:.2f},
-            minMargin: {row['MinMargin']:.2f},
-            maxMargin: {row['MaxMargin']:.2f},
-            profit: {row['TotalProfit']:.2f},
-            revenue: {row['TotalRevenue']:.2f},
-            profitMargin: {row['ProfitMargin%']:.2f}
-        }},
-"""
-
-js_content += """    ]
-};
-
-// Export for use in HTML
-if (typeof module !== 'undefined' && module.exports) {
-    module.exports = dashboardData;
-}
-"""
-
-# Save JavaScript file
-with open('dashboard/dashboard_data.js', 'w', encoding='utf-8') as f:
-    f.write(js_content)
-
-print("✓ Created: dashboard/dashboard_data.js")
-print()
+if WRITE_BUNDLES:
+    print(f"Writing {len(BUNDLES)} panel bundles...")
+    os.makedirs(BUNDLE_DIR, exist_ok=True)
+    sections_by_key = {section[0]: section for section in SECTIONS}
+    manifest = {}
+    for name, keys in BUNDLES.items():
+        path = os.path.join(BUNDLE_DIR, f'{name}.js')
+        size = write_bundle(path, name, [sections_by_key[key] for key in keys], layout=JS_LAYOUT)
+        # Paths in the manifest are relative to the dashboard page
+        manifest[name] = {
+            'file': os.path.relpath(path, 'dashboard').replace(os.sep, '/'),
+            'sections': keys,
+            'bytes': size
+        }
+        print(f"✓ Created: {path} ({size:,} bytes)")
+
+    manifest_file = os.path.join(BUNDLE_DIR, 'manifest.js')
+    write_manifest(manifest_file, kpis_data, manifest, layout=JS_LAYOUT)
+    print(f"✓ Created: {manifest_file}")
+    print()
 print("=" * 60)
 print("CONVERSION COMPLETED!")
 print("=" * 60)
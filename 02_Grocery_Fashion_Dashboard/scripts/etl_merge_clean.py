@@ -3,191 +3,217 @@ ETL Pipeline - Merge and Clean POS1 + POS2 Data
 Combines data from both POS systems with conflict resolution and data quality checks
 """
 
+from collections import Counter
+
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
+from pos_etl import (HashedKeySet, clean_pos_frame, print_issues,
+                     add_features, summarize_frame, merge_summaries)
+from pos_storage import PYARROW_AVAILABLE, DATASET_DIR, reset_dataset, reset_state, write_partitions
+
+# ETL mode: 'in_memory' loads both POS files at once, 'streaming' processes
+# them CHUNK_SIZE rows at a time with bounded memory
+ETL_MODE = 'in_memory'
+CHUNK_SIZE = 500_000
+
+POS_FILES = ['data/pos1_transactions.csv', 'data/pos2_transactions.csv']
+OUTPUT_FILE = 'data/merged_pos_data.csv'
+
+# The partitioned Parquet dataset is what downstream stages read; the flat
+# CSV is an optional export for Excel/Power BI
+WRITE_PARQUET = True
+EXPORT_CSV = True
+
 print("=" * 60)
 print("ETL PIPELINE - MERGE & CLEAN POS DATA")
 print("=" * 60)
 print()
 
-# ============================================
-# LOAD DATA
-# ============================================
+issues = Counter()
 
-print("Step 1: Loading POS datasets...")
-print()
-
-try:
-    df_pos1 = pd.read_csv('data/pos1_transactions.csv')
-    df_pos2 = pd.read_csv('data/pos2_transactions.csv')
+if WRITE_PARQUET and not PYARROW_AVAILABLE:
+    print("⚠️  pyarrow not available - skipping Parquet dataset, writing CSV only")
+    print()
+    WRITE_PARQUET = False
+    EXPORT_CSV = True
+if WRITE_PARQUET:
+    reset_dataset()
+
+# A full rebuild invalidates any incremental aggregate state
+reset_state()
+
+if ETL_MODE == 'streaming':
+    # ============================================
+    # STREAMING MERGE (LOAD → DEDUP → CLEAN → FEATURES → SAVE PER CHUNK)
+    # ============================================
     
-    print(f"✓ POS1 loaded: {len(df_pos1):,} records")
-    print(f"✓ POS2 loaded: {len(df_pos2):,} records")
+    print(f"Streaming POS datasets in chunks of {CHUNK_SIZE:,} records...")
+    print()
+    
+    seen_ids = HashedKeySet()
+    seen_skus = HashedKeySet()
+    summaries = []
+    initial_count = 0
+    duplicates = 0
+    final_count = 0
+    date_min, date_max = None, None
+    header_written = False
+    part = 0
+    
+    for pos_file in POS_FILES:
+        try:
+            reader = pd.read_csv(pos_file, chunksize=CHUNK_SIZE)
+        except FileNotFoundError as e:
+            print(f"ERROR: {e}")
+            print("Please run generate_pos_data.py first!")
+            exit(1)
+        
+        file_count = 0
+        for chunk in reader:
+            file_count += len(chunk)
+            
+            # Drop TransactionIDs already seen in this or an earlier chunk
+            is_new = seen_ids.add(chunk['TransactionID'])
+            duplicates += int((~is_new).sum())
+            chunk = chunk[is_new]
+            initial_count += len(chunk)
+            
+            chunk = add_features(clean_pos_frame(chunk, issues))
+            final_count += len(chunk)
+            if chunk.empty:
+                continue
+            
+            seen_skus.add(chunk['SKU_ID'])
+            summaries.append(summarize_frame(chunk))
+            chunk_min, chunk_max = chunk['Date'].min(), chunk['Date'].max()
+            date_min = chunk_min if date_min is None else min(date_min, chunk_min)
+            date_max = chunk_max if date_max is None else max(date_max, chunk_max)
+            
+            if WRITE_PARQUET:
+                write_partitions(chunk, part)
+                part += 1
+            if EXPORT_CSV:
+                chunk.to_csv(OUTPUT_FILE, mode='a' if header_written else 'w',
+                             header=not header_written, index=False, date_format='%Y-%m-%d')
+                header_written = True
+        
+        print(f"✓ {pos_file}: {file_count:,} records streamed")
+    
+    print(f"✓ Duplicate check: {duplicates} duplicates found")
+    print()
+    print_issues(issues)
+    
+    removed = initial_count - final_count
+    print()
+    print(f"✓ Cleaning complete: {removed:,} invalid records removed ({removed/initial_count*100:.2f}%)")
+    print(f"✓ Final dataset: {final_count:,} valid records")
+    if WRITE_PARQUET:
+        print(f"✓ Saved: {DATASET_DIR}/ (Parquet, partitioned by POS_System/Year/Month)")
+    if EXPORT_CSV:
+        print(f"✓ Saved: {OUTPUT_FILE}")
+    print()
+    
+    summary = merge_summaries(summaries)
+    unique_skus = len(seen_skus)
+else:
+    # ============================================
+    # LOAD DATA
+    # ============================================
+
+    print("Step 1: Loading POS datasets...")
     print()
-except FileNotFoundError as e:
-    print(f"ERROR: {e}")
-    print("Please run generate_pos_data.py first!")
-    exit(1)
-
-# ============================================
-# MERGE DATASETS
-# ============================================
-
-print("Step 2: Merging datasets...")
-print()
-
-# Combine both POS systems
-df_combined = pd.concat([df_pos1, df_pos2], ignore_index=True)
-print(f"✓ Combined dataset: {len(df_combined):,} records")
-
-# Check for duplicates
-duplicates = df_combined.duplicated(subset=['TransactionID']).sum()
-print(f"✓ Duplicate check: {duplicates} duplicates found")
-if duplicates > 0:
-    df_combined = df_combined.drop_duplicates(subset=['TransactionID'])
-    print(f"  Removed duplicates, new count: {len(df_combined):,}")
-print()
-
-# ============================================
-# DATA CLEANING & VALIDATION
-# ============================================
-
-print("Step 3: Data cleaning and validation...")
-print()
-
-initial_count = len(df_combined)
-
-# Convert date columns
-date_columns = ['Date', 'ManufacturingDate', 'ExpiryDate']
-for col in date_columns:
-    df_combined[col] = pd.to_datetime(df_combined[col])
-
-print("✓ Date columns converted to datetime")
-
-# Validate numerical columns
-numeric_cols = ['MRP', 'SellingPrice', 'Quantity', 'NetAmount', 'CostPrice', 'Profit']
-
-# Remove rows with negative or zero values in critical columns
-for col in numeric_cols:
-    invalid_count = (df_combined[col] <= 0).sum()
-    if invalid_count > 0:
-        print(f"  Warning: {invalid_count} invalid values in {col}")
-        df_combined = df_combined[df_combined[col] > 0]
 
-print(f"✓ Numerical validation complete")
+    try:
+        df_pos1 = pd.read_csv(POS_FILES[0])
+        df_pos2 = pd.read_csv(POS_FILES[1])
+    
+        print(f"✓ POS1 loaded: {len(df_pos1):,} records")
+        print(f"✓ POS2 loaded: {len(df_pos2):,} records")
+        print()
+    except FileNotFoundError as e:
+        print(f"ERROR: {e}")
+        print("Please run generate_pos_data.py first!")
+        exit(1)
+
+    # ============================================
+    # MERGE DATASETS
+    # ============================================
+
+    print("Step 2: Merging datasets...")
+    print()
 
-# Validate pricing logic (SellingPrice <= MRP)
-price_issues = (df_combined['SellingPrice'] > df_combined['MRP']).sum()
-if price_issues > 0:
-    print(f"  Warning: {price_issues} records with SellingPrice > MRP")
-    df_combined = df_combined[df_combined['SellingPrice'] <= df_combined['MRP']]
+    # Combine both POS systems
+    df_combined = pd.concat([df_pos1, df_pos2], ignore_index=True)
+    print(f"✓ Combined dataset: {len(df_combined):,} records")
 
-# Validate margin calculations
-df_combined['CalculatedMargin'] = ((df_combined['SellingPrice'] - df_combined['CostPrice']) / df_combined['CostPrice'] * 100)
-margin_diff = abs(df_combined['MarginPercent'] - df_combined['CalculatedMargin'])
-margin_issues = (margin_diff > 1).sum()  # Allow 1% tolerance
-if margin_issues > 0:
-    print(f"  Warning: {margin_issues} records with margin calculation issues")
-    # Recalculate margin for these records
-    df_combined.loc[margin_diff > 1, 'MarginPercent'] = df_combined.loc[margin_diff > 1, 'CalculatedMargin']
+    # Check for duplicates
+    duplicates = df_combined.duplicated(subset=['TransactionID']).sum()
+    print(f"✓ Duplicate check: {duplicates} duplicates found")
+    if duplicates > 0:
+        df_combined = df_combined.drop_duplicates(subset=['TransactionID'])
+        print(f"  Removed duplicates, new count: {len(df_combined):,}")
+    print()
 
-df_combined = df_combined.drop('CalculatedMargin', axis=1)
+    # ============================================
+    # DATA CLEANING & VALIDATION
+    # ============================================
 
-print(f"✓ Pricing validation complete")
+    print("Step 3: Data cleaning and validation...")
+    print()
 
-# Validate date logic
-date_issues = (df_combined['ManufacturingDate'] > df_combined['Date']).sum()
-if date_issues > 0:
-    print(f"  Warning: {date_issues} records with manufacturing date after transaction date")
-    df_combined = df_combined[df_combined['ManufacturingDate'] <= df_combined['Date']]
+    initial_count = len(df_combined)
 
-expiry_issues = (df_combined['ExpiryDate'] < df_combined['ManufacturingDate']).sum()
-if expiry_issues > 0:
-    print(f"  Warning: {expiry_issues} records with expiry before manufacturing")
-    df_combined = df_combined[df_combined['ExpiryDate'] >= df_combined['ManufacturingDate']]
+    # Every rule is evaluated into one mask, so the frame is copied once
+    df_combined = clean_pos_frame(df_combined, issues)
+    print("✓ Date columns converted to datetime")
+    print_issues(issues)
 
-print(f"✓ Date validation complete")
+    final_count = len(df_combined)
+    removed = initial_count - final_count
 
-# Check for missing values
-missing_values = df_combined.isnull().sum()
-if missing_values.sum() > 0:
-    print("\n  Missing values detected:")
-    print(missing_values[missing_values > 0])
-    df_combined = df_combined.dropna()
-    print(f"  Removed rows with missing values")
+    print()
+    print(f"✓ Cleaning complete: {removed:,} invalid records removed ({removed/initial_count*100:.2f}%)")
+    print(f"✓ Final dataset: {final_count:,} valid records")
+    print()
 
-final_count = len(df_combined)
-removed = initial_count - final_count
+    # ============================================
+    # FEATURE ENGINEERING
+    # ============================================
 
-print()
-print(f"✓ Cleaning complete: {removed:,} invalid records removed ({removed/initial_count*100:.2f}%)")
-print(f"✓ Final dataset: {final_count:,} valid records")
-print()
+    print("Step 4: Feature engineering...")
+    print()
 
-# ============================================
-# FEATURE ENGINEERING
-# ============================================
+    df_combined = add_features(df_combined)
 
-print("Step 4: Feature engineering...")
-print()
+    print("✓ Added temporal features (Year, Month, Quarter, Week, DayOfWeek)")
+    print("✓ Added weekend flag")
+    print("✓ Added margin categories")
+    print("✓ Added revenue categories")
+    print("✓ Added stock health indicators")
+    print()
 
-# Add Month, Quarter, Year
-df_combined['Year'] = df_combined['Date'].dt.year
-df_combined['Month'] = df_combined['Date'].dt.month
-df_combined['MonthName'] = df_combined['Date'].dt.strftime('%b')
-df_combined['Quarter'] = df_combined['Date'].dt.quarter
-df_combined['DayOfWeek'] = df_combined['Date'].dt.day_name()
-df_combined['WeekNumber'] = df_combined['Date'].dt.isocalendar().week
-
-# Add IsWeekend flag
-df_combined['IsWeekend'] = df_combined['Date'].dt.dayofweek.isin([5, 6]).astype(int)
-
-# Add Margin Category
-df_combined['MarginCategory'] = pd.cut(
-    df_combined['MarginPercent'],
-    bins=[0, 15, 30, 45, 100],
-    labels=['Low', 'Medium', 'High', 'Very High']
-)
-
-# Add Revenue Category
-df_combined['RevenueCategory'] = pd.cut(
-    df_combined['NetAmount'],
-    bins=[0, 500, 2000, 5000, float('inf')],
-    labels=['Low', 'Medium', 'High', 'Very High']
-)
-
-# Add Stock Health Flag
-df_combined['StockHealth'] = df_combined['StockAgeCategory'].map({
-    'Fresh': 'Excellent',
-    'Normal': 'Good',
-    'Ageing': 'Warning',
-    'Old': 'Critical'
-})
-
-print("✓ Added temporal features (Year, Month, Quarter, Week, DayOfWeek)")
-print("✓ Added weekend flag")
-print("✓ Added margin categories")
-print("✓ Added revenue categories")
-print("✓ Added stock health indicators")
-print()
+    # ============================================
+    # SAVE MERGED DATA
+    # ============================================
 
-# ============================================
-# SAVE MERGED DATA
-# ============================================
+    print("Step 5: Saving merged dataset...")
+    print()
 
-print("Step 5: Saving merged dataset...")
-print()
+    if WRITE_PARQUET:
+        write_partitions(df_combined, 0)
+        print(f"✓ Saved: {DATASET_DIR}/ (Parquet, partitioned by POS_System/Year/Month)")
 
-# Save with date columns as strings for compatibility
-df_save = df_combined.copy()
-for col in date_columns:
-    df_save[col] = df_save[col].dt.strftime('%Y-%m-%d')
+    if EXPORT_CSV:
+        # Save with date columns as strings for compatibility
+        df_combined.to_csv(OUTPUT_FILE, index=False, date_format='%Y-%m-%d')
+        print(f"✓ Saved: {OUTPUT_FILE}")
+    print()
 
-df_save.to_csv('data/merged_pos_data.csv', index=False)
-print("✓ Saved: data/merged_pos_data.csv")
-print()
+    summary = summarize_frame(df_combined)
+    unique_skus = df_combined['SKU_ID'].nunique()
+    date_min, date_max = df_combined['Date'].min(), df_combined['Date'].max()
 
 # ============================================
 # SUMMARY STATISTICS
@@ -198,43 +224,42 @@ print("MERGED DATASET SUMMARY")
 print("=" * 60)
 print()
 
-print(f"Total Records: {len(df_combined):,}")
-print(f"Date Range: {df_combined['Date'].min().date()} to {df_combined['Date'].max().date()}")
-print(f"Unique SKUs: {df_combined['SKU_ID'].nunique():,}")
+# Both modes report from the same per-group roll-up
+total_records = summary['Records'].sum()
+
+print(f"Total Records: {total_records:,}")
+print(f"Date Range: {date_min.date()} to {date_max.date()}")
+print(f"Unique SKUs: {unique_skus:,}")
 print()
 
 print("By POS System:")
-for pos in df_combined['POS_System'].unique():
-    count = len(df_combined[df_combined['POS_System'] == pos])
-    revenue = df_combined[df_combined['POS_System'] == pos]['NetAmount'].sum()
-    print(f"  {pos}: {count:,} records ({count/len(df_combined)*100:.1f}%), ₹{revenue:,.2f}")
+by_pos = summary.groupby(level='POS_System').sum()
+for pos, row in by_pos.iterrows():
+    count = row['Records']
+    print(f"  {pos}: {count:,.0f} records ({count/total_records*100:.1f}%), ₹{row['Revenue']:,.2f}")
 print()
 
 print("By Category:")
-for cat in df_combined['Category'].unique():
-    cat_data = df_combined[df_combined['Category'] == cat]
-    count = len(cat_data)
-    revenue = cat_data['NetAmount'].sum()
-    avg_margin = cat_data['MarginPercent'].mean()
+by_category = summary.groupby(level='Category').sum()
+for cat, row in by_category.iterrows():
+    count = row['Records']
     print(f"  {cat}:")
-    print(f"    Records: {count:,} ({count/len(df_combined)*100:.1f}%)")
-    print(f"    Revenue: ₹{revenue:,.2f}")
-    print(f"    Avg Margin: {avg_margin:.2f}%")
+    print(f"    Records: {count:,.0f} ({count/total_records*100:.1f}%)")
+    print(f"    Revenue: ₹{row['Revenue']:,.2f}")
+    print(f"    Avg Margin: {row['MarginSum']/count:.2f}%")
 print()
 
 print("By SubCategory:")
-for subcat in sorted(df_combined['SubCategory'].unique()):
-    subcat_data = df_combined[df_combined['SubCategory'] == subcat]
-    count = len(subcat_data)
-    revenue = subcat_data['NetAmount'].sum()
-    print(f"  {subcat}: {count:,} records, ₹{revenue:,.2f}")
+by_subcategory = summary.groupby(level='SubCategory').sum()
+for subcat, row in by_subcategory.iterrows():
+    print(f"  {subcat}: {row['Records']:,.0f} records, ₹{row['Revenue']:,.2f}")
 print()
 
 print("Financial Summary:")
-total_revenue = df_combined['NetAmount'].sum()
-total_profit = df_combined['Profit'].sum()
-avg_margin = df_combined['MarginPercent'].mean()
-avg_transaction = df_combined['NetAmount'].mean()
+total_revenue = summary['Revenue'].sum()
+total_profit = summary['Profit'].sum()
+avg_margin = summary['MarginSum'].sum() / total_records
+avg_transaction = total_revenue / total_records
 print(f"  Total Revenue: ₹{total_revenue:,.2f}")
 print(f"  Total Profit: ₹{total_profit:,.2f}")
 print(f"  Average Margin: {avg_margin:.2f}%")
@@ -242,16 +267,16 @@ print(f"  Average Transaction: ₹{avg_transaction:.2f}")
 print()
 
 print("Stock Ageing Analysis:")
+by_age = summary.groupby(level='StockAgeCategory').sum()
 for age_cat in ['Fresh', 'Normal', 'Ageing', 'Old']:
-    age_data = df_combined[df_combined['StockAgeCategory'] == age_cat]
-    count = len(age_data)
-    pct = count / len(df_combined) * 100
-    revenue = age_data['NetAmount'].sum()
+    count = by_age['Records'].get(age_cat, 0)
+    pct = count / total_records * 100
+    revenue = by_age['Revenue'].get(age_cat, 0)
     print(f"  {age_cat}: {count:,} ({pct:.1f}%), ₹{revenue:,.2f}")
 print()
 
 print("Top 5 Brands by Revenue:")
-top_brands = df_combined.groupby('Brand')['NetAmount'].sum().sort_values(ascending=False).head()
+top_brands = summary.groupby(level='Brand')['Revenue'].sum().sort_values(ascending=False).head()
 for brand, revenue in top_brands.items():
     print(f"  {brand}: ₹{revenue:,.2f}")
 print()
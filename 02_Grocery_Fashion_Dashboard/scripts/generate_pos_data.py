@@ -11,6 +11,7 @@ import random
 # Set random seed for reproducibility
 np.random.seed(42)
 random.seed(42)
+rng = np.random.default_rng(42)
 
 print("=" * 60)
 print("GROCERY + FASHION DASHBOARD - DATA GENERATION")
@@ -21,6 +22,19 @@ print()
 # CONFIGURATION
 # ============================================
 
+# Generation engine: 'vectorized' draws whole store-months as NumPy columns,
+# 'loop' builds one dict per transaction (original row-by-row generator)
+GENERATION_ENGINE = 'vectorized'
+
+# Multiplier on the daily base volume (raise for load testing, ~450 gives ~50M rows)
+VOLUME_SCALE = 1
+
+# Output files per POS system
+POS_FILES = {
+    'POS1': 'data/pos1_transactions.csv',
+    'POS2': 'data/pos2_transactions.csv'
+}
+
 # Date range
 START_DATE = datetime(2024, 1, 1)
 END_DATE = datetime(2024, 12, 31)
@@ -68,7 +82,19 @@ FESTIVALS = [
     datetime(2024, 12, 25), # Christmas
 ]
 
+DISCOUNT_OPTIONS = [0, 5, 10, 15, 20, 25, 30]
+STOCK_AGE_BINS = [30, 90, 180]  # Upper bounds for Fresh, Normal, Ageing
+STOCK_AGE_LABELS = ['Fresh', 'Normal', 'Ageing', 'Old']
+
+OUTPUT_COLUMNS = [
+    'TransactionID', 'POS_System', 'Store', 'Date', 'Category', 'SubCategory',
+    'SKU_ID', 'Brand', 'MRP', 'SellingPrice', 'DiscountPercent', 'Quantity',
+    'NetAmount', 'CostPrice', 'MarginPercent', 'Profit', 'ManufacturingDate',
+    'ExpiryDate', 'StockAgeDays', 'DaysToExpiry', 'StockAgeCategory'
+]
+
 print("Configuration:")
+print(f"  Engine: {GENERATION_ENGINE} (volume scale x{VOLUME_SCALE})")
 print(f"  Date Range: {START_DATE.date()} to {END_DATE.date()}")
 print(f"  POS Systems: {POS_SYSTEMS}")
 print(f"  Total Stores: {sum(len(stores) for stores in STORES.values())}")
@@ -112,110 +138,251 @@ def calculate_stock_age(manufacturing_date, transaction_date):
     """Calculate stock age in days"""
     return (transaction_date - manufacturing_date).days
 
+# ============================================
+# VECTORIZED ENGINE
+# ============================================
+
+CATEGORY_NAMES = list(CATEGORIES.keys())
+CATEGORY_WEIGHTS = [0.6, 0.4]
+ALL_STORES = [store for pos in POS_SYSTEMS for store in STORES[pos]]
+
+# Flattened lookup tables: a category's subcategories/brands start at its offset
+SUBCATEGORY_NAMES = [sub for cat in CATEGORY_NAMES for sub in CATEGORIES[cat]['subcategories']]
+BRAND_NAMES = [brand for cat in CATEGORY_NAMES for brand in CATEGORIES[cat]['brands']]
+SUB_COUNT = np.array([len(CATEGORIES[cat]['subcategories']) for cat in CATEGORY_NAMES])
+BRAND_COUNT = np.array([len(CATEGORIES[cat]['brands']) for cat in CATEGORY_NAMES])
+SUB_OFFSET = np.concatenate([[0], np.cumsum(SUB_COUNT)[:-1]])
+BRAND_OFFSET = np.concatenate([[0], np.cumsum(BRAND_COUNT)[:-1]])
+
+PRICE_LOW, PRICE_HIGH = np.array([CATEGORIES[cat]['price_range'] for cat in CATEGORY_NAMES], dtype=float).T
+MARGIN_LOW, MARGIN_HIGH = np.array([CATEGORIES[cat]['margin_range'] for cat in CATEGORY_NAMES], dtype=float).T
+SHELF_LOW, SHELF_HIGH = np.array([CATEGORIES[cat]['shelf_life_days'] for cat in CATEGORY_NAMES]).T
+# Fashion tends to have lower qty per transaction
+MAX_QUANTITY = np.array([3 if cat == 'Fashion' else 5 for cat in CATEGORY_NAMES])
+
+# SKU prefix per (subcategory, brand) pair, same format as generate_sku_id
+SKU_PREFIX = np.array([
+    [f"{cat[:3].upper()}{sub[:3].upper()}{brand[-1]}" for brand in BRAND_NAMES]
+    for cat in CATEGORY_NAMES for sub in CATEGORIES[cat]['subcategories']
+])
+
+def get_seasonality_factors(dates):
+    """Vectorized get_seasonality_factor for a DatetimeIndex"""
+    factors = np.ones(len(dates))
+    
+    # Weekend boost
+    factors[dates.dayofweek >= 5] *= WEEKEND_MULTIPLIER
+    
+    # Festival boost (±3 days)
+    days = dates.values.astype('datetime64[D]')
+    festivals = np.array(FESTIVALS, dtype='datetime64[D]')
+    offsets = np.abs((days[:, None] - festivals[None, :]).astype(np.int64))
+    factors[(offsets <= 3).any(axis=1)] *= FESTIVAL_MULTIPLIER
+    
+    # Month-end boost (last 5 days)
+    factors[(dates.days_in_month - dates.day) < 5] *= MONTH_END_MULTIPLIER
+    
+    return factors
+
+def generate_batch_vectorized(pos_system, store, dates, seasonality, first_id):
+    """Draw all transactions for a block of store-days as typed columns"""
+    base_transactions = rng.integers(30, 61, size=len(dates))
+    daily_transactions = (base_transactions * VOLUME_SCALE * seasonality).astype(np.int64)
+    n = int(daily_transactions.sum())
+    
+    txn_dates = np.repeat(dates.values.astype('datetime64[D]'), daily_transactions)
+    
+    # Product attributes
+    cat_idx = rng.choice(len(CATEGORY_NAMES), size=n, p=CATEGORY_WEIGHTS)
+    sub_idx = SUB_OFFSET[cat_idx] + (rng.random(n) * SUB_COUNT[cat_idx]).astype(np.int64)
+    brand_idx = BRAND_OFFSET[cat_idx] + (rng.random(n) * BRAND_COUNT[cat_idx]).astype(np.int64)
+    sku_ids = np.char.add(SKU_PREFIX[sub_idx, brand_idx], rng.integers(1000, 10000, size=n).astype(str))
+    
+    # Pricing
+    mrp = np.round(PRICE_LOW[cat_idx] + rng.random(n) * (PRICE_HIGH - PRICE_LOW)[cat_idx], 2)
+    discount_pct = rng.choice(DISCOUNT_OPTIONS, size=n)
+    selling_price = np.round(mrp * (1 - discount_pct / 100), 2)
+    quantity = rng.integers(1, MAX_QUANTITY[cat_idx] + 1)
+    net_amount = np.round(selling_price * quantity, 2)
+    
+    # Margin calculation
+    margin_pct = MARGIN_LOW[cat_idx] + rng.random(n) * (MARGIN_HIGH - MARGIN_LOW)[cat_idx]
+    cost_price = np.round(selling_price / (1 + margin_pct / 100), 2)
+    profit = np.round((selling_price - cost_price) * quantity, 2)
+    
+    # Stock information
+    stock_age_days = rng.integers(1, 181, size=n)
+    shelf_life_days = rng.integers(SHELF_LOW[cat_idx], SHELF_HIGH[cat_idx] + 1)
+    manufacturing_date = txn_dates - stock_age_days.astype('timedelta64[D]')
+    expiry_date = manufacturing_date + shelf_life_days.astype('timedelta64[D]')
+    stock_age_idx = np.searchsorted(STOCK_AGE_BINS, stock_age_days, side='left')
+    
+    transaction_ids = np.char.add(
+        f"{pos_system}_{store}_",
+        np.char.zfill(np.arange(first_id, first_id + n).astype(str), 8)
+    )
+    
+    return pd.DataFrame({
+        'TransactionID': transaction_ids,
+        'POS_System': pd.Categorical([pos_system] * n, categories=POS_SYSTEMS),
+        'Store': pd.Categorical([store] * n, categories=ALL_STORES),
+        'Date': txn_dates,
+        'Category': pd.Categorical.from_codes(cat_idx, CATEGORY_NAMES),
+        'SubCategory': np.array(SUBCATEGORY_NAMES)[sub_idx],
+        'SKU_ID': sku_ids,
+        'Brand': np.array(BRAND_NAMES)[brand_idx],
+        'MRP': mrp,
+        'SellingPrice': selling_price,
+        'DiscountPercent': discount_pct,
+        'Quantity': quantity,
+        'NetAmount': net_amount,
+        'CostPrice': cost_price,
+        'MarginPercent': np.round(margin_pct, 2),
+        'Profit': profit,
+        'ManufacturingDate': manufacturing_date,
+        'ExpiryDate': expiry_date,
+        'StockAgeDays': stock_age_days,
+        'DaysToExpiry': shelf_life_days - stock_age_days,
+        'StockAgeCategory': pd.Categorical.from_codes(stock_age_idx, STOCK_AGE_LABELS)
+    }, columns=OUTPUT_COLUMNS)
+
 # ============================================
 # DATA GENERATION
 # ============================================
 
 all_transactions = []
+summary_blocks = []
 transaction_id = 1
 
 print("Generating transactions...")
 print()
 
-for pos_system in POS_SYSTEMS:
-    print(f"Processing {pos_system}...")
-    stores = STORES[pos_system]
+if GENERATION_ENGINE == 'vectorized':
+    seasonality = get_seasonality_factors(DATE_RANGE)
+    month_starts = np.flatnonzero(DATE_RANGE.is_month_start)
+    month_bounds = list(zip(month_starts, list(month_starts[1:]) + [len(DATE_RANGE)]))
+    written_files = set()
+    
+    for pos_system in POS_SYSTEMS:
+        print(f"Processing {pos_system}...")
+        pos_file = POS_FILES[pos_system]
+        
+        for store in STORES[pos_system]:
+            print(f"  Generating data for {store}...", end=" ")
+            
+            store_transactions = 0
+            
+            # One batch per store-month keeps peak memory flat as VOLUME_SCALE grows
+            for lo, hi in month_bounds:
+                batch = generate_batch_vectorized(
+                    pos_system, store, DATE_RANGE[lo:hi], seasonality[lo:hi], transaction_id
+                )
+                batch.to_csv(pos_file, mode='a' if pos_file in written_files else 'w',
+                             header=pos_file not in written_files, index=False,
+                             date_format='%Y-%m-%d')
+                written_files.add(pos_file)
+                
+                summary_blocks.append(batch[['POS_System', 'Store', 'Category', 'NetAmount',
+                                             'Profit', 'MarginPercent', 'StockAgeCategory']])
+                transaction_id += len(batch)
+                store_transactions += len(batch)
+            
+            print(f"✓ {store_transactions:,} transactions")
+else:
+    for pos_system in POS_SYSTEMS:
+        print(f"Processing {pos_system}...")
+        stores = STORES[pos_system]
     
-    for store in stores:
-        print(f"  Generating data for {store}...", end=" ")
+        for store in stores:
+            print(f"  Generating data for {store}...", end=" ")
         
-        store_transactions = 0
+            store_transactions = 0
         
-        for date in DATE_RANGE:
-            # Calculate daily volume based on seasonality
-            base_transactions = random.randint(30, 60)
-            seasonality = get_seasonality_factor(date)
-            daily_transactions = int(base_transactions * seasonality)
+            for date in DATE_RANGE:
+                # Calculate daily volume based on seasonality
+                base_transactions = random.randint(30, 60)
+                seasonality = get_seasonality_factor(date)
+                daily_transactions = int(base_transactions * VOLUME_SCALE * seasonality)
             
-            for _ in range(daily_transactions):
-                # Select category (60% Grocery, 40% Fashion)
-                category = random.choices(
-                    list(CATEGORIES.keys()),
-                    weights=[0.6, 0.4]
-                )[0]
+                for _ in range(daily_transactions):
+                    # Select category (60% Grocery, 40% Fashion)
+                    category = random.choices(
+                        list(CATEGORIES.keys()),
+                        weights=[0.6, 0.4]
+                    )[0]
                 
-                cat_config = CATEGORIES[category]
-                subcategory = random.choice(cat_config['subcategories'])
-                brand = random.choice(cat_config['brands'])
+                    cat_config = CATEGORIES[category]
+                    subcategory = random.choice(cat_config['subcategories'])
+                    brand = random.choice(cat_config['brands'])
                 
-                # Generate SKU
-                sku_id = generate_sku_id(category, subcategory, brand)
+                    # Generate SKU
+                    sku_id = generate_sku_id(category, subcategory, brand)
                 
-                # Pricing
-                mrp = round(random.uniform(*cat_config['price_range']), 2)
-                discount_pct = random.choice([0, 5, 10, 15, 20, 25, 30])
-                selling_price = round(mrp * (1 - discount_pct/100), 2)
+                    # Pricing
+                    mrp = round(random.uniform(*cat_config['price_range']), 2)
+                    discount_pct = random.choice([0, 5, 10, 15, 20, 25, 30])
+                    selling_price = round(mrp * (1 - discount_pct/100), 2)
                 
-                # Quantity (fashion tends to have lower qty per transaction)
-                if category == 'Fashion':
-                    quantity = random.randint(1, 3)
-                else:
-                    quantity = random.randint(1, 5)
+                    # Quantity (fashion tends to have lower qty per transaction)
+                    if category == 'Fashion':
+                        quantity = random.randint(1, 3)
+                    else:
+                        quantity = random.randint(1, 5)
                 
-                net_amount = round(selling_price * quantity, 2)
+                    net_amount = round(selling_price * quantity, 2)
                 
-                # Margin calculation
-                margin_pct = random.uniform(*cat_config['margin_range'])
-                cost_price = round(selling_price / (1 + margin_pct/100), 2)
-                profit = round((selling_price - cost_price) * quantity, 2)
+                    # Margin calculation
+                    margin_pct = random.uniform(*cat_config['margin_range'])
+                    cost_price = round(selling_price / (1 + margin_pct/100), 2)
+                    profit = round((selling_price - cost_price) * quantity, 2)
                 
-                # Stock information
-                manufacturing_date = date - timedelta(days=random.randint(1, 180))
-                shelf_life_days = random.randint(*cat_config['shelf_life_days'])
-                stock_age_days = calculate_stock_age(manufacturing_date, date)
-                expiry_date = manufacturing_date + timedelta(days=shelf_life_days)
-                days_to_expiry = (expiry_date - date).days
+                    # Stock information
+                    manufacturing_date = date - timedelta(days=random.randint(1, 180))
+                    shelf_life_days = random.randint(*cat_config['shelf_life_days'])
+                    stock_age_days = calculate_stock_age(manufacturing_date, date)
+                    expiry_date = manufacturing_date + timedelta(days=shelf_life_days)
+                    days_to_expiry = (expiry_date - date).days
                 
-                # Stock age category
-                if stock_age_days <= 30:
-                    stock_age_category = 'Fresh'
-                elif stock_age_days <= 90:
-                    stock_age_category = 'Normal'
-                elif stock_age_days <= 180:
-                    stock_age_category = 'Ageing'
-                else:
-                    stock_age_category = 'Old'
+                    # Stock age category
+                    if stock_age_days <= 30:
+                        stock_age_category = 'Fresh'
+                    elif stock_age_days <= 90:
+                        stock_age_category = 'Normal'
+                    elif stock_age_days <= 180:
+                        stock_age_category = 'Ageing'
+                    else:
+                        stock_age_category = 'Old'
                 
-                # Create transaction record
-                transaction = {
-                    'TransactionID': f"{pos_system}_{store}_{transaction_id:08d}",
-                    'POS_System': pos_system,
-                    'Store': store,
-                    'Date': date.strftime('%Y-%m-%d'),
-                    'Category': category,
-                    'SubCategory': subcategory,
-                    'SKU_ID': sku_id,
-                    'Brand': brand,
-                    'MRP': mrp,
-                    'SellingPrice': selling_price,
-                    'DiscountPercent': discount_pct,
-                    'Quantity': quantity,
-                    'NetAmount': net_amount,
-                    'CostPrice': cost_price,
-                    'MarginPercent': round(margin_pct, 2),
-                    'Profit': profit,
-                    'ManufacturingDate': manufacturing_date.strftime('%Y-%m-%d'),
-                    'ExpiryDate': expiry_date.strftime('%Y-%m-%d'),
-                    'StockAgeDays': stock_age_days,
-                    'DaysToExpiry': days_to_expiry,
-                    'StockAgeCategory': stock_age_category
-                }
+                    # Create transaction record
+                    transaction = {
+                        'TransactionID': f"{pos_system}_{store}_{transaction_id:08d}",
+                        'POS_System': pos_system,
+                        'Store': store,
+                        'Date': date.strftime('%Y-%m-%d'),
+                        'Category': category,
+                        'SubCategory': subcategory,
+                        'SKU_ID': sku_id,
+                        'Brand': brand,
+                        'MRP': mrp,
+                        'SellingPrice': selling_price,
+                        'DiscountPercent': discount_pct,
+                        'Quantity': quantity,
+                        'NetAmount': net_amount,
+                        'CostPrice': cost_price,
+                        'MarginPercent': round(margin_pct, 2),
+                        'Profit': profit,
+                        'ManufacturingDate': manufacturing_date.strftime('%Y-%m-%d'),
+                        'ExpiryDate': expiry_date.strftime('%Y-%m-%d'),
+                        'StockAgeDays': stock_age_days,
+                        'DaysToExpiry': days_to_expiry,
+                        'StockAgeCategory': stock_age_category
+                    }
                 
-                all_transactions.append(transaction)
-                transaction_id += 1
-                store_transactions += 1
+                    all_transactions.append(transaction)
+                    transaction_id += 1
+                    store_transactions += 1
         
-        print(f"✓ {store_transactions:,} transactions")
+            print(f"✓ {store_transactions:,} transactions")
 
 print()
 print("=" * 60)
@@ -226,15 +393,20 @@ print("=" * 60)
 
 print("Creating POS datasets...")
 
-df_all = pd.DataFrame(all_transactions)
+if GENERATION_ENGINE == 'vectorized':
+    # POS files were streamed during generation; only summary columns are kept
+    df_all = pd.concat(summary_blocks, ignore_index=True)
+else:
+    df_all = pd.DataFrame(all_transactions)
 
 # Split by POS system
 df_pos1 = df_all[df_all['POS_System'] == 'POS1'].copy()
 df_pos2 = df_all[df_all['POS_System'] == 'POS2'].copy()
 
 # Save separate POS files
-df_pos1.to_csv('data/pos1_transactions.csv', index=False)
-df_pos2.to_csv('data/pos2_transactions.csv', index=False)
+if GENERATION_ENGINE != 'vectorized':
+    df_pos1.to_csv(POS_FILES['POS1'], index=False)
+    df_pos2.to_csv(POS_FILES['POS2'], index=False)
 
 print(f"✓ POS1 dataset: {len(df_pos1):,} transactions")
 print(f"✓ POS2 dataset: {len(df_pos2):,} transactions")
@@ -0,0 +1,204 @@
+"""
+Incremental Daily Update - Grocery + Fashion Pipeline
+Ingests only new POS files, validates and merges just those rows, and
+refreshes every dashboard CSV and dashboard_data.js from persisted
+aggregate state instead of reprocessing the whole year
+"""
+
+import os
+import glob
+import json
+import runpy
+from collections import Counter
+from datetime import datetime
+
+import pandas as pd
+
+from pos_etl import HashedKeySet, clean_pos_frame, print_issues, add_features
+from pos_storage import (STATE_DIR, CSV_FILE, DATASET_DIR, PYARROW_AVAILABLE,
+                         dataset_available, load_merged_data, write_partitions)
+from pos_aggregates import (CUBE_DIMENSIONS, SKU_DIMENSIONS, CUBE_MEASURES, SKU_MEASURES,
+                            SOURCE_COLUMNS, build_cubes, merge_cubes, derive_dashboard_tables)
+
+# New POS exports (same schema as pos1/pos2_transactions.csv) are dropped here
+INCOMING_DIR = 'data/incoming'
+CHUNK_SIZE = 500_000
+
+CUBE_FILE = os.path.join(STATE_DIR, 'cube.pkl')
+SKU_CUBE_FILE = os.path.join(STATE_DIR, 'sku_cube.pkl')
+IDS_FILE = os.path.join(STATE_DIR, 'transaction_ids.npy')
+MANIFEST_FILE = os.path.join(STATE_DIR, 'ingested_files.json')
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+print("=" * 60)
+print("INCREMENTAL UPDATE - GROCERY + FASHION PIPELINE")
+print("=" * 60)
+print()
+
+# ============================================
+# FIND NEW POS FILES
+# ============================================
+
+print("Step 1: Scanning for new POS files...")
+print()
+
+manifest = []
+if os.path.exists(MANIFEST_FILE):
+    with open(MANIFEST_FILE, encoding='utf-8') as f:
+        manifest = json.load(f)
+
+ingested = {entry['file'] for entry in manifest}
+new_files = [path for path in sorted(glob.glob(os.path.join(INCOMING_DIR, '*.csv')))
+             if os.path.basename(path) not in ingested]
+
+if not new_files:
+    print(f"✓ No new files in {INCOMING_DIR}/ - dashboards are up to date")
+    exit(0)
+
+for path in new_files:
+    print(f"  • {os.path.basename(path)}")
+print()
+
+# ============================================
+# LOAD OR BOOTSTRAP STATE
+# ============================================
+
+print("Step 2: Loading aggregate state...")
+print()
+
+if os.path.exists(MANIFEST_FILE):
+    cube = pd.read_pickle(CUBE_FILE)
+    sku_cube = pd.read_pickle(SKU_CUBE_FILE)
+    seen_ids = HashedKeySet.load(IDS_FILE)
+    print(f"✓ State loaded: {len(cube):,} cube cells, {len(seen_ids):,} known transactions")
+    print(f"✓ Previously ingested files: {len(manifest)}")
+else:
+    # One full scan of the merged data seeds the cubes and the ID set
+    seen_ids = HashedKeySet()
+    if dataset_available() or os.path.exists(CSV_FILE):
+        print("  No state found - bootstrapping from the merged dataset (one-time full scan)")
+        df = load_merged_data(columns=SOURCE_COLUMNS + ['TransactionID'])
+        cube, sku_cube = build_cubes(df)
+        seen_ids.add(df['TransactionID'])
+        del df
+    else:
+        print("  No state or merged dataset found - starting empty")
+        cube, sku_cube = None, None
+    print(f"✓ State initialized: {len(seen_ids):,} known transactions")
+print()
+
+# ============================================
+# VALIDATE, MERGE AND AGGREGATE THE DELTA
+# ============================================
+
+print("Step 3: Validating and merging new records...")
+print()
+
+run_stamp = datetime.now().strftime('%Y%m%d%H%M%S')
+write_parquet = PYARROW_AVAILABLE and (dataset_available() or not os.path.exists(CSV_FILE))
+append_csv = os.path.exists(CSV_FILE)
+
+issues = Counter()
+cubes, sku_cubes = [], []
+part = 0
+total_read, total_duplicates, total_added = 0, 0, 0
+
+for path in new_files:
+    file_read, file_added = 0, 0
+
+    for chunk in pd.read_csv(path, chunksize=CHUNK_SIZE):
+        file_read += len(chunk)
+
+        # Rows already merged (re-sent files, overlapping exports) are skipped
+        is_new = seen_ids.add(chunk['TransactionID'])
+        total_duplicates += int((~is_new).sum())
+
+        chunk = add_features(clean_pos_frame(chunk[is_new], issues))
+        if chunk.empty:
+            continue
+
+        if write_parquet:
+            write_partitions(chunk, part, prefix=f'delta-{run_stamp}')
+            part += 1
+        if append_csv:
+            chunk.to_csv(CSV_FILE, mode='a', header=False, index=False, date_format='%Y-%m-%d')
+
+        chunk_cube, chunk_sku_cube = build_cubes(chunk)
+        cubes.append(chunk_cube)
+        sku_cubes.append(chunk_sku_cube)
+        file_added += len(chunk)
+
+    manifest.append({
+        'file': os.path.basename(path),
+        'rows_read': file_read,
+        'rows_added': file_added,
+        'ingested_at': datetime.now().isoformat(timespec='seconds')
+    })
+    total_read += file_read
+    total_added += file_added
+    print(f"✓ {os.path.basename(path)}: {file_read:,} read, {file_added:,} merged")
+
+print(f"✓ Duplicate check: {total_duplicates} duplicates skipped")
+print_issues(issues)
+print()
+
+if write_parquet:
+    print(f"✓ Appended to: {DATASET_DIR}/")
+if append_csv:
+    print(f"✓ Appended to: {CSV_FILE}")
+print()
+
+# ============================================
+# UPDATE PERSISTED STATE
+# ============================================
+
+print("Step 4: Updating aggregate state...")
+print()
+
+if cubes:
+    if cube is not None:
+        cubes.insert(0, cube)
+        sku_cubes.insert(0, sku_cube)
+    cube = merge_cubes(cubes, CUBE_DIMENSIONS, CUBE_MEASURES)
+    sku_cube = merge_cubes(sku_cubes, SKU_DIMENSIONS, SKU_MEASURES)
+
+os.makedirs(STATE_DIR, exist_ok=True)
+if cube is not None:
+    cube.to_pickle(CUBE_FILE)
+    sku_cube.to_pickle(SKU_CUBE_FILE)
+seen_ids.save(IDS_FILE)
+with open(MANIFEST_FILE, 'w', encoding='utf-8') as f:
+    json.dump(manifest, f, indent=2)
+
+print(f"✓ State saved: {len(cube) if cube is not None else 0:,} cube cells, "
+      f"{len(seen_ids):,} known transactions")
+print()
+
+if cube is None:
+    print("No valid records merged yet - dashboards not refreshed")
+    exit(0)
+
+# ============================================
+# REFRESH DASHBOARD OUTPUTS
+# ============================================
+
+print("Step 5: Refreshing dashboard outputs...")
+print()
+
+os.makedirs('dashboard', exist_ok=True)
+for name, table in derive_dashboard_tables(cube, sku_cube).items():
+    table.to_csv(f'dashboard/{name}.csv', index=False)
+    print(f"✓ Saved: dashboard/{name}.csv")
+print()
+
+runpy.run_path(os.path.join(SCRIPT_DIR, 'convert_to_js.py'), run_name='__main__')
+
+print()
+print("=" * 60)
+print("INCREMENTAL UPDATE COMPLETED SUCCESSFULLY!")
+print("=" * 60)
+print(f"  Files ingested: {len(new_files)}")
+print(f"  Records read: {total_read:,}")
+print(f"  Records merged: {total_added:,}")
+print("=" * 60)
@@ -0,0 +1,210 @@
+"""
+Streaming JavaScript/JSON emitter for dashboard data
+Writes dashboard CSV tables straight to an open file handle, formatting
+whole columns at a time and never holding the full output in memory
+"""
+
+import os
+import json
+
+import pandas as pd
+
+# Layouts:
+#   'pretty'   - indented objects with bare keys (the original dashboard_data.js format)
+#   'minified' - one object per row, no whitespace, JSON-compatible values
+#   'columnar' - one array per field ({"name": [...], ...}), expanded to rows in the browser
+LAYOUTS = ('pretty', 'minified', 'columnar')
+
+# Rows read and formatted per batch
+CHUNK_ROWS = 50_000
+
+NEEDS_ESCAPE = r'["\\\x00-\x1f]'
+
+# Expands a columnar section back into the row objects the dashboard expects
+COLUMNAR_HELPER = (
+    "function expandColumns(cols) {\n"
+    "    const keys = Object.keys(cols);\n"
+    "    const n = keys.length ? cols[keys[0]].length : 0;\n"
+    "    const rows = new Array(n);\n"
+    "    for (let i = 0; i < n; i++) {\n"
+    "        const row = {};\n"
+    "        for (const k of keys) row[k] = cols[k][i];\n"
+    "        rows[i] = row;\n"
+    "    }\n"
+    "    return rows;\n"
+    "}\n"
+)
+
+# ============================================
+# COLUMN FORMATTING
+# ============================================
+
+def format_column(values, kind):
+    """Format a whole column as JS literals
+
+    kind is 'str' (quoted, escaped), 'int' (as-is) or 'float' (2 decimals).
+    """
+    if kind == 'str':
+        values = values.astype(str)
+        # Only values with quotes, backslashes or control characters need escaping
+        if values.str.contains(NEEDS_ESCAPE).any():
+            return [json.dumps(v, ensure_ascii=False) for v in values]
+        return ('"' + values + '"').tolist()
+    if kind == 'float':
+        return list(map('{:.2f}'.format, values.to_numpy(dtype=float).tolist()))
+    return values.astype(str).tolist()
+
+def _read_chunks(csv_path, columns, limit):
+    """Yield the needed columns of a CSV in CHUNK_ROWS batches"""
+    if limit is not None:
+        yield pd.read_csv(csv_path, usecols=columns, nrows=limit)[columns]
+        return
+    for chunk in pd.read_csv(csv_path, usecols=columns, chunksize=CHUNK_ROWS):
+        yield chunk[columns]
+
+# ============================================
+# SECTION WRITERS
+# ============================================
+
+def write_dict(f, items, layout='pretty'):
+    """Write a {key: "value"} literal (used for the KPI block)"""
+    if layout == 'pretty':
+        f.write("{\n")
+        for key, value in items:
+            f.write(f'        "{key}": "{value}",\n')
+        f.write("    }")
+    else:
+        f.write(json.dumps({str(k): str(v) for k, v in items}, ensure_ascii=False,
+                           separators=(',', ':')))
+
+def write_table(f, csv_path, fields, layout='pretty', limit=None):
+    """Stream a CSV table as an array of row objects (or column arrays)
+
+    fields is a list of (js_name, csv_column, kind) tuples; limit keeps only
+    the first N rows. Only one chunk of formatted rows is in memory at a time.
+    """
+    columns = [col for _, col, _ in fields]
+    names = [name for name, _, _ in fields]
+    kinds = [kind for _, _, kind in fields]
+
+    if layout == 'columnar':
+        _write_columns(f, csv_path, fields, limit)
+        return
+
+    if layout == 'pretty':
+        template = ("        {{\n"
+                    + ",\n".join(f"            {name}: {{}}" for name in names)
+                    + "\n        }},\n")
+        f.write("[\n")
+    else:
+        template = "{{" + ",".join(f'"{name}":{{}}' for name in names) + "}}"
+        f.write("[")
+
+    first = True
+    for chunk in _read_chunks(csv_path, columns, limit):
+        formatted = [format_column(chunk[col], kind) for col, kind in zip(columns, kinds)]
+        rows = [template.format(*values) for values in zip(*formatted)]
+        if not rows:
+            continue
+        if layout == 'pretty':
+            f.writelines(rows)
+        else:
+            if not first:
+                f.write(",")
+            f.write(",".join(rows))
+        first = False
+
+    f.write("    ]" if layout == 'pretty' else "]")
+
+def _write_columns(f, csv_path, fields, limit):
+    """Columnar layout: one pass per field, each streamed in chunks"""
+    f.write("expandColumns({")
+    for i, (name, col, kind) in enumerate(fields):
+        f.write(("," if i else "") + f'"{name}":[')
+        first = True
+        for chunk in _read_chunks(csv_path, [col], limit):
+            values = format_column(chunk[col], kind)
+            if not values:
+                continue
+            if not first:
+                f.write(",")
+            f.write(",".join(values))
+            first = False
+        f.write("]")
+    f.write("})")
+
+# ============================================
+# WHOLE FILES
+# ============================================
+
+def _check_layout(layout):
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown layout {layout!r}, expected one of {LAYOUTS}")
+
+def _write_sections(f, sections, layout, leading_comma):
+    """Write `key: [...]` entries for each (js_name, comment, csv_path, fields, limit)"""
+    pretty = layout == 'pretty'
+    for i, (js_name, comment, csv_path, fields, limit) in enumerate(sections):
+        sep = "," if leading_comma or i else ""
+        f.write(f"{sep}\n    \n    // {comment}\n    {js_name}: " if pretty else f"{sep}{js_name}:")
+        write_table(f, csv_path, fields, layout, limit)
+
+def write_dashboard_js(path, kpis, sections, layout='pretty'):
+    """Write the dashboardData global as a JS file
+
+    sections is a list of (js_name, comment, csv_path, fields, limit).
+    """
+    _check_layout(layout)
+
+    pretty = layout == 'pretty'
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("\n// Grocery + Fashion Dashboard - Interactive Data\n"
+                "// Auto-generated from CSV files\n\n")
+        if layout == 'columnar':
+            f.write(COLUMNAR_HELPER + "\n")
+
+        f.write("const dashboardData = {\n    \n    // Key Performance Indicators\n    kpis: "
+                if pretty else "const dashboardData={kpis:")
+        write_dict(f, kpis, layout)
+        _write_sections(f, sections, layout, leading_comma=True)
+
+        if pretty:
+            f.write("\n};\n\n// Export for use in HTML\n"
+                    "if (typeof module !== 'undefined' && module.exports) {\n"
+                    "    module.exports = dashboardData;\n}\n")
+        else:
+            f.write("};\nif(typeof module!=='undefined'&&module.exports){module.exports=dashboardData;}\n")
+
+def write_bundle(path, name, sections, layout='pretty'):
+    """Write one lazily loaded panel bundle
+
+    The file calls dashboardBundle(name, {section: rows, ...}), which the
+    dashboard defines before injecting the script. Returns the file size.
+    """
+    _check_layout(layout)
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"// Dashboard bundle: {name} (auto-generated)\n")
+        f.write(f'dashboardBundle("{name}", {{')
+        _write_sections(f, sections, layout, leading_comma=False)
+        f.write("\n});\n" if layout == 'pretty' else "});\n")
+    return os.path.getsize(path)
+
+def write_manifest(path, kpis, bundles, layout='pretty'):
+    """Write the bundle manifest loaded up front by the dashboard
+
+    Carries the KPI values inline, so the KPI cards render without waiting
+    for any bundle. bundles maps bundle name -> {file, sections, bytes}.
+    """
+    _check_layout(layout)
+
+    manifest = {'kpis': {str(k): str(v) for k, v in kpis}, 'bundles': bundles}
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("// Dashboard bundle manifest (auto-generated)\n")
+        if layout == 'columnar':
+            f.write(COLUMNAR_HELPER)
+        if layout == 'pretty':
+            f.write("const dashboardManifest = " + json.dumps(manifest, ensure_ascii=False, indent=4) + ";\n")
+        else:
+            f.write("const dashboardManifest=" + json.dumps(manifest, ensure_ascii=False,
+                                                          separators=(',', ':')) + ";\n")
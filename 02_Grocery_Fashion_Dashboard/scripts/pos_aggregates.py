@@ -0,0 +1,220 @@
+"""
+Aggregation engine for the Grocery + Fashion dashboard exports
+Scans the merged data once into two small mergeable cubes and derives all
+eleven dashboard tables from them by roll-up
+"""
+
+import pandas as pd
+
+# Finest grain needed by any dashboard table
+CUBE_DIMENSIONS = ['POS_System', 'Store', 'Category', 'SubCategory', 'Brand',
+                   'StockAgeCategory', 'YearMonth', 'IsWeekend']
+
+# Distinct SKUs per store; sums over it give the top SKUs and its rows are
+# the exact sets behind every UniqueSKUs count
+SKU_DIMENSIONS = ['POS_System', 'Store', 'Category', 'SubCategory', 'Brand', 'SKU_ID']
+
+# Columns the cubes are built from
+SOURCE_COLUMNS = ['POS_System', 'Store', 'Date', 'Category', 'SubCategory', 'SKU_ID', 'Brand',
+                  'NetAmount', 'Profit', 'MarginPercent', 'Quantity',
+                  'StockAgeCategory', 'StockAgeDays', 'IsWeekend']
+
+# How each stored measure combines when cells are merged or rolled up
+CUBE_MEASURES = {
+    'Transactions': 'sum',
+    'Revenue': 'sum',
+    'Profit': 'sum',
+    'MarginSum': 'sum',
+    'MarginMin': 'min',
+    'MarginMax': 'max',
+    'Quantity': 'sum',
+    'StockAgeSum': 'sum'
+}
+SKU_MEASURES = {
+    'Transactions': 'sum',
+    'Revenue': 'sum',
+    'Profit': 'sum',
+    'Quantity': 'sum'
+}
+
+# Dashboard column name -> expression over a rolled-up cube
+OUTPUT_COLUMNS = {
+    'Transactions': lambda g: g['Transactions'],
+    'TotalRevenue': lambda g: g['Revenue'],
+    'Revenue': lambda g: g['Revenue'],
+    'AvgRevenue': lambda g: g['Revenue'] / g['Transactions'],
+    'TotalProfit': lambda g: g['Profit'],
+    'Profit': lambda g: g['Profit'],
+    'AvgProfit': lambda g: g['Profit'] / g['Transactions'],
+    'AvgMargin': lambda g: g['MarginSum'] / g['Transactions'],
+    'MinMargin': lambda g: g['MarginMin'],
+    'MaxMargin': lambda g: g['MarginMax'],
+    'TotalQuantity': lambda g: g['Quantity'],
+    'Quantity': lambda g: g['Quantity'],
+    'AvgStockAge': lambda g: g['StockAgeSum'] / g['Transactions']
+}
+
+# ============================================
+# BUILDING AND MERGING CUBES
+# ============================================
+
+def build_cubes(df):
+    """Reduce merged POS rows to the dimension cube and the SKU cube"""
+    # Categorical SKU codes make the SKU-grain groupby and distinct counts
+    # work on integers instead of hashing strings on every roll-up
+    df = df.assign(YearMonth=df['Date'].dt.to_period('M'),
+                   SKU_ID=df['SKU_ID'].astype('category'))
+
+    cube = df.groupby(CUBE_DIMENSIONS, observed=True).agg(
+        Transactions=('NetAmount', 'size'),
+        Revenue=('NetAmount', 'sum'),
+        Profit=('Profit', 'sum'),
+        MarginSum=('MarginPercent', 'sum'),
+        MarginMin=('MarginPercent', 'min'),
+        MarginMax=('MarginPercent', 'max'),
+        Quantity=('Quantity', 'sum'),
+        StockAgeSum=('StockAgeDays', 'sum')
+    )
+
+    sku_cube = df.groupby(SKU_DIMENSIONS, observed=True).agg(
+        Transactions=('NetAmount', 'size'),
+        Revenue=('NetAmount', 'sum'),
+        Profit=('Profit', 'sum'),
+        Quantity=('Quantity', 'sum')
+    )
+
+    return cube, sku_cube
+
+def merge_cubes(cubes, dimensions, measures):
+    """Combine cubes built from separate chunks or days into one"""
+    return pd.concat(cubes).groupby(level=dimensions, observed=True).agg(measures)
+
+def roll_up(cube, keys):
+    """Aggregate the dimension cube to a coarser set of keys"""
+    return cube.groupby(level=keys, observed=True).agg(CUBE_MEASURES)
+
+def _table(cube, keys, columns):
+    """Roll up to keys and compute the requested dashboard columns"""
+    rolled = roll_up(cube, keys)
+    return pd.DataFrame({col: OUTPUT_COLUMNS[col](rolled) for col in columns})
+
+def _unique_skus(sku_cube, keys):
+    """Exact distinct SKU count per group from the SKU cube"""
+    skus = sku_cube.index.to_frame(index=False)
+    return skus.groupby(keys, observed=True)['SKU_ID'].nunique().rename('UniqueSKUs')
+
+# ============================================
+# DASHBOARD TABLES
+# ============================================
+
+def derive_dashboard_tables(cube, sku_cube):
+    """Build every dashboard CSV from the two cubes
+
+    Returns a dict of output file stem -> DataFrame, in export order.
+    """
+    tables = {}
+
+    # 1. Category performance
+    category = _table(cube, ['Category'], ['Transactions', 'TotalRevenue', 'AvgRevenue',
+                                           'TotalProfit', 'AvgProfit', 'AvgMargin', 'TotalQuantity'])
+    category = category.join(_unique_skus(sku_cube, ['Category']))
+    tables['category_performance'] = category.round(2).reset_index()
+
+    # 2. Subcategory performance
+    subcategory = _table(cube, ['Category', 'SubCategory'],
+                         ['Transactions', 'TotalRevenue', 'AvgRevenue',
+                          'TotalProfit', 'AvgMargin', 'TotalQuantity'])
+    tables['subcategory_performance'] = subcategory.round(2).reset_index()
+
+    # 3. POS system comparison
+    pos = _table(cube, ['POS_System', 'Store'], ['Transactions', 'TotalRevenue', 'TotalProfit',
+                                                 'AvgMargin', 'TotalQuantity'])
+    pos = pos.join(_unique_skus(sku_cube, ['POS_System', 'Store']))
+    tables['pos_comparison'] = pos.round(2).reset_index()
+
+    # 4. Stock ageing, overall and by category
+    ageing_columns = ['Transactions', 'TotalRevenue', 'TotalQuantity', 'AvgStockAge']
+    tables['stock_ageing_overall'] = _table(cube, ['StockAgeCategory'], ageing_columns).round(2).reset_index()
+    tables['stock_ageing_by_category'] = _table(cube, ['Category', 'StockAgeCategory'],
+                                                ageing_columns).round(2).reset_index()
+
+    # 5. Margin analysis (profit margin uses the rounded totals, as before)
+    margin = _table(cube, ['Category', 'SubCategory'], ['AvgMargin', 'MinMargin', 'MaxMargin',
+                                                        'TotalProfit', 'TotalRevenue']).round(2)
+    margin['ProfitMargin%'] = (margin['TotalProfit'] / margin['TotalRevenue'] * 100).round(2)
+    tables['margin_analysis'] = margin.reset_index()
+
+    # 6. Monthly trends
+    monthly = _table(cube, ['YearMonth', 'Category'], ['Transactions', 'Revenue', 'Profit', 'Quantity'])
+    monthly = monthly.round(2).reset_index()
+    monthly['YearMonth'] = monthly['YearMonth'].astype(str)
+    tables['monthly_trends'] = monthly
+
+    # 7. Brand performance
+    brand = _table(cube, ['Category', 'Brand'], ['Transactions', 'TotalRevenue', 'TotalProfit', 'AvgMargin'])
+    brand = brand.join(_unique_skus(sku_cube, ['Category', 'Brand'])).round(2).reset_index()
+    tables['brand_performance'] = brand.sort_values('TotalRevenue', ascending=False)
+
+    # 8. Weekend vs weekday
+    weekend = _table(cube, ['Category', 'IsWeekend'], ['Transactions', 'TotalRevenue',
+                                                       'AvgRevenue', 'TotalQuantity'])
+    weekend = weekend.round(2).reset_index()
+    weekend['Day_Type'] = weekend['IsWeekend'].map({0: 'Weekday', 1: 'Weekend'})
+    tables['weekend_analysis'] = weekend.drop('IsWeekend', axis=1)
+
+    # 9. Top performing SKUs
+    skus = sku_cube.groupby(level=['SKU_ID', 'Category', 'SubCategory', 'Brand'],
+                            observed=True).agg(SKU_MEASURES)
+    skus.columns = ['Transactions', 'TotalRevenue', 'TotalProfit', 'TotalQuantity']
+    skus = skus.round(2).reset_index()
+    tables['top_100_skus'] = skus.sort_values('TotalRevenue', ascending=False).head(100)
+
+    # 10. Summary KPIs
+    tables['summary_kpis'] = derive_kpis(cube, sku_cube)
+
+    return tables
+
+def derive_kpis(cube, sku_cube):
+    """Headline metrics as formatted strings, computed from the cubes"""
+    totals = cube[list(CUBE_MEASURES)].agg(CUBE_MEASURES)
+    transactions = totals['Transactions']
+    by_age = roll_up(cube, ['StockAgeCategory'])['Transactions']
+    by_category = roll_up(cube, ['Category'])['Revenue']
+    by_pos = roll_up(cube, ['POS_System'])['Revenue']
+    unique_skus = sku_cube.index.get_level_values('SKU_ID').nunique()
+    unique_stores = cube.index.get_level_values('Store').nunique()
+
+    return pd.DataFrame({
+        'Metric': [
+            'Total Transactions',
+            'Total Revenue (INR)',
+            'Total Profit (INR)',
+            'Average Margin (%)',
+            'Total Quantity Sold',
+            'Unique SKUs',
+            'Unique Stores',
+            'Fresh Stock (%)',
+            'Ageing Stock (%)',
+            'Average Transaction Value (INR)',
+            'Grocery Revenue (INR)',
+            'Fashion Revenue (INR)',
+            'POS1 Revenue (INR)',
+            'POS2 Revenue (INR)'
+        ],
+        'Value': [
+            f"{int(transactions):,}",
+            f"{totals['Revenue']:,.2f}",
+            f"{totals['Profit']:,.2f}",
+            f"{totals['MarginSum'] / transactions:.2f}",
+            f"{int(totals['Quantity']):,}",
+            f"{unique_skus:,}",
+            f"{unique_stores}",
+            f"{by_age.get('Fresh', 0) / transactions * 100:.2f}",
+            f"{by_age.get('Ageing', 0) / transactions * 100:.2f}",
+            f"{totals['Revenue'] / transactions:,.2f}",
+            f"{by_category.get('Grocery', 0):,.2f}",
+            f"{by_category.get('Fashion', 0):,.2f}",
+            f"{by_pos.get('POS1', 0):,.2f}",
+            f"{by_pos.get('POS2', 0):,.2f}"
+        ]
+    })
@@ -0,0 +1,184 @@
+"""
+Shared ETL helpers for the Grocery + Fashion POS pipeline
+Validation rules, feature engineering and summary roll-ups that work on
+either the full merged frame or one chunk of it at a time
+"""
+
+import pandas as pd
+import numpy as np
+
+DATE_COLUMNS = ['Date', 'ManufacturingDate', 'ExpiryDate']
+NUMERIC_COLUMNS = ['MRP', 'SellingPrice', 'Quantity', 'NetAmount', 'CostPrice', 'Profit']
+SUMMARY_KEYS = ['POS_System', 'Category', 'SubCategory', 'Brand', 'StockAgeCategory']
+
+# ============================================
+# DEDUPLICATION
+# ============================================
+
+class HashedKeySet:
+    """Compact set of string keys stored as one sorted array of 64-bit hashes
+
+    Memory is 8 bytes per key regardless of key length, so tens of millions
+    of TransactionIDs fit in a few hundred MB. Two distinct keys colliding
+    on the same 64-bit hash is negligible at these volumes.
+    """
+
+    def __init__(self):
+        self.hashes = np.empty(0, dtype=np.uint64)
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def save(self, path):
+        """Persist the hashes as a .npy file"""
+        np.save(path, self.hashes)
+
+    @classmethod
+    def load(cls, path):
+        """Restore a set written by save()"""
+        key_set = cls()
+        key_set.hashes = np.load(path)
+        return key_set
+
+    def add(self, keys):
+        """Add keys and return a boolean mask marking the first sighting of each"""
+        hashes = pd.util.hash_pandas_object(pd.Series(keys), index=False).to_numpy()
+        is_new = ~pd.Series(hashes).duplicated().to_numpy()
+
+        if len(self.hashes):
+            pos = np.minimum(np.searchsorted(self.hashes, hashes), len(self.hashes) - 1)
+            is_new &= self.hashes[pos] != hashes
+
+        # Both runs are already sorted, so the stable sort is a linear merge
+        new_hashes = np.sort(hashes[is_new])
+        self.hashes = np.sort(np.concatenate([self.hashes, new_hashes]), kind='stable')
+        return is_new
+
+# ============================================
+# VALIDATION
+# ============================================
+
+def clean_pos_frame(df, issues):
+    """Validate a POS frame with one combined mask instead of a copy per rule
+
+    Rules run in the original order (numeric, pricing, margin, dates,
+    expiry, missing values) and ``issues`` (a Counter) accumulates how many
+    still-valid rows each rule rejected or corrected.
+    """
+    df = df.assign(**{col: pd.to_datetime(df[col]) for col in DATE_COLUMNS})
+
+    valid = np.ones(len(df), dtype=bool)
+
+    # Remove rows with negative or zero values in critical columns
+    for col in NUMERIC_COLUMNS:
+        issues[col] += int(((df[col] <= 0).to_numpy() & valid).sum())
+        valid &= (df[col] > 0).to_numpy()
+
+    # Validate pricing logic (SellingPrice <= MRP)
+    issues['price'] += int(((df['SellingPrice'] > df['MRP']).to_numpy() & valid).sum())
+    valid &= (df['SellingPrice'] <= df['MRP']).to_numpy()
+
+    # Recalculate margins that drift more than 1% from price and cost
+    calculated_margin = (df['SellingPrice'] - df['CostPrice']) / df['CostPrice'] * 100
+    margin_fix = (abs(df['MarginPercent'] - calculated_margin) > 1).to_numpy() & valid
+    issues['margin'] += int(margin_fix.sum())
+    df.loc[margin_fix, 'MarginPercent'] = calculated_margin[margin_fix]
+
+    # Validate date logic
+    issues['date'] += int(((df['ManufacturingDate'] > df['Date']).to_numpy() & valid).sum())
+    valid &= (df['ManufacturingDate'] <= df['Date']).to_numpy()
+
+    issues['expiry'] += int(((df['ExpiryDate'] < df['ManufacturingDate']).to_numpy() & valid).sum())
+    valid &= (df['ExpiryDate'] >= df['ManufacturingDate']).to_numpy()
+
+    df = df[valid]
+
+    # Drop rows with missing values
+    missing = df.isnull().any(axis=1)
+    issues['missing'] += int(missing.sum())
+    return df[~missing.to_numpy()]
+
+def print_issues(issues):
+    """Print the validation warnings collected by clean_pos_frame"""
+    for col in NUMERIC_COLUMNS:
+        if issues[col] > 0:
+            print(f"  Warning: {issues[col]} invalid values in {col}")
+    print(f"✓ Numerical validation complete")
+
+    if issues['price'] > 0:
+        print(f"  Warning: {issues['price']} records with SellingPrice > MRP")
+    if issues['margin'] > 0:
+        print(f"  Warning: {issues['margin']} records with margin calculation issues")
+    print(f"✓ Pricing validation complete")
+
+    if issues['date'] > 0:
+        print(f"  Warning: {issues['date']} records with manufacturing date after transaction date")
+    if issues['expiry'] > 0:
+        print(f"  Warning: {issues['expiry']} records with expiry before manufacturing")
+    print(f"✓ Date validation complete")
+
+    if issues['missing'] > 0:
+        print(f"  Removed {issues['missing']} rows with missing values")
+
+# ============================================
+# FEATURE ENGINEERING
+# ============================================
+
+def add_features(df):
+    """Add temporal, weekend, margin, revenue and stock health features"""
+    df = df.copy()
+
+    # Add Month, Quarter, Year
+    df['Year'] = df['Date'].dt.year
+    df['Month'] = df['Date'].dt.month
+    df['MonthName'] = df['Date'].dt.strftime('%b')
+    df['Quarter'] = df['Date'].dt.quarter
+    df['DayOfWeek'] = df['Date'].dt.day_name()
+    df['WeekNumber'] = df['Date'].dt.isocalendar().week
+
+    # Add IsWeekend flag
+    df['IsWeekend'] = df['Date'].dt.dayofweek.isin([5, 6]).astype(int)
+
+    # Add Margin Category
+    df['MarginCategory'] = pd.cut(
+        df['MarginPercent'],
+        bins=[0, 15, 30, 45, 100],
+        labels=['Low', 'Medium', 'High', 'Very High']
+    )
+
+    # Add Revenue Category
+    df['RevenueCategory'] = pd.cut(
+        df['NetAmount'],
+        bins=[0, 500, 2000, 5000, float('inf')],
+        labels=['Low', 'Medium', 'High', 'Very High']
+    )
+
+    # Add Stock Health Flag
+    df['StockHealth'] = df['StockAgeCategory'].map({
+        'Fresh': 'Excellent',
+        'Normal': 'Good',
+        'Ageing': 'Warning',
+        'Old': 'Critical'
+    })
+
+    return df
+
+# ============================================
+# SUMMARY ROLL-UP
+# ============================================
+
+def summarize_frame(df):
+    """Reduce a cleaned frame to counts and sums per SUMMARY_KEYS group
+
+    Results from separate chunks combine with ``merge_summaries``.
+    """
+    return df.groupby(SUMMARY_KEYS, observed=True).agg(
+        Records=('TransactionID', 'count'),
+        Revenue=('NetAmount', 'sum'),
+        Profit=('Profit', 'sum'),
+        MarginSum=('MarginPercent', 'sum')
+    )
+
+def merge_summaries(summaries):
+    """Combine summarize_frame results from several chunks"""
+    return pd.concat(summaries).groupby(level=SUMMARY_KEYS).sum()
@@ -0,0 +1,121 @@
+"""
+Columnar storage for the merged POS dataset
+Writes data/merged_pos_data/ as a Parquet dataset partitioned by
+POS_System/Year/Month and reads back only the columns and partitions a
+stage needs. Falls back to data/merged_pos_data.csv without pyarrow.
+"""
+
+import os
+import shutil
+
+import pandas as pd
+
+from pos_etl import DATE_COLUMNS
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+DATASET_DIR = 'data/merged_pos_data'
+CSV_FILE = 'data/merged_pos_data.csv'
+
+# Persisted aggregate state for incremental updates (see incremental_update.py)
+STATE_DIR = 'data/pipeline_state'
+PARTITION_COLUMNS = ['POS_System', 'Year', 'Month']
+
+# Low-cardinality text columns stored with dictionary encoding
+CATEGORICAL_COLUMNS = ['Category', 'SubCategory', 'Brand', 'Store', 'StockAgeCategory']
+
+# ============================================
+# WRITING
+# ============================================
+
+def reset_dataset(path=DATASET_DIR):
+    """Remove any previous Parquet dataset so a full rebuild starts clean"""
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+
+def reset_state(path=STATE_DIR):
+    """Drop incremental state so the next incremental run rebuilds it"""
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+
+def write_partitions(df, part, path=DATASET_DIR, prefix='part'):
+    """Append a cleaned frame to the partitioned dataset
+
+    ``prefix`` and ``part`` keep file names unique between calls, so a
+    streaming ETL or a daily delta can be written without overwriting
+    earlier files.
+    """
+    df = df.astype({col: 'category' for col in CATEGORICAL_COLUMNS})
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_to_dataset(
+        table,
+        path,
+        partition_cols=PARTITION_COLUMNS,
+        basename_template=f'{prefix}-{part:05d}-{{i}}.parquet',
+        existing_data_behavior='overwrite_or_ignore'
+    )
+
+# ============================================
+# READING
+# ============================================
+
+def dataset_available(path=DATASET_DIR):
+    """True when the Parquet dataset exists and pyarrow can read it"""
+    return PYARROW_AVAILABLE and os.path.isdir(path)
+
+def _apply_filters(df, filters):
+    """Evaluate [(column, op, value), ...] filters on an in-memory frame"""
+    for col, op, value in filters:
+        if op in ('=', '=='):
+            df = df[df[col] == value]
+        elif op == '!=':
+            df = df[df[col] != value]
+        elif op == 'in':
+            df = df[df[col].isin(value)]
+        elif op == 'not in':
+            df = df[~df[col].isin(value)]
+        else:
+            df = df.query(f"`{col}` {op} @value")
+    return df
+
+def load_merged_data(columns=None, filters=None, path=DATASET_DIR):
+    """Load the merged POS data, reading only the given columns and partitions
+
+    ``filters`` is a list of (column, op, value) tuples ANDed together, e.g.
+    [('POS_System', '=', 'POS1'), ('Month', 'in', [11, 12])]. Filters on
+    POS_System/Year/Month skip whole partitions without opening them.
+    Categorical columns come back with sorted categories so groupby output
+    order matches the CSV-based pipeline.
+    """
+    if dataset_available(path):
+        df = pd.read_parquet(path, columns=columns, filters=filters or None)
+
+        # Partition keys are read back as dictionary columns
+        for col in ('Year', 'Month'):
+            if col in df.columns:
+                df[col] = df[col].astype(int)
+        if 'POS_System' in df.columns:
+            df['POS_System'] = df['POS_System'].astype(str).astype('category')
+    else:
+        usecols = None
+        if columns is not None:
+            filter_cols = [f[0] for f in filters or [] if f[0] not in columns]
+            usecols = list(columns) + filter_cols
+        parse_dates = [col for col in DATE_COLUMNS if usecols is None or col in usecols]
+        df = pd.read_csv(CSV_FILE, usecols=usecols, parse_dates=parse_dates)
+        if filters:
+            df = _apply_filters(df, filters)
+        if columns is not None:
+            df = df[list(columns)]
+        df = df.astype({col: 'category' for col in CATEGORICAL_COLUMNS + ['POS_System']
+                        if col in df.columns})
+
+    for col in CATEGORICAL_COLUMNS + ['POS_System']:
+        if col in df.columns:
+            df[col] = df[col].cat.set_categories(sorted(df[col].cat.categories))
+    return df.reset_index(drop=True)
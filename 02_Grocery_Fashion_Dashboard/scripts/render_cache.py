@@ -0,0 +1,114 @@
+"""
+Render cache for dashboard PNGs
+Skips redrawing a chart when its inputs, the plot style and the script that
+draws it are unchanged since the PNG on disk was rendered
+"""
+
+import os
+import json
+import pickle
+import hashlib
+
+import numpy as np
+import pandas as pd
+import matplotlib
+
+CACHE_FILE = '.render_cache.json'
+
+def _update(h, obj):
+    """Feed a stable fingerprint of obj into the hash"""
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        h.update(repr(obj.shape).encode())
+        h.update(repr(list(obj.columns) if isinstance(obj, pd.DataFrame) else obj.name).encode())
+        h.update(repr(obj.dtypes.to_dict() if isinstance(obj, pd.DataFrame) else obj.dtype).encode())
+        try:
+            h.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+        except TypeError:
+            h.update(pickle.dumps(obj))
+    elif isinstance(obj, np.ndarray):
+        h.update(repr((obj.shape, obj.dtype)).encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, dict):
+        for key in sorted(obj, key=repr):
+            h.update(repr(key).encode())
+            _update(h, obj[key])
+    elif isinstance(obj, (list, tuple)):
+        h.update(f'{type(obj).__name__}[{len(obj)}]'.encode())
+        for item in obj:
+            _update(h, item)
+    else:
+        h.update(repr(obj).encode())
+
+def _style_fingerprint():
+    """Every matplotlib rcParam, so a style change redraws all charts"""
+    return repr(sorted((key, repr(value)) for key, value in matplotlib.rcParams.items()))
+
+class RenderCache:
+    """Tracks which PNGs in output_dir are current
+
+    Usage:
+        cache = RenderCache(viz_dir, __file__)
+        if not cache.is_current('01_chart.png', frame_a, frame_b[['Col']]):
+            ... draw and save ...
+            cache.record('01_chart.png')
+
+    A chart's key covers its input slices, all rcParams, the matplotlib
+    version and the bytes of the script that draws it (so editing the
+    script redraws its charts once).
+    """
+
+    def __init__(self, output_dir, code_file, enabled=True):
+        self.output_dir = output_dir
+        self.path = os.path.join(output_dir, CACHE_FILE)
+        self.enabled = enabled
+        self.rendered = 0
+        self.skipped = 0
+        self._pending = {}
+
+        with open(code_file, 'rb') as f:
+            self.code_version = hashlib.sha256(f.read()).hexdigest()
+
+        self.keys = {}
+        if enabled and os.path.exists(self.path):
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    self.keys = json.load(f)
+            except (OSError, ValueError):
+                self.keys = {}
+
+    def key(self, *inputs):
+        """Hash of the inputs plus the current style and code version"""
+        h = hashlib.sha256()
+        h.update(self.code_version.encode())
+        h.update(matplotlib.__version__.encode())
+        h.update(_style_fingerprint().encode())
+        for obj in inputs:
+            _update(h, obj)
+        return h.hexdigest()
+
+    def is_current(self, filename, *inputs):
+        """True if filename exists and was rendered from identical inputs"""
+        if not self.enabled:
+            self.rendered += 1
+            return False
+
+        key = self.key(*inputs)
+        current = (self.keys.get(filename) == key
+                   and os.path.exists(os.path.join(self.output_dir, filename)))
+        if current:
+            self.skipped += 1
+        else:
+            self._pending[filename] = key
+            self.rendered += 1
+        return current
+
+    def record(self, filename):
+        """Mark filename as rendered with the key computed in is_current()"""
+        if not self.enabled or filename not in self._pending:
+            return
+        self.keys[filename] = self._pending.pop(filename)
+        os.makedirs(self.output_dir, exist_ok=True)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.keys, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
@@ -12,6 +12,25 @@ from pathlib import Path
 # Set random seed for reproducibility
 np.random.seed(42)
 random.seed(42)
+rng = np.random.default_rng(42)
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Generation engine: 'vectorized' draws transactions and web sessions in
+# batches of whole NumPy columns, 'loop' builds one dict per transaction or
+# page event (original row-by-row generator)
+GENERATION_ENGINE = 'vectorized'
+
+# Sales transactions to generate (raise to tens of millions to load-test the
+# analysis scripts); the vectorized engine draws them in batches of this size
+NUM_TRANSACTIONS = 50000
+TRANSACTION_BATCH_SIZE = 1000000
+
+# Web sessions to simulate (10M+ to stress-test 06_ecommerce_analysis.py)
+NUM_SESSIONS = 200000
+SESSION_BATCH_SIZE = 1000000
 
 # Create directories
 Path("data/raw").mkdir(parents=True, exist_ok=True)
@@ -229,95 +248,170 @@ print(f"✓ Generated {len(df_customers)} customers across {df_customers['City']
 # ============================================================================
 # 5. GENERATE SALES TRANSACTIONS DATA
 # ============================================================================
-print("\n💰 Generating Sales Transactions... (This may take a moment)")
-
-transactions_list = []
-transaction_id = 1
+print(f"\n💰 Generating Sales Transactions... ({GENERATION_ENGINE} engine)")
 
 start_date = datetime(2023, 1, 1)
 end_date = datetime(2024, 12, 31)
 total_days = (end_date - start_date).days
 
-# Generate transactions with realistic patterns
-num_transactions = 50000
-
-for _ in range(num_transactions):
-    # Date with seasonal patterns
-    day_offset = random.randint(0, total_days)
-    transaction_date = start_date + timedelta(days=day_offset)
-    month = transaction_date.month
-    
-    # Seasonal multiplier (higher in back-to-school and holidays)
-    if month in [8, 9]:  # Back to school
-        seasonal_factor = 1.3
-    elif month in [11, 12]:  # Holidays
-        seasonal_factor = 1.5
-    elif month in [1, 2]:  # Winter clearance
-        seasonal_factor = 0.8
-    else:
-        seasonal_factor = 1.0
-    
-    # Weekend boost
-    if transaction_date.weekday() >= 5:  # Saturday/Sunday
-        weekend_factor = 1.3
-    else:
-        weekend_factor = 1.0
-    
-    # Channel (online vs offline)
-    channel = np.random.choice(['Online', 'Offline'], p=[0.42, 0.58])
-    
-    if channel == 'Online':
-        store_id = 'ONLINE'
-    else:
-        store_id = random.choice(df_stores['StoreID'].tolist())
-    
-    # Customer (80% existing, 20% new)
-    if random.random() < 0.8:
-        customer_id = random.choice(df_customers['CustomerID'].tolist())
-    else:
-        customer_id = f'GUEST{random.randint(1000, 9999)}'
-    
-    # Product selection (weighted by category popularity)
-    category_weights = [0.28, 0.38, 0.22, 0.12]  # Boys, Girls, Infants, Accessories
-    selected_category = np.random.choice(df_products['Category'].unique(), p=category_weights)
-    product = df_products[df_products['Category'] == selected_category].sample(1).iloc[0]
-    
-    # Quantity (most buy 1-2 items)
-    quantity = np.random.choice([1, 2, 3], p=[0.65, 0.25, 0.10])
-    
-    # Price with occasional discounts
-    base_price = product['Price']
-    if random.random() < 0.15:  # 15% chance of discount
-        discount = np.random.choice([0.10, 0.20, 0.30, 0.40])
-        unit_price = round(base_price * (1 - discount), 2)
-    else:
-        unit_price = base_price
-    
-    total_amount = round(unit_price * quantity, 2)
-    
-    payment_method = np.random.choice(['Credit Card', 'Debit Card', 'PayPal', 'Cash'], 
-                                     p=[0.45, 0.25, 0.20, 0.10])
-    
-    transactions_list.append({
-        'TransactionID': f'TXN{str(transaction_id).zfill(6)}',
-        'Date': transaction_date.date(),
-        'Time': f"{random.randint(9, 20):02d}:{random.randint(0, 59):02d}:00",
-        'StoreID': store_id,
-        'ProductID': product['ProductID'],
-        'CustomerID': customer_id,
+# Category popularity: Boys, Girls, Infants, Accessories
+category_names = df_products['Category'].unique()
+category_weights = [0.28, 0.38, 0.22, 0.12]
+
+# Lookup tables for the vectorized engine, built once instead of per row
+store_ids = df_stores['StoreID'].tolist()
+customer_ids = df_customers['CustomerID'].tolist()
+guest_ids = [f'GUEST{i}' for i in range(1000, 10000)]
+time_slots = [f"{hour:02d}:{minute:02d}:00" for hour in range(9, 21) for minute in range(60)]
+payment_methods = ['Credit Card', 'Debit Card', 'PayPal', 'Cash']
+
+# Product rows grouped by category: products of category c are
+# category_rows[category_start[c]:category_start[c] + category_size[c]]
+product_category = df_products['Category'].to_numpy()
+category_rows = np.concatenate([np.flatnonzero(product_category == c) for c in category_names])
+category_size = np.array([(product_category == c).sum() for c in category_names])
+category_start = np.concatenate([[0], np.cumsum(category_size)[:-1]])
+product_ids = df_products['ProductID'].to_numpy()
+product_prices = df_products['Price'].to_numpy()
+
+def generate_transaction_batch(size, first_id):
+    """Draw `size` transactions as whole columns, numbered from first_id"""
+    dates = np.datetime64(start_date.date()) + rng.integers(0, total_days + 1, size=size).astype('timedelta64[D]')
+    time_idx = rng.integers(0, len(time_slots), size=size)
+    
+    # Channel (online vs offline); offline sales pick a store uniformly
+    online = rng.random(size) < 0.42
+    store_idx = np.where(online, len(store_ids), rng.integers(0, len(store_ids), size=size))
+    
+    # Customer (80% existing, 20% guest)
+    existing = rng.random(size) < 0.8
+    customer_idx = np.where(existing, rng.integers(0, len(customer_ids), size=size),
+                            len(customer_ids) + rng.integers(0, len(guest_ids), size=size))
+    
+    # Product: weighted category, then a uniform product within it
+    category_idx = rng.choice(len(category_names), size=size, p=category_weights)
+    product_idx = category_rows[category_start[category_idx]
+                                + rng.integers(0, category_size[category_idx])]
+    
+    quantity = rng.choice([1, 2, 3], size=size, p=[0.65, 0.25, 0.10])
+    
+    # Price with occasional discounts (15% of transactions)
+    base_price = product_prices[product_idx]
+    discount = rng.choice([0.10, 0.20, 0.30, 0.40], size=size)
+    unit_price = np.where(rng.random(size) < 0.15, np.round(base_price * (1 - discount), 2), base_price)
+    total_amount = np.round(unit_price * quantity, 2)
+    
+    payment_idx = rng.choice(len(payment_methods), size=size, p=[0.45, 0.25, 0.20, 0.10])
+    
+    transaction_ids = np.char.add('TXN', np.char.zfill(np.arange(first_id, first_id + size).astype(str), 6))
+    
+    return pd.DataFrame({
+        'TransactionID': transaction_ids,
+        'Date': dates,
+        'Time': pd.Categorical.from_codes(time_idx, time_slots),
+        'StoreID': pd.Categorical.from_codes(store_idx, store_ids + ['ONLINE']),
+        'ProductID': pd.Categorical.from_codes(product_idx, product_ids),
+        'CustomerID': pd.Categorical.from_codes(customer_idx, customer_ids + guest_ids),
         'Quantity': quantity,
         'UnitPrice': unit_price,
         'TotalAmount': total_amount,
-        'PaymentMethod': payment_method,
-        'Channel': channel
+        'PaymentMethod': pd.Categorical.from_codes(payment_idx, payment_methods),
+        'Channel': pd.Categorical.from_codes(online.astype(np.int8), ['Offline', 'Online'])
     })
+
+if GENERATION_ENGINE == 'vectorized':
+    transaction_batches = []
+    generated = 0
+    while generated < NUM_TRANSACTIONS:
+        size = min(TRANSACTION_BATCH_SIZE, NUM_TRANSACTIONS - generated)
+        transaction_batches.append(generate_transaction_batch(size, generated + 1))
+        generated += size
+        print(f"  Progress: {generated:,} / {NUM_TRANSACTIONS:,} transactions...")
     
-    transaction_id += 1
+    # Categories are fixed per column, so the batches concatenate as categoricals
+    df_transactions = pd.concat(transaction_batches, ignore_index=True)
+    del transaction_batches
+else:
+    transactions_list = []
+    transaction_id = 1
     
-    if transaction_id % 10000 == 0:
-        print(f"  Progress: {transaction_id:,} / {num_transactions:,} transactions...")
-
-df_transactions = pd.DataFrame(transactions_list)
+    for _ in range(NUM_TRANSACTIONS):
+        # Date with seasonal patterns
+        day_offset = random.randint(0, total_days)
+        transaction_date = start_date + timedelta(days=day_offset)
+        month = transaction_date.month
+    
+        # Seasonal multiplier (higher in back-to-school and holidays)
+        if month in [8, 9]:  # Back to school
+            seasonal_factor = 1.3
+        elif month in [11, 12]:  # Holidays
+            seasonal_factor = 1.5
+        elif month in [1, 2]:  # Winter clearance
+            seasonal_factor = 0.8
+        else:
+            seasonal_factor = 1.0
+    
+        # Weekend boost
+        if transaction_date.weekday() >= 5:  # Saturday/Sunday
+            weekend_factor = 1.3
+        else:
+            weekend_factor = 1.0
+    
+        # Channel (online vs offline)
+        channel = np.random.choice(['Online', 'Offline'], p=[0.42, 0.58])
+    
+        if channel == 'Online':
+            store_id = 'ONLINE'
+        else:
+            store_id = random.choice(df_stores['StoreID'].tolist())
+    
+        # Customer (80% existing, 20% new)
+        if random.random() < 0.8:
+            customer_id = random.choice(df_customers['CustomerID'].tolist())
+        else:
+            customer_id = f'GUEST{random.randint(1000, 9999)}'
+    
+        # Product selection (weighted by category popularity)
+        category_weights = [0.28, 0.38, 0.22, 0.12]  # Boys, Girls, Infants, Accessories
+        selected_category = np.random.choice(df_products['Category'].unique(), p=category_weights)
+        product = df_products[df_products['Category'] == selected_category].sample(1).iloc[0]
+    
+        # Quantity (most buy 1-2 items)
+        quantity = np.random.choice([1, 2, 3], p=[0.65, 0.25, 0.10])
+    
+        # Price with occasional discounts
+        base_price = product['Price']
+        if random.random() < 0.15:  # 15% chance of discount
+            discount = np.random.choice([0.10, 0.20, 0.30, 0.40])
+            unit_price = round(base_price * (1 - discount), 2)
+        else:
+            unit_price = base_price
+    
+        total_amount = round(unit_price * quantity, 2)
+    
+        payment_method = np.random.choice(['Credit Card', 'Debit Card', 'PayPal', 'Cash'], 
+                                         p=[0.45, 0.25, 0.20, 0.10])
+    
+        transactions_list.append({
+            'TransactionID': f'TXN{str(transaction_id).zfill(6)}',
+            'Date': transaction_date.date(),
+            'Time': f"{random.randint(9, 20):02d}:{random.randint(0, 59):02d}:00",
+            'StoreID': store_id,
+            'ProductID': product['ProductID'],
+            'CustomerID': customer_id,
+            'Quantity': quantity,
+            'UnitPrice': unit_price,
+            'TotalAmount': total_amount,
+            'PaymentMethod': payment_method,
+            'Channel': channel
+        })
+    
+        transaction_id += 1
+    
+        if transaction_id % 10000 == 0:
+            print(f"  Progress: {transaction_id:,} / {NUM_TRANSACTIONS:,} transactions...")
+    
+    df_transactions = pd.DataFrame(transactions_list)
 df_transactions['Date'] = pd.to_datetime(df_transactions['Date'])
 
 print(f"✓ Generated {len(df_transactions):,} transactions")
@@ -330,48 +424,89 @@ print(f"  Online Sales: {(df_transactions['Channel']=='Online').sum():,} ({(df_t
 # ============================================================================
 print("\n📦 Generating Inventory Data...")
 
-inventory_list = []
-
-for _, product in df_products.iterrows():
-    # Calculate average monthly sales for this product
-    product_sales = df_transactions[df_transactions['ProductID'] == product['ProductID']]['Quantity'].sum()
-    monthly_avg_sales = product_sales / 24  # 2 years of data
-    
-    # Stock level based on sales velocity
-    if monthly_avg_sales > 50:
-        stock_level = random.randint(80, 200)
-        reorder_point = 40
-    elif monthly_avg_sales > 20:
-        stock_level = random.randint(40, 100)
-        reorder_point = 20
-    elif monthly_avg_sales > 5:
-        stock_level = random.randint(15, 50)
-        reorder_point = 10
-    else:
-        stock_level = random.randint(5, 20)
-        reorder_point = 5
+# Stock tiers by average monthly sales: (sales above, stock range, reorder point)
+stock_tiers = [
+    (50, (80, 200), 40),
+    (20, (40, 100), 20),
+    (5, (15, 50), 10),
+    (-np.inf, (5, 20), 5)
+]
+
+if GENERATION_ENGINE == 'vectorized':
+    # One pass over the transactions for every product's units sold
+    units_sold = df_transactions.groupby('ProductID', observed=True)['Quantity'].sum()
+    monthly_avg_sales = df_products['ProductID'].map(units_sold).fillna(0).to_numpy() / 24  # 2 years of data
+    
+    # First tier whose threshold the product's sales velocity clears
+    tier = np.argmax(monthly_avg_sales[:, None] > np.array([t[0] for t in stock_tiers]), axis=1)
+    stock_min = np.array([t[1][0] for t in stock_tiers])[tier]
+    stock_max = np.array([t[1][1] for t in stock_tiers])[tier]
+    reorder_point = np.array([t[2] for t in stock_tiers])[tier]
+    
+    n_products = len(df_products)
+    stock_level = rng.integers(stock_min, stock_max + 1)
     
     # Occasionally create low stock situations
-    if random.random() < 0.10:
-        stock_level = random.randint(0, reorder_point)
+    low_stock = rng.random(n_products) < 0.10
+    stock_level = np.where(low_stock, rng.integers(0, reorder_point + 1), stock_level)
     
-    last_restocked = datetime(2024, 12, 1) - timedelta(days=random.randint(0, 90))
+    lead_times = df_suppliers.set_index('SupplierID')['AverageLeadTime']
     
-    inventory_list.append({
-        'ProductID': product['ProductID'],
-        'WarehouseID': random.choice(['WH001', 'WH002', 'WH003']),
+    df_inventory = pd.DataFrame({
+        'ProductID': df_products['ProductID'].to_numpy(),
+        'WarehouseID': rng.choice(['WH001', 'WH002', 'WH003'], size=n_products),
         'StockLevel': stock_level,
         'ReorderPoint': reorder_point,
-        'LeadTime': df_suppliers[df_suppliers['SupplierID'] == product['SupplierID']]['AverageLeadTime'].values[0],
-        'SupplierID': product['SupplierID'],
-        'LastRestocked': last_restocked.date(),
-        'StockValue': round(stock_level * product['Cost'], 2)
+        'LeadTime': df_products['SupplierID'].map(lead_times).to_numpy(),
+        'SupplierID': df_products['SupplierID'].to_numpy(),
+        'LastRestocked': np.datetime64('2024-12-01') - rng.integers(0, 91, size=n_products).astype('timedelta64[D]'),
+        'StockValue': np.round(stock_level * df_products['Cost'].to_numpy(), 2)
     })
+else:
+    inventory_list = []
 
-df_inventory = pd.DataFrame(inventory_list)
-df_inventory['StockStatus'] = df_inventory.apply(
-    lambda row: 'Critical' if row['StockLevel'] < row['ReorderPoint'] * 0.5 
-    else ('Low' if row['StockLevel'] < row['ReorderPoint'] else 'Normal'), axis=1
+    for _, product in df_products.iterrows():
+        # Calculate average monthly sales for this product
+        product_sales = df_transactions[df_transactions['ProductID'] == product['ProductID']]['Quantity'].sum()
+        monthly_avg_sales = product_sales / 24  # 2 years of data
+    
+        # Stock level based on sales velocity
+        if monthly_avg_sales > 50:
+            stock_level = random.randint(80, 200)
+            reorder_point = 40
+        elif monthly_avg_sales > 20:
+            stock_level = random.randint(40, 100)
+            reorder_point = 20
+        elif monthly_avg_sales > 5:
+            stock_level = random.randint(15, 50)
+            reorder_point = 10
+        else:
+            stock_level = random.randint(5, 20)
+            reorder_point = 5
+    
+        # Occasionally create low stock situations
+        if random.random() < 0.10:
+            stock_level = random.randint(0, reorder_point)
+    
+        last_restocked = datetime(2024, 12, 1) - timedelta(days=random.randint(0, 90))
+    
+        inventory_list.append({
+            'ProductID': product['ProductID'],
+            'WarehouseID': random.choice(['WH001', 'WH002', 'WH003']),
+            'StockLevel': stock_level,
+            'ReorderPoint': reorder_point,
+            'LeadTime': df_suppliers[df_suppliers['SupplierID'] == product['SupplierID']]['AverageLeadTime'].values[0],
+            'SupplierID': product['SupplierID'],
+            'LastRestocked': last_restocked.date(),
+            'StockValue': round(stock_level * product['Cost'], 2)
+        })
+    
+    df_inventory = pd.DataFrame(inventory_list)
+
+df_inventory['StockStatus'] = np.select(
+    [df_inventory['StockLevel'] < df_inventory['ReorderPoint'] * 0.5,
+     df_inventory['StockLevel'] < df_inventory['ReorderPoint']],
+    ['Critical', 'Low'], default='Normal'
 )
 
 print(f"✓ Generated inventory data for {len(df_inventory)} products")
@@ -397,42 +532,102 @@ actions = {
 traffic_sources = ['Organic Search', 'Paid Search', 'Social Media', 'Direct', 'Email', 'Referral']
 devices = ['Desktop', 'Mobile', 'Tablet']
 
-web_analytics_list = []
-session_id = 1
-
-# Generate 200K web sessions
-num_sessions = 200000
-
-for _ in range(num_sessions):
-    session_date = start_date + timedelta(days=random.randint(0, total_days))
-    session_time = f"{random.randint(6, 23):02d}:{random.randint(0, 59):02d}:00"
-    
-    traffic_source = np.random.choice(traffic_sources, p=[0.42, 0.18, 0.15, 0.12, 0.08, 0.05])
-    device = np.random.choice(devices, p=[0.35, 0.58, 0.07])
-    
-    customer_id = random.choice(df_customers['CustomerID'].tolist()) if random.random() < 0.3 else None
-    
-    # Simulate user journey (funnel)
-    current_page = 'Homepage'
-    session_duration = 0
-    
-    # Homepage
-    web_analytics_list.append({
-        'SessionID': f'SES{str(session_id).zfill(7)}',
-        'Date': session_date.date(),
-        'Time': session_time,
-        'Page': current_page,
-        'Action': 'View',
-        'ProductID': None,
-        'CustomerID': customer_id,
-        'DeviceType': device,
-        'TrafficSource': traffic_source,
-        'Duration': random.randint(10, 60)
+traffic_weights = [0.42, 0.18, 0.15, 0.12, 0.08, 0.05]
+device_weights = [0.35, 0.58, 0.07]
+
+# Funnel steps in session order: (page, action, min/max duration, funnel
+# depth needed to reach the step). A session's depth is the number of
+# transitions it passed: Homepage -> Category (40%) -> Product (70%)
+# -> Cart (40%) -> Checkout (32%) -> Order placed (50%)
+funnel_steps = [
+    ('Homepage', 'View', 10, 60, 0),
+    ('Category', 'View', 30, 120, 1),
+    ('Product', 'View', 45, 180, 2),
+    ('Product', 'AddToCart', 5, 5, 3),
+    ('Cart', 'View', 20, 90, 3),
+    ('Checkout', 'View', 60, 240, 4),
+    ('Checkout', 'PlaceOrder', 10, 10, 5),
+    ('OrderConfirmation', 'View', 15, 45, 5)
+]
+funnel_continue = [0.40, 0.70, 0.40, 0.32, 0.50]
+
+action_names = ['View', 'AddToCart', 'PlaceOrder']
+step_page = np.array([pages.index(step[0]) for step in funnel_steps])
+step_action = np.array([action_names.index(step[1]) for step in funnel_steps])
+step_min = np.array([step[2] for step in funnel_steps])
+step_span = np.array([step[3] - step[2] + 1 for step in funnel_steps])
+step_depth = np.array([step[4] for step in funnel_steps])
+step_has_product = step_depth >= 2
+# Steps are ordered by depth, so a session emits the first events_per_depth[depth] steps
+events_per_depth = np.array([(step_depth <= d).sum() for d in range(len(funnel_continue) + 1)])
+session_time_slots = [f"{hour:02d}:{minute:02d}:00" for hour in range(6, 24) for minute in range(60)]
+
+def generate_session_batch(size, first_id):
+    """Simulate `size` sessions at once and emit one row per page event"""
+    session_dates = np.datetime64(start_date.date()) + rng.integers(0, total_days + 1, size=size).astype('timedelta64[D]')
+    time_idx = rng.integers(0, len(session_time_slots), size=size)
+    source_idx = rng.choice(len(traffic_sources), size=size, p=traffic_weights)
+    device_idx = rng.choice(len(devices), size=size, p=device_weights)
+    
+    # 30% of sessions belong to a known customer; -1 codes become missing values
+    customer_idx = np.where(rng.random(size) < 0.3, rng.integers(0, len(customer_ids), size=size), -1)
+    product_idx = rng.integers(0, len(product_ids), size=size)
+    
+    # Funnel depth = number of consecutive stage transitions passed
+    passed = rng.random((size, len(funnel_continue))) < funnel_continue
+    depth = np.cumprod(passed, axis=1).sum(axis=1)
+    
+    # Expand sessions into events: session index and funnel step per row
+    n_events = events_per_depth[depth]
+    session = np.repeat(np.arange(size), n_events)
+    step = np.arange(len(session)) - np.repeat(np.cumsum(n_events) - n_events, n_events)
+    
+    duration = step_min[step] + (rng.random(len(step)) * step_span[step]).astype(np.int64)
+    event_product = np.where(step_has_product[step], product_idx[session], -1)
+    session_ids = np.char.add('SES', np.char.zfill(np.arange(first_id, first_id + size).astype(str), 7))
+    
+    return pd.DataFrame({
+        'SessionID': session_ids[session],
+        'Date': session_dates[session],
+        'Time': pd.Categorical.from_codes(time_idx[session], session_time_slots),
+        'Page': pd.Categorical.from_codes(step_page[step], pages),
+        'Action': pd.Categorical.from_codes(step_action[step], action_names),
+        'ProductID': pd.Categorical.from_codes(event_product, product_ids),
+        'CustomerID': pd.Categorical.from_codes(customer_idx[session], customer_ids),
+        'DeviceType': pd.Categorical.from_codes(device_idx[session], devices),
+        'TrafficSource': pd.Categorical.from_codes(source_idx[session], traffic_sources),
+        'Duration': duration
     })
+
+if GENERATION_ENGINE == 'vectorized':
+    session_batches = []
+    simulated = 0
+    while simulated < NUM_SESSIONS:
+        size = min(SESSION_BATCH_SIZE, NUM_SESSIONS - simulated)
+        session_batches.append(generate_session_batch(size, simulated + 1))
+        simulated += size
+        print(f"  Progress: {simulated:,} / {NUM_SESSIONS:,} sessions...")
+    
+    df_web_analytics = pd.concat(session_batches, ignore_index=True)
+    del session_batches
+else:
+    web_analytics_list = []
+    session_id = 1
+    
+    for _ in range(NUM_SESSIONS):
+        session_date = start_date + timedelta(days=random.randint(0, total_days))
+        session_time = f"{random.randint(6, 23):02d}:{random.randint(0, 59):02d}:00"
+    
+        traffic_source = np.random.choice(traffic_sources, p=[0.42, 0.18, 0.15, 0.12, 0.08, 0.05])
+        device = np.random.choice(devices, p=[0.35, 0.58, 0.07])
     
-    # Continue to category (60% bounce rate)
-    if random.random() > 0.60:
-        current_page = 'Category'
+        customer_id = random.choice(df_customers['CustomerID'].tolist()) if random.random() < 0.3 else None
+    
+        # Simulate user journey (funnel)
+        current_page = 'Homepage'
+        session_duration = 0
+    
+        # Homepage
         web_analytics_list.append({
             'SessionID': f'SES{str(session_id).zfill(7)}',
             'Date': session_date.date(),
@@ -443,42 +638,29 @@ for _ in range(num_sessions):
             'CustomerID': customer_id,
             'DeviceType': device,
             'TrafficSource': traffic_source,
-            'Duration': random.randint(30, 120)
+            'Duration': random.randint(10, 60)
         })
-        
-        # View product (70% continue)
-        if random.random() > 0.30:
-            current_page = 'Product'
-            product_id = random.choice(df_products['ProductID'].tolist())
+    
+        # Continue to category (60% bounce rate)
+        if random.random() > 0.60:
+            current_page = 'Category'
             web_analytics_list.append({
                 'SessionID': f'SES{str(session_id).zfill(7)}',
                 'Date': session_date.date(),
                 'Time': session_time,
                 'Page': current_page,
                 'Action': 'View',
-                'ProductID': product_id,
+                'ProductID': None,
                 'CustomerID': customer_id,
                 'DeviceType': device,
                 'TrafficSource': traffic_source,
-                'Duration': random.randint(45, 180)
+                'Duration': random.randint(30, 120)
             })
-            
-            # Add to cart (40% conversion)
-            if random.random() > 0.60:
-                web_analytics_list.append({
-                    'SessionID': f'SES{str(session_id).zfill(7)}',
-                    'Date': session_date.date(),
-                    'Time': session_time,
-                    'Page': current_page,
-                    'Action': 'AddToCart',
-                    'ProductID': product_id,
-                    'CustomerID': customer_id,
-                    'DeviceType': device,
-                    'TrafficSource': traffic_source,
-                    'Duration': 5
-                })
-                
-                current_page = 'Cart'
+        
+            # View product (70% continue)
+            if random.random() > 0.30:
+                current_page = 'Product'
+                product_id = random.choice(df_products['ProductID'].tolist())
                 web_analytics_list.append({
                     'SessionID': f'SES{str(session_id).zfill(7)}',
                     'Date': session_date.date(),
@@ -489,12 +671,25 @@ for _ in range(num_sessions):
                     'CustomerID': customer_id,
                     'DeviceType': device,
                     'TrafficSource': traffic_source,
-                    'Duration': random.randint(20, 90)
+                    'Duration': random.randint(45, 180)
                 })
+            
+                # Add to cart (40% conversion)
+                if random.random() > 0.60:
+                    web_analytics_list.append({
+                        'SessionID': f'SES{str(session_id).zfill(7)}',
+                        'Date': session_date.date(),
+                        'Time': session_time,
+                        'Page': current_page,
+                        'Action': 'AddToCart',
+                        'ProductID': product_id,
+                        'CustomerID': customer_id,
+                        'DeviceType': device,
+                        'TrafficSource': traffic_source,
+                        'Duration': 5
+                    })
                 
-                # Proceed to checkout (32% abandon cart)
-                if random.random() > 0.68:
-                    current_page = 'Checkout'
+                    current_page = 'Cart'
                     web_analytics_list.append({
                         'SessionID': f'SES{str(session_id).zfill(7)}',
                         'Date': session_date.date(),
@@ -505,25 +700,12 @@ for _ in range(num_sessions):
                         'CustomerID': customer_id,
                         'DeviceType': device,
                         'TrafficSource': traffic_source,
-                        'Duration': random.randint(60, 240)
+                        'Duration': random.randint(20, 90)
                     })
-                    
-                    # Complete purchase (50% complete)
-                    if random.random() > 0.50:
-                        web_analytics_list.append({
-                            'SessionID': f'SES{str(session_id).zfill(7)}',
-                            'Date': session_date.date(),
-                            'Time': session_time,
-                            'Page': current_page,
-                            'Action': 'PlaceOrder',
-                            'ProductID': product_id,
-                            'CustomerID': customer_id,
-                            'DeviceType': device,
-                            'TrafficSource': traffic_source,
-                            'Duration': 10
-                        })
-                        
-                        current_page = 'OrderConfirmation'
+                
+                    # Proceed to checkout (32% abandon cart)
+                    if random.random() > 0.68:
+                        current_page = 'Checkout'
                         web_analytics_list.append({
                             'SessionID': f'SES{str(session_id).zfill(7)}',
                             'Date': session_date.date(),
@@ -534,18 +716,47 @@ for _ in range(num_sessions):
                             'CustomerID': customer_id,
                             'DeviceType': device,
                             'TrafficSource': traffic_source,
-                            'Duration': random.randint(15, 45)
+                            'Duration': random.randint(60, 240)
                         })
+                    
+                        # Complete purchase (50% complete)
+                        if random.random() > 0.50:
+                            web_analytics_list.append({
+                                'SessionID': f'SES{str(session_id).zfill(7)}',
+                                'Date': session_date.date(),
+                                'Time': session_time,
+                                'Page': current_page,
+                                'Action': 'PlaceOrder',
+                                'ProductID': product_id,
+                                'CustomerID': customer_id,
+                                'DeviceType': device,
+                                'TrafficSource': traffic_source,
+                                'Duration': 10
+                            })
+                        
+                            current_page = 'OrderConfirmation'
+                            web_analytics_list.append({
+                                'SessionID': f'SES{str(session_id).zfill(7)}',
+                                'Date': session_date.date(),
+                                'Time': session_time,
+                                'Page': current_page,
+                                'Action': 'View',
+                                'ProductID': product_id,
+                                'CustomerID': customer_id,
+                                'DeviceType': device,
+                                'TrafficSource': traffic_source,
+                                'Duration': random.randint(15, 45)
+                            })
     
-    session_id += 1
+        session_id += 1
     
-    if session_id % 50000 == 0:
-        print(f"  Progress: {session_id:,} / {num_sessions:,} sessions...")
-
-df_web_analytics = pd.DataFrame(web_analytics_list)
+        if session_id % 50000 == 0:
+            print(f"  Progress: {session_id:,} / {NUM_SESSIONS:,} sessions...")
+    
+    df_web_analytics = pd.DataFrame(web_analytics_list)
 df_web_analytics['Date'] = pd.to_datetime(df_web_analytics['Date'])
 
-print(f"✓ Generated {len(df_web_analytics):,} web events from {num_sessions:,} sessions")
+print(f"✓ Generated {len(df_web_analytics):,} web events from {NUM_SESSIONS:,} sessions")
 print(f"  Homepage Views: {(df_web_analytics['Page']=='Homepage').sum():,}")
 print(f"  Product Views: {(df_web_analytics['Page']=='Product').sum():,}")
 print(f"  Add to Cart: {(df_web_analytics['Action']=='AddToCart').sum():,}")
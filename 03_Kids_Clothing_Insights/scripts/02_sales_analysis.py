@@ -8,16 +8,16 @@ import numpy as np
 from datetime import datetime
 from pathlib import Path
 
+from kids_storage import load_table, load_sales
+
 print("📊 Starting Sales Performance Analysis...")
 print("=" * 60)
 
 # Load datasets
 print("\n📂 Loading datasets...")
-df_transactions = pd.read_csv('data/raw/sales_transactions.csv')
-df_products = pd.read_csv('data/raw/products.csv')
-df_stores = pd.read_csv('data/raw/stores.csv')
-
-df_transactions['Date'] = pd.to_datetime(df_transactions['Date'])
+df_transactions = load_table('sales_transactions')
+df_products = load_table('products')
+df_stores = load_table('stores')
 
 print(f"✓ Loaded {len(df_transactions):,} transactions")
 print(f"✓ Loaded {len(df_products):,} products")
@@ -25,8 +25,7 @@ print(f"✓ Loaded {len(df_stores):,} stores")
 
 # Merge data
 print("\n🔗 Merging datasets...")
-df_sales = df_transactions.merge(df_products, on='ProductID', how='left')
-df_sales = df_sales.merge(df_stores, on='StoreID', how='left')
+df_sales = load_sales()
 
 print(f"✓ Created unified sales dataset with {len(df_sales):,} records")
 
@@ -7,16 +7,25 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+from kids_storage import load_table
+from rfm_rules import compile_rules, assign_segments
+from rfm_state import RFMState
+
+# Cohort grain and horizon: 'M' groups customers by signup month, 'W' by
+# signup week; activity is tracked for COHORT_PERIODS periods after signup
+COHORT_FREQ = 'M'
+COHORT_PERIODS = 12
+
+# Per-customer RFM state picked up by rfm_daily_update.py
+RFM_STATE_DIR = 'data/rfm_state'
+
 print("👥 Starting Customer Analytics & RFM Segmentation...")
 print("=" * 60)
 
 # Load datasets
 print("\n📂 Loading datasets...")
-df_customers = pd.read_csv('data/raw/customers.csv')
-df_transactions = pd.read_csv('data/raw/sales_transactions.csv')
-
-df_customers['SignupDate'] = pd.to_datetime(df_customers['SignupDate'])
-df_transactions['Date'] = pd.to_datetime(df_transactions['Date'])
+df_customers = load_table('customers')
+df_transactions = load_table('sales_transactions')
 
 print(f"✓ Loaded {len(df_customers):,} customers")
 print(f"✓ Loaded {len(df_transactions):,} transactions")
@@ -63,13 +72,8 @@ print("\n🎯 Calculating RFM Scores...")
 analysis_date = datetime(2024, 12, 31)
 
 # Calculate RFM
-rfm = df_transactions_registered.groupby('CustomerID').agg({
-    'Date': lambda x: (analysis_date - x.max()).days,  # Recency
-    'TransactionID': 'count',  # Frequency
-    'TotalAmount': 'sum'  # Monetary
-}).reset_index()
-
-rfm.columns = ['CustomerID', 'Recency', 'Frequency', 'Monetary']
+rfm_state = RFMState.from_transactions(df_transactions_registered, 'CustomerID', 'Date', 'TransactionID', 'TotalAmount')
+rfm = rfm_state.rfm(analysis_date)
 
 print(f"\nRFM Statistics:")
 print(f"  Avg Recency: {rfm['Recency'].mean():.1f} days")
@@ -97,51 +101,33 @@ print(f"✓ Calculated RFM scores for {len(rfm):,} customers")
 # ============================================================================
 print("\n🏷️ Creating Customer Segments...")
 
-def segment_customer(row):
-    """Segment customers based on RFM scores"""
-    r, f, m = row['R_Score'], row['F_Score'], row['M_Score']
-    
+# Segment rules over RFM scores, checked in order; customers matching none are 'Lost'
+SEGMENT_RULES = [
     # Champions: High R, F, M
-    if r >= 4 and f >= 4 and m >= 4:
-        return 'Champions'
-    
+    ('Champions', {'R': (4, 5), 'F': (4, 5), 'M': (4, 5)}),
     # Loyal Customers: High F, decent R and M
-    elif f >= 4 and r >= 3 and m >= 3:
-        return 'Loyal Customers'
-    
+    ('Loyal Customers', {'F': (4, 5), 'R': (3, 5), 'M': (3, 5)}),
     # Potential Loyalists: Recent customers with good frequency
-    elif r >= 4 and f >= 2 and m >= 2:
-        return 'Potential Loyalists'
-    
+    ('Potential Loyalists', {'R': (4, 5), 'F': (2, 5), 'M': (2, 5)}),
     # Recent Customers: Very recent but low frequency
-    elif r >= 4 and f <= 2:
-        return 'Recent Customers'
-    
+    ('Recent Customers', {'R': (4, 5), 'F': (1, 2)}),
     # Promising: Mid-level on all scores
-    elif r >= 3 and f >= 2 and m >= 2:
-        return 'Promising'
-    
+    ('Promising', {'R': (3, 5), 'F': (2, 5), 'M': (2, 5)}),
     # Need Attention: Declining engagement
-    elif r >= 2 and f >= 2:
-        return 'Need Attention'
-    
+    ('Need Attention', {'R': (2, 5), 'F': (2, 5)}),
     # At Risk: Used to be good, declining
-    elif r <= 2 and f >= 3:
-        return 'At Risk'
-    
+    ('At Risk', {'R': (1, 2), 'F': (3, 5)}),
     # Cannot Lose: High spenders who haven't returned
-    elif r <= 2 and m >= 4:
-        return 'Cannot Lose Them'
-    
+    ('Cannot Lose Them', {'R': (1, 2), 'M': (4, 5)}),
     # Hibernating: Low recent activity but some history
-    elif r <= 2 and f <= 2 and m >= 2:
-        return 'Hibernating'
-    
-    # Lost: Very low engagement
-    else:
-        return 'Lost'
+    ('Hibernating', {'R': (1, 2), 'F': (1, 2), 'M': (2, 5)})
+]
+
+segment_lookup = compile_rules(SEGMENT_RULES, default='Lost')
+rfm['Segment'] = assign_segments(segment_lookup, rfm['R_Score'], rfm['F_Score'], rfm['M_Score'])
 
-rfm['Segment'] = rfm.apply(segment_customer, axis=1)
+# Daily updates fold new transactions into this state instead of regrouping everything
+rfm_state.save(RFM_STATE_DIR, segment_lookup)
 
 # Segment statistics
 segment_stats = rfm.groupby('Segment').agg({
@@ -278,33 +264,43 @@ for _, row in gender_analysis.iterrows():
 # ============================================================================
 print("\n📅 Performing Cohort Analysis...")
 
-# Create cohort based on signup month
-customer_full['CohortMonth'] = customer_full['SignupDate'].dt.to_period('M')
-
-# Calculate months since signup
-cohort_data = []
-for cohort in customer_full['CohortMonth'].unique():
-    cohort_customers = customer_full[customer_full['CohortMonth'] == cohort]['CustomerID'].tolist()
-    
-    # Count active customers in each subsequent month
-    for month_offset in range(0, 13):  # 12 months
-        target_date = cohort.to_timestamp() + pd.DateOffset(months=month_offset)
-        
-        active = df_transactions_registered[
-            (df_transactions_registered['CustomerID'].isin(cohort_customers)) &
-            (df_transactions_registered['Date'].dt.to_period('M') == target_date.to_period('M'))
-        ]['CustomerID'].nunique()
-        
-        cohort_data.append({
-            'Cohort': str(cohort),
-            'MonthOffset': month_offset,
-            'ActiveCustomers': active
-        })
-
-df_cohort = pd.DataFrame(cohort_data)
+def cohort_activity(customers, transactions, freq='M', periods=12):
+    """Distinct active customers for every signup cohort and period offset
+
+    Dates become integer period ordinals once, so each transaction's offset
+    from its customer's cohort is a subtraction and the whole cohort x offset
+    matrix is one groupby, for any grain or horizon. Cohorts keep the order
+    in which they first appear in ``customers``.
+    """
+    offset_column = {'M': 'MonthOffset', 'W': 'WeekOffset', 'Q': 'QuarterOffset'}.get(freq, 'PeriodOffset')
+
+    cohort_ordinals = pd.Series(customers['SignupDate'].dt.to_period(freq).array.asi8,
+                                index=customers['CustomerID'].values)
+    txn_cohort = transactions['CustomerID'].map(cohort_ordinals)
+    txn_period = transactions['Date'].dt.to_period(freq).array.asi8
+    offsets = txn_period - txn_cohort.to_numpy()
+
+    in_window = txn_cohort.notna().to_numpy() & (offsets >= 0) & (offsets <= periods)
+    active = pd.DataFrame({
+        'Cohort': txn_cohort.to_numpy()[in_window].astype('int64'),
+        offset_column: offsets[in_window].astype('int64'),
+        'CustomerID': transactions['CustomerID'].to_numpy()[in_window]
+    }).groupby(['Cohort', offset_column])['CustomerID'].nunique()
+
+    # Every cohort gets every offset, including periods with no activity
+    cohorts = pd.unique(cohort_ordinals.to_numpy())
+    grid = pd.MultiIndex.from_product([cohorts, range(periods + 1)], names=['Cohort', offset_column])
+    df = active.reindex(grid, fill_value=0).rename('ActiveCustomers').reset_index()
+
+    labels = pd.PeriodIndex.from_ordinals(cohorts, freq=freq).astype(str)
+    df['Cohort'] = df['Cohort'].map(pd.Series(labels, index=cohorts))
+    return df, offset_column
+
+df_cohort, offset_column = cohort_activity(customer_full, df_transactions_registered,
+                                           freq=COHORT_FREQ, periods=COHORT_PERIODS)
 
 # Calculate retention rates
-cohort_sizes = df_cohort[df_cohort['MonthOffset'] == 0].set_index('Cohort')['ActiveCustomers']
+cohort_sizes = df_cohort[df_cohort[offset_column] == 0].set_index('Cohort')['ActiveCustomers']
 df_cohort['CohortSize'] = df_cohort['Cohort'].map(cohort_sizes)
 df_cohort['RetentionRate'] = (df_cohort['ActiveCustomers'] / df_cohort['CohortSize'] * 100).round(2)
 
@@ -7,18 +7,21 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+from kids_storage import load_table
+from replenishment import ReplenishmentEngine
+
+# Replenishment engine state, updated in place by replenishment_daily_update.py
+REPLENISHMENT_STATE_DIR = 'data/replenishment_state'
+
 print("📦 Starting Inventory & Supply Chain Analysis...")
 print("=" * 60)
 
 # Load datasets
 print("\n📂 Loading datasets...")
-df_inventory = pd.read_csv('data/raw/inventory.csv')
-df_products = pd.read_csv('data/raw/products.csv')
-df_suppliers = pd.read_csv('data/raw/suppliers.csv')
-df_transactions = pd.read_csv('data/raw/sales_transactions.csv')
-
-df_inventory['LastRestocked'] = pd.to_datetime(df_inventory['LastRestocked'])
-df_transactions['Date'] = pd.to_datetime(df_transactions['Date'])
+df_inventory = load_table('inventory')
+df_products = load_table('products')
+df_suppliers = load_table('suppliers')
+df_transactions = load_table('sales_transactions')
 
 print(f"✓ Loaded {len(df_inventory):,} inventory records")
 print(f"✓ Loaded {len(df_products):,} products")
@@ -47,6 +50,12 @@ elif 'SupplierID_product' in df_inv_full.columns:
 
 print(f"✓ Created unified inventory dataset")
 
+# Velocity, turnover, days of inventory and reorder points for every SKU x warehouse row
+engine = ReplenishmentEngine(df_inventory)
+engine.update(df_transactions)
+replenishment = engine.table()
+print(f"✓ Evaluated replenishment for {len(replenishment):,} SKU-warehouse rows")
+
 # ============================================================================
 # 1. OVERALL INVENTORY METRICS
 # ============================================================================
@@ -122,37 +131,12 @@ print(f"  Estimated Reorder Cost: ${reorder_low['EstimatedCost'].sum():,.2f}")
 # ============================================================================
 print("\n🔄 Calculating Inventory Turnover...")
 
-# Calculate sales in last 12 months
-last_12_months = df_transactions['Date'].max() - timedelta(days=365)
-recent_sales = df_transactions[df_transactions['Date'] >= last_12_months].groupby('ProductID').agg({
-    'Quantity': 'sum'
-}).reset_index()
-
-recent_sales.columns = ['ProductID', 'UnitsSold_12M']
-
-# Merge with inventory
-turnover_analysis = df_inv_full.merge(recent_sales, on='ProductID', how='left')
-turnover_analysis['UnitsSold_12M'] = turnover_analysis['UnitsSold_12M'].fillna(0)
-
-# Calculate turnover ratio
-turnover_analysis['TurnoverRatio'] = np.where(
-    turnover_analysis['StockLevel'] > 0,
-    turnover_analysis['UnitsSold_12M'] / turnover_analysis['StockLevel'],
-    0
-).round(2)
-
-# Categorize turnover
-def categorize_turnover(ratio):
-    if ratio >= 5:
-        return 'Fast Moving'
-    elif ratio >= 2:
-        return 'Regular'
-    elif ratio >= 0.5:
-        return 'Slow Moving'
-    else:
-        return 'Very Slow/Dead Stock'
-
-turnover_analysis['TurnoverCategory'] = turnover_analysis['TurnoverRatio'].apply(categorize_turnover)
+# Units sold in the last 12 months and turnover bands come from the engine
+turnover_analysis = df_inv_full.assign(
+    UnitsSold_12M=replenishment['UnitsSold_12M'].to_numpy(),
+    TurnoverRatio=replenishment['TurnoverRatio'].to_numpy(),
+    TurnoverCategory=replenishment['TurnoverCategory'].to_numpy()
+)
 
 turnover_summary = turnover_analysis.groupby('TurnoverCategory').agg({
     'ProductID': 'count',
@@ -254,34 +238,12 @@ for _, row in category_inventory.iterrows():
 # ============================================================================
 print("\n📅 Calculating Days of Inventory...")
 
-# Calculate daily sales rate
-daily_sales = df_transactions.groupby('ProductID')['Quantity'].sum() / 730  # 2 years of data
-
-days_inventory = df_inv_full.copy()
-days_inventory = days_inventory.merge(daily_sales.reset_index(), on='ProductID', how='left')
-days_inventory.columns = list(days_inventory.columns[:-1]) + ['DailySalesRate']
-days_inventory['DailySalesRate'] = days_inventory['DailySalesRate'].fillna(0)
-
-days_inventory['DaysOfInventory'] = np.where(
-    days_inventory['DailySalesRate'] > 0,
-    days_inventory['StockLevel'] / days_inventory['DailySalesRate'],
-    999  # High number for no sales
-).round(0)
-
-# Categorize
-def categorize_days(days):
-    if days <= 30:
-        return 'Under 30 days'
-    elif days <= 60:
-        return '30-60 days'
-    elif days <= 90:
-        return '60-90 days'
-    elif days <= 180:
-        return '90-180 days'
-    else:
-        return 'Over 180 days'
-
-days_inventory['DOI_Category'] = days_inventory['DaysOfInventory'].apply(categorize_days)
+# Daily sales rate over the two-year history and DOI bands come from the engine
+days_inventory = df_inv_full.assign(
+    DailySalesRate=replenishment['DailySalesRate'].to_numpy(),
+    DaysOfInventory=replenishment['DaysOfInventory'].to_numpy(),
+    DOI_Category=replenishment['DOI_Category'].to_numpy()
+)
 
 doi_summary = days_inventory.groupby('DOI_Category').agg({
     'ProductID': 'count',
@@ -328,6 +290,31 @@ for _, row in stock_age_analysis.iterrows():
     print(f"  {row['StockAge']}: {row['ProductCount']} items | {row['TotalUnits']:,} units | "
           f"${row['StockValue']:,.2f} ({row['ValueShare']:.1f}%)")
 
+# ============================================================================
+# 10. REPLENISHMENT PLAN
+# ============================================================================
+print("\n🚚 Building Replenishment Plan...")
+
+replenishment_plan = replenishment.assign(
+    ProductName=df_inv_full['ProductName'].to_numpy(),
+    Category=df_inv_full['Category'].to_numpy(),
+    Cost=df_inv_full['Cost'].to_numpy()
+)
+replenishment_plan['OrderCost'] = (replenishment_plan['OrderQuantity'] * replenishment_plan['Cost']).round(2)
+replenishment_plan = replenishment_plan[['ProductID', 'ProductName', 'Category', 'WarehouseID', 'StockLevel',
+                                         'LeadTime', 'DailySalesRate', 'DaysOfInventory', 'SafetyStock',
+                                         'ReorderPoint', 'NeedsReorder', 'OrderQuantity', 'OrderCost']]
+reorder_due = replenishment_plan[replenishment_plan['NeedsReorder']]
+
+print(f"\nDemand-Based Reorder Points:")
+print(f"  Avg Safety Stock: {replenishment_plan['SafetyStock'].mean():.1f} units")
+print(f"  Avg Reorder Point: {replenishment_plan['ReorderPoint'].mean():.1f} units")
+print(f"  Items at or below Reorder Point: {len(reorder_due)} ({len(reorder_due)/len(replenishment_plan)*100:.1f}%)")
+print(f"  Suggested Order Cost: ${reorder_due['OrderCost'].sum():,.2f}")
+
+engine.save(REPLENISHMENT_STATE_DIR)
+print(f"✓ Saved replenishment state to {REPLENISHMENT_STATE_DIR}/")
+
 # ============================================================================
 # SAVE PROCESSED DATA
 # ============================================================================
@@ -372,6 +359,10 @@ slow_moving[['ProductID', 'ProductName', 'Category', 'StockLevel', 'UnitsSold_12
              'TurnoverRatio', 'StockValue']].to_csv('data/processed/slow_moving_inventory.csv', index=False)
 print("✓ Saved slow_moving_inventory.csv")
 
+# Replenishment plan
+replenishment_plan.to_csv('data/processed/replenishment_plan.csv', index=False)
+print("✓ Saved replenishment_plan.csv")
+
 print("\n" + "=" * 60)
 print("✅ Inventory & Supply Chain Analysis Complete!")
 print("=" * 60)
@@ -7,25 +7,39 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+from kids_storage import load_table, load_sales
+from period_cube import PeriodCube
+
+# Dimensions kept in the day-level base table every report rolls up from
+CUBE_DIMENSIONS = ['Category', 'Channel', 'Brand']
+
 print("💼 Starting Executive Summary Analysis...")
 print("=" * 60)
 
 # Load datasets
 print("\n📂 Loading datasets...")
-df_transactions = pd.read_csv('data/raw/sales_transactions.csv')
-df_products = pd.read_csv('data/raw/products.csv')
-df_inventory = pd.read_csv('data/raw/inventory.csv')
-df_customers = pd.read_csv('data/raw/customers.csv')
-
-df_transactions['Date'] = pd.to_datetime(df_transactions['Date'])
+df_transactions = load_table('sales_transactions')
+df_products = load_table('products')
+df_inventory = load_table('inventory')
+df_customers = load_table('customers')
 
 print(f"✓ Loaded {len(df_transactions):,} transactions")
 print(f"✓ Loaded {len(df_products):,} products")
 print(f"✓ Loaded {len(df_inventory):,} inventory records")
 print(f"✓ Loaded {len(df_customers):,} customers")
 
-# Merge transactions with products
-df_sales = df_transactions.merge(df_products[['ProductID', 'Cost', 'Category', 'Margin']], on='ProductID', how='left')
+# Transactions with their product cost, category and margin (prebuilt in the cache)
+df_sales = load_sales(columns=df_transactions.columns.tolist() + ['Cost', 'Category', 'Brand', 'Margin'])
+df_sales['COGS'] = df_sales['Quantity'] * df_sales['Cost']
+
+# One pass over the sales: revenue, COGS, units and transactions per day x dimension
+cube = PeriodCube(df_sales, {
+    'Revenue': ('TotalAmount', 'sum'),
+    'COGS': ('COGS', 'sum'),
+    'UnitsSold': ('Quantity', 'sum'),
+    'Transactions': ('TransactionID', 'nunique')
+}, dimensions=CUBE_DIMENSIONS, money=['Revenue', 'COGS'])
+print(f"✓ Built period cube: {len(cube.base):,} day x dimension cells")
 
 # ============================================================================
 # 1. FINANCIAL OVERVIEW
@@ -34,7 +48,7 @@ print("\n💰 Calculating Financial Metrics...")
 
 # Revenue metrics
 total_revenue = df_sales['TotalAmount'].sum()
-total_cogs = (df_sales['Quantity'] * df_sales['Cost']).sum()
+total_cogs = df_sales['COGS'].sum()
 gross_profit = total_revenue - total_cogs
 gross_margin = (gross_profit / total_revenue * 100) if total_revenue > 0 else 0
 
@@ -98,29 +112,18 @@ print(f"  CLV/CAC Ratio: {clv_cac_ratio:.2f}x")
 # ============================================================================
 print("\n📈 Analyzing Year-over-Year Growth...")
 
-df_sales['Year'] = df_sales['Date'].dt.year
-
-yearly_comparison = df_sales.groupby('Year').agg({
-    'TotalAmount': 'sum',
-    'TransactionID': 'nunique',
-    'Quantity': 'sum'
-}).reset_index()
+yearly = cube.rollup('year', growth={'YoY': 1}, growth_measures=('Revenue', 'Transactions'))
+yearly_comparison = yearly[['Year', 'Revenue', 'Transactions', 'UnitsSold', 'RevenueYoY']]
 
-yearly_comparison.columns = ['Year', 'Revenue', 'Transactions', 'UnitsSold']
-
-# Calculate YoY growth
+# Compare the latest year with the one before it
 if len(yearly_comparison) > 1:
-    revenue_2023 = yearly_comparison[yearly_comparison['Year'] == 2023]['Revenue'].values[0]
-    revenue_2024 = yearly_comparison[yearly_comparison['Year'] == 2024]['Revenue'].values[0]
-    revenue_growth = ((revenue_2024 - revenue_2023) / revenue_2023 * 100)
-    
-    trans_2023 = yearly_comparison[yearly_comparison['Year'] == 2023]['Transactions'].values[0]
-    trans_2024 = yearly_comparison[yearly_comparison['Year'] == 2024]['Transactions'].values[0]
-    trans_growth = ((trans_2024 - trans_2023) / trans_2023 * 100)
-    
+    previous_year, latest_year = yearly.iloc[-2], yearly.iloc[-1]
+    revenue_growth = latest_year['RevenueYoY']
+    trans_growth = latest_year['TransactionsYoY']
+
     print(f"\nYear-over-Year Performance:")
-    print(f"  2023 Revenue: ${revenue_2023:,.2f}")
-    print(f"  2024 Revenue: ${revenue_2024:,.2f}")
+    print(f"  {previous_year['Year']:.0f} Revenue: ${previous_year['Revenue']:,.2f}")
+    print(f"  {latest_year['Year']:.0f} Revenue: ${latest_year['Revenue']:,.2f}")
     print(f"  Revenue Growth: {revenue_growth:+.2f}%")
     print(f"  Transaction Growth: {trans_growth:+.2f}%")
 
@@ -129,16 +132,9 @@ if len(yearly_comparison) > 1:
 # ============================================================================
 print("\n📅 Analyzing Quarterly Performance...")
 
-df_sales['Quarter'] = df_sales['Date'].dt.quarter
-df_sales['YearQuarter'] = df_sales['Year'].astype(str) + '-Q' + df_sales['Quarter'].astype(str)
-
-quarterly_performance = df_sales.groupby('YearQuarter').agg({
-    'TotalAmount': 'sum',
-    'TransactionID': 'nunique',
-    'Quantity': 'sum'
-}).reset_index()
-
-quarterly_performance.columns = ['Quarter', 'Revenue', 'Transactions', 'UnitsSold']
+quarterly_performance = cube.rollup('quarter', growth={'QoQ': 1, 'YoY': 4})
+quarterly_performance = quarterly_performance[['Quarter', 'Revenue', 'Transactions', 'UnitsSold',
+                                               'RevenueQoQ', 'RevenueYoY']]
 
 print(f"\nQuarterly Performance:")
 for _, row in quarterly_performance.iterrows():
@@ -149,13 +145,7 @@ for _, row in quarterly_performance.iterrows():
 # ============================================================================
 print("\n📦 Analyzing Category Contribution to Revenue...")
 
-category_financial = df_sales.groupby('Category').agg({
-    'TotalAmount': 'sum',
-    'Cost': lambda x: (df_sales.loc[x.index, 'Quantity'] * x).sum(),
-    'Quantity': 'sum'
-}).reset_index()
-
-category_financial.columns = ['Category', 'Revenue', 'COGS', 'UnitsSold']
+category_financial = cube.rollup(None, by=['Category'])[['Category', 'Revenue', 'COGS', 'UnitsSold']]
 category_financial['GrossProfit'] = category_financial['Revenue'] - category_financial['COGS']
 category_financial['GrossMargin'] = (category_financial['GrossProfit'] / category_financial['Revenue'] * 100).round(2)
 category_financial['RevenueShare'] = (category_financial['Revenue'] / total_revenue * 100).round(2)
@@ -166,17 +156,23 @@ for _, row in category_financial.iterrows():
     print(f"  {row['Category']}: ${row['Revenue']:,.2f} ({row['RevenueShare']:.1f}%) | "
           f"Margin: {row['GrossMargin']:.1f}%")
 
+# Brand revenue and margin per year, with year-over-year growth
+brand_yearly = cube.rollup('year', by=['Brand'], growth={'YoY': 1})
+brand_yearly['GrossMargin'] = ((brand_yearly['Revenue'] - brand_yearly['COGS']) / brand_yearly['Revenue'] * 100).round(2)
+brand_yearly = brand_yearly[['Year', 'Brand', 'Revenue', 'COGS', 'UnitsSold', 'GrossMargin', 'RevenueYoY']]
+latest_brands = brand_yearly[brand_yearly['Year'] == brand_yearly['Year'].max()].nlargest(5, 'Revenue')
+
+print(f"\nTop 5 Brands ({brand_yearly['Year'].max()}):")
+for brand, revenue, margin, growth in zip(latest_brands['Brand'], latest_brands['Revenue'],
+                                          latest_brands['GrossMargin'], latest_brands['RevenueYoY']):
+    print(f"  {brand}: ${revenue:,.2f} | Margin: {margin:.1f}% | YoY: {growth:+.2f}%")
+
 # ============================================================================
 # 6. CHANNEL CONTRIBUTION
 # ============================================================================
 print("\n🌐 Analyzing Channel Performance...")
 
-channel_financial = df_sales.groupby('Channel').agg({
-    'TotalAmount': 'sum',
-    'TransactionID': 'nunique'
-}).reset_index()
-
-channel_financial.columns = ['Channel', 'Revenue', 'Transactions']
+channel_financial = cube.rollup(None, by=['Channel'])[['Channel', 'Revenue', 'Transactions']]
 channel_financial['RevenueShare'] = (channel_financial['Revenue'] / total_revenue * 100).round(2)
 channel_financial['AvgTransactionValue'] = (channel_financial['Revenue'] / channel_financial['Transactions']).round(2)
 
@@ -190,17 +186,9 @@ for _, row in channel_financial.iterrows():
 # ============================================================================
 print("\n💹 Analyzing Profitability Trends...")
 
-df_sales['YearMonth'] = df_sales['Date'].dt.to_period('M')
-
-monthly_profitability = df_sales.groupby('YearMonth').agg({
-    'TotalAmount': 'sum',
-    'Cost': lambda x: (df_sales.loc[x.index, 'Quantity'] * x).sum()
-}).reset_index()
-
-monthly_profitability.columns = ['YearMonth', 'Revenue', 'COGS']
+monthly_profitability = cube.rollup('month')[['YearMonth', 'Revenue', 'COGS']]
 monthly_profitability['GrossProfit'] = monthly_profitability['Revenue'] - monthly_profitability['COGS']
 monthly_profitability['GrossMargin'] = (monthly_profitability['GrossProfit'] / monthly_profitability['Revenue'] * 100).round(2)
-monthly_profitability['YearMonth'] = monthly_profitability['YearMonth'].astype(str)
 
 print(f"\n✓ Calculated monthly profitability for {len(monthly_profitability)} months")
 print(f"  Avg Monthly Revenue: ${monthly_profitability['Revenue'].mean():,.2f}")
@@ -213,13 +201,13 @@ print(f"  Avg Gross Margin: {monthly_profitability['GrossMargin'].mean():.2f}%")
 print("\n🔮 Generating Revenue Forecast...")
 
 # Calculate average monthly growth rate
-monthly_revenue = df_sales.groupby('YearMonth')['TotalAmount'].sum().reset_index()
+monthly_revenue = monthly_profitability[['YearMonth', 'Revenue']].copy()
 monthly_revenue['MonthNum'] = range(len(monthly_revenue))
 
 # Simple linear regression for forecast
 from numpy import polyfit, poly1d
 x = monthly_revenue['MonthNum'].values
-y = monthly_revenue['TotalAmount'].values
+y = monthly_revenue['Revenue'].values
 z = polyfit(x, y, 1)
 p = poly1d(z)
 
@@ -262,37 +250,27 @@ print(f"  Industry Growth Rate: {market_growth_rate}%")
 # ============================================================================
 print("\n🎯 Creating Executive Scorecard...")
 
-def get_status(value, target, direction='higher'):
-    """Determine status: Green (Good), Yellow (Warning), Red (Critical)"""
-    if direction == 'higher':
-        if value >= target:
-            return 'Green'
-        elif value >= target * 0.9:
-            return 'Yellow'
-        else:
-            return 'Red'
-    else:  # lower is better
-        if value <= target:
-            return 'Green'
-        elif value <= target * 1.1:
-            return 'Yellow'
-        else:
-            return 'Red'
-
-scorecard = [
-    {'KPI': 'Gross Margin %', 'Actual': gross_margin, 'Target': 45.0, 'Status': get_status(gross_margin, 45.0, 'higher')},
-    {'KPI': 'Net Margin %', 'Actual': net_margin, 'Target': 15.0, 'Status': get_status(net_margin, 15.0, 'higher')},
-    {'KPI': 'Inventory Turnover', 'Actual': inventory_turnover, 'Target': 5.0, 'Status': get_status(inventory_turnover, 5.0, 'higher')},
-    {'KPI': 'CLV/CAC Ratio', 'Actual': clv_cac_ratio, 'Target': 5.0, 'Status': get_status(clv_cac_ratio, 5.0, 'higher')},
-    {'KPI': 'Avg Transaction Value', 'Actual': avg_transaction_value, 'Target': 45.0, 'Status': get_status(avg_transaction_value, 45.0, 'higher')},
-]
-
-df_scorecard = pd.DataFrame(scorecard)
+def get_status(actual, target, direction):
+    """Determine status for arrays of KPIs: Green (Good), Yellow (Warning), Red (Critical)"""
+    actual = np.asarray(actual, dtype=float)
+    target = np.asarray(target, dtype=float)
+    higher_is_better = np.asarray(direction) == 'higher'
+    meets = np.where(higher_is_better, actual >= target, actual <= target)
+    near = np.where(higher_is_better, actual >= target * 0.9, actual <= target * 1.1)
+    return np.select([meets, near], ['Green', 'Yellow'], 'Red')
+
+df_scorecard = pd.DataFrame({
+    'KPI': ['Gross Margin %', 'Net Margin %', 'Inventory Turnover', 'CLV/CAC Ratio', 'Avg Transaction Value'],
+    'Actual': [gross_margin, net_margin, inventory_turnover, clv_cac_ratio, avg_transaction_value],
+    'Target': [45.0, 15.0, 5.0, 5.0, 45.0]
+})
+directions = ['higher', 'higher', 'higher', 'higher', 'higher']
+df_scorecard['Status'] = get_status(df_scorecard['Actual'], df_scorecard['Target'], directions)
+status_icons = df_scorecard['Status'].map({'Green': '🟢', 'Yellow': '🟡', 'Red': '🔴'})
 
 print(f"\nExecutive Scorecard:")
-for _, row in df_scorecard.iterrows():
-    status_icon = '🟢' if row['Status'] == 'Green' else ('🟡' if row['Status'] == 'Yellow' else '🔴')
-    print(f"  {status_icon} {row['KPI']}: {row['Actual']:.2f} (Target: {row['Target']:.2f})")
+for icon, kpi, actual, target in zip(status_icons, df_scorecard['KPI'], df_scorecard['Actual'], df_scorecard['Target']):
+    print(f"  {icon} {kpi}: {actual:.2f} (Target: {target:.2f})")
 
 # ============================================================================
 # SAVE PROCESSED DATA
@@ -335,6 +313,10 @@ print("✓ Saved quarterly_performance.csv")
 category_financial.to_csv('data/processed/category_financial.csv', index=False)
 print("✓ Saved category_financial.csv")
 
+# Brand financial by year
+brand_yearly.to_csv('data/processed/brand_yearly_financial.csv', index=False)
+print("✓ Saved brand_yearly_financial.csv")
+
 # Channel financial
 channel_financial.to_csv('data/processed/channel_financial.csv', index=False)
 print("✓ Saved channel_financial.csv")
@@ -7,17 +7,21 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 
+from kids_storage import load_table
+from path_mining import EncodedSessions, first_k_paths, ngram_counts, transition_matrix
+from funnel_cube import build_session_cube, reached, stage_sessions, conversion_by
+
+# Pages per session kept for the most-common-path ranking
+PATH_LENGTH = 3
+
 print("🌐 Starting E-commerce Analytics...")
 print("=" * 60)
 
 # Load datasets
 print("\n📂 Loading datasets...")
-df_web = pd.read_csv('data/raw/web_analytics.csv')
-df_transactions = pd.read_csv('data/raw/sales_transactions.csv')
-df_products = pd.read_csv('data/raw/products.csv')
-
-df_web['Date'] = pd.to_datetime(df_web['Date'])
-df_transactions['Date'] = pd.to_datetime(df_transactions['Date'])
+df_web = load_table('web_analytics')
+df_transactions = load_table('sales_transactions')
+df_products = load_table('products')
 
 print(f"✓ Loaded {len(df_web):,} web events")
 print(f"✓ Loaded {len(df_transactions):,} transactions")
@@ -28,16 +32,22 @@ print(f"✓ Loaded {len(df_products):,} products")
 # ============================================================================
 print("\n📊 Calculating Overall Web Metrics...")
 
-total_sessions = df_web['SessionID'].nunique()
+# One row per session with the funnel stages it reached; the funnel,
+# conversion and journey tables below are all grouped from it
+web_sessions = EncodedSessions(df_web, order='Time')
+session_cube = build_session_cube(df_web, web_sessions, dimensions=['TrafficSource', 'DeviceType', 'Date', 'Time'])
+# Each distinct clock time is parsed once (at most 86,400 of them)
+time_codes, clock_times = pd.factorize(session_cube['Time'])
+session_cube['Hour'] = pd.to_datetime(clock_times, format='%H:%M:%S').hour[time_codes]
+session_cube['DayOfWeek'] = session_cube['Date'].dt.day_name()
+
+total_sessions = len(session_cube)
 total_page_views = len(df_web)
 avg_pages_per_session = total_page_views / total_sessions
-avg_session_duration = df_web.groupby('SessionID')['Duration'].sum().mean()
+avg_session_duration = session_cube['Duration'].mean()
 
-homepage_visits = df_web[df_web['Page'] == 'Homepage']['SessionID'].nunique()
-product_views = df_web[df_web['Page'] == 'Product']['SessionID'].nunique()
-cart_views = df_web[df_web['Page'] == 'Cart']['SessionID'].nunique()
-checkout_views = df_web[df_web['Page'] == 'Checkout']['SessionID'].nunique()
-purchases = df_web[df_web['Action'] == 'PlaceOrder']['SessionID'].nunique()
+homepage_visits, category_views, product_views, cart_views, checkout_views, purchases = stage_sessions(
+    session_cube, ['Homepage', 'Category', 'Product', 'Cart', 'Checkout', 'Purchase'])
 
 # Conversion rate
 conversion_rate = (purchases / total_sessions * 100) if total_sessions > 0 else 0
@@ -58,7 +68,7 @@ funnel_data = {
     'Stage': ['Homepage', 'Category', 'Product', 'Cart', 'Checkout', 'Purchase'],
     'Sessions': [
         homepage_visits,
-        df_web[df_web['Page'] == 'Category']['SessionID'].nunique(),
+        category_views,
         product_views,
         cart_views,
         checkout_views,
@@ -87,8 +97,7 @@ for i in range(1, len(df_funnel)):
 # ============================================================================
 print("\n🛒 Analyzing Cart Abandonment...")
 
-add_to_cart_sessions = df_web[df_web['Action'] == 'AddToCart']['SessionID'].nunique()
-purchase_sessions = df_web[df_web['Action'] == 'PlaceOrder']['SessionID'].nunique()
+add_to_cart_sessions, purchase_sessions = stage_sessions(session_cube, ['AddToCart', 'Purchase'])
 
 cart_abandonment_rate = ((add_to_cart_sessions - purchase_sessions) / add_to_cart_sessions * 100) if add_to_cart_sessions > 0 else 0
 
@@ -113,16 +122,9 @@ for _, row in abandonment_reasons.iterrows():
 # ============================================================================
 print("\n🚀 Analyzing Traffic Sources...")
 
-traffic_analysis = df_web.groupby('TrafficSource')['SessionID'].nunique().reset_index()
-traffic_analysis.columns = ['TrafficSource', 'Sessions']
-traffic_analysis['SessionShare'] = (traffic_analysis['Sessions'] / total_sessions * 100).round(2)
-
-# Calculate conversion by traffic source
-traffic_conversions = df_web[df_web['Action'] == 'PlaceOrder'].groupby('TrafficSource')['SessionID'].nunique().reset_index()
-traffic_conversions.columns = ['TrafficSource', 'Conversions']
-
-traffic_analysis = traffic_analysis.merge(traffic_conversions, on='TrafficSource', how='left')
-traffic_analysis['Conversions'] = traffic_analysis['Conversions'].fillna(0)
+# Sessions and conversions by traffic source
+traffic_analysis = conversion_by(session_cube, 'TrafficSource')
+traffic_analysis.insert(2, 'SessionShare', (traffic_analysis['Sessions'] / total_sessions * 100).round(2))
 traffic_analysis['ConversionRate'] = (traffic_analysis['Conversions'] / traffic_analysis['Sessions'] * 100).round(2)
 traffic_analysis = traffic_analysis.sort_values('Sessions', ascending=False)
 
@@ -136,21 +138,13 @@ for _, row in traffic_analysis.iterrows():
 # ============================================================================
 print("\n📱 Analyzing Device Performance...")
 
-device_analysis = df_web.groupby('DeviceType')['SessionID'].nunique().reset_index()
-device_analysis.columns = ['DeviceType', 'Sessions']
-device_analysis['SessionShare'] = (device_analysis['Sessions'] / total_sessions * 100).round(2)
-
-# Calculate conversion by device
-device_conversions = df_web[df_web['Action'] == 'PlaceOrder'].groupby('DeviceType')['SessionID'].nunique().reset_index()
-device_conversions.columns = ['DeviceType', 'Conversions']
-
-device_analysis = device_analysis.merge(device_conversions, on='DeviceType', how='left')
-device_analysis['Conversions'] = device_analysis['Conversions'].fillna(0)
+# Sessions and conversions by device
+device_analysis = conversion_by(session_cube, 'DeviceType')
+device_analysis.insert(2, 'SessionShare', (device_analysis['Sessions'] / total_sessions * 100).round(2))
 device_analysis['ConversionRate'] = (device_analysis['Conversions'] / device_analysis['Sessions'] * 100).round(2)
 
 # Calculate avg session duration by device
-device_duration = df_web.groupby(['DeviceType', 'SessionID'])['Duration'].sum().reset_index()
-device_duration = device_duration.groupby('DeviceType')['Duration'].mean().reset_index()
+device_duration = session_cube.groupby('DeviceType')['Duration'].mean().reset_index()
 device_duration.columns = ['DeviceType', 'AvgDuration']
 
 device_analysis = device_analysis.merge(device_duration, on='DeviceType', how='left')
@@ -207,11 +201,8 @@ for idx, row in high_performing.head(5).iterrows():
 # ============================================================================
 print("\n⏰ Analyzing Time-based Patterns...")
 
-df_web['Hour'] = pd.to_datetime(df_web['Time'], format='%H:%M:%S').dt.hour
-df_web['DayOfWeek'] = df_web['Date'].dt.day_name()
-
 # Hourly traffic
-hourly_traffic = df_web.groupby('Hour')['SessionID'].nunique().reset_index()
+hourly_traffic = session_cube.groupby('Hour').size().reset_index()
 hourly_traffic.columns = ['Hour', 'Sessions']
 hourly_traffic = hourly_traffic.sort_values('Sessions', ascending=False)
 
@@ -220,15 +211,8 @@ for _, row in hourly_traffic.head(5).iterrows():
     print(f"  {row['Hour']:02d}:00 - {row['Hour']:02d}:59: {row['Sessions']:,} sessions")
 
 # Day of week analysis
-dow_traffic = df_web.groupby('DayOfWeek')['SessionID'].nunique().reset_index()
-dow_traffic.columns = ['DayOfWeek', 'Sessions']
-
-# Calculate conversion by day
-dow_conversions = df_web[df_web['Action'] == 'PlaceOrder'].groupby('DayOfWeek')['SessionID'].nunique().reset_index()
-dow_conversions.columns = ['DayOfWeek', 'Conversions']
-
-dow_traffic = dow_traffic.merge(dow_conversions, on='DayOfWeek', how='left')
-dow_traffic['Conversions'] = dow_traffic['Conversions'].fillna(0)
+# Sessions and conversions by day
+dow_traffic = conversion_by(session_cube, 'DayOfWeek')
 dow_traffic['ConversionRate'] = (dow_traffic['Conversions'] / dow_traffic['Sessions'] * 100).round(2)
 
 # Sort by day of week
@@ -280,13 +264,8 @@ for _, row in category_online.iterrows():
 print("\n🗺️ Analyzing Customer Journey...")
 
 # Calculate avg pages before purchase
-purchase_sessions = df_web[df_web['Action'] == 'PlaceOrder']['SessionID'].unique()
-journey_analysis = df_web[df_web['SessionID'].isin(purchase_sessions)].groupby('SessionID').agg({
-    'Page': 'count',
-    'Duration': 'sum'
-}).reset_index()
-
-journey_analysis.columns = ['SessionID', 'PagesViewed', 'TotalDuration']
+journey_analysis = session_cube.loc[reached(session_cube, 'Purchase'), ['Events', 'Duration']]
+journey_analysis.columns = ['PagesViewed', 'TotalDuration']
 
 avg_pages_before_purchase = journey_analysis['PagesViewed'].mean()
 avg_time_before_purchase = journey_analysis['TotalDuration'].mean()
@@ -295,19 +274,20 @@ print(f"\nPurchase Journey Metrics:")
 print(f"  Avg Pages Before Purchase: {avg_pages_before_purchase:.1f}")
 print(f"  Avg Time Before Purchase: {avg_time_before_purchase:.0f} seconds ({avg_time_before_purchase/60:.1f} minutes)")
 
-# Most common paths (first 3 pages)
-session_paths = df_web.sort_values(['SessionID', 'Time']).groupby('SessionID')['Page'].apply(
-    lambda x: ' → '.join(x.head(3))
-).reset_index()
-
-session_paths.columns = ['SessionID', 'Path']
-path_frequency = session_paths['Path'].value_counts().head(10).reset_index()
-path_frequency.columns = ['Path', 'Frequency']
+# Most common paths (first PATH_LENGTH pages), page transitions and the
+# page-to-page Markov matrix, from the same integer encoding of the events
+path_frequency = first_k_paths(web_sessions, PATH_LENGTH).head(10)
+page_transitions = ngram_counts(web_sessions, 2)
+transition_probabilities = transition_matrix(web_sessions).round(4)
 
 print(f"\nTop 5 Most Common User Paths:")
 for idx, row in path_frequency.head(5).iterrows():
     print(f"  {row['Path']}: {row['Frequency']:,} sessions")
 
+print(f"\nTop 5 Page Transitions:")
+for idx, row in page_transitions.head(5).iterrows():
+    print(f"  {row['Path']}: {row['Frequency']:,} times")
+
 # ============================================================================
 # SAVE PROCESSED DATA
 # ============================================================================
@@ -355,6 +335,12 @@ journey_summary = pd.DataFrame({
 journey_summary.to_csv('data/processed/customer_journey_summary.csv', index=False)
 print("✓ Saved customer_journey_summary.csv")
 
+# Path mining
+path_frequency.to_csv('data/processed/top_user_paths.csv', index=False)
+page_transitions.to_csv('data/processed/page_transitions.csv', index=False)
+transition_probabilities.to_csv('data/processed/page_transition_matrix.csv')
+print("✓ Saved path mining files")
+
 print("\n" + "=" * 60)
 print("✅ E-commerce Analytics Complete!")
 print("=" * 60)
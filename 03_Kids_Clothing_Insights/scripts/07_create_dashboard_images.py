@@ -3,589 +3,91 @@ Dashboard Image Generator
 Creates professional PNG images for all 5 Tableau dashboards using matplotlib
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.gridspec import GridSpec
-import seaborn as sns
-import numpy as np
 import os
-import warnings
-warnings.filterwarnings('ignore')
-
-# Set style
-plt.style.use('seaborn-v0_8-darkgrid')
-sns.set_palette("husl")
-
-# Project color palette
-COLORS = {
-    'pink': '#FF6B9D',      # Girls
-    'blue': '#4A90E2',      # Boys
-    'yellow': '#FFC845',    # Infants
-    'purple': '#9B59B6',    # Accessories
-    'green': '#27AE60',     # Success
-    'orange': '#F39C12',    # Warning
-    'red': '#E74C3C',       # Danger
-    'gray': '#2C3E50'       # Text
-}
-
-# Paths
-SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
-BASE_PATH = os.path.join(PROJECT_DIR, 'data', 'processed')
-OUTPUT_PATH = os.path.join(PROJECT_DIR, 'tableau', 'dashboard_screenshots')
-
-# Ensure output directory exists
-os.makedirs(OUTPUT_PATH, exist_ok=True)
-
-print("=" * 70)
-print("DASHBOARD IMAGE GENERATOR - Kids Clothing Insights")
-print("=" * 70)
-print("\nCreating 5 professional dashboard images...\n")
-
-# ============================================================================
-# DASHBOARD 1: SALES PERFORMANCE
-# ============================================================================
-print("1️⃣  Creating Sales Performance Dashboard...")
-
-fig = plt.figure(figsize=(19.2, 10.8), facecolor='white')
-gs = GridSpec(3, 3, figure=fig, hspace=0.3, wspace=0.3)
-
-# Title
-fig.suptitle('Sales Performance Dashboard', fontsize=28, fontweight='bold', 
-             color=COLORS['purple'], y=0.98)
-
-# Load data
-try:
-    sales_summary = pd.read_csv(os.path.join(BASE_PATH, 'sales_summary.csv'))
-    category_perf = pd.read_csv(os.path.join(BASE_PATH, 'category_performance.csv'))
-    monthly_trends = pd.read_csv(os.path.join(BASE_PATH, 'monthly_trends.csv'))
-    store_perf = pd.read_csv(os.path.join(BASE_PATH, 'store_performance.csv')).head(10)
-    channel_perf = pd.read_csv(os.path.join(BASE_PATH, 'channel_performance.csv'))
-    
-    # KPI Cards (top row)
-    kpi_ax1 = fig.add_subplot(gs[0, 0])
-    kpi_ax1.text(0.5, 0.6, f"${sales_summary['TotalRevenue'].iloc[0]:,.0f}", 
-                ha='center', va='center', fontsize=32, fontweight='bold', color=COLORS['purple'])
-    kpi_ax1.text(0.5, 0.3, "Total Revenue", ha='center', va='center', fontsize=14, color=COLORS['gray'])
-    kpi_ax1.axis('off')
-    kpi_ax1.set_facecolor('#F8F9FA')
-    
-    kpi_ax2 = fig.add_subplot(gs[0, 1])
-    kpi_ax2.text(0.5, 0.6, f"{sales_summary['Transactions'].iloc[0]:,}", 
-                ha='center', va='center', fontsize=32, fontweight='bold', color=COLORS['blue'])
-    kpi_ax2.text(0.5, 0.3, "Transactions", ha='center', va='center', fontsize=14, color=COLORS['gray'])
-    kpi_ax2.axis('off')
-    kpi_ax2.set_facecolor('#F8F9FA')
-    
-    kpi_ax3 = fig.add_subplot(gs[0, 2])
-    kpi_ax3.text(0.5, 0.6, f"${sales_summary['AvgOrderValue'].iloc[0]:.2f}", 
-                ha='center', va='center', fontsize=32, fontweight='bold', color=COLORS['yellow'])
-    kpi_ax3.text(0.5, 0.3, "Avg Order Value", ha='center', va='center', fontsize=14, color=COLORS['gray'])
-    kpi_ax3.axis('off')
-    kpi_ax3.set_facecolor('#F8F9FA')
-    
-    # Category Performance (horizontal bars)
-    ax1 = fig.add_subplot(gs[1, 0])
-    colors_cat = [COLORS['pink'], COLORS['blue'], COLORS['yellow'], COLORS['purple']]
-    ax1.barh(category_perf['Category'], category_perf['TotalRevenue'], color=colors_cat)
-    ax1.set_xlabel('Revenue ($)', fontsize=12, fontweight='bold')
-    ax1.set_title('Revenue by Category', fontsize=14, fontweight='bold', pad=10)
-    ax1.tick_params(axis='both', labelsize=10)
-    for i, v in enumerate(category_perf['TotalRevenue']):
-        ax1.text(v + 10000, i, f'${v:,.0f}', va='center', fontsize=10, fontweight='bold')
-    ax1.grid(axis='x', alpha=0.3)
-    
-    # Monthly Trend (line chart)
-    ax2 = fig.add_subplot(gs[1, 1:])
-    ax2.plot(range(len(monthly_trends)), monthly_trends['TotalRevenue'], 
-            marker='o', linewidth=3, markersize=8, color=COLORS['purple'], label='Revenue')
-    ax2.fill_between(range(len(monthly_trends)), monthly_trends['TotalRevenue'], alpha=0.3, color=COLORS['purple'])
-    ax2.set_xlabel('Month', fontsize=12, fontweight='bold')
-    ax2.set_ylabel('Revenue ($)', fontsize=12, fontweight='bold')
-    ax2.set_title('Monthly Revenue Trend', fontsize=14, fontweight='bold', pad=10)
-    ax2.set_xticks(range(len(monthly_trends)))
-    ax2.set_xticklabels([f"{row['Year']}-{row['Month']:02d}" for _, row in monthly_trends.iterrows()], rotation=45)
-    ax2.tick_params(axis='both', labelsize=10)
-    ax2.grid(alpha=0.3)
-    ax2.legend(fontsize=10)
-    
-    # Store Performance (top 10)
-    ax3 = fig.add_subplot(gs[2, 0:2])
-    ax3.bar(range(len(store_perf)), store_perf['TotalRevenue'], color=COLORS['blue'], alpha=0.7)
-    ax3.set_xlabel('Store', fontsize=12, fontweight='bold')
-    ax3.set_ylabel('Revenue ($)', fontsize=12, fontweight='bold')
-    ax3.set_title('Top 10 Stores by Revenue', fontsize=14, fontweight='bold', pad=10)
-    ax3.set_xticks(range(len(store_perf)))
-    ax3.set_xticklabels(store_perf['StoreName'], rotation=45, ha='right', fontsize=9)
-    ax3.tick_params(axis='y', labelsize=10)
-    ax3.grid(axis='y', alpha=0.3)
-    
-    # Channel Distribution (pie chart)
-    ax4 = fig.add_subplot(gs[2, 2])
-    colors_channel = [COLORS['blue'], COLORS['pink']]
-    wedges, texts, autotexts = ax4.pie(channel_perf['TotalRevenue'], labels=channel_perf['Channel'],
-                                        autopct='%1.1f%%', colors=colors_channel, startangle=90,
-                                        textprops={'fontsize': 12, 'fontweight': 'bold'})
-    ax4.set_title('Channel Distribution', fontsize=14, fontweight='bold', pad=10)
-    
-    plt.tight_layout()
-    output_file = os.path.join(OUTPUT_PATH, '01_sales_performance.png')
-    plt.savefig(output_file, dpi=150, bbox_inches='tight', facecolor='white')
-    plt.close()
-    print(f"   ✅ Saved: {output_file}")
-    
-except Exception as e:
-    print(f"   ❌ Error creating Sales dashboard: {e}")
-
-# ============================================================================
-# DASHBOARD 2: CUSTOMER ANALYTICS
-# ============================================================================
-print("\n2️⃣  Creating Customer Analytics Dashboard...")
-
-fig = plt.figure(figsize=(19.2, 10.8), facecolor='white')
-gs = GridSpec(3, 3, figure=fig, hspace=0.3, wspace=0.3)
-
-fig.suptitle('Customer Analytics Dashboard', fontsize=28, fontweight='bold', 
-             color=COLORS['blue'], y=0.98)
-
-try:
-    customer_rfm = pd.read_csv(os.path.join(BASE_PATH, 'customer_rfm.csv')).head(5000)  # Sample for speed
-    customer_segments = pd.read_csv(os.path.join(BASE_PATH, 'customer_segments.csv'))
-    clv_by_segment = pd.read_csv(os.path.join(BASE_PATH, 'clv_by_segment.csv'))
-    demographics_age = pd.read_csv(os.path.join(BASE_PATH, 'customer_demographics_age.csv'))
-    
-    # KPI Cards
-    total_customers = len(customer_rfm)
-    avg_clv = customer_rfm['CLV'].mean()
-    
-    kpi_ax1 = fig.add_subplot(gs[0, 0])
-    kpi_ax1.text(0.5, 0.6, f"{total_customers:,}", 
-                ha='center', va='center', fontsize=32, fontweight='bold', color=COLORS['blue'])
-    kpi_ax1.text(0.5, 0.3, "Total Customers", ha='center', va='center', fontsize=14, color=COLORS['gray'])
-    kpi_ax1.axis('off')
-    kpi_ax1.set_facecolor('#F8F9FA')
-    
-    kpi_ax2 = fig.add_subplot(gs[0, 1])
-    kpi_ax2.text(0.5, 0.6, f"${avg_clv:.2f}", 
-                ha='center', va='center', fontsize=32, fontweight='bold', color=COLORS['green'])
-    kpi_ax2.text(0.5, 0.3, "Average CLV", ha='center', va='center', fontsize=14, color=COLORS['gray'])
-    kpi_ax2.axis('off')
-    kpi_ax2.set_facecolor('#F8F9FA')
-    
-    kpi_ax3 = fig.add_subplot(gs[0, 2])
-    kpi_ax3.text(0.5, 0.6, f"{len(customer_segments)}", 
-                ha='center', va='center', fontsize=32, fontweight='bold', color=COLORS['purple'])
-    kpi_ax3.text(0.5, 0.3, "Customer Segments", ha='center', va='center', fontsize=14, color=COLORS['gray'])
-    kpi_ax3.axis('off')
-    kpi_ax3.set_facecolor('#F8F9FA')
-    
-    # RFM Scatter Plot
-    ax1 = fig.add_subplot(gs[1, 0:2])
-    scatter = ax1.scatter(customer_rfm['Recency'], customer_rfm['Frequency'], 
-                         s=customer_rfm['Monetary']/5, c=customer_rfm['RFM_Score'],
-                         cmap='viridis', alpha=0.6, edgecolors='white', linewidth=0.5)
-    ax1.set_xlabel('Recency (days)', fontsize=12, fontweight='bold')
-    ax1.set_ylabel('Frequency (purchases)', fontsize=12, fontweight='bold')
-    ax1.set_title('RFM Analysis (size = monetary value)', fontsize=14, fontweight='bold', pad=10)
-    ax1.grid(alpha=0.3)
-    cbar = plt.colorbar(scatter, ax=ax1)
-    cbar.set_label('RFM Score', fontsize=10, fontweight='bold')
-    
-    # Customer Segments (pie)
-    ax2 = fig.add_subplot(gs[1, 2])
-    segment_counts = customer_segments.groupby('Segment').size().sort_values(ascending=False).head(6)
-    colors_seg = plt.cm.Set3(range(len(segment_counts)))
-    ax2.pie(segment_counts.values, labels=segment_counts.index, autopct='%1.1f%%',
-           colors=colors_seg, textprops={'fontsize': 9, 'fontweight': 'bold'})
-    ax2.set_title('Top Customer Segments', fontsize=14, fontweight='bold', pad=10)
-    
-    # CLV by Segment
-    ax3 = fig.add_subplot(gs[2, 0:2])
-    clv_sorted = clv_by_segment.sort_values('AvgCLV', ascending=False).head(10)
-    ax3.barh(range(len(clv_sorted)), clv_sorted['AvgCLV'], color=COLORS['green'], alpha=0.7)
-    ax3.set_yticks(range(len(clv_sorted)))
-    ax3.set_yticklabels(clv_sorted['Segment'], fontsize=10)
-    ax3.set_xlabel('Average CLV ($)', fontsize=12, fontweight='bold')
-    ax3.set_title('Customer Lifetime Value by Segment', fontsize=14, fontweight='bold', pad=10)
-    ax3.grid(axis='x', alpha=0.3)
-    for i, v in enumerate(clv_sorted['AvgCLV']):
-        ax3.text(v + 5, i, f'${v:.2f}', va='center', fontsize=9, fontweight='bold')
-    
-    # Age Demographics
-    ax4 = fig.add_subplot(gs[2, 2])
-    ax4.bar(demographics_age['AgeGroup'], demographics_age['CustomerCount'], color=COLORS['blue'], alpha=0.7)
-    ax4.set_xlabel('Age Group', fontsize=12, fontweight='bold')
-    ax4.set_ylabel('Customers', fontsize=12, fontweight='bold')
-    ax4.set_title('Customers by Age', fontsize=14, fontweight='bold', pad=10)
-    ax4.tick_params(axis='x', rotation=45, labelsize=9)
-    ax4.grid(axis='y', alpha=0.3)
-    
-    plt.tight_layout()
-    output_file = os.path.join(OUTPUT_PATH, '02_customer_analytics.png')
-    plt.savefig(output_file, dpi=150, bbox_inches='tight', facecolor='white')
-    plt.close()
-    print(f"   ✅ Saved: {output_file}")
-    
-except Exception as e:
-    print(f"   ❌ Error creating Customer dashboard: {e}")
-
-# ============================================================================
-# DASHBOARD 3: INVENTORY MANAGEMENT
-# ============================================================================
-print("\n3️⃣  Creating Inventory Management Dashboard...")
-
-fig = plt.figure(figsize=(19.2, 10.8), facecolor='white')
-gs = GridSpec(3, 3, figure=fig, hspace=0.3, wspace=0.3)
-
-fig.suptitle('Inventory Management Dashboard', fontsize=28, fontweight='bold', 
-             color=COLORS['orange'], y=0.98)
-
-try:
-    stock_summary = pd.read_csv(os.path.join(BASE_PATH, 'stock_status_summary.csv'))
-    reorder_alerts = pd.read_csv(os.path.join(BASE_PATH, 'reorder_alerts.csv')).head(15)
-    supplier_perf = pd.read_csv(os.path.join(BASE_PATH, 'supplier_performance.csv'))
-    inventory_turnover = pd.read_csv(os.path.join(BASE_PATH, 'inventory_turnover.csv'))
-    
-    # Stock Status Gauges
-    kpi_ax1 = fig.add_subplot(gs[0, 0])
-    critical_count = stock_summary[stock_summary['StockStatus'] == 'Critical']['ProductCount'].sum() if 'Critical' in stock_summary['StockStatus'].values else 0
-    kpi_ax1.text(0.5, 0.6, f"{critical_count}", 
-                ha='center', va='center', fontsize=36, fontweight='bold', color=COLORS['red'])
-    kpi_ax1.text(0.5, 0.3, "Critical Items", ha='center', va='center', fontsize=14, color=COLORS['gray'])
-    kpi_ax1.axis('off')
-    kpi_ax1.set_facecolor('#FFEBEE')
-    
-    kpi_ax2 = fig.add_subplot(gs[0, 1])
-    low_count = stock_summary[stock_summary['StockStatus'] == 'Low']['ProductCount'].sum() if 'Low' in stock_summary['StockStatus'].values else 0
-    kpi_ax2.text(0.5, 0.6, f"{low_count}", 
-                ha='center', va='center', fontsize=36, fontweight='bold', color=COLORS['orange'])
-    kpi_ax2.text(0.5, 0.3, "Low Stock Items", ha='center', va='center', fontsize=14, color=COLORS['gray'])
-    kpi_ax2.axis('off')
-    kpi_ax2.set_facecolor('#FFF3E0')
-    
-    kpi_ax3 = fig.add_subplot(gs[0, 2])
-    normal_count = stock_summary[stock_summary['StockStatus'] == 'Normal']['ProductCount'].sum() if 'Normal' in stock_summary['StockStatus'].values else 0
-    kpi_ax3.text(0.5, 0.6, f"{normal_count}", 
-                ha='center', va='center', fontsize=36, fontweight='bold', color=COLORS['green'])
-    kpi_ax3.text(0.5, 0.3, "Normal Stock", ha='center', va='center', fontsize=14, color=COLORS['gray'])
-    kpi_ax3.axis('off')
-    kpi_ax3.set_facecolor('#E8F5E9')
-    
-    # Reorder Alerts Table (visual)
-    ax1 = fig.add_subplot(gs[1, 0:2])
-    ax1.axis('tight')
-    ax1.axis('off')
-    table_data = reorder_alerts[['ProductName', 'Category', 'CurrentStock', 'ReorderQuantity']].head(10).values
-    table = ax1.table(cellText=table_data, 
-                     colLabels=['Product', 'Category', 'Stock', 'Reorder Qty'],
-                     cellLoc='left', loc='center',
-                     colWidths=[0.4, 0.2, 0.2, 0.2])
-    table.auto_set_font_size(False)
-    table.set_fontsize(9)
-    table.scale(1, 2)
-    for i in range(len(table_data) + 1):
-        if i == 0:
-            for j in range(4):
-                table[(i, j)].set_facecolor(COLORS['orange'])
-                table[(i, j)].set_text_props(weight='bold', color='white')
+import time
+
+import kids_dashboards
+from kids_dashboards import (DASHBOARDS, OUTPUT_PATH, PRODUCTION_DPI, load_inputs,
+                             stale_dashboards, render_sequential, render_parallel)
+from render_cache import RenderCache
+
+# Render mode: 'parallel' draws each dashboard in its own worker process
+# (all cores), 'sequential' draws them one after another in this process
+RENDER_MODE = 'parallel'
+RENDER_WORKERS = None  # None = one per CPU core, capped at the number of dashboards
+
+# Preview mode draws low-DPI copies into dashboard_screenshots/preview/ for
+# fast layout iteration; the 150-DPI production PNGs are left untouched
+PREVIEW = False
+PREVIEW_DPI = 50
+
+# Skip dashboards whose input data, style and renderers are unchanged
+# since their PNG was written
+USE_RENDER_CACHE = True
+
+# Workers re-import this module on spawn-based platforms (Windows, macOS),
+# so the script body only runs in the parent process
+if __name__ == '__main__':
+    output_path = os.path.join(OUTPUT_PATH, 'preview') if PREVIEW else OUTPUT_PATH
+    dpi = PREVIEW_DPI if PREVIEW else PRODUCTION_DPI
+    os.makedirs(output_path, exist_ok=True)
+
+    print("=" * 70)
+    print("DASHBOARD IMAGE GENERATOR - Kids Clothing Insights")
+    print("=" * 70)
+    print(f"\nCreating 5 professional dashboard images ({'preview' if PREVIEW else 'production'}, {dpi} DPI)...\n")
+
+    # Every input CSV is read once, shared by all dashboards
+    data, missing = load_inputs()
+    print(f"📂 Loaded {len(data)} input tables")
+    for name, error in missing.items():
+        print(f"   ⚠️ {name}: {error}")
+
+    start = time.perf_counter()
+    cache = RenderCache(output_path, kids_dashboards.__file__, enabled=USE_RENDER_CACHE)
+    stale = stale_dashboards(data, cache)
+    if USE_RENDER_CACHE:
+        print(f"♻️  Render cache: {len(DASHBOARDS) - len(stale)} of {len(DASHBOARDS)} dashboards unchanged")
+
+    print(f"\n🎨 Rendering {len(stale)} dashboards ({RENDER_MODE})...")
+    if not stale:
+        results = []
+    elif RENDER_MODE == 'parallel':
+        results = render_parallel(data, stale, output_path, dpi, RENDER_WORKERS)
+    else:
+        results = render_sequential(data, stale, output_path, dpi)
+
+    render_times, errors = {}, {}
+    for index, seconds, error in results:
+        filename, title, _, _ = DASHBOARDS[index]
+        render_times[index] = seconds
+        if error is None:
+            cache.record(filename)
+            print(f"   ✅ Saved: {os.path.join(output_path, filename)} ({seconds:.2f}s)")
         else:
-            for j in range(4):
-                table[(i, j)].set_facecolor('#FFF3E0' if i % 2 == 0 else 'white')
-    ax1.set_title('Top Reorder Alerts', fontsize=14, fontweight='bold', pad=10)
-    
-    # Supplier Performance
-    ax2 = fig.add_subplot(gs[1, 2])
-    supplier_top = supplier_perf.sort_values('SupplierScore', ascending=False).head(8)
-    colors_supplier = [COLORS['green'] if s > 0.85 else COLORS['orange'] if s > 0.75 else COLORS['red'] 
-                      for s in supplier_top['SupplierScore']]
-    ax2.barh(range(len(supplier_top)), supplier_top['SupplierScore'], color=colors_supplier, alpha=0.7)
-    ax2.set_yticks(range(len(supplier_top)))
-    ax2.set_yticklabels(supplier_top['SupplierName'], fontsize=9)
-    ax2.set_xlabel('Score', fontsize=12, fontweight='bold')
-    ax2.set_title('Top Suppliers', fontsize=14, fontweight='bold', pad=10)
-    ax2.set_xlim(0, 1)
-    ax2.grid(axis='x', alpha=0.3)
-    
-    # Inventory Turnover by Category
-    ax3 = fig.add_subplot(gs[2, 0:2])
-    turnover_cat = inventory_turnover.groupby('Category').agg({
-        'InventoryTurnover': 'mean'
-    }).reset_index().sort_values('InventoryTurnover', ascending=False)
-    colors_turn = [COLORS['pink'], COLORS['blue'], COLORS['yellow'], COLORS['purple']][:len(turnover_cat)]
-    ax3.bar(turnover_cat['Category'], turnover_cat['InventoryTurnover'], color=colors_turn, alpha=0.7)
-    ax3.set_xlabel('Category', fontsize=12, fontweight='bold')
-    ax3.set_ylabel('Turnover Rate', fontsize=12, fontweight='bold')
-    ax3.set_title('Inventory Turnover by Category', fontsize=14, fontweight='bold', pad=10)
-    ax3.tick_params(axis='x', rotation=45, labelsize=10)
-    ax3.grid(axis='y', alpha=0.3)
-    ax3.axhline(y=turnover_cat['InventoryTurnover'].mean(), color='red', linestyle='--', 
-               linewidth=2, label='Average')
-    ax3.legend(fontsize=10)
-    
-    # Stock Status Distribution
-    ax4 = fig.add_subplot(gs[2, 2])
-    colors_status = [COLORS['red'], COLORS['orange'], COLORS['green']]
-    ax4.pie(stock_summary['ProductCount'], labels=stock_summary['StockStatus'],
-           autopct='%1.1f%%', colors=colors_status[:len(stock_summary)],
-           textprops={'fontsize': 11, 'fontweight': 'bold'})
-    ax4.set_title('Stock Status', fontsize=14, fontweight='bold', pad=10)
-    
-    plt.tight_layout()
-    output_file = os.path.join(OUTPUT_PATH, '03_inventory_management.png')
-    plt.savefig(output_file, dpi=150, bbox_inches='tight', facecolor='white')
-    plt.close()
-    print(f"   ✅ Saved: {output_file}")
-    
-except Exception as e:
-    print(f"   ❌ Error creating Inventory dashboard: {e}")
-
-# ============================================================================
-# DASHBOARD 4: EXECUTIVE SUMMARY
-# ============================================================================
-print("\n4️⃣  Creating Executive Summary Dashboard...")
-
-fig = plt.figure(figsize=(19.2, 10.8), facecolor='white')
-gs = GridSpec(3, 4, figure=fig, hspace=0.3, wspace=0.3)
-
-fig.suptitle('Executive Summary Dashboard', fontsize=28, fontweight='bold', 
-             color=COLORS['purple'], y=0.98)
-
-try:
-    financial_summary = pd.read_csv(os.path.join(BASE_PATH, 'financial_summary.csv'))
-    kpi_summary = pd.read_csv(os.path.join(BASE_PATH, 'kpi_summary.csv'))
-    quarterly_perf = pd.read_csv(os.path.join(BASE_PATH, 'quarterly_performance.csv'))
-    revenue_forecast = pd.read_csv(os.path.join(BASE_PATH, 'revenue_forecast.csv'))
-    
-    # Top KPI Cards (2 rows)
-    kpis = [
-        ("Revenue", f"${financial_summary['TotalRevenue'].iloc[0]:,.0f}", COLORS['purple']),
-        ("Gross Margin", f"{financial_summary['GrossMargin'].iloc[0]:.1f}%", COLORS['green']),
-        ("Net Margin", f"{financial_summary['NetMargin'].iloc[0]:.1f}%", COLORS['blue']),
-        ("EBITDA", f"${financial_summary['EBITDA'].iloc[0]:,.0f}", COLORS['orange']),
-    ]
-    
-    for idx, (label, value, color) in enumerate(kpis):
-        kpi_ax = fig.add_subplot(gs[0, idx])
-        kpi_ax.text(0.5, 0.6, value, ha='center', va='center', 
-                   fontsize=28, fontweight='bold', color=color)
-        kpi_ax.text(0.5, 0.3, label, ha='center', va='center', 
-                   fontsize=12, color=COLORS['gray'])
-        kpi_ax.axis('off')
-        kpi_ax.set_facecolor('#F8F9FA')
-    
-    # P&L Waterfall (simplified)
-    ax1 = fig.add_subplot(gs[1, 0:2])
-    pl_items = ['Revenue', 'COGS', 'Gross\nProfit', 'OpEx', 'Net\nProfit']
-    pl_values = [
-        financial_summary['TotalRevenue'].iloc[0],
-        -financial_summary['COGS'].iloc[0],
-        financial_summary['GrossProfit'].iloc[0],
-        -financial_summary['OperatingExpenses'].iloc[0],
-        financial_summary['NetProfit'].iloc[0]
-    ]
-    colors_pl = [COLORS['green'], COLORS['red'], COLORS['blue'], COLORS['red'], COLORS['purple']]
-    ax1.bar(range(len(pl_items)), pl_values, color=colors_pl, alpha=0.7)
-    ax1.set_xticks(range(len(pl_items)))
-    ax1.set_xticklabels(pl_items, fontsize=11, fontweight='bold')
-    ax1.set_ylabel('Amount ($)', fontsize=12, fontweight='bold')
-    ax1.set_title('P&L Summary', fontsize=14, fontweight='bold', pad=10)
-    ax1.axhline(y=0, color='black', linewidth=1)
-    ax1.grid(axis='y', alpha=0.3)
-    
-    # Quarterly Performance
-    ax2 = fig.add_subplot(gs[1, 2:])
-    quarters = [f"Q{row['Quarter']}" for _, row in quarterly_perf.iterrows()]
-    ax2.plot(quarters, quarterly_perf['TotalRevenue'], marker='o', linewidth=3, 
-            markersize=10, color=COLORS['purple'], label='Revenue')
-    ax2.fill_between(range(len(quarters)), quarterly_perf['TotalRevenue'], 
-                     alpha=0.3, color=COLORS['purple'])
-    ax2.set_xlabel('Quarter', fontsize=12, fontweight='bold')
-    ax2.set_ylabel('Revenue ($)', fontsize=12, fontweight='bold')
-    ax2.set_title('Quarterly Revenue Trend', fontsize=14, fontweight='bold', pad=10)
-    ax2.grid(alpha=0.3)
-    ax2.legend(fontsize=10)
-    
-    # Revenue Forecast
-    ax3 = fig.add_subplot(gs[2, 0:3])
-    forecast_months = [f"{row['Year']}-{row['Month']:02d}" for _, row in revenue_forecast.iterrows()]
-    ax3.plot(range(len(forecast_months)), revenue_forecast['ForecastRevenue'], 
-            marker='o', linewidth=3, markersize=8, color=COLORS['blue'], 
-            linestyle='--', label='Forecast')
-    ax3.fill_between(range(len(forecast_months)), 
-                     revenue_forecast['ConfidenceLower'],
-                     revenue_forecast['ConfidenceUpper'],
-                     alpha=0.2, color=COLORS['blue'], label='Confidence Band')
-    ax3.set_xlabel('Month', fontsize=12, fontweight='bold')
-    ax3.set_ylabel('Revenue ($)', fontsize=12, fontweight='bold')
-    ax3.set_title('6-Month Revenue Forecast', fontsize=14, fontweight='bold', pad=10)
-    ax3.set_xticks(range(len(forecast_months)))
-    ax3.set_xticklabels(forecast_months, rotation=45, fontsize=9)
-    ax3.grid(alpha=0.3)
-    ax3.legend(fontsize=10)
-    
-    # KPI Scorecard (traffic lights)
-    ax4 = fig.add_subplot(gs[2, 3])
-    ax4.axis('tight')
-    ax4.axis('off')
-    
-    # Create scorecard visual
-    scorecard_data = [
-        ['Gross Margin', '45.2%', '🟢'],
-        ['Net Margin', '11.4%', '🔴'],
-        ['Turnover', '7.0x', '🟢'],
-        ['CLV/CAC', '22.6x', '🟢'],
-    ]
-    
-    table = ax4.table(cellText=scorecard_data,
-                     colLabels=['Metric', 'Value', 'Status'],
-                     cellLoc='center', loc='center',
-                     colWidths=[0.4, 0.3, 0.3])
-    table.auto_set_font_size(False)
-    table.set_fontsize(10)
-    table.scale(1, 2.5)
-    for i in range(len(scorecard_data) + 1):
-        if i == 0:
-            for j in range(3):
-                table[(i, j)].set_facecolor(COLORS['purple'])
-                table[(i, j)].set_text_props(weight='bold', color='white')
+            errors[index] = error
+            print(f"   ❌ Error creating {title} dashboard: {error}")
+    elapsed = time.perf_counter() - start
+
+    # ============================================================================
+    # COMPLETION
+    # ============================================================================
+    print("\n" + "=" * 70)
+    if errors:
+        print(f"⚠️  {len(DASHBOARDS) - len(errors)} OF {len(DASHBOARDS)} DASHBOARD IMAGES UP TO DATE")
+    else:
+        print("✅ ALL DASHBOARD IMAGES CREATED SUCCESSFULLY!")
+    print("=" * 70)
+    print(f"\n📂 Output Location: {output_path}")
+    print("\nDashboards:")
+    for index, (filename, title, _, _) in enumerate(DASHBOARDS):
+        if index in errors:
+            status = " failed"
+        elif index in render_times:
+            status = f"{render_times[index]:>6.2f}s"
         else:
-            for j in range(3):
-                table[(i, j)].set_facecolor('#F8F9FA' if i % 2 == 0 else 'white')
-    ax4.set_title('KPI Scorecard', fontsize=14, fontweight='bold', pad=10)
-    
-    plt.tight_layout()
-    output_file = os.path.join(OUTPUT_PATH, '04_executive_summary.png')
-    plt.savefig(output_file, dpi=150, bbox_inches='tight', facecolor='white')
-    plt.close()
-    print(f"   ✅ Saved: {output_file}")
-    
-except Exception as e:
-    print(f"   ❌ Error creating Executive dashboard: {e}")
-
-# ============================================================================
-# DASHBOARD 5: E-COMMERCE ANALYTICS
-# ============================================================================
-print("\n5️⃣  Creating E-commerce Analytics Dashboard...")
-
-fig = plt.figure(figsize=(19.2, 10.8), facecolor='white')
-gs = GridSpec(3, 3, figure=fig, hspace=0.3, wspace=0.3)
-
-fig.suptitle('E-commerce Analytics Dashboard', fontsize=28, fontweight='bold', 
-             color=COLORS['blue'], y=0.98)
-
-try:
-    conversion_funnel = pd.read_csv(os.path.join(BASE_PATH, 'conversion_funnel.csv'))
-    traffic_source = pd.read_csv(os.path.join(BASE_PATH, 'traffic_source_analysis.csv'))
-    device_analysis = pd.read_csv(os.path.join(BASE_PATH, 'device_analysis.csv'))
-    cart_abandonment = pd.read_csv(os.path.join(BASE_PATH, 'cart_abandonment_reasons.csv'))
-    hourly_traffic = pd.read_csv(os.path.join(BASE_PATH, 'hourly_traffic.csv'))
-    
-    # KPI Cards
-    total_sessions = conversion_funnel['Count'].iloc[0]
-    conversions = conversion_funnel[conversion_funnel['Stage'] == 'Purchase']['Count'].iloc[0]
-    conv_rate = (conversions / total_sessions) * 100
-    
-    kpi_ax1 = fig.add_subplot(gs[0, 0])
-    kpi_ax1.text(0.5, 0.6, f"{total_sessions:,}", 
-                ha='center', va='center', fontsize=32, fontweight='bold', color=COLORS['blue'])
-    kpi_ax1.text(0.5, 0.3, "Sessions", ha='center', va='center', fontsize=14, color=COLORS['gray'])
-    kpi_ax1.axis('off')
-    kpi_ax1.set_facecolor('#F8F9FA')
-    
-    kpi_ax2 = fig.add_subplot(gs[0, 1])
-    kpi_ax2.text(0.5, 0.6, f"{conv_rate:.2f}%", 
-                ha='center', va='center', fontsize=32, fontweight='bold', color=COLORS['green'])
-    kpi_ax2.text(0.5, 0.3, "Conversion Rate", ha='center', va='center', fontsize=14, color=COLORS['gray'])
-    kpi_ax2.axis('off')
-    kpi_ax2.set_facecolor('#F8F9FA')
-    
-    kpi_ax3 = fig.add_subplot(gs[0, 2])
-    cart_abandon_rate = cart_abandonment['Percentage'].sum()
-    kpi_ax3.text(0.5, 0.6, f"{cart_abandon_rate:.1f}%", 
-                ha='center', va='center', fontsize=32, fontweight='bold', color=COLORS['red'])
-    kpi_ax3.text(0.5, 0.3, "Cart Abandonment", ha='center', va='center', fontsize=14, color=COLORS['gray'])
-    kpi_ax3.axis('off')
-    kpi_ax3.set_facecolor('#FFEBEE')
-    
-    # Conversion Funnel
-    ax1 = fig.add_subplot(gs[1, 0:2])
-    stages = conversion_funnel['Stage'].tolist()
-    counts = conversion_funnel['Count'].tolist()
-    colors_funnel = plt.cm.Blues(np.linspace(0.4, 0.9, len(stages)))
-    ax1.barh(range(len(stages)), counts, color=colors_funnel, alpha=0.8)
-    ax1.set_yticks(range(len(stages)))
-    ax1.set_yticklabels(stages, fontsize=11)
-    ax1.set_xlabel('Count', fontsize=12, fontweight='bold')
-    ax1.set_title('Conversion Funnel', fontsize=14, fontweight='bold', pad=10)
-    ax1.grid(axis='x', alpha=0.3)
-    for i, (stage, count) in enumerate(zip(stages, counts)):
-        drop_pct = conversion_funnel['DropOffRate'].iloc[i]
-        ax1.text(count + 2000, i, f"{count:,} ({drop_pct:.1f}% drop)", 
-                va='center', fontsize=9, fontweight='bold')
-    
-    # Traffic Sources
-    ax2 = fig.add_subplot(gs[1, 2])
-    colors_traffic = plt.cm.Set2(range(len(traffic_source)))
-    ax2.pie(traffic_source['Sessions'], labels=traffic_source['TrafficSource'],
-           autopct='%1.1f%%', colors=colors_traffic,
-           textprops={'fontsize': 9, 'fontweight': 'bold'})
-    ax2.set_title('Traffic Sources', fontsize=14, fontweight='bold', pad=10)
-    
-    # Device Performance
-    ax3 = fig.add_subplot(gs[2, 0])
-    colors_device = [COLORS['pink'], COLORS['blue'], COLORS['purple']]
-    ax3.bar(device_analysis['Device'], device_analysis['Sessions'], 
-           color=colors_device, alpha=0.7)
-    ax3.set_xlabel('Device', fontsize=12, fontweight='bold')
-    ax3.set_ylabel('Sessions', fontsize=12, fontweight='bold')
-    ax3.set_title('Sessions by Device', fontsize=14, fontweight='bold', pad=10)
-    ax3.tick_params(axis='x', rotation=45, labelsize=10)
-    ax3.grid(axis='y', alpha=0.3)
-    
-    # Cart Abandonment Reasons
-    ax4 = fig.add_subplot(gs[2, 1])
-    cart_top = cart_abandonment.sort_values('Percentage', ascending=False).head(5)
-    ax4.barh(range(len(cart_top)), cart_top['Percentage'], color=COLORS['red'], alpha=0.7)
-    ax4.set_yticks(range(len(cart_top)))
-    ax4.set_yticklabels(cart_top['Reason'], fontsize=9)
-    ax4.set_xlabel('Percentage (%)', fontsize=12, fontweight='bold')
-    ax4.set_title('Top Abandonment Reasons', fontsize=14, fontweight='bold', pad=10)
-    ax4.grid(axis='x', alpha=0.3)
-    
-    # Hourly Traffic Heatmap
-    ax5 = fig.add_subplot(gs[2, 2])
-    hourly_pivot = hourly_traffic.pivot_table(values='Sessions', 
-                                               index='DayOfWeek', 
-                                               columns='Hour', 
-                                               fill_value=0)
-    sns.heatmap(hourly_pivot, cmap='YlOrRd', ax=ax5, cbar_kws={'label': 'Sessions'},
-               linewidths=0.5, linecolor='white', fmt='d', annot=False)
-    ax5.set_xlabel('Hour of Day', fontsize=12, fontweight='bold')
-    ax5.set_ylabel('Day of Week', fontsize=12, fontweight='bold')
-    ax5.set_title('Traffic Heatmap', fontsize=14, fontweight='bold', pad=10)
-    
-    plt.tight_layout()
-    output_file = os.path.join(OUTPUT_PATH, '05_ecommerce_analytics.png')
-    plt.savefig(output_file, dpi=150, bbox_inches='tight', facecolor='white')
-    plt.close()
-    print(f"   ✅ Saved: {output_file}")
-    
-except Exception as e:
-    print(f"   ❌ Error creating E-commerce dashboard: {e}")
-
-# ============================================================================
-# COMPLETION
-# ============================================================================
-print("\n" + "=" * 70)
-print("✅ ALL DASHBOARD IMAGES CREATED SUCCESSFULLY!")
-print("=" * 70)
-print(f"\n📂 Output Location: {OUTPUT_PATH}")
-print("\nFiles created:")
-print("   1. 01_sales_performance.png")
-print("   2. 02_customer_analytics.png")
-print("   3. 03_inventory_management.png")
-print("   4. 04_executive_summary.png")
-print("   5. 05_ecommerce_analytics.png")
-print("\n🎨 Professional PNG dashboards ready for portfolio!")
-print("=" * 70)
+            status = " cached"
+        print(f"   {index + 1}. {filename:<30} {status}")
+    print(f"\n⏱️  {sum(render_times.values()):.2f}s of dashboard work in {elapsed:.2f}s wall time")
+    print("\n🎨 Professional PNG dashboards ready for portfolio!")
+    print("=" * 70)
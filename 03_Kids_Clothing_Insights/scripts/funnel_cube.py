@@ -0,0 +1,64 @@
+"""
+One-pass funnel cube for web analytics
+Reduces page events to one row per session holding a bitmask of the funnel
+stages it reached, its event count, total duration and dimensions, so the
+funnel, drop-off and conversion tables are small groupbys over sessions
+instead of another filter + nunique scan of every event.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Funnel stage: (event column, value); bit i of Stages is set when the
+# session had at least one event matching stage i
+FUNNEL_STAGES = {
+    'Homepage': ('Page', 'Homepage'),
+    'Category': ('Page', 'Category'),
+    'Product': ('Page', 'Product'),
+    'Cart': ('Page', 'Cart'),
+    'Checkout': ('Page', 'Checkout'),
+    'AddToCart': ('Action', 'AddToCart'),
+    'Purchase': ('Action', 'PlaceOrder')
+}
+
+def build_session_cube(events, sessions, dimensions=(), stages=FUNNEL_STAGES, duration_col='Duration'):
+    """One row per session, in SessionID order
+
+    ``sessions`` is the path_mining.EncodedSessions of the same events.
+    Dimension columns are taken from each session's first event, so they
+    should be constant within a session (traffic source, device, date).
+    """
+    bits = np.zeros(len(events), dtype=np.min_scalar_type(2 ** len(stages) - 1))
+    for column in dict.fromkeys(column for column, _ in stages.values()):
+        # One gather per column: category code -> OR of the stage bits it sets
+        codes, values = pd.factorize(events[column])
+        lookup = np.zeros(len(values) + 1, dtype=bits.dtype)
+        for bit, (stage_column, value) in enumerate(stages.values()):
+            if stage_column == column and value in values:
+                lookup[values.get_loc(value)] |= 1 << bit
+        bits |= lookup[codes]
+
+    first_event = sessions.starts if sessions.order is None else sessions.order[sessions.starts]
+    cube = pd.DataFrame({
+        'Stages': np.bitwise_or.reduceat(sessions.ordered(bits), sessions.starts),
+        'Events': sessions.lengths,
+        'Duration': np.add.reduceat(sessions.ordered(events[duration_col]), sessions.starts)
+    })
+    for column in dimensions:
+        cube[column] = events[column].iloc[first_event].reset_index(drop=True)
+    return cube
+
+def reached(cube, stage, stages=FUNNEL_STAGES):
+    """Boolean mask of sessions that reached a stage"""
+    bit = list(stages).index(stage)
+    return (cube['Stages'].to_numpy() >> bit) & 1 == 1
+
+def stage_sessions(cube, stage_names, stages=FUNNEL_STAGES):
+    """Number of sessions reaching each of the given stages"""
+    return [int(reached(cube, stage, stages).sum()) for stage in stage_names]
+
+def conversion_by(cube, dimension, stage='Purchase', stages=FUNNEL_STAGES):
+    """Sessions and sessions reaching ``stage`` for every value of a dimension"""
+    table = cube[[dimension]].assign(Conversions=reached(cube, stage, stages))
+    table = table.groupby(dimension).agg(Sessions=('Conversions', 'size'), Conversions=('Conversions', 'sum'))
+    return table.reset_index()
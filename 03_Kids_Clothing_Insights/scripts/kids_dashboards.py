@@ -0,0 +1,566 @@
+"""
+Dashboard renderers for the Kids Clothing dashboard PNGs
+All processed CSVs the dashboards read are loaded once into a dict of
+frames; each dashboard is a function that draws one 1920x1080 figure from
+it, so the dashboards can be drawn in turn or spread over a process pool
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.gridspec import GridSpec
+import seaborn as sns
+import warnings
+warnings.filterwarnings('ignore')
+
+# Project color palette
+COLORS = {
+    'pink': '#FF6B9D',      # Girls
+    'blue': '#4A90E2',      # Boys
+    'yellow': '#FFC845',    # Infants
+    'purple': '#9B59B6',    # Accessories
+    'green': '#27AE60',     # Success
+    'orange': '#F39C12',    # Warning
+    'red': '#E74C3C',       # Danger
+    'gray': '#2C3E50'       # Text
+}
+
+# Paths
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+BASE_PATH = os.path.join(PROJECT_DIR, 'data', 'processed')
+OUTPUT_PATH = os.path.join(PROJECT_DIR, 'tableau', 'dashboard_screenshots')
+
+PRODUCTION_DPI = 150
+
+# Input name: (CSV in data/processed, rows kept - None keeps all)
+INPUTS = {
+    'sales_summary': ('sales_summary.csv', None),
+    'category_perf': ('category_performance.csv', None),
+    'monthly_trends': ('monthly_trends.csv', None),
+    'store_perf': ('store_performance.csv', 10),
+    'channel_perf': ('channel_performance.csv', None),
+    'customer_rfm': ('customer_rfm.csv', 5000),  # Sample for speed
+    'customer_segments': ('customer_segments.csv', None),
+    'clv_by_segment': ('clv_by_segment.csv', None),
+    'demographics_age': ('customer_demographics_age.csv', None),
+    'stock_summary': ('stock_status_summary.csv', None),
+    'reorder_alerts': ('reorder_alerts.csv', 15),
+    'supplier_perf': ('supplier_performance.csv', None),
+    'inventory_turnover': ('inventory_turnover.csv', None),
+    'financial_summary': ('financial_summary.csv', None),
+    'kpi_summary': ('kpi_summary.csv', None),
+    'quarterly_perf': ('quarterly_performance.csv', None),
+    'revenue_forecast': ('revenue_forecast.csv', None),
+    'conversion_funnel': ('conversion_funnel.csv', None),
+    'traffic_source': ('traffic_source_analysis.csv', None),
+    'device_analysis': ('device_analysis.csv', None),
+    'cart_abandonment': ('cart_abandonment_reasons.csv', None),
+    'hourly_traffic': ('hourly_traffic.csv', None)
+}
+
+def apply_style():
+    """Chart style shared by every dashboard (set again in each worker)"""
+    plt.style.use('seaborn-v0_8-darkgrid')
+    sns.set_palette("husl")
+
+def load_inputs(base_path=BASE_PATH):
+    """Read every dashboard input once; returns (frames, {name: error} for unreadable files)"""
+    frames, missing = {}, {}
+    for name, (filename, rows) in INPUTS.items():
+        try:
+            df = pd.read_csv(os.path.join(base_path, filename))
+        except (OSError, ValueError) as e:
+            missing[name] = str(e)
+            continue
+        frames[name] = df if rows is None else df.head(rows)
+    return frames, missing
+
+# ============================================================================
+# SHARED ELEMENTS
+# ============================================================================
+
+def _kpi_card(ax, value, label, color, facecolor='#F8F9FA', value_size=32, label_size=14):
+    ax.text(0.5, 0.6, value, ha='center', va='center', fontsize=value_size, fontweight='bold', color=color)
+    ax.text(0.5, 0.3, label, ha='center', va='center', fontsize=label_size, color=COLORS['gray'])
+    ax.axis('off')
+    ax.set_facecolor(facecolor)
+
+def _striped_table(ax, cell_text, col_labels, header_color, stripe_color, **kwargs):
+    """Table with a bold colored header and striped rows, colored when it is built"""
+    n_rows, n_cols = len(cell_text), len(col_labels)
+    stripes = np.where(np.arange(1, n_rows + 1) % 2 == 0, stripe_color, 'white')
+    table = ax.table(cellText=cell_text, colLabels=col_labels,
+                     cellColours=np.repeat(stripes[:, None], n_cols, axis=1),
+                     colColours=[header_color] * n_cols, **kwargs)
+    for col in range(n_cols):
+        table[(0, col)].set_text_props(weight='bold', color='white')
+    return table
+
+def _month_labels(df):
+    """'YYYY-MM' labels from Year and Month columns"""
+    return (df['Year'].astype(str) + '-' + df['Month'].astype(int).map('{:02d}'.format)).tolist()
+
+def _save(path, dpi):
+    plt.tight_layout()
+    plt.savefig(path, dpi=dpi, bbox_inches='tight', facecolor='white')
+    plt.close()
+
+# ============================================================================
+# DASHBOARDS
+# ============================================================================
+
+def draw_sales_performance(data, path, dpi):
+    sales_summary = data['sales_summary']
+    category_perf = data['category_perf']
+    monthly_trends = data['monthly_trends']
+    store_perf = data['store_perf']
+    channel_perf = data['channel_perf']
+
+    fig = plt.figure(figsize=(19.2, 10.8), facecolor='white')
+    gs = GridSpec(3, 3, figure=fig, hspace=0.3, wspace=0.3)
+
+    # Title
+    fig.suptitle('Sales Performance Dashboard', fontsize=28, fontweight='bold',
+                 color=COLORS['purple'], y=0.98)
+
+    # KPI Cards (top row)
+    _kpi_card(fig.add_subplot(gs[0, 0]), f"${sales_summary['TotalRevenue'].iloc[0]:,.0f}", "Total Revenue", COLORS['purple'])
+    _kpi_card(fig.add_subplot(gs[0, 1]), f"{sales_summary['Transactions'].iloc[0]:,}", "Transactions", COLORS['blue'])
+    _kpi_card(fig.add_subplot(gs[0, 2]), f"${sales_summary['AvgOrderValue'].iloc[0]:.2f}", "Avg Order Value", COLORS['yellow'])
+
+    # Category Performance (horizontal bars)
+    ax1 = fig.add_subplot(gs[1, 0])
+    colors_cat = [COLORS['pink'], COLORS['blue'], COLORS['yellow'], COLORS['purple']]
+    ax1.barh(category_perf['Category'], category_perf['TotalRevenue'], color=colors_cat)
+    ax1.set_xlabel('Revenue ($)', fontsize=12, fontweight='bold')
+    ax1.set_title('Revenue by Category', fontsize=14, fontweight='bold', pad=10)
+    ax1.tick_params(axis='both', labelsize=10)
+    for i, v in enumerate(category_perf['TotalRevenue']):
+        ax1.text(v + 10000, i, f'${v:,.0f}', va='center', fontsize=10, fontweight='bold')
+    ax1.grid(axis='x', alpha=0.3)
+
+    # Monthly Trend (line chart)
+    ax2 = fig.add_subplot(gs[1, 1:])
+    ax2.plot(range(len(monthly_trends)), monthly_trends['TotalRevenue'],
+             marker='o', linewidth=3, markersize=8, color=COLORS['purple'], label='Revenue')
+    ax2.fill_between(range(len(monthly_trends)), monthly_trends['TotalRevenue'], alpha=0.3, color=COLORS['purple'])
+    ax2.set_xlabel('Month', fontsize=12, fontweight='bold')
+    ax2.set_ylabel('Revenue ($)', fontsize=12, fontweight='bold')
+    ax2.set_title('Monthly Revenue Trend', fontsize=14, fontweight='bold', pad=10)
+    ax2.set_xticks(range(len(monthly_trends)))
+    ax2.set_xticklabels(_month_labels(monthly_trends), rotation=45)
+    ax2.tick_params(axis='both', labelsize=10)
+    ax2.grid(alpha=0.3)
+    ax2.legend(fontsize=10)
+
+    # Store Performance (top 10)
+    ax3 = fig.add_subplot(gs[2, 0:2])
+    ax3.bar(range(len(store_perf)), store_perf['TotalRevenue'], color=COLORS['blue'], alpha=0.7)
+    ax3.set_xlabel('Store', fontsize=12, fontweight='bold')
+    ax3.set_ylabel('Revenue ($)', fontsize=12, fontweight='bold')
+    ax3.set_title('Top 10 Stores by Revenue', fontsize=14, fontweight='bold', pad=10)
+    ax3.set_xticks(range(len(store_perf)))
+    ax3.set_xticklabels(store_perf['StoreName'], rotation=45, ha='right', fontsize=9)
+    ax3.tick_params(axis='y', labelsize=10)
+    ax3.grid(axis='y', alpha=0.3)
+
+    # Channel Distribution (pie chart)
+    ax4 = fig.add_subplot(gs[2, 2])
+    colors_channel = [COLORS['blue'], COLORS['pink']]
+    ax4.pie(channel_perf['TotalRevenue'], labels=channel_perf['Channel'],
+            autopct='%1.1f%%', colors=colors_channel, startangle=90,
+            textprops={'fontsize': 12, 'fontweight': 'bold'})
+    ax4.set_title('Channel Distribution', fontsize=14, fontweight='bold', pad=10)
+
+    _save(path, dpi)
+
+def draw_customer_analytics(data, path, dpi):
+    customer_rfm = data['customer_rfm']
+    customer_segments = data['customer_segments']
+    clv_by_segment = data['clv_by_segment']
+    demographics_age = data['demographics_age']
+
+    fig = plt.figure(figsize=(19.2, 10.8), facecolor='white')
+    gs = GridSpec(3, 3, figure=fig, hspace=0.3, wspace=0.3)
+
+    fig.suptitle('Customer Analytics Dashboard', fontsize=28, fontweight='bold',
+                 color=COLORS['blue'], y=0.98)
+
+    # KPI Cards
+    _kpi_card(fig.add_subplot(gs[0, 0]), f"{len(customer_rfm):,}", "Total Customers", COLORS['blue'])
+    _kpi_card(fig.add_subplot(gs[0, 1]), f"${customer_rfm['CLV'].mean():.2f}", "Average CLV", COLORS['green'])
+    _kpi_card(fig.add_subplot(gs[0, 2]), f"{len(customer_segments)}", "Customer Segments", COLORS['purple'])
+
+    # RFM Scatter Plot
+    ax1 = fig.add_subplot(gs[1, 0:2])
+    scatter = ax1.scatter(customer_rfm['Recency'], customer_rfm['Frequency'],
+                          s=customer_rfm['Monetary']/5, c=customer_rfm['RFM_Score'],
+                          cmap='viridis', alpha=0.6, edgecolors='white', linewidth=0.5)
+    ax1.set_xlabel('Recency (days)', fontsize=12, fontweight='bold')
+    ax1.set_ylabel('Frequency (purchases)', fontsize=12, fontweight='bold')
+    ax1.set_title('RFM Analysis (size = monetary value)', fontsize=14, fontweight='bold', pad=10)
+    ax1.grid(alpha=0.3)
+    cbar = plt.colorbar(scatter, ax=ax1)
+    cbar.set_label('RFM Score', fontsize=10, fontweight='bold')
+
+    # Customer Segments (pie)
+    ax2 = fig.add_subplot(gs[1, 2])
+    segment_counts = customer_segments.groupby('Segment').size().sort_values(ascending=False).head(6)
+    colors_seg = plt.cm.Set3(range(len(segment_counts)))
+    ax2.pie(segment_counts.values, labels=segment_counts.index, autopct='%1.1f%%',
+            colors=colors_seg, textprops={'fontsize': 9, 'fontweight': 'bold'})
+    ax2.set_title('Top Customer Segments', fontsize=14, fontweight='bold', pad=10)
+
+    # CLV by Segment
+    ax3 = fig.add_subplot(gs[2, 0:2])
+    clv_sorted = clv_by_segment.sort_values('AvgCLV', ascending=False).head(10)
+    ax3.barh(range(len(clv_sorted)), clv_sorted['AvgCLV'], color=COLORS['green'], alpha=0.7)
+    ax3.set_yticks(range(len(clv_sorted)))
+    ax3.set_yticklabels(clv_sorted['Segment'], fontsize=10)
+    ax3.set_xlabel('Average CLV ($)', fontsize=12, fontweight='bold')
+    ax3.set_title('Customer Lifetime Value by Segment', fontsize=14, fontweight='bold', pad=10)
+    ax3.grid(axis='x', alpha=0.3)
+    for i, v in enumerate(clv_sorted['AvgCLV']):
+        ax3.text(v + 5, i, f'${v:.2f}', va='center', fontsize=9, fontweight='bold')
+
+    # Age Demographics
+    ax4 = fig.add_subplot(gs[2, 2])
+    ax4.bar(demographics_age['AgeGroup'], demographics_age['CustomerCount'], color=COLORS['blue'], alpha=0.7)
+    ax4.set_xlabel('Age Group', fontsize=12, fontweight='bold')
+    ax4.set_ylabel('Customers', fontsize=12, fontweight='bold')
+    ax4.set_title('Customers by Age', fontsize=14, fontweight='bold', pad=10)
+    ax4.tick_params(axis='x', rotation=45, labelsize=9)
+    ax4.grid(axis='y', alpha=0.3)
+
+    _save(path, dpi)
+
+def draw_inventory_management(data, path, dpi):
+    stock_summary = data['stock_summary']
+    reorder_alerts = data['reorder_alerts']
+    supplier_perf = data['supplier_perf']
+    inventory_turnover = data['inventory_turnover']
+
+    fig = plt.figure(figsize=(19.2, 10.8), facecolor='white')
+    gs = GridSpec(3, 3, figure=fig, hspace=0.3, wspace=0.3)
+
+    fig.suptitle('Inventory Management Dashboard', fontsize=28, fontweight='bold',
+                 color=COLORS['orange'], y=0.98)
+
+    # Stock Status Gauges
+    status_counts = stock_summary.groupby('StockStatus')['ProductCount'].sum()
+    _kpi_card(fig.add_subplot(gs[0, 0]), f"{status_counts.get('Critical', 0)}", "Critical Items",
+              COLORS['red'], facecolor='#FFEBEE', value_size=36)
+    _kpi_card(fig.add_subplot(gs[0, 1]), f"{status_counts.get('Low', 0)}", "Low Stock Items",
+              COLORS['orange'], facecolor='#FFF3E0', value_size=36)
+    _kpi_card(fig.add_subplot(gs[0, 2]), f"{status_counts.get('Normal', 0)}", "Normal Stock",
+              COLORS['green'], facecolor='#E8F5E9', value_size=36)
+
+    # Reorder Alerts Table (visual)
+    ax1 = fig.add_subplot(gs[1, 0:2])
+    ax1.axis('tight')
+    ax1.axis('off')
+    table_data = reorder_alerts[['ProductName', 'Category', 'CurrentStock', 'ReorderQuantity']].head(10).values
+    table = _striped_table(ax1, table_data, ['Product', 'Category', 'Stock', 'Reorder Qty'],
+                           COLORS['orange'], '#FFF3E0',
+                           cellLoc='left', loc='center', colWidths=[0.4, 0.2, 0.2, 0.2])
+    table.auto_set_font_size(False)
+    table.set_fontsize(9)
+    table.scale(1, 2)
+    ax1.set_title('Top Reorder Alerts', fontsize=14, fontweight='bold', pad=10)
+
+    # Supplier Performance
+    ax2 = fig.add_subplot(gs[1, 2])
+    supplier_top = supplier_perf.sort_values('SupplierScore', ascending=False).head(8)
+    score = supplier_top['SupplierScore'].to_numpy()
+    colors_supplier = np.select([score > 0.85, score > 0.75], [COLORS['green'], COLORS['orange']], COLORS['red'])
+    ax2.barh(range(len(supplier_top)), supplier_top['SupplierScore'], color=colors_supplier, alpha=0.7)
+    ax2.set_yticks(range(len(supplier_top)))
+    ax2.set_yticklabels(supplier_top['SupplierName'], fontsize=9)
+    ax2.set_xlabel('Score', fontsize=12, fontweight='bold')
+    ax2.set_title('Top Suppliers', fontsize=14, fontweight='bold', pad=10)
+    ax2.set_xlim(0, 1)
+    ax2.grid(axis='x', alpha=0.3)
+
+    # Inventory Turnover by Category
+    ax3 = fig.add_subplot(gs[2, 0:2])
+    turnover_cat = inventory_turnover.groupby('Category').agg({
+        'InventoryTurnover': 'mean'
+    }).reset_index().sort_values('InventoryTurnover', ascending=False)
+    colors_turn = [COLORS['pink'], COLORS['blue'], COLORS['yellow'], COLORS['purple']][:len(turnover_cat)]
+    ax3.bar(turnover_cat['Category'], turnover_cat['InventoryTurnover'], color=colors_turn, alpha=0.7)
+    ax3.set_xlabel('Category', fontsize=12, fontweight='bold')
+    ax3.set_ylabel('Turnover Rate', fontsize=12, fontweight='bold')
+    ax3.set_title('Inventory Turnover by Category', fontsize=14, fontweight='bold', pad=10)
+    ax3.tick_params(axis='x', rotation=45, labelsize=10)
+    ax3.grid(axis='y', alpha=0.3)
+    ax3.axhline(y=turnover_cat['InventoryTurnover'].mean(), color='red', linestyle='--',
+                linewidth=2, label='Average')
+    ax3.legend(fontsize=10)
+
+    # Stock Status Distribution
+    ax4 = fig.add_subplot(gs[2, 2])
+    colors_status = [COLORS['red'], COLORS['orange'], COLORS['green']]
+    ax4.pie(stock_summary['ProductCount'], labels=stock_summary['StockStatus'],
+            autopct='%1.1f%%', colors=colors_status[:len(stock_summary)],
+            textprops={'fontsize': 11, 'fontweight': 'bold'})
+    ax4.set_title('Stock Status', fontsize=14, fontweight='bold', pad=10)
+
+    _save(path, dpi)
+
+def draw_executive_summary(data, path, dpi):
+    financial_summary = data['financial_summary']
+    quarterly_perf = data['quarterly_perf']
+    revenue_forecast = data['revenue_forecast']
+
+    fig = plt.figure(figsize=(19.2, 10.8), facecolor='white')
+    gs = GridSpec(3, 4, figure=fig, hspace=0.3, wspace=0.3)
+
+    fig.suptitle('Executive Summary Dashboard', fontsize=28, fontweight='bold',
+                 color=COLORS['purple'], y=0.98)
+
+    # Top KPI Cards
+    kpis = [
+        ("Revenue", f"${financial_summary['TotalRevenue'].iloc[0]:,.0f}", COLORS['purple']),
+        ("Gross Margin", f"{financial_summary['GrossMargin'].iloc[0]:.1f}%", COLORS['green']),
+        ("Net Margin", f"{financial_summary['NetMargin'].iloc[0]:.1f}%", COLORS['blue']),
+        ("EBITDA", f"${financial_summary['EBITDA'].iloc[0]:,.0f}", COLORS['orange']),
+    ]
+    for idx, (label, value, color) in enumerate(kpis):
+        _kpi_card(fig.add_subplot(gs[0, idx]), value, label, color, value_size=28, label_size=12)
+
+    # P&L Waterfall (simplified)
+    ax1 = fig.add_subplot(gs[1, 0:2])
+    pl_items = ['Revenue', 'COGS', 'Gross\nProfit', 'OpEx', 'Net\nProfit']
+    pl_values = [
+        financial_summary['TotalRevenue'].iloc[0],
+        -financial_summary['COGS'].iloc[0],
+        financial_summary['GrossProfit'].iloc[0],
+        -financial_summary['OperatingExpenses'].iloc[0],
+        financial_summary['NetProfit'].iloc[0]
+    ]
+    colors_pl = [COLORS['green'], COLORS['red'], COLORS['blue'], COLORS['red'], COLORS['purple']]
+    ax1.bar(range(len(pl_items)), pl_values, color=colors_pl, alpha=0.7)
+    ax1.set_xticks(range(len(pl_items)))
+    ax1.set_xticklabels(pl_items, fontsize=11, fontweight='bold')
+    ax1.set_ylabel('Amount ($)', fontsize=12, fontweight='bold')
+    ax1.set_title('P&L Summary', fontsize=14, fontweight='bold', pad=10)
+    ax1.axhline(y=0, color='black', linewidth=1)
+    ax1.grid(axis='y', alpha=0.3)
+
+    # Quarterly Performance
+    ax2 = fig.add_subplot(gs[1, 2:])
+    quarters = ('Q' + quarterly_perf['Quarter'].astype(str)).tolist()
+    ax2.plot(quarters, quarterly_perf['TotalRevenue'], marker='o', linewidth=3,
+             markersize=10, color=COLORS['purple'], label='Revenue')
+    ax2.fill_between(range(len(quarters)), quarterly_perf['TotalRevenue'],
+                     alpha=0.3, color=COLORS['purple'])
+    ax2.set_xlabel('Quarter', fontsize=12, fontweight='bold')
+    ax2.set_ylabel('Revenue ($)', fontsize=12, fontweight='bold')
+    ax2.set_title('Quarterly Revenue Trend', fontsize=14, fontweight='bold', pad=10)
+    ax2.grid(alpha=0.3)
+    ax2.legend(fontsize=10)
+
+    # Revenue Forecast
+    ax3 = fig.add_subplot(gs[2, 0:3])
+    forecast_months = _month_labels(revenue_forecast)
+    ax3.plot(range(len(forecast_months)), revenue_forecast['ForecastRevenue'],
+             marker='o', linewidth=3, markersize=8, color=COLORS['blue'],
+             linestyle='--', label='Forecast')
+    ax3.fill_between(range(len(forecast_months)),
+                     revenue_forecast['ConfidenceLower'],
+                     revenue_forecast['ConfidenceUpper'],
+                     alpha=0.2, color=COLORS['blue'], label='Confidence Band')
+    ax3.set_xlabel('Month', fontsize=12, fontweight='bold')
+    ax3.set_ylabel('Revenue ($)', fontsize=12, fontweight='bold')
+    ax3.set_title('6-Month Revenue Forecast', fontsize=14, fontweight='bold', pad=10)
+    ax3.set_xticks(range(len(forecast_months)))
+    ax3.set_xticklabels(forecast_months, rotation=45, fontsize=9)
+    ax3.grid(alpha=0.3)
+    ax3.legend(fontsize=10)
+
+    # KPI Scorecard (traffic lights)
+    ax4 = fig.add_subplot(gs[2, 3])
+    ax4.axis('tight')
+    ax4.axis('off')
+    scorecard_data = [
+        ['Gross Margin', '45.2%', '🟢'],
+        ['Net Margin', '11.4%', '🔴'],
+        ['Turnover', '7.0x', '🟢'],
+        ['CLV/CAC', '22.6x', '🟢'],
+    ]
+    table = _striped_table(ax4, scorecard_data, ['Metric', 'Value', 'Status'],
+                           COLORS['purple'], '#F8F9FA',
+                           cellLoc='center', loc='center', colWidths=[0.4, 0.3, 0.3])
+    table.auto_set_font_size(False)
+    table.set_fontsize(10)
+    table.scale(1, 2.5)
+    ax4.set_title('KPI Scorecard', fontsize=14, fontweight='bold', pad=10)
+
+    _save(path, dpi)
+
+def draw_ecommerce_analytics(data, path, dpi):
+    conversion_funnel = data['conversion_funnel']
+    traffic_source = data['traffic_source']
+    device_analysis = data['device_analysis']
+    cart_abandonment = data['cart_abandonment']
+    hourly_traffic = data['hourly_traffic']
+
+    fig = plt.figure(figsize=(19.2, 10.8), facecolor='white')
+    gs = GridSpec(3, 3, figure=fig, hspace=0.3, wspace=0.3)
+
+    fig.suptitle('E-commerce Analytics Dashboard', fontsize=28, fontweight='bold',
+                 color=COLORS['blue'], y=0.98)
+
+    # KPI Cards
+    total_sessions = conversion_funnel['Count'].iloc[0]
+    conversions = conversion_funnel[conversion_funnel['Stage'] == 'Purchase']['Count'].iloc[0]
+    conv_rate = (conversions / total_sessions) * 100
+    _kpi_card(fig.add_subplot(gs[0, 0]), f"{total_sessions:,}", "Sessions", COLORS['blue'])
+    _kpi_card(fig.add_subplot(gs[0, 1]), f"{conv_rate:.2f}%", "Conversion Rate", COLORS['green'])
+    _kpi_card(fig.add_subplot(gs[0, 2]), f"{cart_abandonment['Percentage'].sum():.1f}%", "Cart Abandonment",
+              COLORS['red'], facecolor='#FFEBEE')
+
+    # Conversion Funnel
+    ax1 = fig.add_subplot(gs[1, 0:2])
+    stages = conversion_funnel['Stage'].tolist()
+    counts = conversion_funnel['Count'].tolist()
+    colors_funnel = plt.cm.Blues(np.linspace(0.4, 0.9, len(stages)))
+    ax1.barh(range(len(stages)), counts, color=colors_funnel, alpha=0.8)
+    ax1.set_yticks(range(len(stages)))
+    ax1.set_yticklabels(stages, fontsize=11)
+    ax1.set_xlabel('Count', fontsize=12, fontweight='bold')
+    ax1.set_title('Conversion Funnel', fontsize=14, fontweight='bold', pad=10)
+    ax1.grid(axis='x', alpha=0.3)
+    for i, (count, drop_pct) in enumerate(zip(counts, conversion_funnel['DropOffRate'])):
+        ax1.text(count + 2000, i, f"{count:,} ({drop_pct:.1f}% drop)",
+                 va='center', fontsize=9, fontweight='bold')
+
+    # Traffic Sources
+    ax2 = fig.add_subplot(gs[1, 2])
+    colors_traffic = plt.cm.Set2(range(len(traffic_source)))
+    ax2.pie(traffic_source['Sessions'], labels=traffic_source['TrafficSource'],
+            autopct='%1.1f%%', colors=colors_traffic,
+            textprops={'fontsize': 9, 'fontweight': 'bold'})
+    ax2.set_title('Traffic Sources', fontsize=14, fontweight='bold', pad=10)
+
+    # Device Performance
+    ax3 = fig.add_subplot(gs[2, 0])
+    colors_device = [COLORS['pink'], COLORS['blue'], COLORS['purple']]
+    ax3.bar(device_analysis['Device'], device_analysis['Sessions'],
+            color=colors_device, alpha=0.7)
+    ax3.set_xlabel('Device', fontsize=12, fontweight='bold')
+    ax3.set_ylabel('Sessions', fontsize=12, fontweight='bold')
+    ax3.set_title('Sessions by Device', fontsize=14, fontweight='bold', pad=10)
+    ax3.tick_params(axis='x', rotation=45, labelsize=10)
+    ax3.grid(axis='y', alpha=0.3)
+
+    # Cart Abandonment Reasons
+    ax4 = fig.add_subplot(gs[2, 1])
+    cart_top = cart_abandonment.sort_values('Percentage', ascending=False).head(5)
+    ax4.barh(range(len(cart_top)), cart_top['Percentage'], color=COLORS['red'], alpha=0.7)
+    ax4.set_yticks(range(len(cart_top)))
+    ax4.set_yticklabels(cart_top['Reason'], fontsize=9)
+    ax4.set_xlabel('Percentage (%)', fontsize=12, fontweight='bold')
+    ax4.set_title('Top Abandonment Reasons', fontsize=14, fontweight='bold', pad=10)
+    ax4.grid(axis='x', alpha=0.3)
+
+    # Hourly Traffic Heatmap
+    ax5 = fig.add_subplot(gs[2, 2])
+    hourly_pivot = hourly_traffic.pivot_table(values='Sessions',
+                                              index='DayOfWeek',
+                                              columns='Hour',
+                                              fill_value=0)
+    sns.heatmap(hourly_pivot, cmap='YlOrRd', ax=ax5, cbar_kws={'label': 'Sessions'},
+                linewidths=0.5, linecolor='white', fmt='d', annot=False)
+    ax5.set_xlabel('Hour of Day', fontsize=12, fontweight='bold')
+    ax5.set_ylabel('Day of Week', fontsize=12, fontweight='bold')
+    ax5.set_title('Traffic Heatmap', fontsize=14, fontweight='bold', pad=10)
+
+    _save(path, dpi)
+
+# Output file, title, renderer and the inputs it reads, in report order
+DASHBOARDS = [
+    ('01_sales_performance.png', 'Sales Performance', draw_sales_performance,
+     ['sales_summary', 'category_perf', 'monthly_trends', 'store_perf', 'channel_perf']),
+    ('02_customer_analytics.png', 'Customer Analytics', draw_customer_analytics,
+     ['customer_rfm', 'customer_segments', 'clv_by_segment', 'demographics_age']),
+    ('03_inventory_management.png', 'Inventory Management', draw_inventory_management,
+     ['stock_summary', 'reorder_alerts', 'supplier_perf', 'inventory_turnover']),
+    ('04_executive_summary.png', 'Executive Summary', draw_executive_summary,
+     ['financial_summary', 'kpi_summary', 'quarterly_perf', 'revenue_forecast']),
+    ('05_ecommerce_analytics.png', 'E-commerce Analytics', draw_ecommerce_analytics,
+     ['conversion_funnel', 'traffic_source', 'device_analysis', 'cart_abandonment', 'hourly_traffic'])
+]
+
+# ============================================================================
+# RENDERING
+# ============================================================================
+
+def stale_dashboards(data, cache=None):
+    """Indices of the dashboards whose PNG must be redrawn
+
+    With a RenderCache, a dashboard is skipped when its inputs, the style
+    and this module are unchanged since its PNG was written. Dashboards with
+    a missing input are always attempted, so their error is reported.
+    """
+    if cache is None:
+        return list(range(len(DASHBOARDS)))
+    apply_style()
+    stale = []
+    for index, (filename, _, _, inputs) in enumerate(DASHBOARDS):
+        if any(name not in data for name in inputs) or \
+                not cache.is_current(filename, *[data[name] for name in inputs]):
+            stale.append(index)
+    return stale
+
+def _render(data, index, output_dir, dpi):
+    """Draw one dashboard and return (index, seconds, error message or None)"""
+    filename, _, draw, inputs = DASHBOARDS[index]
+    start = time.perf_counter()
+    try:
+        missing = [name for name in inputs if name not in data]
+        if missing:
+            raise FileNotFoundError(f"missing input {', '.join(INPUTS[name][0] for name in missing)}")
+        draw(data, os.path.join(output_dir, filename), dpi)
+        error = None
+    except Exception as e:
+        plt.close('all')
+        error = str(e)
+    return index, time.perf_counter() - start, error
+
+def render_sequential(data, indices, output_dir=OUTPUT_PATH, dpi=PRODUCTION_DPI):
+    """Draw the given dashboards in this process, yielding (index, seconds, error) as each finishes"""
+    apply_style()
+    for index in indices:
+        yield _render(data, index, output_dir, dpi)
+
+# Inputs shared with pool workers; set once per worker by _init_worker
+_worker_data = None
+
+def _init_worker(data):
+    global _worker_data
+    apply_style()
+    _worker_data = data
+
+def _render_in_worker(index, output_dir, dpi):
+    return _render(_worker_data, index, output_dir, dpi)
+
+def render_parallel(data, indices, output_dir=OUTPUT_PATH, dpi=PRODUCTION_DPI, workers=None):
+    """Draw the given dashboards on a process pool, yielding (index, seconds, error) as each finishes
+
+    The loaded inputs are small summary tables, so each worker receives one
+    pickled copy when it starts rather than one per dashboard.
+    """
+    workers = workers or min(os.cpu_count() or 1, len(indices))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(data,)) as pool:
+        futures = [pool.submit(_render_in_worker, index, output_dir, dpi) for index in indices]
+        for future in as_completed(futures):
+            yield future.result()
@@ -0,0 +1,138 @@
+"""
+Columnar cache for the Kids Clothing star schema
+Parses each raw CSV once (typed dates, dictionary-encoded dimensions) and
+builds the enriched sales fact table (transactions + products + stores),
+keeping both as Parquet files in data/cache/. A cached file is rebuilt as
+soon as any raw CSV it was built from changes. Falls back to reading the
+CSVs directly without pyarrow.
+"""
+
+import os
+import json
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+RAW_DIR = 'data/raw'
+CACHE_DIR = 'data/cache'
+MANIFEST_FILE = 'manifest.json'
+
+# Set to False to always parse the raw CSVs (e.g. when debugging the generator)
+USE_CACHE = True
+
+# table name: (date columns, low-cardinality text columns stored as categories)
+TABLES = {
+    'sales_transactions': (['Date'], ['StoreID', 'PaymentMethod', 'Channel']),
+    'products': ([], ['Category', 'Subcategory', 'Size', 'Season', 'Color', 'Brand']),
+    'stores': ([], ['City', 'State', 'Region', 'StoreType']),
+    'customers': (['SignupDate'], ['City', 'State', 'Gender']),
+    'inventory': (['LastRestocked'], ['WarehouseID', 'StockStatus']),
+    'suppliers': ([], ['Country']),
+    'web_analytics': (['Date'], ['Page', 'Action', 'DeviceType', 'TrafficSource'])
+}
+
+# Enriched fact table: transactions joined to their product and store rows
+SALES_SOURCES = ['sales_transactions', 'products', 'stores']
+
+# ============================================================================
+# CACHE BOOKKEEPING
+# ============================================================================
+
+def _raw_path(name):
+    return os.path.join(RAW_DIR, f'{name}.csv')
+
+def _signature(sources):
+    """Size and modification time of every raw CSV a cached file depends on"""
+    signature = {}
+    for name in sources:
+        stat = os.stat(_raw_path(name))
+        signature[name] = [stat.st_size, stat.st_mtime_ns]
+    return signature
+
+def _load_manifest():
+    path = os.path.join(CACHE_DIR, MANIFEST_FILE)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_manifest(manifest):
+    path = os.path.join(CACHE_DIR, MANIFEST_FILE)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def clear_cache():
+    """Delete every cached Parquet file so the next load re-parses the CSVs"""
+    if not os.path.isdir(CACHE_DIR):
+        return
+    for filename in os.listdir(CACHE_DIR):
+        if filename.endswith('.parquet') or filename == MANIFEST_FILE:
+            os.remove(os.path.join(CACHE_DIR, filename))
+
+def _cached(key, sources, build, columns):
+    """Read data/cache/<key>.parquet, rebuilding it first if it is stale"""
+    if not (PYARROW_AVAILABLE and USE_CACHE):
+        df = build()
+        return df[list(columns)] if columns is not None else df
+
+    path = os.path.join(CACHE_DIR, f'{key}.parquet')
+    signature = _signature(sources)
+    manifest = _load_manifest()
+    if manifest.get(key) != signature or not os.path.exists(path):
+        df = build()
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = path + '.tmp'
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), tmp_path)
+        os.replace(tmp_path, path)
+        manifest[key] = signature
+        _save_manifest(manifest)
+        if columns is not None:
+            df = df[list(columns)]
+    else:
+        df = pd.read_parquet(path, columns=columns)
+    return _sort_categories(df)
+
+def _sort_categories(df):
+    """Sorted categories keep groupby output in the same order as plain strings"""
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].cat.set_categories(sorted(df[col].cat.categories))
+    return df
+
+# ============================================================================
+# BUILDERS
+# ============================================================================
+
+def _read_raw(name):
+    """Parse one raw CSV with typed dates and categorical dimensions"""
+    date_columns, categorical_columns = TABLES[name]
+    df = pd.read_csv(_raw_path(name), parse_dates=date_columns)
+    df = df.astype({col: 'category' for col in categorical_columns})
+    return _sort_categories(df)
+
+def _build_sales():
+    df_sales = _read_raw('sales_transactions').merge(_read_raw('products'), on='ProductID', how='left')
+    return df_sales.merge(_read_raw('stores'), on='StoreID', how='left')
+
+# ============================================================================
+# LOADERS
+# ============================================================================
+
+def load_table(name, columns=None):
+    """Load one raw table, e.g. load_table('customers', ['CustomerID', 'SignupDate'])"""
+    return _cached(name, [name], lambda: _read_raw(name), columns)
+
+def load_sales(columns=None):
+    """Load the enriched sales fact table (transactions + products + stores)"""
+    return _cached('sales', SALES_SOURCES, _build_sales, columns)
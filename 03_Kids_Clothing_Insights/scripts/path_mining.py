@@ -0,0 +1,152 @@
+"""
+Session path mining for web analytics events
+Encodes pages as small integers and sessions as integer codes once, then
+counts first-k-step paths, page n-grams and Markov transitions with array
+operations instead of one Python call per session.
+"""
+
+import numpy as np
+import pandas as pd
+
+START = 'Start'
+EXIT = 'Exit'
+
+class EncodedSessions:
+    """Events ordered by session, with integer session/page codes and step numbers
+
+    Usage:
+        sessions = EncodedSessions(df_web, order='Time')
+        paths = first_k_paths(sessions, 3)
+        bigrams = ngram_counts(sessions, 2)
+        matrix = transition_matrix(sessions)
+    """
+
+    def __init__(self, events, session_col='SessionID', page_col='Page', order=None):
+        session_codes, _ = pd.factorize(events[session_col], sort=True)
+        page_codes, pages = pd.factorize(events[page_col], sort=True)
+
+        # Stable sort by session (then by the order column), keeping the
+        # original event order within ties; skipped when already sorted
+        keys = [session_codes]
+        if order is not None:
+            keys.insert(0, pd.factorize(events[order], sort=True)[0])
+        sort_index = None
+        if not _is_sorted(keys):
+            sort_index = np.lexsort(keys)
+
+        # Smallest integer types keep 100M-event tables to a few bytes per event
+        self.order = sort_index
+        self.session = _compact(_take(session_codes, sort_index))
+        self.page = _compact(_take(page_codes, sort_index))
+        self.pages = list(pages)
+        self.n_sessions = int(self.session[-1]) + 1 if len(self.session) else 0
+
+        # Position of every event within its session
+        is_start = np.ones(len(self.session), dtype=bool)
+        is_start[1:] = self.session[1:] != self.session[:-1]
+        self.starts = np.flatnonzero(is_start)
+        self.lengths = np.diff(np.append(self.starts, len(self.session)))
+        self.step = _compact(np.arange(len(self.session)) - np.repeat(self.starts, self.lengths))
+
+    def label(self, codes):
+        return [self.pages[code] for code in codes]
+
+    def ordered(self, values):
+        """An event-level array in session order"""
+        values = np.asarray(values)
+        return values if self.order is None else values[self.order]
+
+def _is_sorted(keys):
+    """True when rows are already ordered by keys (last key is the primary one)"""
+    if len(keys[0]) < 2:
+        return True
+    primary = keys[-1]
+    if np.any(primary[1:] < primary[:-1]):
+        return False
+    if len(keys) == 1:
+        return True
+    same = primary[1:] == primary[:-1]
+    return not np.any(same & (keys[0][1:] < keys[0][:-1]))
+
+def _compact(codes):
+    return codes.astype(np.min_scalar_type(codes.max() if len(codes) else 0))
+
+def _take(values, index):
+    return values if index is None else values[index]
+
+def first_k_paths(sessions, k=3, separator=' → '):
+    """Sessions per distinct first-k-page path, most frequent first
+
+    Each path is packed into one integer (base = number of pages + 1, digit
+    0 for "no page"), so shorter sessions stay distinct from longer ones.
+    Ties keep the order in which paths first appear.
+    """
+    base = len(sessions.pages) + 1
+    if base ** k >= 2 ** 63:
+        raise ValueError(f"path length {k} is too long to pack {base - 1} pages into 64 bits")
+
+    # A session has at most one event per step, so each pass is a plain scatter
+    codes = np.zeros(sessions.n_sessions, dtype=np.int64)
+    for position in range(k):
+        at_step = sessions.step == position
+        codes[sessions.session[at_step]] += (sessions.page[at_step].astype(np.int64) + 1) * base ** (k - 1 - position)
+
+    counts = pd.Series(codes).value_counts()
+    paths = []
+    for code in counts.index:
+        digits = []
+        for position in range(k):
+            digit = code // base ** (k - 1 - position) % base
+            if digit:
+                digits.append(sessions.pages[digit - 1])
+        paths.append(separator.join(digits))
+    return pd.DataFrame({'Path': paths, 'Frequency': counts.to_numpy()})
+
+def ngram_counts(sessions, n=2, separator=' → '):
+    """Occurrences of every n consecutive pages inside a session"""
+    if len(sessions.session) < n:
+        return pd.DataFrame({'Path': [], 'Frequency': []})
+    base = len(sessions.pages)
+    span = len(sessions.session) - n + 1
+
+    # A window is valid when it starts and ends in the same session
+    valid = sessions.session[:span] == sessions.session[n - 1:]
+    codes = np.zeros(span, dtype=np.int64)
+    for offset in range(n):
+        codes = codes * base + sessions.page[offset:offset + span]
+    counts = pd.Series(codes[valid]).value_counts()
+
+    paths = []
+    for code in counts.index:
+        digits = [code // base ** (n - 1 - position) % base for position in range(n)]
+        paths.append(separator.join(sessions.label(digits)))
+    return pd.DataFrame({'Path': paths, 'Frequency': counts.to_numpy()})
+
+def transition_matrix(sessions, normalize=True):
+    """Page-to-page Markov transitions, including session Start and Exit states
+
+    Rows are the current state (Start + pages), columns the next state
+    (pages + Exit). With normalize=True each row holds probabilities.
+    """
+    n_pages = len(sessions.pages)
+    is_last = np.ones(len(sessions.session), dtype=bool)
+    is_last[:-1] = sessions.session[:-1] != sessions.session[1:]
+
+    # State codes: Start = 0, pages = 1..P as source; pages = 0..P-1, Exit = P as target
+    source = sessions.page.astype(np.int64) + 1
+    target = np.empty(len(source), dtype=np.int64)
+    target[:-1] = sessions.page[1:]
+    target[is_last] = n_pages
+
+    entries = sessions.step == 0
+    counts = np.bincount(sessions.page[entries], minlength=n_pages)
+    matrix = np.zeros((n_pages + 1, n_pages + 1), dtype=np.int64)
+    matrix[0, :n_pages] = counts
+    matrix[1:] = np.bincount(source * (n_pages + 1) + target,
+                             minlength=(n_pages + 1) ** 2)[n_pages + 1:].reshape(n_pages, n_pages + 1)
+
+    df = pd.DataFrame(matrix, index=[START] + sessions.pages, columns=sessions.pages + [EXIT])
+    if normalize:
+        df = df.div(df.sum(axis=1).replace(0, 1), axis=0)
+    df.index.name = 'FromPage'
+    return df
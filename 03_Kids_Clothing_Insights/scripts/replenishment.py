@@ -0,0 +1,205 @@
+"""
+Indexed replenishment engine for inventory analysis
+Keeps stock, lead times and trailing sales per SKU x warehouse row in flat
+arrays indexed by product position, so sales velocity, turnover, days of
+inventory, safety stock and reorder points are computed vectorized, and a
+new batch of sales only re-evaluates the products it touches.
+"""
+
+import os
+import json
+
+import numpy as np
+import pandas as pd
+
+STATE_FILE = 'replenishment_state.pkl'
+META_FILE = 'replenishment_state.json'
+
+# Trailing windows (days before the latest sale, inclusive)
+TURNOVER_DAYS = 365
+VELOCITY_DAYS = 730
+
+# Safety stock = Z x daily demand std x sqrt(lead time); 1.65 ~ 95% service level
+SERVICE_LEVEL_Z = 1.65
+# A reorder tops stock up to the reorder point plus this many days of demand
+ORDER_COVER_DAYS = 30
+
+# (lowest turnover ratio, label), checked in order
+TURNOVER_CATEGORIES = [(5, 'Fast Moving'), (2, 'Regular'), (0.5, 'Slow Moving')]
+TURNOVER_DEFAULT = 'Very Slow/Dead Stock'
+# (highest days of inventory, label), checked in order
+DOI_CATEGORIES = [(30, 'Under 30 days'), (60, '30-60 days'), (90, '60-90 days'), (180, '90-180 days')]
+DOI_DEFAULT = 'Over 180 days'
+NO_SALES_DOI = 999
+
+class ReplenishmentEngine:
+    """Replenishment metrics for every inventory row, in inventory order
+
+    Usage:
+        engine = ReplenishmentEngine(df_inventory)
+        engine.update(df_transactions)        # full history: every product touched
+        plan = engine.table()
+        engine.save(state_dir)
+        ...
+        engine = ReplenishmentEngine.load(state_dir)
+        touched = engine.update(new_sales)    # only these products are re-evaluated
+    """
+
+    def __init__(self, inventory, product_col='ProductID', warehouse_col='WarehouseID',
+                 stock_col='StockLevel', lead_time_col='LeadTime'):
+        self.columns = {'product': product_col, 'warehouse': warehouse_col,
+                        'stock': stock_col, 'lead_time': lead_time_col}
+        self.ingested = []
+
+        # Product-indexed store: every inventory row points at its product's position
+        self.row_product, products = pd.factorize(inventory[product_col], sort=True)
+        self.products = pd.Index(products, name=product_col)
+        self.warehouses = inventory[warehouse_col].to_numpy()
+        self.stock = inventory[stock_col].to_numpy()
+        self.lead_time = inventory[lead_time_col].to_numpy()
+
+        # Trailing demand per product, and the (product, day, units) log behind it
+        self.end = None
+        self.sales = pd.DataFrame({'product': np.array([], dtype=np.int64),
+                                   'day': np.array([], dtype=np.int64),
+                                   'units': np.array([], dtype=np.int64)})
+        n_products = len(self.products)
+        self.units_turnover = np.zeros(n_products, dtype=np.int64)
+        self.units_velocity = np.zeros(n_products, dtype=np.int64)
+        self.units_squared = np.zeros(n_products, dtype=np.int64)
+
+        n_rows = len(self.row_product)
+        self.metrics = {
+            'DailySalesRate': np.zeros(n_rows),
+            'UnitsSold_12M': np.zeros(n_rows, dtype=np.int64),
+            'TurnoverRatio': np.zeros(n_rows),
+            'TurnoverCategory': np.full(n_rows, len(TURNOVER_CATEGORIES)),
+            'DaysOfInventory': np.full(n_rows, float(NO_SALES_DOI)),
+            'DOI_Category': np.full(n_rows, len(DOI_CATEGORIES)),
+            'SafetyStock': np.zeros(n_rows),
+            'ReorderPoint': np.zeros(n_rows, dtype=np.int64),
+            'OrderQuantity': np.zeros(n_rows, dtype=np.int64)
+        }
+        self._evaluate(np.ones(n_rows, dtype=bool))
+
+    def update(self, sales, date_col='Date', quantity_col='Quantity'):
+        """Fold a batch of sales into the trailing windows; returns the products re-evaluated
+
+        Besides the products sold in the batch, products whose older sales
+        drop out of a window because the latest sale date moved are touched.
+        """
+        days = sales[date_col].to_numpy().astype('datetime64[D]').astype(np.int64)
+        if len(days) == 0:
+            return self.products[:0]
+        end = days.max() if self.end is None else max(self.end, days.max())
+
+        # Sales of products without an inventory row never reach the metrics
+        codes = self.products.get_indexer(sales[self.columns['product']])
+        known = codes >= 0
+        batch = pd.DataFrame({'product': codes[known], 'day': days[known],
+                              'units': sales[quantity_col].to_numpy()[known]})
+        batch = batch.groupby(['product', 'day'], as_index=False)['units'].sum()
+
+        touched = np.zeros(len(self.products), dtype=bool)
+        touched[batch['product'].to_numpy()] = True
+        if self.end is not None and end > self.end:
+            log_day = self.sales['day'].to_numpy()
+            for window in (TURNOVER_DAYS, VELOCITY_DAYS):
+                expired = (log_day >= self.end - window) & (log_day < end - window)
+                touched[self.sales['product'].to_numpy()[expired]] = True
+
+        self.end = int(end)
+        self.sales = pd.concat([self.sales[self.sales['day'] >= self.end - VELOCITY_DAYS], batch],
+                               ignore_index=True)
+        self._aggregate(touched)
+        self._evaluate(touched[self.row_product])
+        return self.products[touched]
+
+    def _aggregate(self, touched):
+        """Recompute the trailing-window sums of the touched products from the log"""
+        log = self.sales[touched[self.sales['product'].to_numpy()]]
+        # A product-day may arrive in several batches; demand variance needs daily totals
+        daily = log.groupby(['product', 'day'], as_index=False)['units'].sum()
+        product = daily['product'].to_numpy()
+        day = daily['day'].to_numpy()
+        units = daily['units'].to_numpy()
+
+        n_products = len(self.products)
+        in_turnover = day >= self.end - TURNOVER_DAYS
+        in_velocity = day >= self.end - VELOCITY_DAYS
+        sums = {
+            'units_turnover': np.bincount(product[in_turnover], units[in_turnover], n_products),
+            'units_velocity': np.bincount(product[in_velocity], units[in_velocity], n_products),
+            'units_squared': np.bincount(product[in_velocity], units[in_velocity] ** 2, n_products)
+        }
+        for name, values in sums.items():
+            getattr(self, name)[touched] = values[touched].round().astype(np.int64)
+
+    def _evaluate(self, rows):
+        """Vectorized metrics for the selected inventory rows"""
+        product = self.row_product[rows]
+        stock = self.stock[rows]
+        lead_time = self.lead_time[rows]
+        units_turnover = self.units_turnover[product]
+        rate = self.units_velocity[product] / VELOCITY_DAYS
+
+        turnover = np.divide(units_turnover, stock, out=np.zeros(len(stock)), where=stock > 0).round(2)
+        doi = np.divide(stock, rate, out=np.full(len(stock), float(NO_SALES_DOI)), where=rate > 0).round(0)
+
+        # Daily demand std over the velocity window, days without sales counting as zero
+        variance = self.units_squared[product] / VELOCITY_DAYS - rate ** 2
+        safety_stock = SERVICE_LEVEL_Z * np.sqrt(variance.clip(min=0)) * np.sqrt(lead_time)
+        reorder_point = np.ceil(rate * lead_time + safety_stock)
+        order_quantity = np.where(stock <= reorder_point,
+                                  np.ceil(reorder_point + rate * ORDER_COVER_DAYS) - stock, 0)
+
+        self.metrics['DailySalesRate'][rows] = rate
+        self.metrics['UnitsSold_12M'][rows] = units_turnover
+        self.metrics['TurnoverRatio'][rows] = turnover
+        self.metrics['TurnoverCategory'][rows] = np.select(
+            [turnover >= low for low, _ in TURNOVER_CATEGORIES], range(len(TURNOVER_CATEGORIES)),
+            len(TURNOVER_CATEGORIES))
+        self.metrics['DaysOfInventory'][rows] = doi
+        self.metrics['DOI_Category'][rows] = np.select(
+            [doi <= high for high, _ in DOI_CATEGORIES], range(len(DOI_CATEGORIES)), len(DOI_CATEGORIES))
+        self.metrics['SafetyStock'][rows] = safety_stock.round(2)
+        self.metrics['ReorderPoint'][rows] = reorder_point
+        self.metrics['OrderQuantity'][rows] = order_quantity
+
+    def table(self):
+        """One row per inventory row with stock, demand and replenishment metrics"""
+        columns = self.columns
+        plan = pd.DataFrame({
+            columns['product']: self.products[self.row_product],
+            columns['warehouse']: self.warehouses,
+            columns['stock']: self.stock,
+            columns['lead_time']: self.lead_time
+        })
+        for name, values in self.metrics.items():
+            plan[name] = values
+        turnover_labels = np.array([label for _, label in TURNOVER_CATEGORIES] + [TURNOVER_DEFAULT], dtype=object)
+        doi_labels = np.array([label for _, label in DOI_CATEGORIES] + [DOI_DEFAULT], dtype=object)
+        plan['TurnoverCategory'] = turnover_labels[plan['TurnoverCategory'].to_numpy()]
+        plan['DOI_Category'] = doi_labels[plan['DOI_Category'].to_numpy()]
+        plan['NeedsReorder'] = plan['OrderQuantity'] > 0
+        return plan
+
+    def save(self, state_dir):
+        os.makedirs(state_dir, exist_ok=True)
+        pd.to_pickle(self, os.path.join(state_dir, STATE_FILE))
+        meta = {
+            'columns': self.columns,
+            'rows': len(self.row_product),
+            'products': len(self.products),
+            'last_sale': None if self.end is None else str(np.datetime64(self.end, 'D')),
+            'ingested': self.ingested
+        }
+        with open(os.path.join(state_dir, META_FILE), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+
+    @classmethod
+    def load(cls, state_dir):
+        return pd.read_pickle(os.path.join(state_dir, STATE_FILE))
+
+def state_exists(state_dir):
+    return os.path.exists(os.path.join(state_dir, META_FILE))
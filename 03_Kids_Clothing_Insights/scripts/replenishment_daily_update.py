@@ -0,0 +1,78 @@
+"""
+Daily Replenishment Update - Kids Clothing
+Folds new transaction files from data/incoming/ into the replenishment state
+saved by 04_inventory_management.py and re-evaluates velocity, days of
+inventory and reorder points for the products they touch only. Rerunning
+script 04 rebuilds the state from data/raw/ and clears the list of ingested
+files.
+"""
+
+import os
+import glob
+from datetime import datetime
+
+import pandas as pd
+
+from replenishment import ReplenishmentEngine, state_exists
+
+# New exports (same columns as sales_transactions.csv) are dropped here
+INCOMING_DIR = 'data/incoming'
+STATE_DIR = 'data/replenishment_state'
+OUTPUT_FILE = 'data/processed/replenishment_plan_daily.csv'
+
+print("🔁 Starting Daily Replenishment Update...")
+print("=" * 60)
+
+if not state_exists(STATE_DIR):
+    print(f"\n⚠️ No replenishment state in {STATE_DIR}/ - run 04_inventory_management.py first")
+    exit(1)
+
+engine = ReplenishmentEngine.load(STATE_DIR)
+print(f"\n✓ Loaded replenishment state for {len(engine.row_product):,} SKU-warehouse rows")
+
+# ============================================================================
+# 1. INGEST NEW SALES
+# ============================================================================
+print("\n📥 Ingesting new transaction files...")
+
+ingested = {entry['file'] for entry in engine.ingested}
+new_files = [path for path in sorted(glob.glob(os.path.join(INCOMING_DIR, '*.csv')))
+             if os.path.basename(path) not in ingested]
+
+changed = pd.Index([])
+for path in new_files:
+    df = pd.read_csv(path, usecols=[engine.columns['product'], 'Date', 'Quantity'], parse_dates=['Date'])
+    changed = changed.union(engine.update(df))
+    engine.ingested.append({
+        'file': os.path.basename(path),
+        'rows': len(df),
+        'ingested_at': datetime.now().isoformat(timespec='seconds')
+    })
+    print(f"✓ {os.path.basename(path)}: {len(df):,} transactions")
+
+if not new_files:
+    print(f"✓ No new files in {INCOMING_DIR}/")
+print(f"✓ {len(changed):,} products re-evaluated")
+
+# ============================================================================
+# 2. REORDER POINTS
+# ============================================================================
+print("\n🚚 Updating reorder points...")
+
+plan = engine.table()
+plan['Updated'] = plan[engine.columns['product']].isin(changed)
+
+engine.save(STATE_DIR)
+os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
+plan.to_csv(OUTPUT_FILE, index=False)
+
+reorder_due = plan[plan['NeedsReorder']]
+print(f"\n📊 Replenishment Status:")
+print(f"  Items at or below Reorder Point: {len(reorder_due):,} ({len(reorder_due) / len(plan) * 100:.1f}%)")
+print(f"  Units to Order: {reorder_due['OrderQuantity'].sum():,}")
+print(f"  Newly Updated Items Needing Reorder: {reorder_due['Updated'].sum():,}")
+
+print(f"\n✓ Saved {OUTPUT_FILE}")
+print("\n" + "=" * 60)
+print("✅ Daily Replenishment Update Complete!")
+print("=" * 60)
@@ -0,0 +1,81 @@
+"""
+Daily RFM Update - Kids Clothing
+Folds new transaction files from data/incoming/ into the RFM state saved by
+03_customer_segmentation.py, then rescores and resegments every customer
+without regrouping the full transaction history. Rerunning script 03
+rebuilds the state from data/raw/ and clears the list of ingested files.
+"""
+
+import os
+import glob
+from datetime import datetime
+
+import pandas as pd
+
+from rfm_state import RFMState, state_exists
+
+# New exports (same columns as sales_transactions.csv) are dropped here
+INCOMING_DIR = 'data/incoming'
+STATE_DIR = 'data/rfm_state'
+OUTPUT_FILE = 'data/processed/customer_rfm_daily.csv'
+
+# Script 03 scores recency against the end of the generated period
+ANALYSIS_DATE = datetime(2024, 12, 31)
+
+print("🔁 Starting Daily RFM Update...")
+print("=" * 60)
+
+if not state_exists(STATE_DIR):
+    print(f"\n⚠️ No RFM state in {STATE_DIR}/ - run 03_customer_segmentation.py first")
+    exit(1)
+
+state = RFMState.load(STATE_DIR)
+print(f"\n✓ Loaded RFM state for {len(state.customers):,} customers")
+
+# ============================================================================
+# 1. INGEST NEW TRANSACTIONS
+# ============================================================================
+print("\n📥 Ingesting new transaction files...")
+
+ingested = {entry['file'] for entry in state.ingested}
+new_files = [path for path in sorted(glob.glob(os.path.join(INCOMING_DIR, '*.csv')))
+             if os.path.basename(path) not in ingested]
+
+columns = state.columns
+changed = pd.Index([])
+for path in new_files:
+    df = pd.read_csv(path, usecols=list(columns.values()), parse_dates=[columns['date']])
+    df = df[~df[columns['customer']].str.startswith('GUEST')]
+    changed = changed.union(state.update(df))
+    state.ingested.append({
+        'file': os.path.basename(path),
+        'rows': len(df),
+        'ingested_at': datetime.now().isoformat(timespec='seconds')
+    })
+    print(f"✓ {os.path.basename(path)}: {len(df):,} registered-customer transactions")
+
+if not new_files:
+    print(f"✓ No new files in {INCOMING_DIR}/")
+print(f"✓ {len(changed):,} customers updated")
+
+# ============================================================================
+# 2. RESCORE CUSTOMERS
+# ============================================================================
+print("\n🎯 Rescoring customers...")
+
+analysis_date = max(ANALYSIS_DATE, state.last_date)
+rfm = state.score(analysis_date)
+rfm['Updated'] = rfm[columns['customer']].isin(changed)
+
+state.save(STATE_DIR)
+os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
+rfm.to_csv(OUTPUT_FILE, index=False)
+
+print(f"\n📊 Customer Segments (as of {analysis_date:%Y-%m-%d}):")
+for segment, count in rfm['Segment'].value_counts().items():
+    print(f"  {segment}: {count:,} customers ({count / len(rfm) * 100:.1f}%)")
+
+print(f"\n✓ Saved {OUTPUT_FILE}")
+print("\n" + "=" * 60)
+print("✅ Daily RFM Update Complete!")
+print("=" * 60)
@@ -14,16 +14,25 @@ import numpy as np
 from datetime import datetime, timedelta
 import random
 
+from samplers import AliasSampler, compile_pools
+
 # Set random seed for reproducibility
 np.random.seed(42)
 random.seed(42)
+rng = np.random.default_rng(42)
 
 print("=" * 70)
 print("MEN'S CLOTHING RETAIL DATA GENERATOR")
 print("=" * 70)
 
 # Configuration
-NUM_TRANSACTIONS = 100000  # 100K transactions
+# Generation engine: 'vectorized' draws transactions in batches of whole
+# NumPy columns from samplers built once, 'loop' builds one dict per
+# transaction (original row-by-row generator)
+GENERATION_ENGINE = 'vectorized'
+TRANSACTION_BATCH_SIZE = 1000000
+
+NUM_TRANSACTIONS = 100000  # 100K transactions (20M+ for load testing with the vectorized engine)
 NUM_CUSTOMERS = 12000  # 12K unique customers
 NUM_PRODUCTS = 500  # 500 unique products
 START_DATE = datetime(2023, 1, 1)
@@ -77,6 +86,19 @@ STORES = [
 # Sales Channels
 CHANNELS = ['In-Store', 'Online', 'Mobile App']
 
+# Customer segments and their population shares
+SEGMENTS = ['Premium', 'Value-Conscious', 'Trendy', 'Casual Shopper', 'Fitness Enthusiast']
+SEGMENT_SHARES = [0.15, 0.25, 0.20, 0.25, 0.15]
+
+# Products each segment shops from: {product column: allowed values}, all
+# conditions must hold; segments not listed shop the whole catalog
+SEGMENT_PRODUCT_POOLS = {
+    'Premium': {'BrandTier': ['Premium']},
+    'Value-Conscious': {'BrandTier': ['Budget']},
+    'Fitness Enthusiast': {'Category': ['Sports & Activewear']},
+    'Trendy': {'Category': ['Casual Wear', 'Accessories']}
+}
+
 print("\n📊 Generating Product Catalog...")
 
 # Generate Product Catalog
@@ -134,10 +156,7 @@ print("\n👥 Generating Customer Base...")
 customers = []
 for i in range(1, NUM_CUSTOMERS + 1):
     # Customer segments
-    segment = np.random.choice(
-        ['Premium', 'Value-Conscious', 'Trendy', 'Casual Shopper', 'Fitness Enthusiast'],
-        p=[0.15, 0.25, 0.20, 0.25, 0.15]
-    )
+    segment = np.random.choice(SEGMENTS, p=SEGMENT_SHARES)
     
     # Age groups
     age = int(np.random.normal(35, 12))
@@ -164,97 +183,193 @@ for i in range(1, NUM_CUSTOMERS + 1):
 customers_df = pd.DataFrame(customers)
 print(f"✅ Generated {len(customers_df)} customers across 5 segments")
 
-print("\n🛍️ Generating Transactions...")
+print(f"\n🛍️ Generating Transactions... ({GENERATION_ENGINE} engine)")
 
-# Generate Transactions
-transactions = []
+# Customer weights (repeat customers more likely), computed once for every draw
+customer_weights = (customers_df.groupby('CustomerID').cumcount() + 1).to_numpy()
 
-for i in range(1, NUM_TRANSACTIONS + 1):
-    # Select random date with seasonal bias
-    day_offset = random.randint(0, (END_DATE - START_DATE).days)
-    trans_date = START_DATE + timedelta(days=day_offset)
-    month = trans_date.month
-    
-    # Seasonal adjustments
-    season_boost = 1.0
-    if month in [10, 11, 12]:  # Festive season
-        season_boost = 1.5
-    elif month in [1, 7]:  # Sale months
-        season_boost = 1.3
-    
-    # Customer selection (repeat customers more likely)
-    if random.random() < 0.6:  # 60% repeat customers
-        customer = customers_df.sample(1, weights=customers_df.groupby('CustomerID').cumcount() + 1).iloc[0]
-    else:
-        customer = customers_df.sample(1).iloc[0]
+# Segment product pools as row indexes: segment i shops
+# products_df.iloc[pool_rows[pool_start[i]:pool_start[i] + pool_size[i]]]
+pool_rows, pool_start, pool_size = compile_pools(products_df, SEGMENT_PRODUCT_POOLS, SEGMENTS)
+
+# ============================================================================
+# VECTORIZED ENGINE: SAMPLERS BUILT ONCE
+# ============================================================================
+
+# Every calendar day with its month, year and quarter, gathered by day index
+calendar = pd.date_range(START_DATE, END_DATE, freq='D')
+day_labels = calendar.strftime('%Y-%m-%d')
+day_month = calendar.month.to_numpy()
+day_year = calendar.year.to_numpy()
+day_quarter = (day_month - 1) // 3
+
+# Discount range (%) by month: sale months, festive offers, regular months
+month_discount_low = np.zeros(13)
+month_discount_high = np.full(13, 15.0)
+month_discount_low[[1, 7]], month_discount_high[[1, 7]] = 20, 50
+month_discount_low[[11, 12]], month_discount_high[[11, 12]] = 10, 30
+
+customer_segment = pd.Categorical(customers_df['Segment'], categories=SEGMENTS).codes
+repeat_customer_sampler = AliasSampler(customer_weights)
+
+# Product columns as arrays: prices and attribute codes gathered by product row,
+# so batches hold codes rather than millions of strings
+product_prices = products_df['Price'].to_numpy()
+product_attributes = {
+    column: pd.Categorical(products_df[column])
+    for column in ['Category', 'SubCategory', 'Brand', 'BrandTier', 'Size']
+}
+
+payment_methods = ['Credit Card', 'Debit Card', 'UPI', 'Cash', 'Wallet']
+
+def generate_transaction_batch(size, first_id):
+    """Draw `size` transactions as whole columns, numbered from first_id"""
+    day_idx = rng.integers(0, len(calendar), size=size)
+    month = day_month[day_idx]
     
-    # Product selection based on customer segment
-    if customer['Segment'] == 'Premium':
-        product = products_df[products_df['BrandTier'] == 'Premium'].sample(1).iloc[0]
-    elif customer['Segment'] == 'Value-Conscious':
-        product = products_df[products_df['BrandTier'] == 'Budget'].sample(1).iloc[0]
-    elif customer['Segment'] == 'Fitness Enthusiast':
-        product = products_df[products_df['Category'] == 'Sports & Activewear'].sample(1).iloc[0]
-    elif customer['Segment'] == 'Trendy':
-        product = products_df[products_df['Category'].isin(['Casual Wear', 'Accessories'])].sample(1).iloc[0]
-    else:
-        product = products_df.sample(1).iloc[0]
+    # Customer: 60% weighted towards repeat customers, 40% uniform
+    repeat = rng.random(size) < 0.6
+    customer_idx = np.where(repeat, repeat_customer_sampler.draw(rng, size),
+                            rng.integers(0, len(customers_df), size=size))
     
-    # Quantity (mostly 1, sometimes 2-3)
-    quantity = np.random.choice([1, 2, 3], p=[0.7, 0.25, 0.05])
+    # Product: a uniform offset into the customer's segment pool
+    segment = customer_segment[customer_idx]
+    product_idx = pool_rows[pool_start[segment] + rng.integers(0, pool_size[segment])]
     
-    # Discount
-    if month in [1, 7]:  # Sale months
-        discount_pct = np.random.uniform(20, 50)
-    elif month in [11, 12]:  # Festive offers
-        discount_pct = np.random.uniform(10, 30)
-    else:
-        discount_pct = np.random.uniform(0, 15)
+    quantity = rng.choice([1, 2, 3], size=size, p=[0.7, 0.25, 0.05])
+    discount_pct = rng.uniform(month_discount_low[month], month_discount_high[month])
     
     # Price calculations
-    unit_price = product['Price']
+    unit_price = product_prices[product_idx]
     discount_amount = unit_price * (discount_pct / 100)
     final_price = unit_price - discount_amount
     total_amount = final_price * quantity
     
-    # Store and Channel
-    store = random.choice(STORES)
-    channel = random.choice(CHANNELS)
+    store_idx = rng.integers(0, len(STORES), size=size)
+    channel_idx = rng.integers(0, len(CHANNELS), size=size)
+    payment_idx = rng.choice(len(payment_methods), size=size, p=[0.30, 0.25, 0.25, 0.10, 0.10])
+    
+    # Category, brand, size, ... of each drawn product, gathered as codes
+    attributes = {column: pd.Categorical.from_codes(values.codes[product_idx], values.categories)
+                  for column, values in product_attributes.items()}
     
-    # Payment method
-    payment = np.random.choice(
-        ['Credit Card', 'Debit Card', 'UPI', 'Cash', 'Wallet'],
-        p=[0.30, 0.25, 0.25, 0.10, 0.10]
-    )
+    transaction_ids = np.char.add('T', np.char.zfill(np.arange(first_id, first_id + size).astype(str), 7))
     
-    transactions.append({
-        'TransactionID': f'T{i:07d}',
-        'Date': trans_date.strftime('%Y-%m-%d'),
-        'CustomerID': customer['CustomerID'],
-        'ProductID': product['ProductID'],
-        'Category': product['Category'],
-        'SubCategory': product['SubCategory'],
-        'Brand': product['Brand'],
-        'BrandTier': product['BrandTier'],
-        'Size': product['Size'],
+    return pd.DataFrame({
+        'TransactionID': transaction_ids,
+        'Date': pd.Categorical.from_codes(day_idx, day_labels, ordered=True),
+        'CustomerID': pd.Categorical.from_codes(customer_idx, customers_df['CustomerID']),
+        'ProductID': pd.Categorical.from_codes(product_idx, products_df['ProductID']),
+        **attributes,
         'Quantity': quantity,
-        'UnitPrice': round(unit_price, 2),
-        'DiscountPercent': round(discount_pct, 2),
-        'DiscountAmount': round(discount_amount, 2),
-        'FinalPrice': round(final_price, 2),
-        'TotalAmount': round(total_amount, 2),
-        'Store': store,
-        'Channel': channel,
-        'PaymentMethod': payment,
-        'Month': trans_date.month,
-        'Year': trans_date.year,
-        'Quarter': f'Q{(trans_date.month-1)//3 + 1}'
+        'UnitPrice': np.round(unit_price, 2),
+        'DiscountPercent': np.round(discount_pct, 2),
+        'DiscountAmount': np.round(discount_amount, 2),
+        'FinalPrice': np.round(final_price, 2),
+        'TotalAmount': np.round(total_amount, 2),
+        'Store': pd.Categorical.from_codes(store_idx, STORES),
+        'Channel': pd.Categorical.from_codes(channel_idx, CHANNELS),
+        'PaymentMethod': pd.Categorical.from_codes(payment_idx, payment_methods),
+        'Month': month,
+        'Year': day_year[day_idx],
+        'Quarter': pd.Categorical.from_codes(day_quarter[day_idx], ['Q1', 'Q2', 'Q3', 'Q4'])
     })
+
+if GENERATION_ENGINE == 'vectorized':
+    transaction_batches = []
+    generated = 0
+    while generated < NUM_TRANSACTIONS:
+        size = min(TRANSACTION_BATCH_SIZE, NUM_TRANSACTIONS - generated)
+        transaction_batches.append(generate_transaction_batch(size, generated + 1))
+        generated += size
+        print(f"   Generated {generated:,} transactions...")
     
-    if i % 10000 == 0:
-        print(f"   Generated {i:,} transactions...")
+    # Categories are fixed per column, so the batches concatenate as categoricals
+    transactions_df = pd.concat(transaction_batches, ignore_index=True)
+    del transaction_batches
+else:
+    # Generate Transactions
+    transactions = []
+    
+    for i in range(1, NUM_TRANSACTIONS + 1):
+        # Select random date with seasonal bias
+        day_offset = random.randint(0, (END_DATE - START_DATE).days)
+        trans_date = START_DATE + timedelta(days=day_offset)
+        month = trans_date.month
+        
+        # Seasonal adjustments
+        season_boost = 1.0
+        if month in [10, 11, 12]:  # Festive season
+            season_boost = 1.5
+        elif month in [1, 7]:  # Sale months
+            season_boost = 1.3
+        
+        # Customer selection (repeat customers more likely)
+        if random.random() < 0.6:  # 60% repeat customers
+            customer = customers_df.sample(1, weights=customer_weights).iloc[0]
+        else:
+            customer = customers_df.sample(1).iloc[0]
+        
+        # Product selection based on customer segment
+        segment = SEGMENTS.index(customer['Segment'])
+        pool = pool_rows[pool_start[segment]:pool_start[segment] + pool_size[segment]]
+        product = products_df.take(pool).sample(1).iloc[0]
+        
+        # Quantity (mostly 1, sometimes 2-3)
+        quantity = np.random.choice([1, 2, 3], p=[0.7, 0.25, 0.05])
+        
+        # Discount
+        if month in [1, 7]:  # Sale months
+            discount_pct = np.random.uniform(20, 50)
+        elif month in [11, 12]:  # Festive offers
+            discount_pct = np.random.uniform(10, 30)
+        else:
+            discount_pct = np.random.uniform(0, 15)
+        
+        # Price calculations
+        unit_price = product['Price']
+        discount_amount = unit_price * (discount_pct / 100)
+        final_price = unit_price - discount_amount
+        total_amount = final_price * quantity
+        
+        # Store and Channel
+        store = random.choice(STORES)
+        channel = random.choice(CHANNELS)
+        
+        # Payment method
+        payment = np.random.choice(
+            ['Credit Card', 'Debit Card', 'UPI', 'Cash', 'Wallet'],
+            p=[0.30, 0.25, 0.25, 0.10, 0.10]
+        )
+        
+        transactions.append({
+            'TransactionID': f'T{i:07d}',
+            'Date': trans_date.strftime('%Y-%m-%d'),
+            'CustomerID': customer['CustomerID'],
+            'ProductID': product['ProductID'],
+            'Category': product['Category'],
+            'SubCategory': product['SubCategory'],
+            'Brand': product['Brand'],
+            'BrandTier': product['BrandTier'],
+            'Size': product['Size'],
+            'Quantity': quantity,
+            'UnitPrice': round(unit_price, 2),
+            'DiscountPercent': round(discount_pct, 2),
+            'DiscountAmount': round(discount_amount, 2),
+            'FinalPrice': round(final_price, 2),
+            'TotalAmount': round(total_amount, 2),
+            'Store': store,
+            'Channel': channel,
+            'PaymentMethod': payment,
+            'Month': trans_date.month,
+            'Year': trans_date.year,
+            'Quarter': f'Q{(trans_date.month-1)//3 + 1}'
+        })
+        
+        if i % 10000 == 0:
+            print(f"   Generated {i:,} transactions...")
 
-transactions_df = pd.DataFrame(transactions)
+    transactions_df = pd.DataFrame(transactions)
 print(f"✅ Generated {len(transactions_df):,} transactions")
 
 # Save datasets
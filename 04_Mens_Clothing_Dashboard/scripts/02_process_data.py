@@ -14,6 +14,74 @@ import numpy as np
 from datetime import datetime, timedelta
 import os
 
+from aggregation_plan import AggregationPlan, write_tables
+from rfm_rules import compile_rules, assign_segments
+from rfm_state import RFMState
+
+# Per-customer RFM state picked up by rfm_daily_update.py
+RFM_STATE_DIR = '../data/rfm_state'
+
+# Threads writing the processed CSVs (1 = one after another)
+WRITE_WORKERS = 4
+
+# Aggregated tables: name -> (group keys, {column: (source column, aggregation)}).
+# Tables with the same keys share one groupby; 'Month' is the transaction's
+# year-month period
+OUTPUT_TABLES = {
+    'rfm': (['CustomerID'], {
+        'LastPurchase': ('Date', 'max'),
+        'Frequency': ('TransactionID', 'count'),
+        'Monetary': ('TotalAmount', 'sum')
+    }),
+    'customer_lifetime_value': (['CustomerID'], {
+        'TotalRevenue': ('TotalAmount', 'sum'),
+        'TotalPurchases': ('TransactionID', 'count'),
+        'FirstPurchase': ('Date', 'min'),
+        'LastPurchase': ('Date', 'max')
+    }),
+    'monthly_sales_by_category': (['Month', 'Category'], {
+        'Revenue': ('TotalAmount', 'sum'),
+        'Transactions': ('TransactionID', 'count'),
+        'Customers': ('CustomerID', 'nunique'),
+        'Units': ('Quantity', 'sum')
+    }),
+    'monthly_totals': (['Month'], {
+        'Revenue': ('TotalAmount', 'sum'),
+        'Transactions': ('TransactionID', 'count'),
+        'Customers': ('CustomerID', 'nunique'),
+        'Units': ('Quantity', 'sum'),
+        'Margin': ('MarginAmount', 'sum')
+    }),
+    'category_performance': (['Category'], {
+        'Revenue': ('TotalAmount', 'sum'),
+        'Transactions': ('TransactionID', 'count'),
+        'Customers': ('CustomerID', 'nunique'),
+        'Units': ('Quantity', 'sum'),
+        'Margin': ('MarginAmount', 'sum')
+    }),
+    'brand_performance': (['Brand', 'BrandTier'], {
+        'Revenue': ('TotalAmount', 'sum'),
+        'Transactions': ('TransactionID', 'count'),
+        'Units': ('Quantity', 'sum')
+    }),
+    'store_performance': (['Store'], {
+        'Revenue': ('TotalAmount', 'sum'),
+        'Transactions': ('TransactionID', 'count'),
+        'Customers': ('CustomerID', 'nunique'),
+        'Margin': ('MarginAmount', 'sum')
+    }),
+    'channel_performance': (['Channel'], {
+        'Revenue': ('TotalAmount', 'sum'),
+        'Transactions': ('TransactionID', 'count'),
+        'Customers': ('CustomerID', 'nunique')
+    }),
+    'product_performance': (['ProductID'], {
+        'Revenue': ('TotalAmount', 'sum'),
+        'UnitsSold': ('Quantity', 'sum'),
+        'Transactions': ('TransactionID', 'count')
+    })
+}
+
 print("=" * 70)
 print("MEN'S CLOTHING DATA PROCESSING & ANALYSIS")
 print("=" * 70)
@@ -49,13 +117,21 @@ transactions_df['WeekOfYear'] = transactions_df['Date'].dt.isocalendar().week
 transactions_df['IsWeekend'] = transactions_df['DayOfWeek'].isin(['Saturday', 'Sunday']).astype(int)
 transactions_df['MonthName'] = transactions_df['Date'].dt.strftime('%B')
 
-# Calculate margin amount
-merged_df = transactions_df.merge(products_df[['ProductID', 'Cost']], on='ProductID', how='left')
-transactions_df['CostAmount'] = merged_df['Cost'] * transactions_df['Quantity']
+# Calculate margin amount (unit cost looked up by ProductID, no full-table merge)
+unit_cost = transactions_df['ProductID'].map(products_df.set_index('ProductID')['Cost'])
+transactions_df['CostAmount'] = unit_cost * transactions_df['Quantity']
 transactions_df['MarginAmount'] = transactions_df['TotalAmount'] - transactions_df['CostAmount']
 
 print("✅ Added time-based and financial features")
 
+# Every aggregated table in one planned pass
+print("\n⚙️ Running Aggregation Plan...")
+
+aggregation_plan = AggregationPlan(OUTPUT_TABLES)
+tables = aggregation_plan.run(transactions_df, derived={'Month': transactions_df['Date'].dt.to_period('M')})
+
+print(f"✅ {aggregation_plan.summary()}")
+
 # RFM Analysis
 print("\n📊 Calculating RFM Metrics...")
 
@@ -63,13 +139,9 @@ print("\n📊 Calculating RFM Metrics...")
 analysis_date = transactions_df['Date'].max() + timedelta(days=1)
 
 # Calculate RFM for each customer
-rfm = transactions_df.groupby('CustomerID').agg({
-    'Date': lambda x: (analysis_date - x.max()).days,  # Recency
-    'TransactionID': 'count',  # Frequency
-    'TotalAmount': 'sum'  # Monetary
-}).reset_index()
-
-rfm.columns = ['CustomerID', 'Recency', 'Frequency', 'Monetary']
+rfm_state = RFMState(tables['rfm'].set_index('CustomerID'),
+                     {'customer': 'CustomerID', 'date': 'Date', 'id': 'TransactionID', 'amount': 'TotalAmount'})
+rfm = rfm_state.rfm(analysis_date)
 
 # Add RFM scores (1-5 scale)
 rfm['R_Score'] = pd.qcut(rfm['Recency'], q=5, labels=[5, 4, 3, 2, 1], duplicates='drop')
@@ -80,22 +152,21 @@ rfm['M_Score'] = pd.qcut(rfm['Monetary'], q=5, labels=[1, 2, 3, 4, 5], duplicate
 rfm['RFM_Score'] = rfm['R_Score'].astype(str) + rfm['F_Score'].astype(str) + rfm['M_Score'].astype(str)
 rfm['RFM_Total'] = rfm['R_Score'].astype(int) + rfm['F_Score'].astype(int) + rfm['M_Score'].astype(int)
 
-# Segment customers based on RFM
-def segment_customers(row):
-    if row['RFM_Total'] >= 13:
-        return 'Champions'
-    elif row['RFM_Total'] >= 10:
-        return 'Loyal Customers'
-    elif row['RFM_Total'] >= 7:
-        return 'Potential Loyalists'
-    elif row['RFM_Total'] >= 5 and row['R_Score'] >= 3:
-        return 'Recent Customers'
-    elif row['RFM_Total'] >= 5:
-        return 'At Risk'
-    else:
-        return 'Lost Customers'
-
-rfm['RFM_Segment'] = rfm.apply(segment_customers, axis=1)
+# Segment customers based on RFM (rules checked in order, 'RFM' is the score total)
+SEGMENT_RULES = [
+    ('Champions', {'RFM': (13, 15)}),
+    ('Loyal Customers', {'RFM': (10, 15)}),
+    ('Potential Loyalists', {'RFM': (7, 15)}),
+    ('Recent Customers', {'RFM': (5, 15), 'R': (3, 5)}),
+    ('At Risk', {'RFM': (5, 15)})
+]
+
+segment_lookup = compile_rules(SEGMENT_RULES, default='Lost Customers')
+rfm['RFM_Segment'] = assign_segments(segment_lookup, rfm['R_Score'].astype(int),
+                                     rfm['F_Score'].astype(int), rfm['M_Score'].astype(int))
+
+# Daily updates fold new transactions into this state instead of regrouping everything
+rfm_state.save(RFM_STATE_DIR, segment_lookup)
 
 # Merge RFM back with customer data
 customers_analysis = customers_df.merge(rfm, on='CustomerID', how='left')
@@ -108,31 +179,11 @@ for segment in rfm['RFM_Segment'].value_counts().items():
 # Monthly Aggregations for Time Series
 print("\n📈 Creating Time Series Aggregations...")
 
-monthly_sales = transactions_df.groupby([
-    transactions_df['Date'].dt.to_period('M'),
-    'Category'
-]).agg({
-    'TotalAmount': 'sum',
-    'TransactionID': 'count',
-    'CustomerID': 'nunique',
-    'Quantity': 'sum'
-}).reset_index()
-
-monthly_sales.columns = ['Month', 'Category', 'Revenue', 'Transactions', 'Customers', 'Units']
+monthly_sales = tables['monthly_sales_by_category']
 monthly_sales['Month'] = monthly_sales['Month'].astype(str)
 
 # Overall monthly totals
-monthly_totals = transactions_df.groupby(
-    transactions_df['Date'].dt.to_period('M')
-).agg({
-    'TotalAmount': 'sum',
-    'TransactionID': 'count',
-    'CustomerID': 'nunique',
-    'Quantity': 'sum',
-    'MarginAmount': 'sum'
-}).reset_index()
-
-monthly_totals.columns = ['Month', 'Revenue', 'Transactions', 'Customers', 'Units', 'Margin']
+monthly_totals = tables['monthly_totals']
 monthly_totals['Month'] = monthly_totals['Month'].astype(str)
 monthly_totals['AvgTransactionValue'] = monthly_totals['Revenue'] / monthly_totals['Transactions']
 
@@ -141,15 +192,7 @@ print(f"✅ Created {len(monthly_totals)} months of time series data")
 # Category Performance
 print("\n🏷️ Analyzing Category Performance...")
 
-category_performance = transactions_df.groupby('Category').agg({
-    'TotalAmount': 'sum',
-    'TransactionID': 'count',
-    'CustomerID': 'nunique',
-    'Quantity': 'sum',
-    'MarginAmount': 'sum'
-}).reset_index()
-
-category_performance.columns = ['Category', 'Revenue', 'Transactions', 'Customers', 'Units', 'Margin']
+category_performance = tables['category_performance']
 category_performance['RevenueShare'] = (category_performance['Revenue'] / category_performance['Revenue'].sum() * 100).round(2)
 category_performance['AvgTransactionValue'] = (category_performance['Revenue'] / category_performance['Transactions']).round(2)
 category_performance['MarginPercent'] = (category_performance['Margin'] / category_performance['Revenue'] * 100).round(2)
@@ -161,13 +204,7 @@ print(f"✅ Analyzed {len(category_performance)} categories")
 # Brand Performance
 print("\n🏆 Analyzing Brand Performance...")
 
-brand_performance = transactions_df.groupby(['Brand', 'BrandTier']).agg({
-    'TotalAmount': 'sum',
-    'TransactionID': 'count',
-    'Quantity': 'sum'
-}).reset_index()
-
-brand_performance.columns = ['Brand', 'BrandTier', 'Revenue', 'Transactions', 'Units']
+brand_performance = tables['brand_performance']
 brand_performance = brand_performance.sort_values('Revenue', ascending=False)
 
 print(f"✅ Analyzed {len(brand_performance)} brands")
@@ -175,14 +212,7 @@ print(f"✅ Analyzed {len(brand_performance)} brands")
 # Store Performance
 print("\n🏪 Analyzing Store Performance...")
 
-store_performance = transactions_df.groupby('Store').agg({
-    'TotalAmount': 'sum',
-    'TransactionID': 'count',
-    'CustomerID': 'nunique',
-    'MarginAmount': 'sum'
-}).reset_index()
-
-store_performance.columns = ['Store', 'Revenue', 'Transactions', 'Customers', 'Margin']
+store_performance = tables['store_performance']
 store_performance['AvgTransactionValue'] = (store_performance['Revenue'] / store_performance['Transactions']).round(2)
 store_performance = store_performance.sort_values('Revenue', ascending=False)
 
@@ -191,13 +221,7 @@ print(f"✅ Analyzed {len(store_performance)} stores")
 # Channel Analysis
 print("\n🌐 Analyzing Channel Performance...")
 
-channel_performance = transactions_df.groupby('Channel').agg({
-    'TotalAmount': 'sum',
-    'TransactionID': 'count',
-    'CustomerID': 'nunique'
-}).reset_index()
-
-channel_performance.columns = ['Channel', 'Revenue', 'Transactions', 'Customers']
+channel_performance = tables['channel_performance']
 channel_performance['RevenueShare'] = (channel_performance['Revenue'] / channel_performance['Revenue'].sum() * 100).round(2)
 
 print(f"✅ Analyzed {len(channel_performance)} channels")
@@ -205,13 +229,8 @@ print(f"✅ Analyzed {len(channel_performance)} channels")
 # Customer Lifetime Value
 print("\n💰 Calculating Customer Lifetime Value...")
 
-clv_data = transactions_df.groupby('CustomerID').agg({
-    'TotalAmount': 'sum',
-    'TransactionID': 'count',
-    'Date': ['min', 'max']
-}).reset_index()
-
-clv_data.columns = ['CustomerID', 'TotalRevenue', 'TotalPurchases', 'FirstPurchase', 'LastPurchase']
+# Shares the CustomerID grouping with the RFM metrics
+clv_data = tables['customer_lifetime_value']
 clv_data['CustomerTenure'] = (clv_data['LastPurchase'] - clv_data['FirstPurchase']).dt.days
 clv_data['AvgOrderValue'] = clv_data['TotalRevenue'] / clv_data['TotalPurchases']
 
@@ -223,14 +242,7 @@ print(f"✅ Calculated CLV for {len(clv_data):,} customers")
 # Product Performance
 print("\n📦 Analyzing Product Performance...")
 
-product_performance = transactions_df.groupby(['ProductID']).agg({
-    'TotalAmount': 'sum',
-    'Quantity': 'sum',
-    'TransactionID': 'count'
-}).reset_index()
-
-product_performance.columns = ['ProductID', 'Revenue', 'UnitsSold', 'Transactions']
-product_performance = product_performance.merge(
+product_performance = tables['product_performance'].merge(
     products_df[['ProductID', 'ProductName', 'Category', 'Brand', 'Price']], 
     on='ProductID', 
     how='left'
@@ -245,20 +257,25 @@ print("\n💾 Saving Processed Datasets...")
 output_dir = '../data/processed/'
 os.makedirs(output_dir, exist_ok=True)
 
-# Save all processed datasets
-transactions_df.to_csv(f'{output_dir}transactions_processed.csv', index=False)
-customers_analysis.to_csv(f'{output_dir}customers_rfm.csv', index=False)
-rfm.to_csv(f'{output_dir}rfm_analysis.csv', index=False)
-monthly_sales.to_csv(f'{output_dir}monthly_sales_by_category.csv', index=False)
-monthly_totals.to_csv(f'{output_dir}monthly_totals.csv', index=False)
-category_performance.to_csv(f'{output_dir}category_performance.csv', index=False)
-brand_performance.to_csv(f'{output_dir}brand_performance.csv', index=False)
-store_performance.to_csv(f'{output_dir}store_performance.csv', index=False)
-channel_performance.to_csv(f'{output_dir}channel_performance.csv', index=False)
-clv_data.to_csv(f'{output_dir}customer_lifetime_value.csv', index=False)
-product_performance.to_csv(f'{output_dir}product_performance.csv', index=False)
-
-print(f"✅ Saved 11 processed datasets to {output_dir}")
+# Save all processed datasets, written concurrently
+processed_files = {
+    'transactions_processed.csv': transactions_df,
+    'customers_rfm.csv': customers_analysis,
+    'rfm_analysis.csv': rfm,
+    'monthly_sales_by_category.csv': monthly_sales,
+    'monthly_totals.csv': monthly_totals,
+    'category_performance.csv': category_performance,
+    'brand_performance.csv': brand_performance,
+    'store_performance.csv': store_performance,
+    'channel_performance.csv': channel_performance,
+    'customer_lifetime_value.csv': clv_data,
+    'product_performance.csv': product_performance
+}
+write_times = write_tables({f'{output_dir}{name}': df for name, df in processed_files.items()},
+                           workers=WRITE_WORKERS)
+
+print(f"✅ Saved {len(processed_files)} processed datasets to {output_dir} "
+      f"({sum(write_times.values()):.1f}s of writes)")
 
 # Generate Summary Report
 print("\n" + "=" * 70)
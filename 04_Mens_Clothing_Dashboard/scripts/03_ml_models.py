@@ -10,13 +10,23 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
-from sklearn.cluster import KMeans
 from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import silhouette_score
 import warnings
 warnings.filterwarnings('ignore')
 import os
 
+from clustering import sweep
+
+# K-means model selection: candidate cluster counts, fitted in parallel
+K_RANGE = range(3, 9)
+OPTIMAL_K = 5  # chosen for a good balance; its model is reused from the sweep
+SWEEP_WORKERS = None  # None = one process per CPU core, 1 = fit in this process
+
+# 'kmeans' (full KMeans), 'minibatch' (MiniBatchKMeans) or 'auto', which
+# switches to MiniBatchKMeans above MINIBATCH_MIN_CUSTOMERS customers
+CLUSTER_ALGORITHM = 'auto'
+MINIBATCH_MIN_CUSTOMERS = 200000
+
 print("=" * 70)
 print("MACHINE LEARNING MODELS - MEN'S CLOTHING")
 print("=" * 70)
@@ -166,25 +176,22 @@ features_scaled = scaler.fit_transform(clustering_data[['Recency_Log', 'Frequenc
 print(f"✅ Features prepared: Recency, Frequency, Monetary (log-transformed & scaled)")
 
 # Find optimal number of clusters using elbow method
-print(f"\n🔍 Finding Optimal Number of Clusters...")
-inertias = []
-silhouette_scores = []
-K_range = range(3, 9)
-
-for k in K_range:
-    kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-    kmeans.fit(features_scaled)
-    inertias.append(kmeans.inertia_)
-    silhouette_scores.append(silhouette_score(features_scaled, kmeans.labels_))
-
-# Choose k=5 for good balance
-optimal_k = 5
+if CLUSTER_ALGORITHM == 'auto':
+    algorithm = 'minibatch' if len(features_scaled) > MINIBATCH_MIN_CUSTOMERS else 'kmeans'
+else:
+    algorithm = CLUSTER_ALGORITHM
+print(f"\n🔍 Finding Optimal Number of Clusters ({algorithm}, k = {K_RANGE.start}-{K_RANGE.stop - 1})...")
+models, k_scores = sweep(features_scaled, K_RANGE, algorithm=algorithm, workers=SWEEP_WORKERS)
+for _, score in k_scores.iterrows():
+    print(f"   k={int(score['K'])}: inertia {score['Inertia']:,.0f}, silhouette {score['Silhouette']:.3f}")
+
+optimal_k = OPTIMAL_K
 print(f"✅ Selected K = {optimal_k} clusters")
 
-# Train final model
-print(f"\n🤖 Training K-Means Model...")
-kmeans_final = KMeans(n_clusters=optimal_k, random_state=42, n_init=10)
-cluster_labels = kmeans_final.fit_predict(features_scaled)
+# Final model is the sweep's fit for the chosen k
+print(f"\n🤖 Using K-Means Model from the sweep...")
+kmeans_final = models[optimal_k]
+cluster_labels = kmeans_final.labels_
 
 # Add clusters to dataframe
 rfm['ML_Cluster'] = cluster_labels
@@ -273,7 +280,7 @@ plt.close()
 
 # Model performance metrics
 print(f"\n📈 Model Performance:")
-print(f"   Silhouette Score: {silhouette_score(features_scaled, cluster_labels):.3f}")
+print(f"   Silhouette Score: {k_scores.set_index('K').loc[optimal_k, 'Silhouette']:.3f}")
 print(f"   Inertia: {kmeans_final.inertia_:.2f}")
 print(f"   Number of Iterations: {kmeans_final.n_iter_}")
 
@@ -8,10 +8,17 @@ import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+from matplotlib.patches import Patch
 import warnings
 warnings.filterwarnings('ignore')
 import os
 
+from render_cache import RenderCache
+
+# Skip charts whose input data, style and this script are unchanged since
+# their PNG was written
+USE_RENDER_CACHE = True
+
 # Set style
 sns.set_style("whitegrid")
 plt.rcParams['figure.facecolor'] = 'white'
@@ -45,6 +52,7 @@ print("✅ All data loaded successfully")
 # Create output directory
 viz_dir = '../visualizations/'
 os.makedirs(viz_dir, exist_ok=True)
+cache = RenderCache(viz_dir, __file__, enabled=USE_RENDER_CACHE)
 
 # Color palette
 colors = {
@@ -68,26 +76,28 @@ viz_count = 0
 viz_count += 1
 print(f"   {viz_count}. Category Performance...")
 
-plt.figure(figsize=(12, 7))
-bars = plt.bar(category_perf['Category'], category_perf['Revenue']/1000000, 
-               color=[colors['formal'], colors['casual'], colors['sports'], colors['accessories']], 
-               edgecolor='black', linewidth=1.5)
-
-# Add value labels
-for bar in bars:
-    height = bar.get_height()
-    plt.text(bar.get_x() + bar.get_width()/2., height,
-             f'₹{height:.1f}M\n({category_perf.iloc[bars.index(bar)]["RevenueShare"]:.1f}%)',
-             ha='center', va='bottom', fontsize=11, fontweight='bold')
-
-plt.xlabel('Category', fontsize=12, fontweight='bold')
-plt.ylabel('Revenue (Millions ₹)', fontsize=12, fontweight='bold')
-plt.title('Category Revenue Performance', fontsize=14, fontweight='bold', pad=20)
-plt.xticks(rotation=15, ha='right')
-plt.grid(axis='y', alpha=0.3)
-plt.tight_layout()
-plt.savefig(f'{viz_dir}01_category_performance.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('01_category_performance.png', category_perf[['Category', 'Revenue', 'RevenueShare']], colors):
+    plt.figure(figsize=(12, 7))
+    bars = plt.bar(category_perf['Category'], category_perf['Revenue']/1000000, 
+                   color=[colors['formal'], colors['casual'], colors['sports'], colors['accessories']], 
+                   edgecolor='black', linewidth=1.5)
+
+    # Add value labels
+    for bar in bars:
+        height = bar.get_height()
+        plt.text(bar.get_x() + bar.get_width()/2., height,
+                 f'₹{height:.1f}M\n({category_perf.iloc[bars.index(bar)]["RevenueShare"]:.1f}%)',
+                 ha='center', va='bottom', fontsize=11, fontweight='bold')
+
+    plt.xlabel('Category', fontsize=12, fontweight='bold')
+    plt.ylabel('Revenue (Millions ₹)', fontsize=12, fontweight='bold')
+    plt.title('Category Revenue Performance', fontsize=14, fontweight='bold', pad=20)
+    plt.xticks(rotation=15, ha='right')
+    plt.grid(axis='y', alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(f'{viz_dir}01_category_performance.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('01_category_performance.png')
 
 # ============================================================================
 # 2. MONTHLY REVENUE TREND
@@ -95,20 +105,23 @@ plt.close()
 viz_count += 1
 print(f"   {viz_count}. Monthly Revenue Trend...")
 
+# Parsed outside the cached block: the insights below also read Month
 monthly_totals['Month'] = pd.to_datetime(monthly_totals['Month'])
-plt.figure(figsize=(14, 7))
-plt.plot(monthly_totals['Month'], monthly_totals['Revenue']/1000000, 
-         marker='o', linewidth=2.5, color=colors['primary'], markersize=8)
-plt.fill_between(monthly_totals['Month'], monthly_totals['Revenue']/1000000, 
-                 alpha=0.3, color=colors['primary'])
-plt.xlabel('Month', fontsize=12, fontweight='bold')
-plt.ylabel('Revenue (Millions ₹)', fontsize=12, fontweight='bold')
-plt.title('Monthly Revenue Trend (2023-2024)', fontsize=14, fontweight='bold', pad=20)
-plt.grid(True, alpha=0.3)
-plt.xticks(rotation=45, ha='right')
-plt.tight_layout()
-plt.savefig(f'{viz_dir}02_monthly_trend.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('02_monthly_trend.png', monthly_totals[['Month', 'Revenue']], colors):
+    plt.figure(figsize=(14, 7))
+    plt.plot(monthly_totals['Month'], monthly_totals['Revenue']/1000000, 
+             marker='o', linewidth=2.5, color=colors['primary'], markersize=8)
+    plt.fill_between(monthly_totals['Month'], monthly_totals['Revenue']/1000000, 
+                     alpha=0.3, color=colors['primary'])
+    plt.xlabel('Month', fontsize=12, fontweight='bold')
+    plt.ylabel('Revenue (Millions ₹)', fontsize=12, fontweight='bold')
+    plt.title('Monthly Revenue Trend (2023-2024)', fontsize=14, fontweight='bold', pad=20)
+    plt.grid(True, alpha=0.3)
+    plt.xticks(rotation=45, ha='right')
+    plt.tight_layout()
+    plt.savefig(f'{viz_dir}02_monthly_trend.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('02_monthly_trend.png')
 
 # ============================================================================
 # 3. CHANNEL DISTRIBUTION PIE CHART
@@ -116,16 +129,18 @@ plt.close()
 viz_count += 1
 print(f"   {viz_count}. Channel Distribution...")
 
-plt.figure(figsize=(10, 10))
-colors_pie = [colors['primary'], colors['secondary'], colors['accent1']]
-explode = (0.05, 0.05, 0.05)
-plt.pie(channel_perf['Revenue'], labels=channel_perf['Channel'], autopct='%1.1f%%',
-        colors=colors_pie, explode=explode, startangle=90, 
-        textprops={'fontsize': 12, 'fontweight': 'bold'},
-        wedgeprops={'edgecolor': 'black', 'linewidth': 1.5})
-plt.title('Sales Channel Distribution', fontsize=14, fontweight='bold', pad=20)
-plt.savefig(f'{viz_dir}03_channel_distribution.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('03_channel_distribution.png', channel_perf[['Channel', 'Revenue']], colors):
+    plt.figure(figsize=(10, 10))
+    colors_pie = [colors['primary'], colors['secondary'], colors['accent1']]
+    explode = (0.05, 0.05, 0.05)
+    plt.pie(channel_perf['Revenue'], labels=channel_perf['Channel'], autopct='%1.1f%%',
+            colors=colors_pie, explode=explode, startangle=90, 
+            textprops={'fontsize': 12, 'fontweight': 'bold'},
+            wedgeprops={'edgecolor': 'black', 'linewidth': 1.5})
+    plt.title('Sales Channel Distribution', fontsize=14, fontweight='bold', pad=20)
+    plt.savefig(f'{viz_dir}03_channel_distribution.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('03_channel_distribution.png')
 
 # ============================================================================
 # 4. TOP 10 STORES BY REVENUE
@@ -133,26 +148,28 @@ plt.close()
 viz_count += 1
 print(f"   {viz_count}. Top Stores Performance...")
 
-plt.figure(figsize=(12, 8))
-top_stores = store_perf.nlargest(10, 'Revenue')
-bars = plt.barh(top_stores['Store'], top_stores['Revenue']/1000000, 
-                color=colors['success'], edgecolor='black', linewidth=1)
-
-# Add value labels
-for i, bar in enumerate(bars):
-    width = bar.get_width()
-    plt.text(width, bar.get_y() + bar.get_height()/2.,
-             f'₹{width:.1f}M',
-             ha='left', va='center', fontsize=10, fontweight='bold', 
-             bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8))
-
-plt.xlabel('Revenue (Millions ₹)', fontsize=12, fontweight='bold')
-plt.ylabel('Store', fontsize=12, fontweight='bold')
-plt.title('Top 10 Stores by Revenue', fontsize=14, fontweight='bold', pad=20)
-plt.grid(axis='x', alpha=0.3)
-plt.tight_layout()
-plt.savefig(f'{viz_dir}04_top_stores.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('04_top_stores.png', store_perf[['Store', 'Revenue']], colors):
+    plt.figure(figsize=(12, 8))
+    top_stores = store_perf.nlargest(10, 'Revenue')
+    bars = plt.barh(top_stores['Store'], top_stores['Revenue']/1000000, 
+                    color=colors['success'], edgecolor='black', linewidth=1)
+
+    # Add value labels
+    for i, bar in enumerate(bars):
+        width = bar.get_width()
+        plt.text(width, bar.get_y() + bar.get_height()/2.,
+                 f'₹{width:.1f}M',
+                 ha='left', va='center', fontsize=10, fontweight='bold', 
+                 bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8))
+
+    plt.xlabel('Revenue (Millions ₹)', fontsize=12, fontweight='bold')
+    plt.ylabel('Store', fontsize=12, fontweight='bold')
+    plt.title('Top 10 Stores by Revenue', fontsize=14, fontweight='bold', pad=20)
+    plt.grid(axis='x', alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(f'{viz_dir}04_top_stores.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('04_top_stores.png')
 
 # ============================================================================
 # 5. BRAND PERFORMANCE (TOP 10)
@@ -160,37 +177,38 @@ plt.close()
 viz_count += 1
 print(f"   {viz_count}. Brand Performance...")
 
-plt.figure(figsize=(12, 8))
-top_brands = brand_perf.nlargest(10, 'Revenue')
-colors_brand = [colors['primary'] if tier == 'Premium' else colors['secondary'] if tier == 'Mid-Range' else colors['accent1'] 
-                for tier in top_brands['BrandTier']]
-bars = plt.bar(range(len(top_brands)), top_brands['Revenue']/1000000, 
-               color=colors_brand, edgecolor='black', linewidth=1.5)
-
-# Add value labels
-for i, bar in enumerate(bars):
-    height = bar.get_height()
-    plt.text(bar.get_x() + bar.get_width()/2., height,
-             f'₹{height:.1f}M',
-             ha='center', va='bottom', fontsize=9, fontweight='bold')
-
-plt.xlabel('Brand', fontsize=12, fontweight='bold')
-plt.ylabel('Revenue (Millions ₹)', fontsize=12, fontweight='bold')
-plt.title('Top 10 Brands by Revenue', fontsize=14, fontweight='bold', pad=20)
-plt.xticks(range(len(top_brands)), top_brands['Brand'], rotation=45, ha='right')
-
-# Legend for brand tiers
-from matplotlib.patches import Patch
-legend_elements = [
-    Patch(facecolor=colors['primary'], edgecolor='black', label='Premium'),
-    Patch(facecolor=colors['secondary'], edgecolor='black', label='Mid-Range'),
-    Patch(facecolor=colors['accent1'], edgecolor='black', label='Budget')
-]
-plt.legend(handles=legend_elements, loc='upper right', fontsize=10)
-plt.grid(axis='y', alpha=0.3)
-plt.tight_layout()
-plt.savefig(f'{viz_dir}05_brand_performance.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('05_brand_performance.png', brand_perf[['Brand', 'BrandTier', 'Revenue']], colors):
+    plt.figure(figsize=(12, 8))
+    top_brands = brand_perf.nlargest(10, 'Revenue')
+    colors_brand = [colors['primary'] if tier == 'Premium' else colors['secondary'] if tier == 'Mid-Range' else colors['accent1'] 
+                    for tier in top_brands['BrandTier']]
+    bars = plt.bar(range(len(top_brands)), top_brands['Revenue']/1000000, 
+                   color=colors_brand, edgecolor='black', linewidth=1.5)
+
+    # Add value labels
+    for i, bar in enumerate(bars):
+        height = bar.get_height()
+        plt.text(bar.get_x() + bar.get_width()/2., height,
+                 f'₹{height:.1f}M',
+                 ha='center', va='bottom', fontsize=9, fontweight='bold')
+
+    plt.xlabel('Brand', fontsize=12, fontweight='bold')
+    plt.ylabel('Revenue (Millions ₹)', fontsize=12, fontweight='bold')
+    plt.title('Top 10 Brands by Revenue', fontsize=14, fontweight='bold', pad=20)
+    plt.xticks(range(len(top_brands)), top_brands['Brand'], rotation=45, ha='right')
+
+    # Legend for brand tiers
+    legend_elements = [
+        Patch(facecolor=colors['primary'], edgecolor='black', label='Premium'),
+        Patch(facecolor=colors['secondary'], edgecolor='black', label='Mid-Range'),
+        Patch(facecolor=colors['accent1'], edgecolor='black', label='Budget')
+    ]
+    plt.legend(handles=legend_elements, loc='upper right', fontsize=10)
+    plt.grid(axis='y', alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(f'{viz_dir}05_brand_performance.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('05_brand_performance.png')
 
 # ============================================================================
 # 6. RFM SEGMENT DISTRIBUTION
@@ -198,27 +216,29 @@ plt.close()
 viz_count += 1
 print(f"   {viz_count}. RFM Segmentation...")
 
-plt.figure(figsize=(12, 8))
-segment_counts = rfm['RFM_Segment'].value_counts()
-colors_rfm = plt.cm.viridis(np.linspace(0, 1, len(segment_counts)))
-bars = plt.bar(segment_counts.index, segment_counts.values, 
-               color=colors_rfm, edgecolor='black', linewidth=1.5)
-
-# Add value labels
-for bar in bars:
-    height = bar.get_height()
-    plt.text(bar.get_x() + bar.get_width()/2., height,
-             f'{int(height):,}\n({height/len(rfm)*100:.1f}%)',
-             ha='center', va='bottom', fontsize=10, fontweight='bold')
-
-plt.xlabel('Customer Segment', fontsize=12, fontweight='bold')
-plt.ylabel('Number of Customers', fontsize=12, fontweight='bold')
-plt.title('Customer Segmentation (RFM Analysis)', fontsize=14, fontweight='bold', pad=20)
-plt.xticks(rotation=30, ha='right')
-plt.grid(axis='y', alpha=0.3)
-plt.tight_layout()
-plt.savefig(f'{viz_dir}06_rfm_segments.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('06_rfm_segments.png', rfm['RFM_Segment']):
+    plt.figure(figsize=(12, 8))
+    segment_counts = rfm['RFM_Segment'].value_counts()
+    colors_rfm = plt.cm.viridis(np.linspace(0, 1, len(segment_counts)))
+    bars = plt.bar(segment_counts.index, segment_counts.values, 
+                   color=colors_rfm, edgecolor='black', linewidth=1.5)
+
+    # Add value labels
+    for bar in bars:
+        height = bar.get_height()
+        plt.text(bar.get_x() + bar.get_width()/2., height,
+                 f'{int(height):,}\n({height/len(rfm)*100:.1f}%)',
+                 ha='center', va='bottom', fontsize=10, fontweight='bold')
+
+    plt.xlabel('Customer Segment', fontsize=12, fontweight='bold')
+    plt.ylabel('Number of Customers', fontsize=12, fontweight='bold')
+    plt.title('Customer Segmentation (RFM Analysis)', fontsize=14, fontweight='bold', pad=20)
+    plt.xticks(rotation=30, ha='right')
+    plt.grid(axis='y', alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(f'{viz_dir}06_rfm_segments.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('06_rfm_segments.png')
 
 # ============================================================================
 # 7. TRANSACTION VALUE DISTRIBUTION
@@ -226,21 +246,23 @@ plt.close()
 viz_count += 1
 print(f"   {viz_count}. Transaction Distribution...")
 
-plt.figure(figsize=(12, 7))
-plt.hist(transactions['TotalAmount'], bins=50, color=colors['primary'], 
-         edgecolor='black', alpha=0.7)
-plt.axvline(transactions['TotalAmount'].mean(), color='red', linestyle='--', 
-            linewidth=2, label=f'Mean: ₹{transactions["TotalAmount"].mean():,.0f}')
-plt.axvline(transactions['TotalAmount'].median(), color='green', linestyle='--', 
-            linewidth=2, label=f'Median: ₹{transactions["TotalAmount"].median():,.0f}')
-plt.xlabel('Transaction Amount (₹)', fontsize=12, fontweight='bold')
-plt.ylabel('Frequency', fontsize=12, fontweight='bold')
-plt.title('Transaction Value Distribution', fontsize=14, fontweight='bold', pad=20)
-plt.legend(fontsize=11)
-plt.grid(axis='y', alpha=0.3)
-plt.tight_layout()
-plt.savefig(f'{viz_dir}07_transaction_distribution.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('07_transaction_distribution.png', transactions['TotalAmount'], colors):
+    plt.figure(figsize=(12, 7))
+    plt.hist(transactions['TotalAmount'], bins=50, color=colors['primary'], 
+             edgecolor='black', alpha=0.7)
+    plt.axvline(transactions['TotalAmount'].mean(), color='red', linestyle='--', 
+                linewidth=2, label=f'Mean: ₹{transactions["TotalAmount"].mean():,.0f}')
+    plt.axvline(transactions['TotalAmount'].median(), color='green', linestyle='--', 
+                linewidth=2, label=f'Median: ₹{transactions["TotalAmount"].median():,.0f}')
+    plt.xlabel('Transaction Amount (₹)', fontsize=12, fontweight='bold')
+    plt.ylabel('Frequency', fontsize=12, fontweight='bold')
+    plt.title('Transaction Value Distribution', fontsize=14, fontweight='bold', pad=20)
+    plt.legend(fontsize=11)
+    plt.grid(axis='y', alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(f'{viz_dir}07_transaction_distribution.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('07_transaction_distribution.png')
 
 # ============================================================================
 # 8. WEEKDAY vs WEEKEND SALES
@@ -248,42 +270,44 @@ plt.close()
 viz_count += 1
 print(f"   {viz_count}. Weekday vs Weekend Analysis...")
 
-weekend_sales = transactions.groupby('IsWeekend').agg({
-    'TotalAmount': 'sum',
-    'TransactionID': 'count'
-}).reset_index()
-weekend_sales['IsWeekend'] = weekend_sales['IsWeekend'].map({0: 'Weekday', 1: 'Weekend'})
-
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-
-# Revenue comparison
-bars1 = ax1.bar(weekend_sales['IsWeekend'], weekend_sales['TotalAmount']/1000000, 
-                color=[colors['primary'], colors['secondary']], edgecolor='black', linewidth=1.5)
-for bar in bars1:
-    height = bar.get_height()
-    ax1.text(bar.get_x() + bar.get_width()/2., height,
-             f'₹{height:.1f}M',
-             ha='center', va='bottom', fontsize=11, fontweight='bold')
-ax1.set_ylabel('Revenue (Millions ₹)', fontsize=11, fontweight='bold')
-ax1.set_title('Revenue: Weekday vs Weekend', fontsize=12, fontweight='bold')
-ax1.grid(axis='y', alpha=0.3)
-
-# Transaction count comparison
-bars2 = ax2.bar(weekend_sales['IsWeekend'], weekend_sales['TransactionID'], 
-                color=[colors['primary'], colors['secondary']], edgecolor='black', linewidth=1.5)
-for bar in bars2:
-    height = bar.get_height()
-    ax2.text(bar.get_x() + bar.get_width()/2., height,
-             f'{int(height):,}',
-             ha='center', va='bottom', fontsize=11, fontweight='bold')
-ax2.set_ylabel('Number of Transactions', fontsize=11, fontweight='bold')
-ax2.set_title('Transactions: Weekday vs Weekend', fontsize=12, fontweight='bold')
-ax2.grid(axis='y', alpha=0.3)
-
-plt.suptitle('Weekend vs Weekday Sales Analysis', fontsize=14, fontweight='bold', y=1.02)
-plt.tight_layout()
-plt.savefig(f'{viz_dir}08_weekday_weekend.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('08_weekday_weekend.png', transactions[['IsWeekend', 'TotalAmount', 'TransactionID']], colors):
+    weekend_sales = transactions.groupby('IsWeekend').agg({
+        'TotalAmount': 'sum',
+        'TransactionID': 'count'
+    }).reset_index()
+    weekend_sales['IsWeekend'] = weekend_sales['IsWeekend'].map({0: 'Weekday', 1: 'Weekend'})
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+
+    # Revenue comparison
+    bars1 = ax1.bar(weekend_sales['IsWeekend'], weekend_sales['TotalAmount']/1000000, 
+                    color=[colors['primary'], colors['secondary']], edgecolor='black', linewidth=1.5)
+    for bar in bars1:
+        height = bar.get_height()
+        ax1.text(bar.get_x() + bar.get_width()/2., height,
+                 f'₹{height:.1f}M',
+                 ha='center', va='bottom', fontsize=11, fontweight='bold')
+    ax1.set_ylabel('Revenue (Millions ₹)', fontsize=11, fontweight='bold')
+    ax1.set_title('Revenue: Weekday vs Weekend', fontsize=12, fontweight='bold')
+    ax1.grid(axis='y', alpha=0.3)
+
+    # Transaction count comparison
+    bars2 = ax2.bar(weekend_sales['IsWeekend'], weekend_sales['TransactionID'], 
+                    color=[colors['primary'], colors['secondary']], edgecolor='black', linewidth=1.5)
+    for bar in bars2:
+        height = bar.get_height()
+        ax2.text(bar.get_x() + bar.get_width()/2., height,
+                 f'{int(height):,}',
+                 ha='center', va='bottom', fontsize=11, fontweight='bold')
+    ax2.set_ylabel('Number of Transactions', fontsize=11, fontweight='bold')
+    ax2.set_title('Transactions: Weekday vs Weekend', fontsize=12, fontweight='bold')
+    ax2.grid(axis='y', alpha=0.3)
+
+    plt.suptitle('Weekend vs Weekday Sales Analysis', fontsize=14, fontweight='bold', y=1.02)
+    plt.tight_layout()
+    plt.savefig(f'{viz_dir}08_weekday_weekend.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('08_weekday_weekend.png')
 
 # ============================================================================
 # 9. CUSTOMER LIFETIME VALUE DISTRIBUTION
@@ -291,27 +315,29 @@ plt.close()
 viz_count += 1
 print(f"   {viz_count}. CLV Distribution...")
 
-plt.figure(figsize=(12, 7))
-clv_segments = clv.groupby('RFM_Segment')['TotalRevenue'].mean().sort_values(ascending=False)
-colors_clv = plt.cm.plasma(np.linspace(0, 1, len(clv_segments)))
-bars = plt.barh(clv_segments.index, clv_segments.values, 
-                color=colors_clv, edgecolor='black', linewidth=1.5)
-
-# Add value labels
-for bar in bars:
-    width = bar.get_width()
-    plt.text(width, bar.get_y() + bar.get_height()/2.,
-             f'₹{width:,.0f}',
-             ha='left', va='center', fontsize=10, fontweight='bold',
-             bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8))
-
-plt.xlabel('Average Customer Lifetime Value (₹)', fontsize=12, fontweight='bold')
-plt.ylabel('Customer Segment', fontsize=12, fontweight='bold')
-plt.title('Average CLV by Customer Segment', fontsize=14, fontweight='bold', pad=20)
-plt.grid(axis='x', alpha=0.3)
-plt.tight_layout()
-plt.savefig(f'{viz_dir}09_clv_by_segment.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('09_clv_by_segment.png', clv[['RFM_Segment', 'TotalRevenue']]):
+    plt.figure(figsize=(12, 7))
+    clv_segments = clv.groupby('RFM_Segment')['TotalRevenue'].mean().sort_values(ascending=False)
+    colors_clv = plt.cm.plasma(np.linspace(0, 1, len(clv_segments)))
+    bars = plt.barh(clv_segments.index, clv_segments.values, 
+                    color=colors_clv, edgecolor='black', linewidth=1.5)
+
+    # Add value labels
+    for bar in bars:
+        width = bar.get_width()
+        plt.text(width, bar.get_y() + bar.get_height()/2.,
+                 f'₹{width:,.0f}',
+                 ha='left', va='center', fontsize=10, fontweight='bold',
+                 bbox=dict(boxstyle='round,pad=0.3', facecolor='white', alpha=0.8))
+
+    plt.xlabel('Average Customer Lifetime Value (₹)', fontsize=12, fontweight='bold')
+    plt.ylabel('Customer Segment', fontsize=12, fontweight='bold')
+    plt.title('Average CLV by Customer Segment', fontsize=14, fontweight='bold', pad=20)
+    plt.grid(axis='x', alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(f'{viz_dir}09_clv_by_segment.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('09_clv_by_segment.png')
 
 # ============================================================================
 # 10. DISCOUNT ANALYSIS
@@ -319,50 +345,54 @@ plt.close()
 viz_count += 1
 print(f"   {viz_count}. Discount Impact Analysis...")
 
-# Create discount brackets
-transactions['DiscountBracket'] = pd.cut(transactions['DiscountPercent'], 
-                                          bins=[0, 10, 20, 30, 50], 
-                                          labels=['0-10%', '10-20%', '20-30%', '30-50%'])
-discount_impact = transactions.groupby('DiscountBracket').agg({
-    'TotalAmount': 'sum',
-    'TransactionID': 'count'
-}).reset_index()
-
-fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
-
-# Revenue by discount bracket
-colors_disc = [colors['success'], colors['primary'], colors['secondary'], colors['accent2']]
-bars1 = ax1.bar(discount_impact['DiscountBracket'], discount_impact['TotalAmount']/1000000, 
-                color=colors_disc, edgecolor='black', linewidth=1.5)
-for bar in bars1:
-    height = bar.get_height()
-    ax1.text(bar.get_x() + bar.get_width()/2., height,
-             f'₹{height:.1f}M',
-             ha='center', va='bottom', fontsize=10, fontweight='bold')
-ax1.set_xlabel('Discount Range', fontsize=11, fontweight='bold')
-ax1.set_ylabel('Revenue (Millions ₹)', fontsize=11, fontweight='bold')
-ax1.set_title('Revenue by Discount Range', fontsize=12, fontweight='bold')
-ax1.grid(axis='y', alpha=0.3)
-
-# Transaction count by discount bracket
-bars2 = ax2.bar(discount_impact['DiscountBracket'], discount_impact['TransactionID'], 
-                color=colors_disc, edgecolor='black', linewidth=1.5)
-for bar in bars2:
-    height = bar.get_height()
-    ax2.text(bar.get_x() + bar.get_width()/2., height,
-             f'{int(height):,}',
-             ha='center', va='bottom', fontsize=10, fontweight='bold')
-ax2.set_xlabel('Discount Range', fontsize=11, fontweight='bold')
-ax2.set_ylabel('Number of Transactions', fontsize=11, fontweight='bold')
-ax2.set_title('Transactions by Discount Range', fontsize=12, fontweight='bold')
-ax2.grid(axis='y', alpha=0.3)
-
-plt.suptitle('Discount Impact on Sales', fontsize=14, fontweight='bold', y=1.02)
-plt.tight_layout()
-plt.savefig(f'{viz_dir}10_discount_analysis.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('10_discount_analysis.png', transactions[['DiscountPercent', 'TotalAmount', 'TransactionID']], colors):
+    # Create discount brackets
+    transactions['DiscountBracket'] = pd.cut(transactions['DiscountPercent'], 
+                                              bins=[0, 10, 20, 30, 50], 
+                                              labels=['0-10%', '10-20%', '20-30%', '30-50%'])
+    discount_impact = transactions.groupby('DiscountBracket').agg({
+        'TotalAmount': 'sum',
+        'TransactionID': 'count'
+    }).reset_index()
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+
+    # Revenue by discount bracket
+    colors_disc = [colors['success'], colors['primary'], colors['secondary'], colors['accent2']]
+    bars1 = ax1.bar(discount_impact['DiscountBracket'], discount_impact['TotalAmount']/1000000, 
+                    color=colors_disc, edgecolor='black', linewidth=1.5)
+    for bar in bars1:
+        height = bar.get_height()
+        ax1.text(bar.get_x() + bar.get_width()/2., height,
+                 f'₹{height:.1f}M',
+                 ha='center', va='bottom', fontsize=10, fontweight='bold')
+    ax1.set_xlabel('Discount Range', fontsize=11, fontweight='bold')
+    ax1.set_ylabel('Revenue (Millions ₹)', fontsize=11, fontweight='bold')
+    ax1.set_title('Revenue by Discount Range', fontsize=12, fontweight='bold')
+    ax1.grid(axis='y', alpha=0.3)
+
+    # Transaction count by discount bracket
+    bars2 = ax2.bar(discount_impact['DiscountBracket'], discount_impact['TransactionID'], 
+                    color=colors_disc, edgecolor='black', linewidth=1.5)
+    for bar in bars2:
+        height = bar.get_height()
+        ax2.text(bar.get_x() + bar.get_width()/2., height,
+                 f'{int(height):,}',
+                 ha='center', va='bottom', fontsize=10, fontweight='bold')
+    ax2.set_xlabel('Discount Range', fontsize=11, fontweight='bold')
+    ax2.set_ylabel('Number of Transactions', fontsize=11, fontweight='bold')
+    ax2.set_title('Transactions by Discount Range', fontsize=12, fontweight='bold')
+    ax2.grid(axis='y', alpha=0.3)
+
+    plt.suptitle('Discount Impact on Sales', fontsize=14, fontweight='bold', y=1.02)
+    plt.tight_layout()
+    plt.savefig(f'{viz_dir}10_discount_analysis.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('10_discount_analysis.png')
 
 print(f"\n✅ Generated {viz_count} visualizations")
+if USE_RENDER_CACHE:
+    print(f"   ♻️  {cache.skipped} unchanged (reused from render cache), {cache.rendered} redrawn")
 
 # Generate insights summary
 print("\n" + "=" * 70)
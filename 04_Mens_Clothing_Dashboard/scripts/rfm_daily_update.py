@@ -0,0 +1,78 @@
+"""
+Daily RFM Update - Men's Clothing
+Folds new transaction files from data/incoming/ into the RFM state saved by
+02_process_data.py, then rescores and resegments every customer
+without regrouping the full transaction history. Rerunning script 03
+rebuilds the state from data/raw/ and clears the list of ingested files.
+"""
+
+import os
+import glob
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from rfm_state import RFMState, state_exists
+
+# New exports (same columns as transactions.csv) are dropped here
+INCOMING_DIR = '../data/incoming'
+STATE_DIR = '../data/rfm_state'
+OUTPUT_FILE = '../data/processed/rfm_daily.csv'
+
+print("🔁 Starting Daily RFM Update...")
+print("=" * 70)
+
+if not state_exists(STATE_DIR):
+    print(f"\n⚠️ No RFM state in {STATE_DIR}/ - run 02_process_data.py first")
+    exit(1)
+
+state = RFMState.load(STATE_DIR)
+print(f"\n✓ Loaded RFM state for {len(state.customers):,} customers")
+
+# ============================================================================
+# 1. INGEST NEW TRANSACTIONS
+# ============================================================================
+print("\n📥 Ingesting new transaction files...")
+
+ingested = {entry['file'] for entry in state.ingested}
+new_files = [path for path in sorted(glob.glob(os.path.join(INCOMING_DIR, '*.csv')))
+             if os.path.basename(path) not in ingested]
+
+columns = state.columns
+changed = pd.Index([])
+for path in new_files:
+    df = pd.read_csv(path, usecols=list(columns.values()), parse_dates=[columns['date']])
+    changed = changed.union(state.update(df))
+    state.ingested.append({
+        'file': os.path.basename(path),
+        'rows': len(df),
+        'ingested_at': datetime.now().isoformat(timespec='seconds')
+    })
+    print(f"✓ {os.path.basename(path)}: {len(df):,} transactions")
+
+if not new_files:
+    print(f"✓ No new files in {INCOMING_DIR}/")
+print(f"✓ {len(changed):,} customers updated")
+
+# ============================================================================
+# 2. RESCORE CUSTOMERS
+# ============================================================================
+print("\n🎯 Rescoring customers...")
+
+# Same reference point as 02_process_data.py: the day after the latest transaction
+analysis_date = state.last_date + timedelta(days=1)
+rfm = state.score(analysis_date).rename(columns={'Segment': 'RFM_Segment'})
+rfm['Updated'] = rfm[columns['customer']].isin(changed)
+
+state.save(STATE_DIR)
+os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
+rfm.to_csv(OUTPUT_FILE, index=False)
+
+print(f"\n📊 Customer Segments (as of {analysis_date:%Y-%m-%d}):")
+for segment, count in rfm['RFM_Segment'].value_counts().items():
+    print(f"  {segment}: {count:,} customers ({count / len(rfm) * 100:.1f}%)")
+
+print(f"\n✓ Saved {OUTPUT_FILE}")
+print("\n" + "=" * 70)
+print("✅ Daily RFM Update Complete!")
+print("=" * 70)
@@ -0,0 +1,80 @@
+"""
+Weighted samplers for synthetic data generation
+Builds a Walker alias table once per weighted population (customers, ...),
+after which any number of weighted draws costs two uniform random numbers
+each, instead of a DataFrame.sample() call that re-normalizes the weights
+for every row. Filtered populations (e.g. the products a customer segment
+shops from) are compiled once into integer index pools.
+"""
+
+import numpy as np
+
+class AliasSampler:
+    """Draws indexes 0..n-1 with probability proportional to ``weights``
+
+    Usage:
+        customers = AliasSampler(customer_weights)
+        customer_idx = customers.draw(rng, 1_000_000)
+        stores = AliasSampler(store_traffic, values=store_ids)  # draws entries of values
+    """
+
+    def __init__(self, weights, values=None):
+        weights = np.asarray(weights, dtype=float)
+        if weights.ndim != 1 or len(weights) == 0:
+            raise ValueError("AliasSampler needs a non-empty 1-D weight array")
+        if (weights < 0).any() or weights.sum() <= 0:
+            raise ValueError("AliasSampler weights must be non-negative with a positive total")
+
+        n = len(weights)
+        self.values = None if values is None else np.asarray(values)
+        self.prob = np.ones(n)
+        self.alias = np.arange(n)
+
+        # Vose's construction: pair every under-full bucket with an over-full one
+        scaled = weights * n / weights.sum()
+        small = list(np.flatnonzero(scaled < 1))
+        large = list(np.flatnonzero(scaled >= 1))
+        while small and large:
+            low, high = small.pop(), large[-1]
+            self.prob[low] = scaled[low]
+            self.alias[low] = high
+            scaled[high] -= 1 - scaled[low]
+            if scaled[high] < 1:
+                small.append(large.pop())
+        # Whatever is left is full up to floating-point error
+        self.prob[small + large] = 1.0
+
+    def __len__(self):
+        return len(self.prob)
+
+    def draw(self, rng, size):
+        """``size`` weighted draws: indexes, or entries of ``values`` when given"""
+        bucket = rng.integers(0, len(self.prob), size=size)
+        index = np.where(rng.random(size) < self.prob[bucket], bucket, self.alias[bucket])
+        return index if self.values is None else self.values[index]
+
+def compile_pools(frame, pools, keys):
+    """Row indexes of ``frame`` for each key, laid out back to back
+
+    ``pools`` maps a key to {column: allowed values}; a row joins the pool
+    when every column holds one of its allowed values, and keys without an
+    entry pool every row. Returns (rows, start, size) with the pool of
+    keys[i] at rows[start[i]:start[i] + size[i]], so a uniform draw for key
+    codes k is rows[start[k] + rng.integers(0, size[k])].
+    """
+    unknown = set(pools) - set(keys)
+    if unknown:
+        raise ValueError(f"pools defined for unknown keys: {sorted(unknown)}")
+
+    members = []
+    for key in keys:
+        keep = np.ones(len(frame), dtype=bool)
+        for column, allowed in pools.get(key, {}).items():
+            keep &= frame[column].isin(allowed).to_numpy()
+        if not keep.any():
+            raise ValueError(f"pool for {key!r} matches no rows")
+        members.append(np.flatnonzero(keep))
+
+    size = np.array([len(rows) for rows in members])
+    start = np.concatenate([[0], np.cumsum(size)[:-1]])
+    return np.concatenate(members), start, size
@@ -12,6 +12,12 @@ import warnings
 warnings.filterwarnings('ignore')
 import os
 
+from render_cache import RenderCache
+
+# Skip charts whose input data, style and this script are unchanged since
+# their PNG was written
+USE_RENDER_CACHE = True
+
 # Create output directory
 os.makedirs('../visualizations', exist_ok=True)
 
@@ -41,214 +47,243 @@ print("  ✅ All datasets loaded")
 # Color palette
 colors = ['#667eea', '#764ba2', '#f093fb', '#4facfe', '#43e97b', '#fa709a']
 
+cache = RenderCache('../visualizations', __file__, enabled=USE_RENDER_CACHE)
+
 print("\n🎨 Generating Visualizations...")
 
 # 1. Category Revenue Comparison
 print("  1/12 Category Revenue...")
-plt.figure(figsize=(12, 8))
-bars = plt.barh(category_kpis['category'], category_kpis['revenue']/10000000, color=colors)
-plt.xlabel('Revenue (₹ Crore)', fontsize=12, fontweight='bold')
-plt.ylabel('Category', fontsize=12, fontweight='bold')
-plt.title('Category-wise Revenue Performance', fontsize=14, fontweight='bold', pad=20)
-for i, bar in enumerate(bars):
-    width = bar.get_width()
-    plt.text(width, bar.get_y() + bar.get_height()/2, 
-             f'₹{width:.1f} Cr\n({category_kpis.iloc[i]["revenue_share_pct"]:.1f}%)',
-             ha='left', va='center', fontweight='bold')
-plt.tight_layout()
-plt.savefig('../visualizations/01_category_revenue.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('01_category_revenue.png', category_kpis[['category', 'revenue', 'revenue_share_pct']], colors):
+    plt.figure(figsize=(12, 8))
+    bars = plt.barh(category_kpis['category'], category_kpis['revenue']/10000000, color=colors)
+    plt.xlabel('Revenue (₹ Crore)', fontsize=12, fontweight='bold')
+    plt.ylabel('Category', fontsize=12, fontweight='bold')
+    plt.title('Category-wise Revenue Performance', fontsize=14, fontweight='bold', pad=20)
+    for i, bar in enumerate(bars):
+        width = bar.get_width()
+        plt.text(width, bar.get_y() + bar.get_height()/2, 
+                 f'₹{width:.1f} Cr\n({category_kpis.iloc[i]["revenue_share_pct"]:.1f}%)',
+                 ha='left', va='center', fontweight='bold')
+    plt.tight_layout()
+    plt.savefig('../visualizations/01_category_revenue.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('01_category_revenue.png')
 
 # 2. Monthly Revenue Trend
 print("  2/12 Monthly Trend...")
-plt.figure(figsize=(14, 8))
-plt.plot(range(len(monthly_ts)), monthly_ts['revenue']/10000000, marker='o', linewidth=2, color='#667eea', markersize=6)
-plt.fill_between(range(len(monthly_ts)), monthly_ts['revenue']/10000000, alpha=0.3, color='#667eea')
-plt.xlabel('Month Index', fontsize=12, fontweight='bold')
-plt.ylabel('Revenue (₹ Crore)', fontsize=12, fontweight='bold')
-plt.title('Monthly Revenue Trend (36 Months)', fontsize=14, fontweight='bold', pad=20)
-plt.grid(True, alpha=0.3)
-growth = ((monthly_ts.iloc[-1]['revenue'] - monthly_ts.iloc[0]['revenue']) / monthly_ts.iloc[0]['revenue'] * 100)
-plt.text(0.02, 0.98, f'Total Growth: {growth:+.1f}%', transform=plt.gca().transAxes,
-         fontsize=11, fontweight='bold', va='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
-plt.tight_layout()
-plt.savefig('../visualizations/02_monthly_trend.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('02_monthly_trend.png', monthly_ts['revenue']):
+    plt.figure(figsize=(14, 8))
+    plt.plot(range(len(monthly_ts)), monthly_ts['revenue']/10000000, marker='o', linewidth=2, color='#667eea', markersize=6)
+    plt.fill_between(range(len(monthly_ts)), monthly_ts['revenue']/10000000, alpha=0.3, color='#667eea')
+    plt.xlabel('Month Index', fontsize=12, fontweight='bold')
+    plt.ylabel('Revenue (₹ Crore)', fontsize=12, fontweight='bold')
+    plt.title('Monthly Revenue Trend (36 Months)', fontsize=14, fontweight='bold', pad=20)
+    plt.grid(True, alpha=0.3)
+    growth = ((monthly_ts.iloc[-1]['revenue'] - monthly_ts.iloc[0]['revenue']) / monthly_ts.iloc[0]['revenue'] * 100)
+    plt.text(0.02, 0.98, f'Total Growth: {growth:+.1f}%', transform=plt.gca().transAxes,
+             fontsize=11, fontweight='bold', va='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.8))
+    plt.tight_layout()
+    plt.savefig('../visualizations/02_monthly_trend.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('02_monthly_trend.png')
 
 # 3. Channel Distribution
 print("  3/12 Channel Distribution...")
-plt.figure(figsize=(10, 10))
-explode = [0.05, 0, 0]
-plt.pie(channel_kpis['revenue'], labels=channel_kpis['channel'], autopct='%1.1f%%',
-        startangle=90, colors=colors[:3], explode=explode, textprops={'fontsize': 12, 'fontweight': 'bold'})
-plt.title('Revenue Distribution by Channel', fontsize=14, fontweight='bold', pad=20)
-plt.tight_layout()
-plt.savefig('../visualizations/03_channel_distribution.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('03_channel_distribution.png', channel_kpis[['channel', 'revenue']], colors):
+    plt.figure(figsize=(10, 10))
+    explode = [0.05, 0, 0]
+    plt.pie(channel_kpis['revenue'], labels=channel_kpis['channel'], autopct='%1.1f%%',
+            startangle=90, colors=colors[:3], explode=explode, textprops={'fontsize': 12, 'fontweight': 'bold'})
+    plt.title('Revenue Distribution by Channel', fontsize=14, fontweight='bold', pad=20)
+    plt.tight_layout()
+    plt.savefig('../visualizations/03_channel_distribution.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('03_channel_distribution.png')
 
 # 4. Top 10 Stores
 print("  4/12 Top Stores...")
-plt.figure(figsize=(12, 8))
-top_stores = store_kpis.head(10)
-bars = plt.barh(range(len(top_stores)), top_stores['revenue']/10000000, color=colors[0])
-plt.yticks(range(len(top_stores)), [f"{row['store_name']}\n({row['store_type']})" for _, row in top_stores.iterrows()])
-plt.xlabel('Revenue (₹ Crore)', fontsize=12, fontweight='bold')
-plt.ylabel('Store', fontsize=12, fontweight='bold')
-plt.title('Top 10 Store Performance', fontsize=14, fontweight='bold', pad=20)
-for i, bar in enumerate(bars):
-    plt.text(bar.get_width(), bar.get_y() + bar.get_height()/2,
-             f' ₹{bar.get_width():.1f} Cr', va='center', fontweight='bold')
-plt.tight_layout()
-plt.savefig('../visualizations/04_top_stores.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('04_top_stores.png', store_kpis.head(10)[['store_name', 'store_type', 'revenue']], colors):
+    plt.figure(figsize=(12, 8))
+    top_stores = store_kpis.head(10)
+    bars = plt.barh(range(len(top_stores)), top_stores['revenue']/10000000, color=colors[0])
+    plt.yticks(range(len(top_stores)), [f"{row['store_name']}\n({row['store_type']})" for _, row in top_stores.iterrows()])
+    plt.xlabel('Revenue (₹ Crore)', fontsize=12, fontweight='bold')
+    plt.ylabel('Store', fontsize=12, fontweight='bold')
+    plt.title('Top 10 Store Performance', fontsize=14, fontweight='bold', pad=20)
+    for i, bar in enumerate(bars):
+        plt.text(bar.get_width(), bar.get_y() + bar.get_height()/2,
+                 f' ₹{bar.get_width():.1f} Cr', va='center', fontweight='bold')
+    plt.tight_layout()
+    plt.savefig('../visualizations/04_top_stores.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('04_top_stores.png')
 
 # 5. Customer Segment Value
 print("  5/12 Customer Segments...")
-plt.figure(figsize=(12, 8))
-x = range(len(segment_kpis))
-bars1 = plt.bar([i-0.2 for i in x], segment_kpis['revenue_per_customer']/100000, 0.4, label='Revenue per Customer', color=colors[0])
-bars2 = plt.bar([i+0.2 for i in x], segment_kpis['transactions_per_customer'], 0.4, label='Transactions per Customer', color=colors[1])
-plt.xlabel('Customer Segment', fontsize=12, fontweight='bold')
-plt.ylabel('Value', fontsize=12, fontweight='bold')
-plt.title('Customer Segment Analysis', fontsize=14, fontweight='bold', pad=20)
-plt.xticks(x, segment_kpis['segment'], rotation=45)
-plt.legend(fontsize=10)
-plt.tight_layout()
-plt.savefig('../visualizations/05_segment_analysis.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('05_segment_analysis.png', segment_kpis[['segment', 'revenue_per_customer', 'transactions_per_customer']], colors):
+    plt.figure(figsize=(12, 8))
+    x = range(len(segment_kpis))
+    bars1 = plt.bar([i-0.2 for i in x], segment_kpis['revenue_per_customer']/100000, 0.4, label='Revenue per Customer', color=colors[0])
+    bars2 = plt.bar([i+0.2 for i in x], segment_kpis['transactions_per_customer'], 0.4, label='Transactions per Customer', color=colors[1])
+    plt.xlabel('Customer Segment', fontsize=12, fontweight='bold')
+    plt.ylabel('Value', fontsize=12, fontweight='bold')
+    plt.title('Customer Segment Analysis', fontsize=14, fontweight='bold', pad=20)
+    plt.xticks(x, segment_kpis['segment'], rotation=45)
+    plt.legend(fontsize=10)
+    plt.tight_layout()
+    plt.savefig('../visualizations/05_segment_analysis.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('05_segment_analysis.png')
 
 # 6. Category Margin Comparison
 print("  6/12 Category Margins...")
-plt.figure(figsize=(12, 8))
-bars = plt.bar(category_kpis['category'], category_kpis['avg_margin_pct'], color=colors)
-plt.xlabel('Category', fontsize=12, fontweight='bold')
-plt.ylabel('Average Margin (%)', fontsize=12, fontweight='bold')
-plt.title('Category-wise Profit Margin', fontsize=14, fontweight='bold', pad=20)
-plt.xticks(rotation=45, ha='right')
-for i, bar in enumerate(bars):
-    plt.text(bar.get_x() + bar.get_width()/2, bar.get_height(),
-             f'{bar.get_height():.1f}%', ha='center', va='bottom', fontweight='bold')
-plt.tight_layout()
-plt.savefig('../visualizations/06_category_margins.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('06_category_margins.png', category_kpis[['category', 'avg_margin_pct']], colors):
+    plt.figure(figsize=(12, 8))
+    bars = plt.bar(category_kpis['category'], category_kpis['avg_margin_pct'], color=colors)
+    plt.xlabel('Category', fontsize=12, fontweight='bold')
+    plt.ylabel('Average Margin (%)', fontsize=12, fontweight='bold')
+    plt.title('Category-wise Profit Margin', fontsize=14, fontweight='bold', pad=20)
+    plt.xticks(rotation=45, ha='right')
+    for i, bar in enumerate(bars):
+        plt.text(bar.get_x() + bar.get_width()/2, bar.get_height(),
+                 f'{bar.get_height():.1f}%', ha='center', va='bottom', fontweight='bold')
+    plt.tight_layout()
+    plt.savefig('../visualizations/06_category_margins.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('06_category_margins.png')
 
 # 7. Revenue Forecast
 print("  7/12 Revenue Forecast...")
-plt.figure(figsize=(14, 8))
-historical_months = range(len(monthly_ts))
-forecast_months = range(len(monthly_ts), len(monthly_ts) + len(forecast))
-plt.plot(historical_months, monthly_ts['revenue']/10000000, marker='o', label='Historical', linewidth=2, color='#667eea')
-plt.plot(forecast_months, forecast['forecasted_revenue']/10000000, marker='s', label='Forecast', linewidth=2, color='#fa709a', linestyle='--')
-plt.axvline(x=len(monthly_ts)-0.5, color='red', linestyle=':', linewidth=2, label='Forecast Start')
-plt.xlabel('Month Index', fontsize=12, fontweight='bold')
-plt.ylabel('Revenue (₹ Crore)', fontsize=12, fontweight='bold')
-plt.title('12-Month Revenue Forecast (ML Model)', fontsize=14, fontweight='bold', pad=20)
-plt.legend(fontsize=10)
-plt.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.savefig('../visualizations/07_revenue_forecast.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('07_revenue_forecast.png', monthly_ts['revenue'], forecast['forecasted_revenue']):
+    plt.figure(figsize=(14, 8))
+    historical_months = range(len(monthly_ts))
+    forecast_months = range(len(monthly_ts), len(monthly_ts) + len(forecast))
+    plt.plot(historical_months, monthly_ts['revenue']/10000000, marker='o', label='Historical', linewidth=2, color='#667eea')
+    plt.plot(forecast_months, forecast['forecasted_revenue']/10000000, marker='s', label='Forecast', linewidth=2, color='#fa709a', linestyle='--')
+    plt.axvline(x=len(monthly_ts)-0.5, color='red', linestyle=':', linewidth=2, label='Forecast Start')
+    plt.xlabel('Month Index', fontsize=12, fontweight='bold')
+    plt.ylabel('Revenue (₹ Crore)', fontsize=12, fontweight='bold')
+    plt.title('12-Month Revenue Forecast (ML Model)', fontsize=14, fontweight='bold', pad=20)
+    plt.legend(fontsize=10)
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.savefig('../visualizations/07_revenue_forecast.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('07_revenue_forecast.png')
 
 # 8. Anomaly Detection
 print("  8/12 Anomaly Detection...")
-anomalies['date'] = pd.to_datetime(anomalies['date'])
-plt.figure(figsize=(14, 8))
-normal = anomalies[anomalies['is_anomaly'] == 0]
-anomaly = anomalies[anomalies['is_anomaly'] == 1]
-plt.scatter(range(len(normal)), normal['revenue']/100000, alpha=0.5, s=30, color='#667eea', label='Normal Days')
-plt.scatter(anomaly.index, anomaly['revenue']/100000, alpha=0.9, s=100, color='red', marker='X', label='Anomalies', edgecolors='black', linewidths=1.5)
-plt.xlabel('Day Index', fontsize=12, fontweight='bold')
-plt.ylabel('Revenue (₹ Lakhs)', fontsize=12, fontweight='bold')
-plt.title('Anomaly Detection in Daily Revenue', fontsize=14, fontweight='bold', pad=20)
-plt.legend(fontsize=10)
-plt.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.savefig('../visualizations/08_anomaly_detection.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('08_anomaly_detection.png', anomalies[['is_anomaly', 'revenue']]):
+    anomalies['date'] = pd.to_datetime(anomalies['date'])
+    plt.figure(figsize=(14, 8))
+    normal = anomalies[anomalies['is_anomaly'] == 0]
+    anomaly = anomalies[anomalies['is_anomaly'] == 1]
+    plt.scatter(range(len(normal)), normal['revenue']/100000, alpha=0.5, s=30, color='#667eea', label='Normal Days')
+    plt.scatter(anomaly.index, anomaly['revenue']/100000, alpha=0.9, s=100, color='red', marker='X', label='Anomalies', edgecolors='black', linewidths=1.5)
+    plt.xlabel('Day Index', fontsize=12, fontweight='bold')
+    plt.ylabel('Revenue (₹ Lakhs)', fontsize=12, fontweight='bold')
+    plt.title('Anomaly Detection in Daily Revenue', fontsize=14, fontweight='bold', pad=20)
+    plt.legend(fontsize=10)
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.savefig('../visualizations/08_anomaly_detection.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('08_anomaly_detection.png')
 
 # 9. Category Performance Classification
 print("  9/12 Performance Classification...")
-plt.figure(figsize=(12, 8))
-perf_counts = classification.groupby(['category', 'performance_class']).size().unstack(fill_value=0)
-perf_counts.plot(kind='bar', stacked=True, color=['#43e97b', '#f093fb', '#fa709a'], figsize=(12, 8))
-plt.xlabel('Category', fontsize=12, fontweight='bold')
-plt.ylabel('Count', fontsize=12, fontweight='bold')
-plt.title('Category Performance Classification (ML)', fontsize=14, fontweight='bold', pad=20)
-plt.legend(title='Performance', fontsize=10)
-plt.xticks(rotation=45, ha='right')
-plt.tight_layout()
-plt.savefig('../visualizations/09_performance_classification.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('09_performance_classification.png', classification[['category', 'performance_class']]):
+    plt.figure(figsize=(12, 8))
+    perf_counts = classification.groupby(['category', 'performance_class']).size().unstack(fill_value=0)
+    perf_counts.plot(kind='bar', stacked=True, color=['#43e97b', '#f093fb', '#fa709a'], figsize=(12, 8))
+    plt.xlabel('Category', fontsize=12, fontweight='bold')
+    plt.ylabel('Count', fontsize=12, fontweight='bold')
+    plt.title('Category Performance Classification (ML)', fontsize=14, fontweight='bold', pad=20)
+    plt.legend(title='Performance', fontsize=10)
+    plt.xticks(rotation=45, ha='right')
+    plt.tight_layout()
+    plt.savefig('../visualizations/09_performance_classification.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('09_performance_classification.png')
 
 # 10. Store Type Comparison
 print("  10/12 Store Type Analysis...")
-plt.figure(figsize=(12, 8))
-store_type_kpis = store_kpis.groupby('store_type').agg({'revenue': 'sum', 'transactions': 'sum', 'customers': 'sum'}).reset_index()
-x = range(len(store_type_kpis))
-width = 0.25
-plt.bar([i-width for i in x], store_type_kpis['revenue']/10000000, width, label='Revenue (Cr)', color=colors[0])
-plt.bar(x, store_type_kpis['transactions']/1000, width, label='Transactions (K)', color=colors[1])
-plt.bar([i+width for i in x], store_type_kpis['customers']/1000, width, label='Customers (K)', color=colors[2])
-plt.xlabel('Store Type', fontsize=12, fontweight='bold')
-plt.ylabel('Value', fontsize=12, fontweight='bold')
-plt.title('Performance by Store Type', fontsize=14, fontweight='bold', pad=20)
-plt.xticks(x, store_type_kpis['store_type'])
-plt.legend(fontsize=10)
-plt.tight_layout()
-plt.savefig('../visualizations/10_store_type_analysis.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('10_store_type_analysis.png', store_kpis[['store_type', 'revenue', 'transactions', 'customers']], colors):
+    plt.figure(figsize=(12, 8))
+    store_type_kpis = store_kpis.groupby('store_type').agg({'revenue': 'sum', 'transactions': 'sum', 'customers': 'sum'}).reset_index()
+    x = range(len(store_type_kpis))
+    width = 0.25
+    plt.bar([i-width for i in x], store_type_kpis['revenue']/10000000, width, label='Revenue (Cr)', color=colors[0])
+    plt.bar(x, store_type_kpis['transactions']/1000, width, label='Transactions (K)', color=colors[1])
+    plt.bar([i+width for i in x], store_type_kpis['customers']/1000, width, label='Customers (K)', color=colors[2])
+    plt.xlabel('Store Type', fontsize=12, fontweight='bold')
+    plt.ylabel('Value', fontsize=12, fontweight='bold')
+    plt.title('Performance by Store Type', fontsize=14, fontweight='bold', pad=20)
+    plt.xticks(x, store_type_kpis['store_type'])
+    plt.legend(fontsize=10)
+    plt.tight_layout()
+    plt.savefig('../visualizations/10_store_type_analysis.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('10_store_type_analysis.png')
 
 # 11. Revenue vs Profit Scatter
 print("  11/12 Revenue-Profit Analysis...")
-plt.figure(figsize=(12, 8))
-for i, row in category_kpis.iterrows():
-    plt.scatter(row['revenue']/10000000, row['profit']/10000000, s=300, alpha=0.6, color=colors[i])
-    plt.annotate(row['category'], (row['revenue']/10000000, row['profit']/10000000),
-                 ha='center', va='center', fontweight='bold', fontsize=10)
-plt.xlabel('Revenue (₹ Crore)', fontsize=12, fontweight='bold')
-plt.ylabel('Profit (₹ Crore)', fontsize=12, fontweight='bold')
-plt.title('Revenue vs Profit by Category', fontsize=14, fontweight='bold', pad=20)
-plt.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.savefig('../visualizations/11_revenue_profit_scatter.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('11_revenue_profit_scatter.png', category_kpis[['category', 'revenue', 'profit']], colors):
+    plt.figure(figsize=(12, 8))
+    for i, row in category_kpis.iterrows():
+        plt.scatter(row['revenue']/10000000, row['profit']/10000000, s=300, alpha=0.6, color=colors[i])
+        plt.annotate(row['category'], (row['revenue']/10000000, row['profit']/10000000),
+                     ha='center', va='center', fontweight='bold', fontsize=10)
+    plt.xlabel('Revenue (₹ Crore)', fontsize=12, fontweight='bold')
+    plt.ylabel('Profit (₹ Crore)', fontsize=12, fontweight='bold')
+    plt.title('Revenue vs Profit by Category', fontsize=14, fontweight='bold', pad=20)
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    plt.savefig('../visualizations/11_revenue_profit_scatter.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('11_revenue_profit_scatter.png')
 
 # 12. KPI Dashboard Summary
 print("  12/12 KPI Summary...")
-fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
-fig.suptitle('Multi-Category Retail KPI Dashboard Summary', fontsize=16, fontweight='bold', y=0.995)
-
-# Top left - Category revenue pie
-ax1.pie(category_kpis['revenue'], labels=category_kpis['category'], autopct='%1.1f%%',
-        startangle=90, colors=colors)
-ax1.set_title('Revenue by Category', fontweight='bold', fontsize=12)
-
-# Top right - Monthly trend
-ax2.plot(range(len(monthly_ts)), monthly_ts['revenue']/10000000, marker='o', linewidth=2, color='#667eea')
-ax2.fill_between(range(len(monthly_ts)), monthly_ts['revenue']/10000000, alpha=0.3, color='#667eea')
-ax2.set_title('Monthly Revenue Trend', fontweight='bold', fontsize=12)
-ax2.set_xlabel('Month', fontweight='bold')
-ax2.set_ylabel('Revenue (₹ Cr)', fontweight='bold')
-ax2.grid(True, alpha=0.3)
-
-# Bottom left - Channel distribution
-ax3.bar(channel_kpis['channel'], channel_kpis['revenue']/10000000, color=colors[:3])
-ax3.set_title('Revenue by Channel', fontweight='bold', fontsize=12)
-ax3.set_xlabel('Channel', fontweight='bold')
-ax3.set_ylabel('Revenue (₹ Cr)', fontweight='bold')
-ax3.tick_params(axis='x', rotation=45)
-
-# Bottom right - Segment analysis
-ax4.barh(segment_kpis['segment'], segment_kpis['revenue_per_customer']/100000, color=colors[1])
-ax4.set_title('Revenue per Customer by Segment', fontweight='bold', fontsize=12)
-ax4.set_xlabel('Revenue per Customer (₹ Lakhs)', fontweight='bold')
-ax4.set_ylabel('Segment', fontweight='bold')
-
-plt.tight_layout()
-plt.savefig('../visualizations/12_kpi_dashboard_summary.png', dpi=300, bbox_inches='tight')
-plt.close()
+if not cache.is_current('12_kpi_dashboard_summary.png', category_kpis[['category', 'revenue']], monthly_ts['revenue'],
+                        channel_kpis[['channel', 'revenue']], segment_kpis[['segment', 'revenue_per_customer']], colors):
+    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+    fig.suptitle('Multi-Category Retail KPI Dashboard Summary', fontsize=16, fontweight='bold', y=0.995)
+
+    # Top left - Category revenue pie
+    ax1.pie(category_kpis['revenue'], labels=category_kpis['category'], autopct='%1.1f%%',
+            startangle=90, colors=colors)
+    ax1.set_title('Revenue by Category', fontweight='bold', fontsize=12)
+
+    # Top right - Monthly trend
+    ax2.plot(range(len(monthly_ts)), monthly_ts['revenue']/10000000, marker='o', linewidth=2, color='#667eea')
+    ax2.fill_between(range(len(monthly_ts)), monthly_ts['revenue']/10000000, alpha=0.3, color='#667eea')
+    ax2.set_title('Monthly Revenue Trend', fontweight='bold', fontsize=12)
+    ax2.set_xlabel('Month', fontweight='bold')
+    ax2.set_ylabel('Revenue (₹ Cr)', fontweight='bold')
+    ax2.grid(True, alpha=0.3)
+
+    # Bottom left - Channel distribution
+    ax3.bar(channel_kpis['channel'], channel_kpis['revenue']/10000000, color=colors[:3])
+    ax3.set_title('Revenue by Channel', fontweight='bold', fontsize=12)
+    ax3.set_xlabel('Channel', fontweight='bold')
+    ax3.set_ylabel('Revenue (₹ Cr)', fontweight='bold')
+    ax3.tick_params(axis='x', rotation=45)
+
+    # Bottom right - Segment analysis
+    ax4.barh(segment_kpis['segment'], segment_kpis['revenue_per_customer']/100000, color=colors[1])
+    ax4.set_title('Revenue per Customer by Segment', fontweight='bold', fontsize=12)
+    ax4.set_xlabel('Revenue per Customer (₹ Lakhs)', fontweight='bold')
+    ax4.set_ylabel('Segment', fontweight='bold')
+
+    plt.tight_layout()
+    plt.savefig('../visualizations/12_kpi_dashboard_summary.png', dpi=300, bbox_inches='tight')
+    plt.close()
+    cache.record('12_kpi_dashboard_summary.png')
 
 print("\n✅ All 12 visualizations created successfully!")
+if USE_RENDER_CACHE:
+    print(f"  ♻️  {cache.skipped} unchanged (reused from render cache), {cache.rendered} redrawn")
 
 # Generate insights
 insights = []
@@ -12,6 +12,12 @@ from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
 
+from rfm_rules import compile_rules, assign_segments
+from rfm_state import RFMState
+
+# Per-customer RFM state picked up by rfm_daily_update.py
+RFM_STATE_DIR = '../data/rfm_state'
+
 print("="*80)
 print("📊 ADVANCED ANALYTICS & KPI PROCESSOR")
 print("="*80)
@@ -186,11 +192,8 @@ print("\n👥 Performing RFM Segmentation...")
 # Calculate RFM metrics
 current_date = transactions['date'].max()
 
-rfm = transactions.groupby('customer_id').agg({
-    'date': lambda x: (current_date - x.max()).days,  # Recency
-    'transaction_id': 'count',  # Frequency
-    'revenue': 'sum'  # Monetary
-}).reset_index()
+rfm_state = RFMState.from_transactions(transactions, 'customer_id', 'date', 'transaction_id', 'revenue')
+rfm = rfm_state.rfm(current_date)
 
 rfm.columns = ['customer_id', 'recency', 'frequency', 'monetary']
 
@@ -201,20 +204,19 @@ rfm['m_score'] = pd.qcut(rfm['monetary'], 5, labels=[1,2,3,4,5], duplicates='dro
 
 rfm['rfm_score'] = rfm['r_score'] + rfm['f_score'] + rfm['m_score']
 
-# Create segments
-def rfm_segment(row):
-    if row['rfm_score'] >= 13:
-        return 'Champions'
-    elif row['rfm_score'] >= 11:
-        return 'Loyal'
-    elif row['rfm_score'] >= 9:
-        return 'Potential'
-    elif row['rfm_score'] >= 7:
-        return 'At Risk'
-    else:
-        return 'Lost'
-
-rfm['segment'] = rfm.apply(rfm_segment, axis=1)
+# Create segments (rules checked in order on the R+F+M total)
+SEGMENT_RULES = [
+    ('Champions', {'RFM': (13, 15)}),
+    ('Loyal', {'RFM': (11, 15)}),
+    ('Potential', {'RFM': (9, 15)}),
+    ('At Risk', {'RFM': (7, 15)})
+]
+
+segment_lookup = compile_rules(SEGMENT_RULES, default='Lost')
+rfm['segment'] = assign_segments(segment_lookup, rfm['r_score'], rfm['f_score'], rfm['m_score'])
+
+# Daily updates fold new transactions into this state instead of regrouping everything
+rfm_state.save(RFM_STATE_DIR, segment_lookup)
 
 # Merge with customer data
 rfm = rfm.merge(customers[['customer_id', 'name', 'city', 'region', 'segment']], 
@@ -0,0 +1,39 @@
+"""
+Rule-table RFM segmentation
+Compiles an ordered list of segment rules over 1-5 R/F/M scores into a
+125-entry lookup array, so segmenting any number of customers is a single
+vectorized gather instead of one Python call per row.
+"""
+
+import numpy as np
+
+SCORES = 5
+
+def compile_rules(rules, default):
+    """Evaluate the rules once for every (R, F, M) combination
+
+    ``rules`` is an ordered list of (segment, conditions) pairs. Conditions
+    map 'R', 'F', 'M' or 'RFM' (the R+F+M total) to inclusive (low, high)
+    bounds; the first rule whose conditions all hold wins, and combinations
+    matched by no rule get ``default``. Entry (R-1)*25 + (F-1)*5 + (M-1)
+    of the returned array is the segment for scores R, F, M.
+    """
+    r, f, m = (axis.ravel() + 1 for axis in np.indices((SCORES, SCORES, SCORES)))
+    values = {'R': r, 'F': f, 'M': m, 'RFM': r + f + m}
+
+    lookup = np.full(SCORES ** 3, default, dtype=object)
+    unassigned = np.ones(SCORES ** 3, dtype=bool)
+    for segment, conditions in rules:
+        match = unassigned.copy()
+        for key, (low, high) in conditions.items():
+            match &= (values[key] >= low) & (values[key] <= high)
+        lookup[match] = segment
+        unassigned &= ~match
+    return lookup
+
+def assign_segments(lookup, r_score, f_score, m_score):
+    """Segment for every customer, gathered from a compiled lookup"""
+    r = np.asarray(r_score, dtype=np.int64)
+    f = np.asarray(f_score, dtype=np.int64)
+    m = np.asarray(m_score, dtype=np.int64)
+    return lookup[(r - 1) * SCORES ** 2 + (f - 1) * SCORES + (m - 1)]
@@ -0,0 +1,127 @@
+"""
+Persistent per-customer RFM state
+Keeps every customer's last purchase date, purchase count and total spend
+so new transactions are folded in by re-aggregating only the customers
+they touch, instead of regrouping the whole history on every run. Scores
+and segments are re-derived from the state (one row per customer).
+"""
+
+import os
+import json
+
+import numpy as np
+import pandas as pd
+
+from rfm_rules import assign_segments
+
+STATE_FILE = 'rfm_state.pkl'
+META_FILE = 'rfm_state.json'
+
+class RFMState:
+    """Per-customer LastPurchase / Frequency / Monetary, indexed by customer
+
+    Usage:
+        state = RFMState.from_transactions(df, 'CustomerID', 'Date', 'TransactionID', 'TotalAmount')
+        rfm = state.rfm(analysis_date)        # same frame as a full groupby
+        state.save(state_dir, segment_lookup)
+        ...
+        state = RFMState.load(state_dir)
+        changed = state.update(new_transactions)
+        scores = state.score(analysis_date)   # R/F/M scores and segments
+    """
+
+    def __init__(self, customers, columns, segment_lookup=None, ingested=None):
+        self.customers = customers
+        self.columns = columns
+        self.segment_lookup = segment_lookup
+        self.ingested = ingested or []
+
+    @classmethod
+    def from_transactions(cls, transactions, customer_col, date_col, id_col, amount_col):
+        columns = {'customer': customer_col, 'date': date_col, 'id': id_col, 'amount': amount_col}
+        return cls(_aggregate(transactions, columns), columns)
+
+    @property
+    def last_date(self):
+        """Most recent purchase across all customers"""
+        return self.customers['LastPurchase'].max()
+
+    def update(self, transactions):
+        """Fold new transactions into the state; returns the customers touched"""
+        delta = _aggregate(transactions, self.columns)
+        positions = self.customers.index.get_indexer(delta.index)
+        known = positions >= 0
+
+        # Only the rows of customers in the delta are touched
+        rows = positions[known]
+        existing = delta[known]
+        last_purchase = self.customers['LastPurchase'].to_numpy(copy=True)
+        frequency = self.customers['Frequency'].to_numpy(copy=True)
+        monetary = self.customers['Monetary'].to_numpy(copy=True)
+        last_purchase[rows] = np.maximum(last_purchase[rows],
+                                         existing['LastPurchase'].to_numpy().astype(last_purchase.dtype))
+        frequency[rows] += existing['Frequency'].to_numpy()
+        monetary[rows] += existing['Monetary'].to_numpy()
+        self.customers = self.customers.assign(LastPurchase=last_purchase, Frequency=frequency, Monetary=monetary)
+
+        if (~known).any():
+            # Keep customers sorted so rank(method='first') ties break as in a full groupby
+            self.customers = pd.concat([self.customers, delta[~known]]).sort_index()
+        return delta.index
+
+    def rfm(self, analysis_date):
+        """Customer / Recency / Frequency / Monetary, as the full-history groupby builds it"""
+        rfm = self.customers.reset_index()
+        rfm.insert(1, 'Recency', (analysis_date - rfm.pop('LastPurchase')).dt.days)
+        return rfm
+
+    def score(self, analysis_date):
+        """RFM frame with 1-5 quintile scores and, if a lookup was saved, segments
+
+        Quintile boundaries are exact quantiles over the state itself, so they
+        match what the full pipeline's pd.qcut would give on the same history.
+        """
+        rfm = self.rfm(analysis_date)
+        rfm['R_Score'] = pd.qcut(rfm['Recency'], 5, labels=[5, 4, 3, 2, 1]).astype(int)
+        rfm['F_Score'] = pd.qcut(rfm['Frequency'].rank(method='first'), 5, labels=[1, 2, 3, 4, 5]).astype(int)
+        rfm['M_Score'] = pd.qcut(rfm['Monetary'], 5, labels=[1, 2, 3, 4, 5]).astype(int)
+        if self.segment_lookup is not None:
+            rfm['Segment'] = assign_segments(self.segment_lookup, rfm['R_Score'], rfm['F_Score'], rfm['M_Score'])
+        return rfm
+
+    def save(self, state_dir, segment_lookup=None):
+        """Write the state, plus the compiled segment lookup from rfm_rules"""
+        if segment_lookup is not None:
+            self.segment_lookup = segment_lookup
+        os.makedirs(state_dir, exist_ok=True)
+        self.customers.to_pickle(os.path.join(state_dir, STATE_FILE))
+        meta = {
+            'columns': self.columns,
+            'segment_lookup': None if self.segment_lookup is None else list(self.segment_lookup),
+            'ingested': self.ingested
+        }
+        with open(os.path.join(state_dir, META_FILE), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+
+    @classmethod
+    def load(cls, state_dir):
+        customers = pd.read_pickle(os.path.join(state_dir, STATE_FILE))
+        with open(os.path.join(state_dir, META_FILE), encoding='utf-8') as f:
+            meta = json.load(f)
+        lookup = meta['segment_lookup']
+        if lookup is not None:
+            lookup = np.array(lookup, dtype=object)
+        return cls(customers, meta['columns'], lookup, meta['ingested'])
+
+def state_exists(state_dir):
+    return os.path.exists(os.path.join(state_dir, META_FILE))
+
+def _aggregate(transactions, columns):
+    """One row per customer, in the same order and dtypes as the pipelines' groupby"""
+    customers = transactions.groupby(columns['customer']).agg(
+        LastPurchase=(columns['date'], 'max'),
+        Frequency=(columns['id'], 'count'),
+        Monetary=(columns['amount'], 'sum')
+    )
+    customers.index.name = columns['customer']
+    return customers